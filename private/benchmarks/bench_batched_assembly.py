@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark: batched result assembly (process_chapter_batched)
+
+Compares assemble_chapter_records() against the previous per-verse loop
+(linear verse lookup, eager debug JSON, un-memoized divine-names transforms)
+on the largest recorded chapters in debug/, plus a synthetic 176-verse chapter
+(Psalms 119 sized) built by tiling them. Both implementations must produce
+the same column values.
+
+Usage:
+    python benchmarks/bench_batched_assembly.py
+    python benchmarks/bench_batched_assembly.py --chapters 5 --repeat 20
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import re
+import sys
+import time
+
+PRIVATE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PRIVATE_DIR)
+sys.path.insert(0, os.path.join(PRIVATE_DIR, 'src'))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark')
+
+from interactive_parallel_processor import assemble_chapter_records  # noqa: E402
+from hebrew_figurative_db.database.records import InstanceRecord, VerseRecord  # noqa: E402
+from hebrew_figurative_db.text_extraction.hebrew_utils import HebrewTextProcessor  # noqa: E402
+from hebrew_figurative_db.text_extraction.hebrew_divine_names_modifier import HebrewDivineNamesModifier  # noqa: E402
+
+DEBUG_DIR = os.path.join(PRIVATE_DIR, 'debug')
+FILENAME_PATTERN = re.compile(r'debug_response_(.+)_(\d+)_\d{8}_\d{6}\.json$')
+
+
+def legacy_assembly(verse_results, verses_data, book_name, chapter, divine_names_modifier, logger):
+    """The assembly loop as it was before assemble_chapter_records()."""
+    records = []
+    for vr in verse_results:
+        verse_num = vr.get('verse')
+        reference = vr.get('reference', f'{book_name} {chapter}:{verse_num}')
+        instances = vr.get('instances', [])
+
+        verse_specific_deliberation = vr.get('deliberation', '')
+        if verse_specific_deliberation:
+            logger.debug(f"Found verse-specific deliberation for {reference}: {len(verse_specific_deliberation)} chars")
+        else:
+            verse_specific_deliberation = None
+
+        original_verse = next((v for v in verses_data if v['verse'] == verse_num), None)
+        if not original_verse:
+            continue
+
+        hebrew_stripped = HebrewTextProcessor.strip_diacritics(original_verse['hebrew'])
+        hebrew_non_sacred = divine_names_modifier.modify_divine_names(original_verse['hebrew'])
+        english_non_sacred = divine_names_modifier.modify_english_with_hebrew_terms(original_verse['english'])
+        english_text_clean = original_verse['english']
+        english_text_clean_non_sacred = divine_names_modifier.modify_english_with_hebrew_terms(english_text_clean)
+        verse_specific_deliberation_non_sacred = divine_names_modifier.modify_english_with_hebrew_terms(verse_specific_deliberation) if verse_specific_deliberation else None
+        hebrew_words = original_verse['hebrew'].split()
+        word_count = len([w for w in hebrew_words if w.strip()])
+
+        verse_data = {
+            'reference': reference, 'book': book_name, 'chapter': chapter, 'verse': verse_num,
+            'hebrew': original_verse['hebrew'], 'hebrew_stripped': hebrew_stripped,
+            'hebrew_text_non_sacred': hebrew_non_sacred, 'english': original_verse['english'],
+            'english_text_clean': english_text_clean, 'english_text_clean_non_sacred': english_text_clean_non_sacred,
+            'english_text_non_sacred': english_non_sacred, 'word_count': word_count,
+            'instances_detected': len(instances),
+            'figurative_detection_deliberation': verse_specific_deliberation,
+            'figurative_detection_deliberation_non_sacred': verse_specific_deliberation_non_sacred,
+            'model_used': 'gpt-5.1-medium-batched', 'truncation_occurred': 'no', 'pro_model_used': 'no',
+            'both_models_truncated': 'no', 'tertiary_decomposed': 'no'
+        }
+        logger.debug(f"Verse data for insertion: {json.dumps(verse_data, indent=2, ensure_ascii=False)}")
+
+        instance_records = []
+        for instance in instances:
+            figurative_text = instance.get('english_text', '')
+            figurative_text_non_sacred = divine_names_modifier.modify_english_with_hebrew_terms(figurative_text) if figurative_text else ''
+            figurative_data = {
+                'figurative_language': instance.get('figurative_language', 'no'),
+                'simile': instance.get('simile', 'no'), 'metaphor': instance.get('metaphor', 'no'),
+                'personification': instance.get('personification', 'no'), 'idiom': instance.get('idiom', 'no'),
+                'hyperbole': instance.get('hyperbole', 'no'), 'metonymy': instance.get('metonymy', 'no'),
+                'other': instance.get('other', 'no'), 'confidence': instance.get('confidence', 0.5),
+                'figurative_text': figurative_text, 'figurative_text_non_sacred': figurative_text_non_sacred,
+                'figurative_text_in_hebrew': instance.get('hebrew_text', ''),
+                'figurative_text_in_hebrew_stripped': HebrewTextProcessor.strip_diacritics(instance.get('hebrew_text', '')),
+                'figurative_text_in_hebrew_non_sacred': divine_names_modifier.modify_divine_names(instance.get('hebrew_text', '')),
+                'explanation': instance.get('explanation', ''), 'speaker': instance.get('speaker', ''),
+                'purpose': instance.get('purpose', ''),
+                'target': json.dumps(instance.get('target', [])) if instance.get('target') else '[]',
+                'vehicle': json.dumps(instance.get('vehicle', [])) if instance.get('vehicle') else '[]',
+                'ground': json.dumps(instance.get('ground', [])) if instance.get('ground') else '[]',
+                'posture': json.dumps(instance.get('posture', [])) if instance.get('posture') else '[]',
+                'tagging_analysis_deliberation': '', 'model_used': 'gpt-5.1-medium-batched'
+            }
+            instance_records.append((instance, figurative_data))
+        records.append((verse_data, instance_records))
+    return records
+
+
+def same_records(records, legacy_records):
+    """assemble_chapter_records() output matches the legacy dicts column for column."""
+    if len(records) != len(legacy_records):
+        return False
+    for (verse, instances), (verse_data, legacy_instances) in zip(records, legacy_records):
+        if verse != VerseRecord.from_dict(verse_data):
+            return False
+        if instances != [InstanceRecord.from_dict(figurative_data) for _, figurative_data in legacy_instances]:
+            return False
+    return True
+
+
+def load_largest_chapters(limit):
+    """Return [(book, chapter, verse_results)] for the recorded responses with the most verses."""
+    chapters = {}
+    for path in glob.glob(os.path.join(DEBUG_DIR, 'debug_response_*.json')):
+        match = FILENAME_PATTERN.search(os.path.basename(path))
+        if not match:
+            continue
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                verse_results = json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if not isinstance(verse_results, list):
+            continue
+        key = (match.group(1), int(match.group(2)))
+        if len(verse_results) > len(chapters.get(key, [])):
+            chapters[key] = verse_results
+    ranked = sorted(chapters.items(), key=lambda item: len(item[1]), reverse=True)
+    return [(book, chapter, results) for (book, chapter), results in ranked[:limit]]
+
+
+def build_verses_data(book, chapter, verse_results):
+    """Reconstruct source verses from the recorded instance fragments (plus a divine name per verse)."""
+    verses_data = []
+    for vr in verse_results:
+        instances = vr.get('instances', [])
+        hebrew = ' '.join(i.get('hebrew_text', '') for i in instances) + ' וַיֹּאמֶר יְהוָה אֱלֹהִים'
+        english = ' '.join(i.get('english_text', '') for i in instances) + ' and the LORD God said'
+        verses_data.append({'reference': f"{book} {chapter}:{vr.get('verse')}", 'verse': vr.get('verse'),
+                            'hebrew': hebrew.strip(), 'english': english.strip()})
+    return verses_data
+
+
+def tile_chapter(chapters, verse_count):
+    """Build a synthetic chapter of verse_count verses by tiling recorded verses."""
+    pool = [(vr, v) for _, _, results in chapters for vr, v in zip(results, build_verses_data('X', 0, results))]
+    verse_results, verses_data = [], []
+    for n in range(1, verse_count + 1):
+        vr, verse = pool[(n - 1) % len(pool)]
+        verse_results.append(dict(vr, verse=n, reference=f'Psalms 119:{n}'))
+        verses_data.append(dict(verse, verse=n, reference=f'Psalms 119:{n}'))
+    return verse_results, verses_data
+
+
+def time_it(func, repeat, *args):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark batched result assembly')
+    parser.add_argument('--chapters', type=int, default=5, help='Largest recorded chapters to benchmark')
+    parser.add_argument('--repeat', type=int, default=10, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    logger = logging.getLogger('bench_batched_assembly')
+    logger.setLevel(logging.INFO)  # Debug off, as in production runs
+    modifier = HebrewDivineNamesModifier(logger=logger)
+
+    chapters = load_largest_chapters(args.chapters)
+    if not chapters:
+        print(f"No debug responses found in {DEBUG_DIR}")
+        return
+
+    cases = [(f"{book} {chapter}", results, build_verses_data(book, chapter, results), book, chapter)
+             for book, chapter, results in chapters]
+    psalm_results, psalm_verses = tile_chapter(chapters, 176)
+    cases.append(("Psalms 119 (synthetic)", psalm_results, psalm_verses, 'Psalms', 119))
+
+    print(f"{'Chapter':<26}{'Verses':>7}{'Inst':>6}{'Legacy ms':>11}{'New ms':>9}{'Speedup':>9}")
+    for label, verse_results, verses_data, book, chapter in cases:
+        run_args = (verse_results, verses_data, book, chapter, modifier, logger)
+        new_records = assemble_chapter_records(*run_args)
+        if not same_records(new_records, legacy_assembly(*run_args)):
+            raise SystemExit(f"Output mismatch for {label}")
+
+        legacy = time_it(legacy_assembly, args.repeat, *run_args)
+        new = time_it(assemble_chapter_records, args.repeat, *run_args)
+        instances = sum(len(r) for _, r in new_records)
+        print(f"{label:<26}{len(verse_results):>7}{instances:>6}{legacy * 1000:>11.2f}{new * 1000:>9.2f}"
+              f"{legacy / new:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark: divine-names rewriting throughput
+
+Times the precompiled rule-table engine (HebrewDivineNamesModifier) against the
+original six-pass modifier on the same inputs check_divine_names_equivalence.py
+uses (database if present, otherwise the recorded debug/ responses), split into
+Hebrew fragments and English texts, as the pipeline calls them per verse and
+per instance.
+
+Usage:
+    python benchmarks/bench_divine_names.py
+    python benchmarks/bench_divine_names.py --database ../database/Pentateuch_Psalms_fig_language.db --repeat 3
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+from check_divine_names_equivalence import (  # noqa: E402
+    DEBUG_DIR, DEFAULT_DATABASE, HebrewDivineNamesModifier, LegacyHebrewDivineNamesModifier,
+    load_database_texts, load_debug_texts,
+)
+
+HEBREW_LETTER = re.compile(r'[א-ת]')
+
+
+def time_pass(func, texts, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark divine-names rewriting')
+    parser.add_argument('--database', default=DEFAULT_DATABASE, help='Database to read verses/instances from')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    texts = load_database_texts(args.database) if os.path.exists(args.database) else load_debug_texts()
+    if not texts:
+        print(f"No texts found in {args.database} or {DEBUG_DIR}")
+        return
+
+    logger = logging.getLogger('bench_divine_names')
+    logger.setLevel(logging.INFO)  # Debug off, as in production runs
+    engine = HebrewDivineNamesModifier(logger=logger)
+    legacy = LegacyHebrewDivineNamesModifier(logger=logger)
+
+    hebrew = [t for t in texts if HEBREW_LETTER.search(t)]
+    english = [t for t in texts if not HEBREW_LETTER.search(t)]
+    cases = [
+        ('Hebrew (modify_divine_names)', hebrew, engine.modify_divine_names, legacy.modify_divine_names),
+        ('English (modify_english_...)', english,
+         engine.modify_english_with_hebrew_terms, legacy.modify_english_with_hebrew_terms),
+    ]
+
+    print(f"{'Input':<30}{'Texts':>8}{'Legacy/s':>12}{'Engine/s':>12}{'Speedup':>9}")
+    for label, sample, new_func, old_func in cases:
+        if not sample:
+            continue
+        old = time_pass(old_func, sample, args.repeat)
+        new = time_pass(new_func, sample, args.repeat)
+        print(f"{label:<30}{len(sample):>8}{len(sample) / old:>12,.0f}{len(sample) / new:>12,.0f}"
+              f"{old / new:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
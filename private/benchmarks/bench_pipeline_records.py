@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark: chapter hand-off with slotted records vs. dicts
+
+For the largest recorded chapters in debug/ (plus the synthetic 176-verse chapter of
+bench_batched_assembly.py), times everything that happens to a chapter after assembly:
+
+  insert      bulk insert of verses and instances into an in-memory database
+  prepare     building the validator's instance list
+  update      mapping one VALID decision per detected type back to the rows
+
+legacy   the dict hand-off (frozen copy): row tuples built by per-key lookups from
+         sanitized copies, instance.copy() plus verse context for validation, and
+         validation dicts turned into UPDATE tuples
+records  VerseRecord / InstanceRecord / ValidationRecord through insert_chapter_bulk(),
+         validation_payload() and update_validation_records()
+
+and reports the container memory a chapter holds while in flight (dicts, tuples and
+records; the strings are the same objects in both).
+
+Usage:
+    python benchmarks/bench_pipeline_records.py
+    python benchmarks/bench_pipeline_records.py --chapters 5 --repeat 20
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PRIVATE_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, PRIVATE_DIR)
+sys.path.insert(0, os.path.join(PRIVATE_DIR, 'src'))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark')
+
+from bench_batched_assembly import (  # noqa: E402
+    DEBUG_DIR, build_verses_data, legacy_assembly, load_largest_chapters, tile_chapter,
+)
+from interactive_parallel_processor import apply_validation_results, assemble_chapter_records  # noqa: E402
+from hebrew_figurative_db.database.db_manager import (  # noqa: E402
+    FIGURATIVE_INSERT_SQL, VALIDATION_UPDATE_SQL, VERSE_INSERT_SQL, DatabaseManager,
+)
+from hebrew_figurative_db.database.records import FIGURATIVE_TYPES  # noqa: E402
+from hebrew_figurative_db.text_extraction.hebrew_divine_names_modifier import HebrewDivineNamesModifier  # noqa: E402
+
+VALIDATION_COLUMNS = ([f'validation_decision_{t}' for t in FIGURATIVE_TYPES] +
+                      [f'validation_reason_{t}' for t in FIGURATIVE_TYPES] +
+                      ['final_figurative_language'] + [f'final_{t}' for t in FIGURATIVE_TYPES] +
+                      ['validation_response', 'validation_error'])
+
+
+def open_database():
+    db = DatabaseManager(':memory:')
+    db.connect()
+    db.setup_database(drop_existing=False)
+    db.cursor.execute('BEGIN')
+    return db
+
+
+def fake_validation_results(instances):
+    """One VALID decision per detected type, as the validator would return them"""
+    return [{'instance_id': instance['instance_id'],
+             'validation_results': {t: {'decision': 'VALID', 'reason': 'benchmark'}
+                                    for t in FIGURATIVE_TYPES if instance.get(t) == 'yes'}}
+            for instance in instances]
+
+
+def legacy_handoff(db, verses_data, instances_data, logger):
+    """The dict hand-off before the record classes (frozen copy)"""
+    verse_ids = db._insert_rows_contiguous(VERSE_INSERT_SQL, [db._verse_row(v) for v in verses_data])
+    ordered = sorted(instances_data, key=lambda item: item[0])
+    rows = [db._figurative_row(verse_ids[verse_idx], db._sanitize_figurative_data(instance_dict))
+            for verse_idx, instance_dict in ordered]
+    instance_ids = db._insert_rows_contiguous(FIGURATIVE_INSERT_SQL, rows)
+
+    chapter_instances = []
+    for idx, ((verse_idx, instance_dict), db_id) in enumerate(zip(ordered, instance_ids)):
+        verse_dict = verses_data[verse_idx]
+        instance = instance_dict.copy()
+        instance['verse_reference'] = verse_dict['reference']
+        instance['hebrew_text'] = verse_dict['hebrew']
+        instance['english_text'] = verse_dict['english']
+        instance['instance_id'] = idx + 1
+        instance['db_id'] = db_id
+        chapter_instances.append(instance)
+
+    updates = []
+    for result in fake_validation_results(chapter_instances):
+        data = {f'final_{t}': 'no' for t in FIGURATIVE_TYPES}
+        for fig_type, decision in result['validation_results'].items():
+            data[f'validation_decision_{fig_type}'] = decision['decision']
+            data[f'validation_reason_{fig_type}'] = decision['reason']
+            data[f'final_{fig_type}'] = 'yes'
+        data['final_figurative_language'] = 'yes' if result['validation_results'] else 'no'
+        data['validation_response'] = '{}'
+        data['validation_error'] = None
+        updates.append((chapter_instances[result['instance_id'] - 1]['db_id'], data))
+    db.cursor.executemany(VALIDATION_UPDATE_SQL, [
+        tuple(db._sanitize_validation_data(data).get(column) for column in VALIDATION_COLUMNS) + (db_id,)
+        for db_id, data in updates])
+    return chapter_instances
+
+
+def records_handoff(db, verses, instances, logger):
+    """The record hand-off: insert_chapter_bulk() -> validation_payload() -> update_validation_records()"""
+    _, inserted = db.insert_chapter_bulk(verses, instances)
+    chapter_instances = []
+    for idx, (verse_idx, _, record) in enumerate(inserted):
+        payload = record.validation_payload(verses[verse_idx])
+        payload['instance_id'] = idx + 1
+        chapter_instances.append(payload)
+    apply_validation_results(fake_validation_results(chapter_instances),
+                             {i['instance_id']: i['db_id'] for i in chapter_instances}, db, logger)
+    return chapter_instances
+
+
+def container_bytes(obj):
+    """Bytes held by the containers/records reachable from obj (strings and numbers not counted)"""
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(container_bytes(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(container_bytes(v) for v in obj)
+    if hasattr(obj, '__slots__'):
+        return sys.getsizeof(obj) + sum(container_bytes(getattr(obj, name)) for name in obj.__slots__)
+    return 0
+
+
+def time_handoff(handoff, make_input, logger, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        verses, instances = make_input()
+        db = open_database()
+        start = time.perf_counter()
+        handoff(db, verses, instances, logger)
+        best = min(best, time.perf_counter() - start)
+        db.close()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the chapter hand-off: records vs dicts')
+    parser.add_argument('--chapters', type=int, default=5, help='Largest recorded chapters to benchmark')
+    parser.add_argument('--repeat', type=int, default=10, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    logger = logging.getLogger('bench_pipeline_records')
+    logger.setLevel(logging.INFO)
+    modifier = HebrewDivineNamesModifier(logger=logger)
+
+    chapters = load_largest_chapters(args.chapters)
+    if not chapters:
+        print(f"No debug responses found in {DEBUG_DIR}")
+        return
+    cases = [(f"{book} {chapter}", results, build_verses_data(book, chapter, results), book, chapter)
+             for book, chapter, results in chapters]
+    psalm_results, psalm_verses = tile_chapter(chapters, 176)
+    cases.append(("Psalms 119 (synthetic)", psalm_results, psalm_verses, 'Psalms', 119))
+
+    print(f"{'Chapter':<26}{'Inst':>6}{'Dict KB':>9}{'Rec KB':>8}{'Legacy ms':>11}{'Rec ms':>8}{'Speedup':>9}")
+    for label, verse_results, verses_data, book, chapter in cases:
+        run_args = (verse_results, verses_data, book, chapter, modifier, logger)
+
+        def legacy_input():
+            records = legacy_assembly(*run_args)
+            return ([verse for verse, _ in records],
+                    [(i, data) for i, (_, pairs) in enumerate(records) for _, data in pairs])
+
+        def records_input():
+            records = assemble_chapter_records(*run_args)
+            return ([verse for verse, _ in records],
+                    [(i, record) for i, (_, instances) in enumerate(records) for record in instances])
+
+        # In-flight memory: the chapter's prepared data plus the validator's instance list
+        verses, instances = legacy_input()
+        db = open_database()
+        dict_bytes = container_bytes((verses, instances, legacy_handoff(db, verses, instances, logger)))
+        db.close()
+        verses, instances = records_input()
+        db = open_database()
+        record_bytes = container_bytes((verses, instances, records_handoff(db, verses, instances, logger)))
+        db.close()
+
+        legacy = time_handoff(legacy_handoff, legacy_input, logger, args.repeat)
+        new = time_handoff(records_handoff, records_input, logger, args.repeat)
+        print(f"{label:<26}{len(instances):>6}{dict_bytes / 1024:>9.1f}{record_bytes / 1024:>8.1f}"
+              f"{legacy * 1000:>11.2f}{new * 1000:>8.2f}{legacy / new:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Corpus benchmark: detection response parsing, free-form vs. structured output
+
+Each recorded verse array in debug/*.json is turned into the two responses the
+pipeline can receive for the same chapter:
+
+  free-form   deliberation prose plus the verse array in a ```json fence (as today)
+  structured  the compact {"verses": [...]} object a schema-constrained provider
+              returns, produced by mock_llm_server.conform_to_schema() from the
+              DetectionResponse schema sent with STRUCTURED_OUTPUT=1
+
+and both go through parse_detection_response(): json_recovery plus the per-instance
+Pydantic pass for free-form, one DetectionResponse.model_validate_json() for
+structured. Reported: best-of-N time over the corpus, verses and instances parsed.
+
+Usage:
+    python benchmarks/bench_structured_output.py
+    python benchmarks/bench_structured_output.py --repeat 5
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+PRIVATE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, PRIVATE_DIR)
+sys.path.insert(0, os.path.join(PRIVATE_DIR, 'src'))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark')
+
+from bench_json_recovery import DEBUG_DIR, load_corpus, make_response  # noqa: E402
+from interactive_parallel_processor import parse_detection_response  # noqa: E402
+from mock_llm_server import conform_to_schema  # noqa: E402
+from hebrew_figurative_db.ai_analysis.structured_output import (  # noqa: E402
+    PYDANTIC_AVAILABLE, detection_response_format,
+)
+
+
+def time_parse(responses, structured, logger, repeat):
+    best = float('inf')
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [parse_detection_response(text, logger, structured=structured) for text in responses]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark free-form vs structured detection response parsing')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    if not PYDANTIC_AVAILABLE:
+        print("pydantic is not installed - structured output is unavailable")
+        return
+    corpus = load_corpus()
+    if not corpus:
+        print(f"No recorded verse arrays in {DEBUG_DIR}")
+        return
+    logger = logging.getLogger('bench_structured_output')
+    logger.disabled = True
+
+    schema = detection_response_format()['json_schema']['schema']
+    rng = random.Random(0)
+    free_form = [make_response(data, 'clean', rng) for data in corpus]
+    structured = [conform_to_schema(json.dumps(data, ensure_ascii=False), schema) for data in corpus]
+
+    print(f"Corpus: {len(corpus)} responses, {sum(len(data) for data in corpus)} verses\n")
+    print(f"{'Response':<12}{'Chars':>12}{'Best (ms)':>11}{'MB/s':>8}{'Verses':>8}{'Instances':>11}")
+    for label, responses, is_structured in (('free-form', free_form, False), ('structured', structured, True)):
+        best, results = time_parse(responses, is_structured, logger, args.repeat)
+        size = sum(len(text) for text in responses)
+        verses = sum(len(result) for result in results)
+        instances = sum(len(vr.get('instances') or []) for result in results for vr in result)
+        print(f"{label:<12}{size:>12,}{best * 1000:>11.1f}{size / best / 1e6:>8.1f}{verses:>8}{instances:>11}")
+
+
+if __name__ == '__main__':
+    main()
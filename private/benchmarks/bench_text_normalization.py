@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark: Sefaria verse cleaning throughput
+
+Times clean_sefaria_text() against the original four-pass _clean_text() over the
+raw Hebrew and English verses of a full-book fetch (see
+check_text_normalization_equivalence.py for the sources), separately, since most
+Hebrew verses carry no markup and English ones carry footnotes and <br> tags.
+
+Usage:
+    python benchmarks/bench_text_normalization.py --book Psalms
+    python benchmarks/bench_text_normalization.py --mock --repeat 10
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+from check_text_normalization_equivalence import (  # noqa: E402
+    add_book_arguments, clean_sefaria_text, legacy_clean_text, load_book_texts, start_mock_sefaria,
+)
+
+HEBREW_LETTER = re.compile(r'[א-ת]')
+
+
+def time_pass(func, texts, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Sefaria verse cleaning')
+    add_book_arguments(parser)
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    texts = load_book_texts(args.book, start_mock_sefaria() if args.mock else args.base_url)
+    hebrew = [t for t in texts if HEBREW_LETTER.search(t)]
+    english = [t for t in texts if not HEBREW_LETTER.search(t)]
+
+    print(f"{'Input':<12}{'Verses':>8}{'Legacy/s':>12}{'New/s':>12}{'Speedup':>9}")
+    for label, sample in (('Hebrew', hebrew), ('English', english)):
+        if not sample:
+            continue
+        old = time_pass(legacy_clean_text, sample, args.repeat)
+        new = time_pass(clean_sefaria_text, sample, args.repeat)
+        print(f"{label:<12}{len(sample):>8}{len(sample) / old:>12,.0f}{len(sample) / new:>12,.0f}"
+              f"{old / new:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Golden-output check: divine-names rule-table engine vs. the original six-pass modifier
+
+Runs both implementations over every text the pipeline feeds through the
+modifier and requires byte-identical output (and identical has_divine_names()
+answers). Sources, in order of preference:
+
+  1. --database: verses.hebrew_text / english_text / figurative_detection_deliberation
+     and figurative_language.figurative_text_in_hebrew / figurative_text / explanation
+  2. the recorded model responses in debug/ (instance Hebrew/English fragments,
+     explanations and deliberations) when no database is available
+
+plus a fixed set of edge cases (word boundaries, maqaf, prefixes, unvoweled forms)
+and --fuzz random strings over the letters, marks and separators the rules use.
+
+Usage:
+    python benchmarks/check_divine_names_equivalence.py
+    python benchmarks/check_divine_names_equivalence.py --fuzz 200000
+    python benchmarks/check_divine_names_equivalence.py --database ../database/Pentateuch_Psalms_fig_language.db
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import random
+import re
+import sqlite3
+import sys
+from typing import Optional
+
+PRIVATE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PRIVATE_DIR, 'src'))
+
+from hebrew_figurative_db.text_extraction.hebrew_divine_names_modifier import HebrewDivineNamesModifier  # noqa: E402
+
+DEBUG_DIR = os.path.join(PRIVATE_DIR, 'debug')
+DEFAULT_DATABASE = os.path.join(os.path.dirname(PRIVATE_DIR), 'database', 'Pentateuch_Psalms_fig_language.db')
+
+EDGE_CASES = [
+    'יהוה אלהים צבאות', 'אלוה שדי', 'שדי', 'השדי', 'שדי.', 'שדי֑ ', 'שָׂדַי',
+    'וַיֹּאמֶר יְהוָה אֱלֹהִים', 'יְהֹוָה', 'יְהוִה', 'הָאֱלֹהִים', 'וֵאלֹהֵי', 'כֵּאלֹהִים', 'לֵאלֹהִים',
+    'בֵּאלֹהֶיהָ', 'מֵאלֹהֵי', 'אֱלוֹהֵ֥י יִשְׁעִֽי', 'אֱל֣וֹהַּ', 'אֵל', 'אֵ֣ל שַׁדַּ֑י', 'אֶל־', 'אֵל־עֶלְיוֹן',
+    '־אֵל', 'בֵּית־אֵל', 'יְהוָ֣ה צְבָא֑וֹת', 'צְבָאוֹת', 'שַׁדַּי', 'שַׁ֭דַּי', 'אֱלֹהַי', 'אֱלֹהָיו',
+    'The LORD (יְהוָה) is God (אֱלֹהִים)', 'no Hebrew here at all', '', 'א', 'ישש', 'הוה',
+]
+
+
+class LegacyHebrewDivineNamesModifier:
+    """Frozen copy of the six-pass modifier (pre rule-table engine) - the golden reference"""
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger(__name__)
+
+    def modify_divine_names(self, hebrew_text: str) -> str:
+        """Apply all divine name modifications to Hebrew text"""
+        if not hebrew_text or not isinstance(hebrew_text, str):
+            return hebrew_text
+
+        modified_text = hebrew_text
+
+        # Apply modifications in order of specificity (most specific first)
+        # 1. Tetragrammaton: יהוה → ה׳
+        modified_text = self._modify_tetragrammaton(modified_text)
+
+        # 2. El Shaddai: שַׁדַּי → שַׁקַּי (before general patterns)
+        modified_text = self._modify_el_shaddai(modified_text)
+
+        # 3. Elohim family: replace ה with ק in divine names
+        modified_text = self._modify_elohim_family(modified_text)
+
+        # 4. El with tzere: אֵל → קֵל (NOT preposition אֶל)
+        modified_text = self._modify_el_tzere(modified_text)
+
+        # 5. Tzevaot: צְבָאוֹת → צְבָקוֹת
+        modified_text = self._modify_tzevaot(modified_text)
+
+        # 6. Eloah: אֱלוֹהַּ → אֱלוֹקַּ
+        modified_text = self._modify_eloah(modified_text)
+
+        # Log if text changed
+        if modified_text != hebrew_text:
+            self.logger.debug(f"Divine names modified: '{hebrew_text}' → '{modified_text}'")
+
+        return modified_text
+
+    def modify_english_with_hebrew_terms(self, english_text: str) -> str:
+        """Apply divine name modifications to English text that contains Hebrew terms"""
+        if not english_text or not isinstance(english_text, str):
+            return english_text
+
+        # This method applies the same Hebrew divine name modifications
+        # but to English text that may contain Hebrew terms
+        modified_text = english_text
+
+        # Apply the same modifications as Hebrew text
+        # The patterns should work the same way since we're looking for Hebrew characters
+
+        # 1. Tetragrammaton: יהוה → ה׳
+        modified_text = self._modify_tetragrammaton(modified_text)
+
+        # 2. El Shaddai: שַׁדַּי → שַׁקַּי (before general patterns)
+        modified_text = self._modify_el_shaddai(modified_text)
+
+        # 3. Elohim family: replace ה with ק in divine names
+        modified_text = self._modify_elohim_family(modified_text)
+
+        # 4. El with tzere: אֵל → קֵל (NOT preposition אֶל)
+        modified_text = self._modify_el_tzere(modified_text)
+
+        # 5. Tzevaot: צְבָאוֹת → צְבָקוֹת
+        modified_text = self._modify_tzevaot(modified_text)
+
+        # 6. Eloah: אֱלוֹהַּ → אֱלוֹקַּ
+        modified_text = self._modify_eloah(modified_text)
+
+        # Log if text changed
+        if modified_text != english_text:
+            self.logger.debug(f"English text with Hebrew divine names modified")
+
+        return modified_text
+
+    def _modify_tetragrammaton(self, text: str) -> str:
+        """Replace יהוה with ה׳"""
+        # Match both voweled and unvoweled forms
+        patterns = [
+            (r'יהוה', 'ה׳'),  # Unvoweled
+            (r'יְ?[\u0591-\u05C7]*הֹ?[\u0591-\u05C7]*וָ?[\u0591-\u05C7]*ה', 'ה׳'),  # Voweled with cantillation marks
+        ]
+
+        modified = text
+        for pattern, replacement in patterns:
+            new_modified = re.sub(pattern, replacement, modified)
+            if new_modified != modified:
+                self.logger.debug(f"Tetragrammaton modified: {pattern} → {replacement}")
+                modified = new_modified
+
+        return modified
+
+    def _modify_elohim_family(self, text: str) -> str:
+        """Replace ה with ק in Elohim family words"""
+
+        # Simple replacement approach - replace ה with ק in Elohim words
+        modified = text
+
+        # Pattern 1: Basic unvoweled אלהים
+        if 'אלהים' in text:
+            modified = modified.replace('אלהים', 'אלקים')
+            self.logger.debug("Elohim (unvoweled) modified: אלהים → אלקים")
+
+        # Pattern 2: Voweled Elohim patterns with cantillation marks
+        # Must have: א + hataf segol + ל + holam + ה + any vowel + suffix
+        # Covers: אֱלֹהִים (Elohim), אֱלֹהֶיךָ (Elohekha), אֱלֹהֵיכֶם (Eloheikhem),
+        #         אֱלֹהַי (Elohai - my God), אֱלֹהָיו (Elohav - his God), etc.
+        # Vowels include: hiriq (ִ), tzere (ֵ), segol (ֶ), patah (ַ), qamatz (ָ)
+        elohim_pattern = r'א[\u0591-\u05C7]*[ֱ][\u0591-\u05C7]*ל[\u0591-\u05C7]*[ֹ][\u0591-\u05C7]*ה[\u0591-\u05C7]*[ִֵֶַָ][\u0591-\u05C7]*[םיּךֶָו]'
+        def elohim_replacer(match):
+            return match.group().replace('ה', 'ק')
+
+        new_modified = re.sub(elohim_pattern, elohim_replacer, modified)
+        if new_modified != modified:
+            self.logger.debug(f"Elohim (voweled) modified")
+            modified = new_modified
+
+        # Pattern 2b: Prefixed Elohim forms (וֵאלֹהִים, כֵּאלֹהִים, לֵאלֹהִים, בֵּאלֹהִים, מֵאלֹהִים)
+        # When a prefix (ו, כ, ל, ב, מ) is added to Elohim, hataf segol is often replaced by other vowels
+        # Pattern: prefix + vowel + alef + lamed + holam + heh + vowel + (optional suffix)
+        # Covers: וֵאלֹהִים (ve-Elohim - "and God"), כֵּאלֹהִים (ke-Elohim - "like God"),
+        #         לֵאלֹהִים (le-Elohim - "to God"), בֵּאלֹהִים (be-Elohim - "in God"),
+        #         מֵאלֹהֵי (me-Elohei - "from God of"), וֵאלֹהָי (ve-Elohai - "and my God"), etc.
+        # Note: Using character class [ובכלמ] for common prefixes
+        prefixed_elohim_pattern = r'[ובכלמ][\u0591-\u05C7]*[ִֵֶַּ]?[\u0591-\u05C7]*א[\u0591-\u05C7]*ל[\u0591-\u05C7]*[ֹ][\u0591-\u05C7]*ה[\u0591-\u05C7]*[ִֵֶַָ]'
+        new_modified = re.sub(prefixed_elohim_pattern, elohim_replacer, modified)
+        if new_modified != modified:
+            self.logger.debug(f"Prefixed Elohim (voweled) modified")
+            modified = new_modified
+
+        # Pattern 3: With definite article הָאֱלֹהִים (with cantillation marks)
+        # Must have: ה + vowel + א + hataf segol + ל + holam + ה + any vowel + suffix
+        # Covers forms with definite article
+        ha_elohim_pattern = r'ה[\u0591-\u05C7]*[ָ]?[\u0591-\u05C7]*א[\u0591-\u05C7]*[ֱ][\u0591-\u05C7]*ל[\u0591-\u05C7]*[ֹ][\u0591-\u05C7]*ה[\u0591-\u05C7]*[ִֵֶַָ][\u0591-\u05C7]*[םיּךֶָו]'
+        new_modified = re.sub(ha_elohim_pattern, elohim_replacer, modified)
+        if new_modified != modified:
+            self.logger.debug(f"Ha-Elohim modified")
+            modified = new_modified
+
+        # Pattern 4: Construct form with vav-holam: אֱלוֹהֵי (Elohei - "God of")
+        # This is a variant spelling where the 'o' is spelled with vav-holam instead of just holam
+        # Example: אֱלוֹהֵ֥י יִשְׁעִֽי (Elohei yish'i - "God of my salvation", Psalms 18:47)
+        # Pattern: א + hataf segol + ל + vav + holam + ה + vowel
+        elohei_construct_pattern = r'א[\u0591-\u05C7]*[ֱ][\u0591-\u05C7]*ל[\u0591-\u05C7]*ו[\u0591-\u05C7]*[ֹ][\u0591-\u05C7]*ה[\u0591-\u05C7]*[ִֵֶַָ]'
+        new_modified = re.sub(elohei_construct_pattern, elohim_replacer, modified)
+        if new_modified != modified:
+            self.logger.debug(f"Elohim construct (vav-holam) modified")
+            modified = new_modified
+
+        return modified
+
+    def _modify_el_tzere(self, text: str) -> str:
+        """Replace אֵל (with tzere) with קֵל, but NOT אֶל (with segol) or when part of other words"""
+        # Use a simple approach: match אֵל that is preceded by space, hyphen, or start of string
+        # and followed by space, hyphen, end of string, or only vowels/cantillation
+
+        pattern = r'(^|[\s\-\u05BE])אֵ([\u0591-\u05C7]*)ל(?=[\s\-\u05BE]|$)'
+
+        def replacer(match):
+            prefix = match.group(1)
+            cantillation = match.group(2)
+            return f"{prefix}קֵ{cantillation}ל"
+
+        modified = re.sub(pattern, replacer, text)
+        if modified != text:
+            self.logger.debug(f"El (tzere) modified: אֵל → קֵל")
+
+        return modified
+
+    def _modify_tzevaot(self, text: str) -> str:
+        """Replace א with ק in צְבָאוֹת"""
+        # Unvoweled form
+        if 'צבאות' in text:
+            modified = text.replace('צבאות', 'צבקות')
+            if modified != text:
+                self.logger.debug("Tzevaot (unvoweled) modified: צבאות → צבקות")
+        else:
+            modified = text
+
+        # Voweled form with cantillation marks - use replacer function
+        tzevaot_pattern = r'צ[\u0591-\u05C7]*[ְ]?[\u0591-\u05C7]*ב[\u0591-\u05C7]*[ָ]?[\u0591-\u05C7]*א[\u0591-\u05C7]*[וֹ]?[\u0591-\u05C7]*ת'
+        def tzevaot_replacer(match):
+            return match.group().replace('א', 'ק')
+
+        new_modified = re.sub(tzevaot_pattern, tzevaot_replacer, modified)
+        if new_modified != modified:
+            self.logger.debug(f"Tzevaot (voweled) modified")
+            modified = new_modified
+
+        return modified
+
+    def _modify_el_shaddai(self, text: str) -> str:
+        """Replace ד with ק in שַׁדַּי (only when it's a standalone divine name, not part of another word)"""
+        modified = text
+
+        # Unvoweled form - only match when preceded/followed by word boundary
+        # Word boundaries: start/end of string, space, hyphen (maqaf), or common punctuation
+        # Allow optional cantillation marks after the yud before the word boundary
+        unvoweled_pattern = r'(^|[\s\-\u05BE.,;:!?])שדי(?=[\u0591-\u05C7]*(?:[\s\-\u05BE.,;:!?]|$))'
+        def unvoweled_replacer(match):
+            prefix = match.group(1)
+            return f"{prefix}שקי"
+
+        new_modified = re.sub(unvoweled_pattern, unvoweled_replacer, modified)
+        if new_modified != modified:
+            self.logger.debug("El Shaddai (unvoweled) modified: שדי → שקי")
+            modified = new_modified
+
+        # Voweled form with cantillation marks - only match standalone word
+        # Pattern: shin + (vowels/marks) + dalet + (vowels/marks) + yud + (optional cantillation after)
+        # Must be preceded by word boundary, and followed by cantillation+word boundary
+        # The yud can have cantillation marks after it, so we allow [\u0591-\u05C7]* after the final י
+        shaddai_pattern = r'(^|[\s\-\u05BE.,;:!?])ש[\u0591-\u05C7]*[ַׁ]?[\u0591-\u05C7]*ד[\u0591-\u05C7]*[ַּ]?[\u0591-\u05C7]*י(?=[\u0591-\u05C7]*(?:[\s\-\u05BE.,;:!?]|$))'
+        def shaddai_replacer(match):
+            prefix = match.group(1)
+            modified_word = match.group()[len(prefix):].replace('ד', 'ק')
+            return f"{prefix}{modified_word}"
+
+        new_modified = re.sub(shaddai_pattern, shaddai_replacer, modified)
+        if new_modified != modified:
+            self.logger.debug(f"El Shaddai (voweled) modified")
+            modified = new_modified
+
+        return modified
+
+    def _modify_eloah(self, text: str) -> str:
+        """Replace ה with ק in אֱלוֹהַּ (Eloah - singular form of Elohim)"""
+        # Unvoweled form
+        if 'אלוה' in text:
+            modified = text.replace('אלוה', 'אלוק')
+            if modified != text:
+                self.logger.debug("Eloah (unvoweled) modified: אלוה → אלוק")
+        else:
+            modified = text
+
+        # Voweled form with cantillation marks
+        # Must have: א + hataf segol + ל + vav + holam + ה + patah/qamatz + dagesh
+        # Example: אֱל֣וֹהַּ (from Psalms 114:7)
+        # Pattern breakdown:
+        # - א followed by optional cantillation/vowels
+        # - ֱ (hataf segol) - required for Eloah
+        # - ל followed by optional cantillation
+        # - ו (vav) followed by optional cantillation
+        # - ֹ (holam) - required for Eloah
+        # - ה followed by optional cantillation
+        # - ַ (patah) - required for Eloah
+        # - Optional dagesh and other marks
+        eloah_pattern = r'א[\u0591-\u05C7]*ֱ[\u0591-\u05C7]*ל[\u0591-\u05C7]*ו[\u0591-\u05C7]*ֹ[\u0591-\u05C7]*ה[\u0591-\u05C7]*ַ[\u0591-\u05C7]*'
+        def eloah_replacer(match):
+            return match.group().replace('ה', 'ק')
+
+        new_modified = re.sub(eloah_pattern, eloah_replacer, modified)
+        if new_modified != modified:
+            self.logger.debug(f"Eloah (voweled) modified")
+            modified = new_modified
+
+        return modified
+
+    def has_divine_names(self, text: str) -> bool:
+        """Check if text (Hebrew or English with Hebrew terms) contains any divine names that would be modified"""
+        if not text:
+            return False
+
+        patterns = [
+            r'יהוה',  # Tetragrammaton (unvoweled)
+            r'יְ?[\u0591-\u05C7]*הֹ?[\u0591-\u05C7]*וָ?[\u0591-\u05C7]*ה',  # Tetragrammaton (voweled with cantillation)
+            r'אלהים',  # Elohim (unvoweled)
+            r'א[\u0591-\u05C7]*[ֱ]?[\u0591-\u05C7]*ל[\u0591-\u05C7]*[ֹ]?[\u0591-\u05C7]*ה[\u0591-\u05C7]*[ִֵֶָ]',  # Elohim (voweled with cantillation)
+            r'[ובכלמ][\u0591-\u05C7]*[ִֵֶַּ]?[\u0591-\u05C7]*א[\u0591-\u05C7]*ל[\u0591-\u05C7]*[ֹ][\u0591-\u05C7]*ה[\u0591-\u05C7]*[ִֵֶַָ]',  # Prefixed Elohim forms
+            r'ה[\u0591-\u05C7]*[ָ]?[\u0591-\u05C7]*א[\u0591-\u05C7]*[ֱ]?[\u0591-\u05C7]*ל[\u0591-\u05C7]*[ֹ]?[\u0591-\u05C7]*ה[\u0591-\u05C7]*[ִֵֶָ]',  # Ha-Elohim with cantillation
+            r'(^|[\s\-\u05BE])אֵ[\u0591-\u05C7]*ל(?=[\s\-\u05BE]|$)',  # El with tzere (standalone word only)
+            r'צבאות',  # Tzevaot (unvoweled)
+            r'צ[\u0591-\u05C7]*[ְ]?[\u0591-\u05C7]*ב[\u0591-\u05C7]*[ָ]?[\u0591-\u05C7]*א[\u0591-\u05C7]*[וֹ]?[\u0591-\u05C7]*ת',  # Tzevaot (voweled with cantillation)
+            r'(^|[\s\-\u05BE.,;:!?])שדי(?=[\u0591-\u05C7]*(?:[\s\-\u05BE.,;:!?]|$))',  # Shaddai (unvoweled) - standalone only
+            r'(^|[\s\-\u05BE.,;:!?])ש[\u0591-\u05C7]*[ַׁ]?[\u0591-\u05C7]*ד[\u0591-\u05C7]*[ַּ]?[\u0591-\u05C7]*י(?=[\u0591-\u05C7]*(?:[\s\-\u05BE.,;:!?]|$))',  # Shaddai (voweled) - standalone only
+            r'אלוה',  # Eloah (unvoweled)
+            r'א[\u0591-\u05C7]*ֱ[\u0591-\u05C7]*ל[\u0591-\u05C7]*ו[\u0591-\u05C7]*ֹ[\u0591-\u05C7]*ה[\u0591-\u05C7]*ַ[\u0591-\u05C7]*'  # Eloah (voweled with cantillation)
+        ]
+
+        for pattern in patterns:
+            if re.search(pattern, text):
+                return True
+
+        return False
+
+
+def load_database_texts(path):
+    """All modifier inputs stored in the database"""
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    texts = []
+    for query in ("SELECT hebrew_text, english_text, figurative_detection_deliberation FROM verses",
+                  "SELECT figurative_text_in_hebrew, figurative_text, explanation FROM figurative_language"):
+        for row in cursor.execute(query):
+            texts.extend(t for t in row if t)
+    conn.close()
+    return texts
+
+
+def load_debug_texts():
+    """Hebrew/English fragments, explanations and deliberations from recorded responses"""
+    texts = []
+    for path in sorted(glob.glob(os.path.join(DEBUG_DIR, 'debug_response_*.json'))):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                verse_results = json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if not isinstance(verse_results, list):
+            continue
+        for vr in verse_results:
+            if not isinstance(vr, dict):
+                continue
+            texts.append(vr.get('deliberation') or '')
+            for instance in vr.get('instances', []):
+                texts.extend(instance.get(key) or '' for key in ('hebrew_text', 'english_text', 'explanation'))
+    return [t for t in texts if isinstance(t, str) and t]
+
+
+FUZZ_ALPHABET = list('אבדהויכלמצשתםךק') + ['ְ', 'ֱ', 'ִ', 'ֵ', 'ֶ', 'ַ', 'ָ', 'ֹ', 'ּ', 'ׁ', '\u0591', '\u05A5'] + [' ', '-', '\u05BE', '.', '׳']
+
+
+def fuzz_texts(count, seed=0):
+    """Random short strings biased towards the letters/marks that make up divine names"""
+    rng = random.Random(seed)
+    seeds = [t for t in EDGE_CASES if t]
+    for _ in range(count):
+        if rng.random() < 0.5:
+            chars = list(rng.choice(seeds))
+            for _ in range(rng.randint(1, 3)):
+                chars.insert(rng.randint(0, len(chars)), rng.choice(FUZZ_ALPHABET))
+            yield ''.join(chars)
+        else:
+            yield ''.join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(1, 14)))
+
+
+def corpus_variants(texts):
+    """Each text, plus each Hebrew word on its own (exercises ^/$ anchored boundaries)"""
+    for text in texts:
+        yield text
+        for word in re.findall(r'[\u0591-\u05F4]+', text):
+            yield word
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check divine-names engine against the original modifier')
+    parser.add_argument('--database', default=DEFAULT_DATABASE, help='Database to read verses/instances from')
+    parser.add_argument('--fuzz', type=int, default=50000, help='Random strings to compare in addition to the corpus')
+    args = parser.parse_args()
+
+    if os.path.exists(args.database):
+        texts = load_database_texts(args.database)
+        source = args.database
+    else:
+        texts = load_debug_texts()
+        source = DEBUG_DIR
+    texts = EDGE_CASES + texts + list(fuzz_texts(args.fuzz))
+
+    logger = logging.getLogger('check_divine_names_equivalence')
+    logger.setLevel(logging.INFO)
+    engine = HebrewDivineNamesModifier(logger=logger)
+    legacy = LegacyHebrewDivineNamesModifier(logger=logger)
+
+    checked = changed = 0
+    mismatches = []
+    for text in corpus_variants(texts):
+        checked += 1
+        expected = legacy.modify_divine_names(text)
+        if expected != text:
+            changed += 1
+        for label, got, want in (
+                ('modify_divine_names', engine.modify_divine_names(text), expected),
+                ('modify_english_with_hebrew_terms', engine.modify_english_with_hebrew_terms(text),
+                 legacy.modify_english_with_hebrew_terms(text)),
+                ('has_divine_names', engine.has_divine_names(text), legacy.has_divine_names(text))):
+            if got != want:
+                mismatches.append((label, text, want, got))
+
+    print(f"Source: {source}")
+    print(f"Texts checked: {checked} ({changed} contain divine names)")
+    for label, text, want, got in mismatches[:20]:
+        print(f"MISMATCH [{label}] input={text!r}\n  expected={want!r}\n  got=     {got!r}")
+    if mismatches:
+        raise SystemExit(f"{len(mismatches)} mismatches")
+    print("All outputs byte-identical")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Golden-output check: clean_sefaria_text() vs. the original SefariaClient._clean_text()
+
+Runs both over every raw Hebrew and English verse of a full-book fetch (before any
+cleaning) and requires byte-identical output, plus a fixed set of edge cases
+(nested footnote tags, unterminated tags, <br> variants, sof pasuq) and --fuzz
+random strings assembled from the markup fragments the patterns look for.
+
+The book is fetched from the Sefaria API (SEFARIA_BASE_URL or --base-url), or from
+the mock server's /api/texts/ stub with --mock.
+
+Usage:
+    python benchmarks/check_text_normalization_equivalence.py --book Genesis
+    python benchmarks/check_text_normalization_equivalence.py --mock --fuzz 200000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+PRIVATE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PRIVATE_DIR)
+sys.path.insert(0, os.path.join(PRIVATE_DIR, 'src'))
+
+from hebrew_figurative_db.text_extraction.sefaria_client import SefariaClient  # noqa: E402
+from hebrew_figurative_db.text_extraction.text_normalization import clean_sefaria_text  # noqa: E402
+
+# Chapter counts for the books benchmarked here (interactive_parallel_processor.SUPPORTED_BOOKS has all)
+BOOK_CHAPTERS = {'Genesis': 50, 'Exodus': 40, 'Deuteronomy': 34, 'Psalms': 150, 'Isaiah': 66, 'Jonah': 4}
+
+EDGE_CASES = [
+    '',
+    'In the beginning',
+    'בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים׃',
+    'When God began<sup class="footnote-marker">a</sup><i class="footnote">Others “In the beginning God created.”</i> to create',
+    'x<sup class="footnote-marker">*</sup><i class="footnote"><b>Lit.</b> “<i>nested</i> text”</i> tail</i>',
+    'a<sup class="footnote-marker">b</sup><i class="footnote">line\nbreak</i>c',
+    'they said<sup class="endFootnote">-c</sup> and went',
+    'one<br>two<br/>three<br />four<br  >five<BR>six',
+    '<small>the LORD</small> spoke <b>to</b> Moses',
+    'unterminated <b tag',
+    'stray > and < signs',
+    '<<br>>',
+    '<sup class="footnote-marker">x</sup>no footnote body',
+    '  ׃ padded ׃  ',
+    '&nbsp;entity&thinsp;kept',
+]
+
+FUZZ_FRAGMENTS = [
+    '<sup class="footnote-marker">', '<sup class="endFootnote">', '</sup>', '<i class="footnote">', '</i>',
+    '<i>', '<br>', '<br/>', '<br />', '<br', '<b>', '</b>', '<small>', '</small>', '<', '>', '/', ' ', '\n',
+    '׃', 'א', 'ְ', 'word', '*', '-c', 'a',
+]
+
+
+def legacy_clean_text(text):
+    """SefariaClient._clean_text as it was before text_normalization (frozen copy)"""
+    if not text:
+        return ""
+    clean_text = re.sub(r'<sup class="footnote-marker">[^<]*</sup><i class="footnote">.*?</i>', '', text)
+    clean_text = re.sub(r'<sup class="endFootnote">[^<]*</sup>', '', clean_text)
+    clean_text = re.sub(r'<br\s*/?>', ' ', clean_text)
+    clean_text = re.sub(r'<[^>]+>', '', clean_text)
+    clean_text = clean_text.replace('׃', '').strip()
+    return clean_text
+
+
+def start_mock_sefaria():
+    """Start mock_llm_server.py on a free port; returns its Sefaria API base URL"""
+    from mock_llm_server import start_mock_server_in_thread
+    _, base_url = start_mock_server_in_thread()
+    return base_url[:-len('/v1')] + '/api'
+
+
+def load_book_texts(book, base_url=None):
+    """Raw (uncleaned) Hebrew and English verse strings for every chapter of book"""
+    client = SefariaClient(base_url=base_url)
+    urls = [f"{client.base_url}/texts/{book}.{chapter}" for chapter in range(1, BOOK_CHAPTERS[book] + 1)]
+    with ThreadPoolExecutor(max_workers=client.max_concurrency) as pool:
+        responses = list(pool.map(lambda url: client._get_with_retry(url).json(), urls))
+    texts = []
+    for data in responses:
+        for key in ('he', 'text'):
+            texts.extend(t for t in data.get(key, []) if isinstance(t, str))
+    return texts
+
+
+def fuzz_texts(count, seed=0):
+    """Random strings of markup fragments, biased towards near-misses of the patterns"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(rng.choice(FUZZ_FRAGMENTS) for _ in range(rng.randint(1, 14)))
+
+
+def add_book_arguments(parser):
+    parser.add_argument('--book', default='Genesis', choices=sorted(BOOK_CHAPTERS), help='Book to fetch')
+    parser.add_argument('--base-url', default=None, help='Sefaria API base URL (default: SEFARIA_BASE_URL or sefaria.org)')
+    parser.add_argument('--mock', action='store_true', help='Fetch from a local mock_llm_server.py stub instead')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check clean_sefaria_text against the original _clean_text')
+    add_book_arguments(parser)
+    parser.add_argument('--fuzz', type=int, default=50000, help='Random strings to compare in addition to the book')
+    args = parser.parse_args()
+
+    base_url = start_mock_sefaria() if args.mock else args.base_url
+    book_texts = load_book_texts(args.book, base_url)
+    texts = EDGE_CASES + book_texts + list(fuzz_texts(args.fuzz))
+
+    changed = 0
+    mismatches = []
+    for text in texts:
+        expected = legacy_clean_text(text)
+        if expected != text:
+            changed += 1
+        got = clean_sefaria_text(text)
+        if got != expected:
+            mismatches.append((text, expected, got))
+
+    print(f"Source: {args.book} ({len(book_texts)} raw verse strings{' from mock server' if args.mock else ''})")
+    print(f"Texts checked: {len(texts)} ({changed} changed by cleaning)")
+    for text, want, got in mismatches[:20]:
+        print(f"MISMATCH input={text!r}\n  expected={want!r}\n  got=     {got!r}")
+    if mismatches:
+        raise SystemExit(f"{len(mismatches)} mismatches")
+    print("All outputs byte-identical")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Token accounting: chapter validation prompt, previous format vs. compact payload
+
+Builds each chapter's validation request both ways and reports input tokens:
+
+  legacy   one user message carrying the instructions plus an indent=2, ASCII-escaped
+           instance list with the full verse Hebrew/English repeated in every instance
+  compact  CHAPTER_VALIDATION_SYSTEM_PROMPT (static, cacheable across chapters) plus a
+           user message with a VERSES table keyed by reference and unindented instances
+
+Chapters come from --database (figurative_language joined to verses, as the recovery
+path sends them) or, without a database, from the recorded detection responses in
+debug/ (verse text reconstructed from the instance fragments). Tokens are counted
+with tiktoken (o200k_base) when installed, otherwise with the pipeline's
+estimate_text_tokens() heuristic.
+
+Usage:
+    python benchmarks/validation_prompt_tokens.py
+    python benchmarks/validation_prompt_tokens.py --database ../database/Pentateuch_Psalms_fig_language.db --top 10
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sqlite3
+import sys
+from collections import OrderedDict
+
+PRIVATE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PRIVATE_DIR)
+sys.path.insert(0, os.path.join(PRIVATE_DIR, 'src'))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark')
+
+from interactive_parallel_processor import estimate_text_tokens  # noqa: E402
+from hebrew_figurative_db.ai_analysis.metaphor_validator import (  # noqa: E402
+    CHAPTER_VALIDATION_SYSTEM_PROMPT, MetaphorValidator,
+)
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+DEBUG_DIR = os.path.join(PRIVATE_DIR, 'debug')
+DEFAULT_DATABASE = os.path.join(os.path.dirname(PRIVATE_DIR), 'database', 'Pentateuch_Psalms_fig_language.db')
+FILENAME_PATTERN = re.compile(r'debug_response_(.+)_(\d+)_\d{8}_\d{6}\.json$')
+FIG_TYPES = ['simile', 'metaphor', 'personification', 'idiom', 'hyperbole', 'metonymy', 'other']
+
+# GPT-5.1 input pricing (USD per 1M tokens); cached input is billed at 10%
+INPUT_PRICE = 1.25
+CACHED_INPUT_PRICE = 0.125
+
+LEGACY_SYSTEM_MESSAGE = "You are a biblical Hebrew scholar specializing in figurative language validation for an entire chapter."
+
+
+def legacy_chapter_validation_prompt(chapter_instances):
+    """MetaphorValidator._create_chapter_validation_prompt before the compact payload (frozen copy)"""
+    prompt_instances = []
+    for instance in chapter_instances:
+        types_to_validate = []
+        for fig_type in FIG_TYPES:
+            if instance.get(fig_type) == 'yes':
+                types_to_validate.append(fig_type)
+
+        prompt_instances.append({
+            "instance_id": instance['instance_id'],
+            "verse_reference": instance.get('verse_reference', ''),
+            "hebrew_text": instance.get('hebrew_text', ''),
+            "english_text": instance.get('english_text', ''),
+            "figurative_text": instance.get('figurative_text', ''),
+            "explanation": instance.get('explanation', ''),
+            "confidence": instance.get('confidence', 0.0),
+            "types": types_to_validate
+        })
+
+    # The instructions were identical to today's system prompt, but followed the per-chapter data
+    instructions = CHAPTER_VALIDATION_SYSTEM_PROMPT.split('TASK:\n', 1)[1].replace(
+        'Review each instance in the DETECTED INSTANCES array.', 'Review each instance in the JSON array above.')
+    return f"""You are a biblical Hebrew scholar validating a list of detected figurative language instances from an entire chapter.
+
+DETECTED INSTANCES FROM ALL VERSES:
+```json
+{json.dumps(prompt_instances, indent=2)}
+```
+
+TASK:
+{instructions}
+Provide your validation output below.
+
+VALIDATION:
+"""
+
+
+def load_database_chapters(path):
+    """{(book, chapter): [instance dicts]} shaped as the pipeline sends them for validation"""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute("""
+        SELECT v.book, v.chapter, v.reference, v.hebrew_text, v.english_text,
+               fl.figurative_text, fl.explanation, fl.confidence, fl.simile, fl.metaphor, fl.personification,
+               fl.idiom, fl.hyperbole, fl.metonymy, fl.other
+        FROM figurative_language fl JOIN verses v ON fl.verse_id = v.id
+        ORDER BY v.book, v.chapter, v.verse, fl.id
+    """)
+    chapters = OrderedDict()
+    for row in rows:
+        instance = {key: row[key] for key in ['figurative_text', 'explanation', 'confidence'] + FIG_TYPES}
+        instance.update(verse_reference=row['reference'], hebrew_text=row['hebrew_text'],
+                        english_text=row['english_text'])
+        chapters.setdefault((row['book'], row['chapter']), []).append(instance)
+    conn.close()
+    return chapters
+
+
+def load_debug_chapters():
+    """Latest recorded detection response per chapter, with verse text rebuilt from the fragments"""
+    latest = {}
+    for path in sorted(glob.glob(os.path.join(DEBUG_DIR, 'debug_response_*.json'))):
+        match = FILENAME_PATTERN.search(os.path.basename(path))
+        if match:
+            latest[(match.group(1), int(match.group(2)))] = path
+
+    chapters = OrderedDict()
+    for (book, chapter), path in sorted(latest.items()):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                verse_results = json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if not isinstance(verse_results, list):
+            continue
+        instances = []
+        for vr in verse_results:
+            verse_instances = vr.get('instances') or []
+            hebrew = ' '.join(i.get('hebrew_text', '') for i in verse_instances)
+            english = ' '.join(i.get('english_text', '') for i in verse_instances)
+            for instance in verse_instances:
+                instance = dict(instance, figurative_text=instance.get('english_text', ''))
+                instance.update(verse_reference=vr.get('reference', f"{book} {chapter}:{vr.get('verse')}"),
+                                hebrew_text=hebrew, english_text=english)
+                instances.append(instance)
+        if instances:
+            chapters[(book, chapter)] = instances
+    return chapters
+
+
+def make_counter():
+    if TIKTOKEN_AVAILABLE:
+        encoding = tiktoken.get_encoding('o200k_base')
+        return lambda text: len(encoding.encode(text)), 'tiktoken o200k_base'
+    return estimate_text_tokens, 'estimate_text_tokens() heuristic'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare chapter validation prompt sizes (legacy vs compact)')
+    parser.add_argument('--database', default=DEFAULT_DATABASE, help='Database to read chapters from')
+    parser.add_argument('--top', type=int, default=5, help='Largest chapters to list individually')
+    args = parser.parse_args()
+
+    if os.path.exists(args.database):
+        chapters, source = load_database_chapters(args.database), args.database
+    else:
+        chapters, source = load_debug_chapters(), DEBUG_DIR
+    if not chapters:
+        print(f"No chapters found in {source}")
+        return
+
+    count_tokens, counter_name = make_counter()
+    validator = MetaphorValidator.__new__(MetaphorValidator)  # Prompt building only, no API client
+    static_tokens = count_tokens(CHAPTER_VALIDATION_SYSTEM_PROMPT)
+
+    rows = []
+    for (book, chapter), instances in chapters.items():
+        for i, instance in enumerate(instances, 1):
+            instance['instance_id'] = i
+        legacy = count_tokens(LEGACY_SYSTEM_MESSAGE) + count_tokens(legacy_chapter_validation_prompt(instances))
+        compact = static_tokens + count_tokens(validator._create_chapter_validation_prompt(instances))
+        rows.append((f"{book} {chapter}", len(instances), legacy, compact))
+
+    total_legacy = sum(r[2] for r in rows)
+    total_compact = sum(r[3] for r in rows)
+    # Every chapter after the first can read the static prefix from the provider's prompt cache
+    cached = static_tokens * (len(rows) - 1)
+    legacy_cost = total_legacy * INPUT_PRICE / 1e6
+    compact_cost = ((total_compact - cached) * INPUT_PRICE + cached * CACHED_INPUT_PRICE) / 1e6
+
+    print(f"Source: {source} ({len(rows)} chapters, {sum(r[1] for r in rows)} instances)")
+    print(f"Token counter: {counter_name}")
+    print(f"Static system prefix: {static_tokens} tokens\n")
+    print(f"{'Chapter':<22}{'Inst':>6}{'Legacy':>10}{'Compact':>10}{'Saved':>8}")
+    for label, count, legacy, compact in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]:
+        print(f"{label:<22}{count:>6}{legacy:>10,}{compact:>10,}{1 - compact / legacy:>8.0%}")
+    print(f"{'TOTAL':<22}{sum(r[1] for r in rows):>6}{total_legacy:>10,}{total_compact:>10,}"
+          f"{1 - total_compact / total_legacy:>8.0%}")
+    print(f"\nInput cost at ${INPUT_PRICE}/1M: legacy ${legacy_cost:.4f}, compact ${compact_cost:.4f} "
+          f"(static prefix cached after the first chapter at ${CACHED_INPUT_PRICE}/1M)")
+
+
+if __name__ == '__main__':
+    main()
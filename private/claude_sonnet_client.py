@@ -6,11 +6,17 @@ Serves as a high-quality fallback when Gemini models fail
 """
 import anthropic
 import os
+import sys
 import json
 import re
 import logging
 from typing import Dict, List, Optional, Tuple, Any, Callable
 
+# Add source path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from hebrew_figurative_db.ai_analysis.json_recovery import RECOVERY_CODE_FENCE, recover_json_array
+
 
 class ClaudeSonnetClient:
     """Claude Sonnet 4 client for figurative language analysis"""
@@ -260,24 +266,10 @@ Begin your analysis:"""
                     self.logger.debug(f"  📄 JSON preview: '{json_string[:200] if len(json_string) > 200 else json_string}'")
 
             if json_string and json_string != "[]":
-                try:
-                    instances = json.loads(json_string)
-                    if self.logger:
-                        self.logger.info(f"  ✅ JSON parsing succeeded")
-                except json.JSONDecodeError as parse_error:
-                    if self.logger:
-                        self.logger.error(f"  ❌ JSON parsing failed: {parse_error}")
-                    # Try to fix common JSON issues
-                    fixed_json = self._fix_json_format(json_string)
-                    if fixed_json:
-                        try:
-                            instances = json.loads(fixed_json)
-                            if self.logger:
-                                self.logger.info("  ✅ JSON parsing succeeded after format repair")
-                        except json.JSONDecodeError:
-                            instances = []
-                    else:
-                        instances = []
+                # Extracted text is already repaired by json_recovery
+                instances = json.loads(json_string, strict=False)
+                if self.logger:
+                    self.logger.info("  ✅ JSON parsing succeeded")
             else:
                 instances = []
 
@@ -289,88 +281,15 @@ Begin your analysis:"""
         return instances, figurative_detection, tagging_analysis
 
     def _extract_json_array(self, response_text: str) -> str:
-        """Extract JSON array using robust logic adapted from Gemini system"""
-
-        if self.logger:
-            self.logger.info(f"    🔍 JSON Array Extraction:")
-
-        # First try to find complete JSON array with proper bracket matching
-        json_match = re.search(r'\[.*?\]', response_text, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(0).strip()
-            if self.logger:
-                self.logger.info(f"      📄 Found JSON-like array: {len(json_str)} chars")
-            # Validate this looks like proper JSON with objects
-            if '{' in json_str and '}' in json_str:
-                if self.logger:
-                    self.logger.info(f"      ✅ Array contains objects - using this match")
-                return json_str
-
-        # Use sophisticated bracket matching for standalone arrays
-        start_bracket = response_text.find('[')
-        if start_bracket != -1:
-            bracket_count = 0
-            in_string = False
-            escape_next = False
-            end_pos = len(response_text)
-
-            for i in range(start_bracket, len(response_text)):
-                char = response_text[i]
-
-                if escape_next:
-                    escape_next = False
-                    continue
-
-                if char == '\\' and in_string:
-                    escape_next = True
-                    continue
-
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-
-                if not in_string:
-                    if char == '[':
-                        bracket_count += 1
-                    elif char == ']':
-                        bracket_count -= 1
-                        if bracket_count == 0:
-                            end_pos = i + 1
-                            break
-
-            candidate_json = response_text[start_bracket:end_pos]
-
-            # Verify this contains objects
-            if '{' in candidate_json and '}' in candidate_json:
-                if self.logger:
-                    self.logger.info(f"      ✅ Bracket-matched array contains objects")
-                return candidate_json.strip()
-
-        # Check if empty array is indicated
-        if '[]' in response_text or 'no figurative language found' in response_text.lower():
+        """Extract the JSON instance array with the shared recovering scanner (json_recovery)"""
+        recovered = recover_json_array(response_text)
+        if recovered.value is None:
             if self.logger:
-                self.logger.info(f"      📄 Empty array pattern detected")
+                self.logger.warning("      ❌ No valid JSON array found - returning empty")
             return "[]"
-
-        if self.logger:
-            self.logger.warning(f"      ❌ No valid JSON array found - returning empty")
-        return "[]"
-
-    def _fix_json_format(self, json_str: str) -> str:
-        """Attempt to fix common JSON formatting issues"""
-        try:
-            # Remove any trailing commas before closing brackets/braces
-            json_str = re.sub(r',\s*}', '}', json_str)
-            json_str = re.sub(r',\s*]', ']', json_str)
-
-            # Fix missing quotes around field names
-            json_str = re.sub(r'(\w+):', r'"\1":', json_str)
-
-            # Try to parse again
-            json.loads(json_str)
-            return json_str
-        except:
-            return None
+        if self.logger and set(recovered.recoveries) - {RECOVERY_CODE_FENCE}:
+            self.logger.warning(f"      ⚠️ JSON recovered from response ({', '.join(recovered.recoveries)})")
+        return recovered.text
 
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get usage statistics"""
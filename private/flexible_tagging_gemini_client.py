@@ -22,6 +22,7 @@ from typing import Optional, Dict
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from hebrew_figurative_db.ai_analysis.gemini_api_multi_model import MultiModelGeminiClient, TextContext
+from hebrew_figurative_db.ai_analysis.json_recovery import RECOVERY_CODE_FENCE, recover_json_array
 
 # Try to import Claude Sonnet client (optional fallback)
 try:
@@ -76,19 +77,8 @@ class FlexibleTaggingGeminiClient(MultiModelGeminiClient):
         # Claude fallback tracking
         self.claude_fallback_count = 0
 
-        # Initialize JSON extraction success tracking for enhanced detection
-        self.json_extraction_successes = {
-            "strategy_1": 0,  # Markdown JSON block extraction
-            "strategy_2": 0,  # Generic code block extraction
-            "strategy_3": 0,  # Enhanced bracket counting
-            "strategy_4": 0,  # Greedy JSON array matching
-            "strategy_5": 0,  # JSON repair for truncated responses
-            "strategy_6": 0,  # Manual object extraction
-            "strategy_7": 0,  # Advanced JSON repair with string escaping
-            "strategy_8": 0,  # Response pre-processing & sanitization
-            "strategy_9": 0,  # Progressive parsing with validation checkpoints
-            "strategy_10": 0   # Manual detection extraction (last resort)
-        }
+        # Detection responses parsed, keyed by the json_recovery repairs applied ('clean' if none)
+        self.json_extraction_successes = {}
 
         # Feature flag for enhanced JSON extraction (gradual rollout)
         self.use_enhanced_json_extraction = True  # Set to False for fallback during testing
@@ -638,31 +628,10 @@ Analysis:"""
                 self.logger.info(f"JSON extracted: {len(json_string)} chars")
 
             if json_string and json_string != "[]":
-                # First try to parse as-is
-                try:
-                    instances = json.loads(json_string)
-                    if self.logger:
-                        self.logger.info(f"  [OK] JSON parsing succeeded on first attempt")
-                except json.JSONDecodeError as parse_error:
-                    if self.logger:
-                        self.logger.error(f"  ❌ Initial JSON parsing failed: {parse_error}")
-                        self.logger.error(f"  ❌ Parse error position: {getattr(parse_error, 'pos', 'unknown')}")
-                        self.logger.error(f"  ❌ Parse error line/col: {getattr(parse_error, 'lineno', 'unknown')}/{getattr(parse_error, 'colno', 'unknown')}")
-                    # Try to fix common JSON issues
-                    fixed_json = self._fix_json_format(json_string)
-                    if fixed_json:
-                        try:
-                            instances = json.loads(fixed_json)
-                            if self.logger:
-                                self.logger.info("  [OK] JSON parsing succeeded after format repair")
-                        except json.JSONDecodeError as repair_error:
-                            if self.logger:
-                                self.logger.error(f"  ❌ JSON format repair also failed: {repair_error}")
-                            raise parse_error  # Re-raise the original error
-                    else:
-                        if self.logger:
-                            self.logger.error(f"  ❌ JSON format repair returned None")
-                        raise parse_error  # Re-raise the original error
+                # Extracted text is already repaired by json_recovery
+                instances = json.loads(json_string, strict=False)
+                if self.logger:
+                    self.logger.info("  [OK] JSON parsing succeeded")
 
                 # Validate that instances are properly formatted dictionaries
                 if isinstance(instances, list):
@@ -799,681 +768,32 @@ Analysis:"""
         # The model_used field is set in analyze_figurative_language_flexible and should not be overwritten
         return result
 
-    def _extract_json_array(self, response_text: str) -> str:
-        """Extract JSON array using robust logic adapted from multi-model system"""
-
-        if self.logger:
-            self.logger.info(f"    🔍 JSON Array Extraction:")
-
-        # First try to find complete JSON array with proper bracket matching
-        json_match = re.search(r'\[.*?\]', response_text, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(0).strip()
-            if self.logger:
-                self.logger.info(f"      📄 Found JSON-like array: {len(json_str)} chars")
-                self.logger.info(f"      📄 Array content: '{json_str}'")
-            # Validate this looks like proper JSON with objects
-            if '{' in json_str and '}' in json_str:
-                if self.logger:
-                    self.logger.info(f"      [OK] Array contains objects - using this match")
-                return json_str
-            elif self.logger:
-                self.logger.info(f"      [WARNING] Array doesn't contain objects - continuing search")
-
-        # Look for JSON OUTPUT section specifically
-        json_output_match = re.search(r'(?:STRUCTURED )?JSON OUTPUT\s*:?\s*(.*?)(?:\s*$)', response_text, re.IGNORECASE | re.DOTALL)
-        if json_output_match:
-            json_section = json_output_match.group(1).strip()
-            if self.logger:
-                self.logger.info(f"      📄 Found JSON OUTPUT section: {len(json_section)} chars")
-            # Extract array from this section with more robust bracket matching
-            array_match = re.search(r'(\[[\s\S]*?\])', json_section)
-            if array_match:
-                candidate_json = array_match.group(1).strip()
-                # Check if the JSON appears complete by looking for proper structure
-                if self._is_json_complete(candidate_json):
-                    if self.logger:
-                        self.logger.info(f"      [OK] Found complete array in JSON OUTPUT section")
-                    return candidate_json
-                else:
-                    if self.logger:
-                        self.logger.warning(f"      [WARNING] JSON appears incomplete in OUTPUT section")
-                    # Continue to other extraction methods
-        elif self.logger:
-            self.logger.info(f"      [WARNING] No JSON OUTPUT section found")
-
-        # Use sophisticated bracket matching for standalone arrays
-        start_bracket = response_text.find('[')
-        if start_bracket != -1:
-            if self.logger:
-                self.logger.info(f"      📄 Attempting sophisticated bracket matching from position {start_bracket}")
-
-            bracket_count = 0
-            in_string = False
-            escape_next = False
-            end_pos = len(response_text)
-
-            for i in range(start_bracket, len(response_text)):
-                char = response_text[i]
-
-                if escape_next:
-                    escape_next = False
-                    continue
-
-                if char == '\\' and in_string:
-                    escape_next = True
-                    continue
-
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-
-                if not in_string:
-                    if char == '[':
-                        bracket_count += 1
-                    elif char == ']':
-                        bracket_count -= 1
-                        if bracket_count == 0:
-                            end_pos = i + 1
-                            break
-
-            candidate_json = response_text[start_bracket:end_pos]
-
-            if self.logger:
-                self.logger.info(f"      📄 Bracket matching found: {len(candidate_json)} chars")
-
-            # Verify this contains objects
-            if '{' in candidate_json and '}' in candidate_json:
-                if self.logger:
-                    self.logger.info(f"      [OK] Bracket-matched array contains objects")
-                return candidate_json.strip()
-            elif self.logger:
-                self.logger.info(f"      [WARNING] Bracket-matched array doesn't contain objects")
-        elif self.logger:
-            self.logger.info(f"      [WARNING] No opening bracket '[' found in response")
-
-        # Check if empty array is indicated
-        if '[]' in response_text or 'no figurative language found' in response_text.lower():
-            if self.logger:
-                self.logger.info(f"      📄 Empty array pattern detected")
-            return "[]"
-
-        if self.logger:
-            self.logger.warning(f"      ❌ No valid JSON array found - returning empty")
-        return "[]"
-
-    def _is_json_complete(self, json_str: str) -> bool:
-        """Check if JSON string appears to be complete with required fields"""
-        try:
-            # Basic completeness check - must have required fields
-            required_fields = ['figurative_language', 'confidence', 'target', 'vehicle', 'ground', 'posture']
-
-            # Check if JSON ends with proper closing bracket
-            if not json_str.strip().endswith(']'):
-                return False
-
-            # Check if it contains most required fields
-            found_fields = sum(1 for field in required_fields if f'"{field}"' in json_str)
-
-            # Consider complete if it has most required fields (allows for some flexibility)
-            return found_fields >= 4
-        except:
-            return False
-
     def _extract_json_with_fallbacks(self, response_text: str, context: str = "detection") -> Optional[str]:
         """
-        Extract JSON from response text using 10 robust fallback strategies adapted from validation system.
-
-        This method implements the same 10-strategy approach that has proven successful in the
-        validation phase, adapted for detection-phase JSON structure (figurative language instances).
+        Extract detection JSON with the shared recovering scanner (json_recovery).
 
         Args:
             response_text: The API response text containing JSON
             context: Context description for logging (e.g., verse reference)
 
         Returns:
-            JSON string if successful, None if all strategies fail
-        """
-
-        if self.logger:
-            self.logger.info(f"🔍 Enhanced JSON Extraction with 10 strategies for {context}")
-
-        # Strategy 1: Standard markdown JSON block extraction
-        json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response_text, re.DOTALL)
-        if json_match:
-            json_string = json_match.group(1).strip()
-            try:
-                # Validate it looks like detection JSON (contains figurative language fields)
-                if self._validate_detection_json(json_string):
-                    self.json_extraction_successes["strategy_1"] += 1
-                    if self.logger:
-                        self.logger.info(f"  ✅ Strategy 1 (markdown JSON) successful for {context}")
-                    return json_string
-                else:
-                    if self.logger:
-                        self.logger.debug(f"Strategy 1 JSON doesn't match detection structure for {context}")
-            except Exception as e:
-                if self.logger:
-                    self.logger.warning(f"Strategy 1 failed for {context}: {e}")
-
-        # Strategy 2: Generic code block extraction (without json specifier)
-        json_match = re.search(r'```\s*([\s\S]*?)\s*```', response_text, re.DOTALL)
-        if json_match:
-            json_string = json_match.group(1).strip()
-            try:
-                if self._validate_detection_json(json_string):
-                    self.json_extraction_successes["strategy_2"] += 1
-                    if self.logger:
-                        self.logger.info(f"  ✅ Strategy 2 (generic code block) successful for {context}")
-                    return json_string
-                else:
-                    if self.logger:
-                        self.logger.debug(f"Strategy 2 JSON doesn't match detection structure for {context}")
-            except Exception as e:
-                if self.logger:
-                    self.logger.warning(f"Strategy 2 failed for {context}: {e}")
-
-        # Strategy 3: Enhanced bracket counting algorithm (use existing sophisticated logic)
-        try:
-            result = self._extract_with_enhanced_bracket_counting(response_text, context)
-            if result:
-                return result
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 3 failed for {context}: {e}")
-
-        # Strategy 4: Greedy JSON array matching
-        json_pattern = r'\[\s*\{[\s\S]*\}\s*\]'  # More permissive pattern for large arrays
-        json_match = re.search(json_pattern, response_text)
-        if json_match:
-            json_string = json_match.group(0)
-            try:
-                if self._validate_detection_json(json_string):
-                    self.json_extraction_successes["strategy_4"] += 1
-                    if self.logger:
-                        self.logger.info(f"  ✅ Strategy 4 (greedy matching) successful for {context}")
-                    return json_string
-                else:
-                    if self.logger:
-                        self.logger.debug(f"Strategy 4 JSON doesn't match detection structure for {context}")
-            except Exception as e:
-                if self.logger:
-                    self.logger.warning(f"Strategy 4 failed for {context}: {e}")
-
-        # Strategy 5: JSON repair for truncated responses
-        try:
-            result = self._repair_truncated_json(response_text, context)
-            if result:
-                return result
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 5 failed for {context}: {e}")
-
-        # Strategy 6: Manual object extraction
-        try:
-            result = self._extract_detection_objects_manually(response_text, context)
-            if result:
-                return result
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 6 failed for {context}: {e}")
-
-        # Strategy 7: Advanced JSON repair with string escaping
-        try:
-            result = self._advanced_json_repair(response_text, context)
-            if result:
-                return result
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 7 failed for {context}: {e}")
-
-        # Strategy 8: Response pre-processing & sanitization
-        try:
-            result = self._sanitize_and_extract(response_text, context)
-            if result:
-                return result
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 8 failed for {context}: {e}")
-
-        # Strategy 9: Progressive parsing with validation checkpoints
-        try:
-            result = self._progressive_parsing(response_text, context)
-            if result:
-                return result
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 9 failed for {context}: {e}")
-
-        # Strategy 10: Manual detection extraction (last resort)
-        try:
-            result = self._manual_detection_extraction(response_text, context)
-            if result:
-                return result
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 10 failed for {context}: {e}")
-
-        # All strategies failed
-        if self.logger:
-            self.logger.error(f"❌ All 10 JSON extraction strategies failed for {context}")
-            self.logger.error(f"Response length: {len(response_text)} characters")
-            self.logger.error(f"Response preview: {response_text[:200]}...{response_text[-200:] if len(response_text) > 400 else response_text[-200:]}")
-
-        return None
-
-    def _validate_detection_json(self, json_string: str) -> bool:
-        """
-        Validate that JSON string matches detection-phase structure.
-
-        Detection JSON should contain figurative language instances with fields like:
-        - figurative_language, metaphor, simile, personification, etc.
-        - target, vehicle, ground, posture arrays
-        - confidence, explanation
+            JSON string of the recovered instance array if it holds detection-like objects, None otherwise
+            (_extract_json_array, inherited from MultiModelGeminiClient, returns "[]" in that case)
         """
-        try:
-            # Quick validation by loading and checking structure
-            parsed = json.loads(json_string)
-
-            if not isinstance(parsed, list):
-                return False
-
-            # Check at least one object has detection-like fields
-            detection_fields = ['figurative_language', 'metaphor', 'simile', 'confidence', 'target']
-
-            for obj in parsed:
-                if isinstance(obj, dict) and any(field in obj for field in detection_fields):
-                    return True
-
-            return False
-
-        except json.JSONDecodeError:
-            return False
-        except Exception:
-            return False
-
-    def _extract_with_enhanced_bracket_counting(self, response_text: str, context: str) -> Optional[str]:
-        """Strategy 3: Enhanced bracket counting with string awareness (adapted from existing logic)"""
-
-        if self.logger:
-            self.logger.debug(f"  🔧 Strategy 3: Enhanced bracket counting for {context}")
-
-        start_bracket = response_text.find('[')
-        if start_bracket != -1:
-            bracket_count = 0
-            in_string = False
-            escape_next = False
-            end_pos = len(response_text)
-
-            for i in range(start_bracket, len(response_text)):
-                char = response_text[i]
-
-                if escape_next:
-                    escape_next = False
-                    continue
-
-                if char == '\\' and in_string:
-                    escape_next = True
-                    continue
-
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-
-                if not in_string:
-                    if char == '[':
-                        bracket_count += 1
-                    elif char == ']':
-                        bracket_count -= 1
-                        if bracket_count == 0:
-                            end_pos = i + 1
-                            break
-
-            candidate_json = response_text[start_bracket:end_pos]
-
-            # Verify this contains detection-like objects
-            if '{' in candidate_json and any(field in candidate_json for field in ['figurative_language', 'metaphor', 'confidence']):
-                if self._validate_detection_json(candidate_json):
-                    self.json_extraction_successes["strategy_3"] += 1
-                    if self.logger:
-                        self.logger.info(f"  ✅ Strategy 3 (enhanced bracket counting) successful for {context}")
-                    return candidate_json.strip()
-
-        return None
-
-    def _repair_truncated_json(self, response_text: str, context: str) -> Optional[str]:
-        """Strategy 5: JSON repair for truncated responses"""
-
-        if self.logger:
-            self.logger.debug(f"  🔧 Strategy 5: JSON repair for {context}")
-
-        first_bracket = response_text.find('[')
-        if first_bracket != -1:
-            truncated_json = response_text[first_bracket:]
-
-            # Count braces and brackets to identify missing closings
-            open_braces = truncated_json.count('{')
-            close_braces = truncated_json.count('}')
-            open_brackets = truncated_json.count('[')
-            close_brackets = truncated_json.count(']')
-
-            if self.logger:
-                self.logger.debug(f"  JSON structure analysis for {context}: "
-                               f"{open_braces} {{ vs {close_braces} }}, "
-                               f"{open_brackets} [ vs {close_brackets} ]")
-
-            # Add missing closing brackets and braces
-            missing_braces = open_braces - close_braces
-            missing_brackets = open_brackets - close_brackets
-
-            repaired_json = truncated_json
-            # Add closing brackets first (inner structures)
-            for _ in range(missing_brackets):
-                repaired_json += ']'
-            # Add closing braces (outer structures)
-            for _ in range(missing_braces):
-                repaired_json += '}'
-
-            if self._validate_detection_json(repaired_json):
-                self.json_extraction_successes["strategy_5"] += 1
-                if self.logger:
-                    self.logger.info(f"  ✅ Strategy 5 (JSON repair) successful for {context} "
-                                   f"- added {missing_brackets} ] and {missing_braces} }}")
-                return repaired_json
-
-        return None
-
-    def _extract_detection_objects_manually(self, response_text: str, context: str) -> Optional[str]:
-        """Strategy 6: Manual object extraction adapted for detection structure"""
-
-        if self.logger:
-            self.logger.debug(f"  🔧 Strategy 6: Manual object extraction for {context}")
-
-        try:
-            # Look for individual detection objects in the response
-            object_pattern = r'\{\s*"(?:figurative_language|metaphor|simile|confidence)"\s*:[\s\S]*?\}'
-            objects = re.findall(object_pattern, response_text)
-
-            if objects:
-                # Try to parse each object individually
-                valid_objects = []
-                for i, obj_str in enumerate(objects):
-                    try:
-                        # Try to complete the object if truncated
-                        if not obj_str.rstrip().endswith('}'):
-                            obj_str += '}'
-                        obj = json.loads(obj_str)
-
-                        # Ensure it has detection-like structure
-                        if any(field in obj for field in ['figurative_language', 'metaphor', 'simile', 'confidence']):
-                            valid_objects.append(obj)
-
-                    except json.JSONDecodeError:
-                        continue
-
-                if valid_objects:
-                    self.json_extraction_successes["strategy_6"] += 1
-                    if self.logger:
-                        self.logger.info(f"  ✅ Strategy 6 (manual extraction) successful for {context} "
-                                       f"- extracted {len(valid_objects)} objects")
-                    return json.dumps(valid_objects)
-
-        except Exception as e:
-            if self.logger:
-                self.logger.debug(f"Strategy 6 extraction error: {e}")
-
-        return None
-
-    def _advanced_json_repair(self, response_text: str, context: str) -> Optional[str]:
-        """Strategy 7: Advanced JSON repair with string escaping fixes"""
-
-        if self.logger:
-            self.logger.debug(f"  🔧 Strategy 7: Advanced JSON repair for {context}")
-
-        try:
-            first_bracket = response_text.find('[')
-            if first_bracket != -1:
-                json_candidate = response_text[first_bracket:]
-
-                # Advanced string escaping fixes for detection JSON
-                # Fix unescaped quotes in figurative text fields
-                json_candidate = re.sub(
-                    r'("(?:figurative_text|explanation|hebrew_text|english_text)"\s*:\s*")([^"]*)"([^,\]\}])',
-                    lambda m: m.group(1) + m.group(2).replace('\\', '\\\\').replace('"', '\\"') + '"' + m.group(3),
-                    json_candidate
-                )
-
-                # Fix common JSON corruption patterns
-                # 1. Fix missing commas between objects
-                json_candidate = re.sub(r'\}\s*\{', '},{', json_candidate)
-                # 2. Fix trailing commas
-                json_candidate = re.sub(r',(\s*[}\]])', r'\1', json_candidate)
-                # 3. Fix missing quotes around property names
-                json_candidate = re.sub(r'(\{|\,)\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:', r'\1 "\2":', json_candidate)
-
-                # Count and fix brackets/braces
-                open_braces = json_candidate.count('{')
-                close_braces = json_candidate.count('}')
-                open_brackets = json_candidate.count('[')
-                close_brackets = json_candidate.count(']')
-
-                # Add missing closing brackets
-                missing_braces = open_braces - close_braces
-                missing_brackets = open_brackets - close_brackets
-
-                # Smart completion
-                if missing_braces > 0 or missing_brackets > 0:
-                    for _ in range(missing_brackets):
-                        json_candidate += ']'
-                    for _ in range(missing_braces):
-                        json_candidate += '}'
-
-                if self._validate_detection_json(json_candidate):
-                    self.json_extraction_successes["strategy_7"] += 1
-                    if self.logger:
-                        self.logger.info(f"  ✅ Strategy 7 (advanced JSON repair) successful for {context}")
-                    return json_candidate
-
-        except Exception as e:
-            if self.logger:
-                self.logger.debug(f"Strategy 7 error: {e}")
-
-        return None
-
-    def _sanitize_and_extract(self, response_text: str, context: str) -> Optional[str]:
-        """Strategy 8: Response pre-processing & sanitization"""
-
-        if self.logger:
-            self.logger.debug(f"  🔧 Strategy 8: Response sanitization for {context}")
-
-        try:
-            # Clean the response text before extraction
-            cleaned_response = response_text
-
-            # Remove markdown formatting artifacts
-            cleaned_response = re.sub(r'```[a-zA-Z]*\s*', '', cleaned_response)
-            cleaned_response = re.sub(r'```\s*$', '', cleaned_response)
-
-            # Remove common non-JSON text patterns for detection
-            cleaned_response = re.sub(r'DETECTION\s*RESULTS?\s*:', '', cleaned_response, flags=re.IGNORECASE)
-            cleaned_response = re.sub(r'Figurative language.*?(?=\[)', '', cleaned_response, flags=re.IGNORECASE|re.DOTALL)
-            cleaned_response = re.sub(r'```.*?```\s*', '', cleaned_response, flags=re.DOTALL)
-
-            # Normalize whitespace but preserve structure
-            cleaned_response = re.sub(r'\s+', ' ', cleaned_response)
-            cleaned_response = cleaned_response.strip()
-
-            # Try standard extraction on cleaned text
-            if '[' in cleaned_response:
-                json_match = re.search(r'\[[\s\S]*\]', cleaned_response, re.DOTALL)
-                if json_match:
-                    json_string = json_match.group(0)
-                    if self._validate_detection_json(json_string):
-                        self.json_extraction_successes["strategy_8"] += 1
-                        if self.logger:
-                            self.logger.info(f"  ✅ Strategy 8 (sanitization) successful for {context}")
-                        return json_string
-
-        except Exception as e:
-            if self.logger:
-                self.logger.debug(f"Strategy 8 error: {e}")
-
-        return None
-
-    def _progressive_parsing(self, response_text: str, context: str) -> Optional[str]:
-        """Strategy 9: Progressive parsing with validation checkpoints"""
-
-        if self.logger:
-            self.logger.debug(f"  🔧 Strategy 9: Progressive parsing for {context}")
-
-        try:
-            first_bracket = response_text.find('[')
-            if first_bracket != -1:
-                # Find all object starts
-                object_starts = []
-                pos = first_bracket
-                depth = 0
-
-                while pos < len(response_text):
-                    if response_text[pos] == '{':
-                        if depth == 0:
-                            object_starts.append(pos)
-                        depth += 1
-                    elif response_text[pos] == '}':
-                        depth -= 1
-                    elif response_text[pos] == ']' and depth == 0:
-                        break
-                    pos += 1
-
-                detection_results = []
-
-                # Parse each object individually
-                for i, obj_start in enumerate(object_starts):
-                    try:
-                        # Find the end of this object
-                        obj_end = obj_start
-                        brace_depth = 1
-
-                        while obj_end < len(response_text) - 1 and brace_depth > 0:
-                            obj_end += 1
-                            if response_text[obj_end] == '{':
-                                brace_depth += 1
-                            elif response_text[obj_end] == '}':
-                                brace_depth -= 1
-
-                        obj_str = response_text[obj_start:obj_end + 1]
-
-                        # Try to parse the object
-                        obj = json.loads(obj_str)
-
-                        # Validate it's a detection object
-                        if any(field in obj for field in ['figurative_language', 'metaphor', 'simile', 'confidence']):
-                            # Ensure required fields with defaults
-                            if 'figurative_language' not in obj:
-                                obj['figurative_language'] = 'no' if any(obj.get(t) == 'yes' for t in ['metaphor', 'simile', 'personification']) else 'yes'
-                            if 'confidence' not in obj:
-                                obj['confidence'] = 0.8
-
-                            detection_results.append(obj)
-
-                    except (json.JSONDecodeError, Exception) as e:
-                        # Create minimal detection object for this instance
-                        minimal_obj = {
-                            'figurative_language': 'no',
-                            'confidence': 0.5,
-                            'metaphor': 'no',
-                            'simile': 'no',
-                            'personification': 'no',
-                            'idiom': 'no',
-                            'hyperbole': 'no',
-                            'metonymy': 'no',
-                            'other': 'no',
-                            'explanation': f'Progressive parsing fallback: {str(e)[:100]}'
-                        }
-                        detection_results.append(minimal_obj)
-                        if self.logger:
-                            self.logger.debug(f"Created minimal object for instance {i + 1} due to: {e}")
-
-                if detection_results:
-                    self.json_extraction_successes["strategy_9"] += 1
-                    if self.logger:
-                        self.logger.info(f"  ✅ Strategy 9 (progressive parsing) successful for {context} - extracted {len(detection_results)} objects")
-                    return json.dumps(detection_results)
-
-        except Exception as e:
+        recovered = recover_json_array(response_text)
+        detection_fields = ['figurative_language', 'metaphor', 'simile', 'confidence', 'target']
+        if not recovered.value or not any(isinstance(obj, dict) and any(field in obj for field in detection_fields)
+                                          for obj in recovered.value):
             if self.logger:
-                self.logger.debug(f"Strategy 9 error: {e}")
-
-        return None
-
-    def _manual_detection_extraction(self, response_text: str, context: str) -> Optional[str]:
-        """Strategy 10: Manual detection extraction (last resort)"""
-
-        if self.logger:
-            self.logger.debug(f"  🔧 Strategy 10: Manual detection extraction for {context}")
-
-        try:
-            # Create minimal detection results based on text analysis
-            detection_results = []
-
-            # Look for indicators of figurative language in the text
-            figurative_indicators = [
-                'metaphor', 'simile', 'personification', 'idiom', 'hyperbole', 'metonymy',
-                'like', 'as', 'compare', 'comparison', 'figure', 'image', 'symbol'
-            ]
-
-            has_figurative_language = any(indicator.lower() in response_text.lower() for indicator in figurative_indicators)
-
-            if has_figurative_language:
-                # Create a minimal detection object
-                detection_results.append({
-                    'figurative_language': 'yes',
-                    'confidence': 0.6,
-                    'metaphor': 'yes' if 'metaphor' in response_text.lower() else 'no',
-                    'simile': 'yes' if 'like' in response_text.lower() or 'as' in response_text.lower() else 'no',
-                    'personification': 'no',
-                    'idiom': 'no',
-                    'hyperbole': 'no',
-                    'metonymy': 'no',
-                    'other': 'no',
-                    'figurative_text': 'Manual extraction from corrupted response',
-                    'explanation': 'Fallback extraction due to JSON corruption - requires manual review',
-                    'target': ['unknown'],
-                    'vehicle': ['unknown'],
-                    'ground': ['unknown'],
-                    'posture': ['unknown']
-                })
-            else:
-                # No figurative language detected
-                detection_results.append({
-                    'figurative_language': 'no',
-                    'confidence': 0.9,
-                    'metaphor': 'no',
-                    'simile': 'no',
-                    'personification': 'no',
-                    'idiom': 'no',
-                    'hyperbole': 'no',
-                    'metonymy': 'no',
-                    'other': 'no',
-                    'figurative_text': '',
-                    'explanation': 'No figurative language detected in manual extraction',
-                    'target': [],
-                    'vehicle': [],
-                    'ground': [],
-                    'posture': []
-                })
-
-            if detection_results:
-                self.json_extraction_successes["strategy_10"] += 1
-                if self.logger:
-                    self.logger.info(f"  ✅ Strategy 10 (manual extraction) successful for {context} - created fallback object")
-                return json.dumps(detection_results)
-
-        except Exception as e:
-            if self.logger:
-                self.logger.debug(f"Strategy 10 error: {e}")
+                self.logger.debug(f"No detection JSON found for {context} ({len(response_text)} chars)")
+            return None
 
-        return None
+        key = '+'.join(recovered.recoveries) or 'clean'
+        self.json_extraction_successes[key] = self.json_extraction_successes.get(key, 0) + 1
+        if self.logger and set(recovered.recoveries) - {RECOVERY_CODE_FENCE}:
+            self.logger.warning(f"Recovered {len(recovered.value)} instances for {context} "
+                                f"({', '.join(recovered.recoveries)})")
+        return recovered.text
 
     def _validate_instance_format(self, instance: dict):
         """Ensure instance has all required fields with proper defaults"""
@@ -1634,48 +954,18 @@ Analysis:"""
         return base_info
 
     def get_json_extraction_stats(self) -> Dict:
-        """Get comprehensive JSON extraction statistics for the enhanced detection system"""
+        """Get JSON extraction statistics: detection responses by the recoveries they needed"""
         total_extractions = sum(self.json_extraction_successes.values())
-
-        if total_extractions == 0:
-            return {
-                'total_extractions': 0,
-                'strategy_usage': self.json_extraction_successes.copy(),
-                'most_successful_strategy': 'None',
-                'success_rate': 0.0
-            }
-
-        # Find most successful strategy
-        most_successful = max(self.json_extraction_successes.items(), key=lambda x: x[1])
+        repaired = sum(count for key, count in self.json_extraction_successes.items()
+                       if key not in ('clean', RECOVERY_CODE_FENCE))
 
         return {
             'total_extractions': total_extractions,
-            'strategy_usage': self.json_extraction_successes.copy(),
-            'most_successful_strategy': f"{most_successful[0]} ({most_successful[1]} uses)",
-            'enhanced_extraction_enabled': self.use_enhanced_json_extraction,
-            'strategy_success_rates': {
-                strategy: count / total_extractions * 100
-                for strategy, count in self.json_extraction_successes.items()
-                if count > 0
-            }
+            'recovery_usage': self.json_extraction_successes.copy(),
+            'repaired_rate': repaired / total_extractions * 100 if total_extractions else 0.0,
+            'enhanced_extraction_enabled': self.use_enhanced_json_extraction
         }
 
-    def _fix_json_format(self, json_str: str) -> str:
-        """Attempt to fix common JSON formatting issues"""
-        try:
-            # Remove any trailing commas before closing brackets/braces
-            json_str = re.sub(r',\s*}', '}', json_str)
-            json_str = re.sub(r',\s*]', ']', json_str)
-
-            # Fix missing quotes around field names
-            json_str = re.sub(r'(\w+):', r'"\1":', json_str)
-
-            # Try to parse again
-            json.loads(json_str)
-            return json_str
-        except:
-            return None
-
     def _call_detection_only(self, hebrew_text: str, english_text: str, book: str, chapter: int):
         """
         Step 1: Detection only - simplified prompt for identifying figurative language
@@ -1760,7 +1050,7 @@ Analysis:"""
             instances = []
             if json_string and json_string != "[]":
                 try:
-                    instances = json.loads(json_string)
+                    instances = json.loads(json_string, strict=False)
                 except json.JSONDecodeError:
                     pass
 
@@ -1856,7 +1146,7 @@ Analysis:"""
             validated_instances = []
             if json_string and json_string != "[]":
                 try:
-                    validated_instances = json.loads(json_string)
+                    validated_instances = json.loads(json_string, strict=False)
                 except json.JSONDecodeError:
                     pass
 
@@ -1960,7 +1250,7 @@ Analysis:"""
             tagged_instances = []
             if json_string and json_string != "[]":
                 try:
-                    tagged_instances = json.loads(json_string)
+                    tagged_instances = json.loads(json_string, strict=False)
                     # Ensure all instances have hierarchical tags
                     for instance in tagged_instances:
                         if 'target' not in instance:
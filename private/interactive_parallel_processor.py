@@ -15,12 +15,14 @@ import json
 import time
 import re
 import uuid
-import hashlib
+import heapq
+import sqlite3
 import concurrent.futures
 import threading
 import queue
+import shutil
+from collections import deque
 from datetime import datetime
-from pathlib import Path
 from dotenv import load_dotenv
 from typing import List, Dict, Tuple, Optional, Any
 
@@ -100,62 +102,107 @@ VERSE_ESTIMATES = {
 MAX_COMPLETION_TOKENS_DEFAULT = 65536
 MAX_COMPLETION_TOKENS_PROPHETIC = 100000  # Higher limit for Jeremiah, Isaiah
 
+# Adaptive chapter splitting - chapters whose estimated output exceeds the model's budget
+# are split into verse windows that share one chapter context and run in parallel
+DETECTION_MODEL = "gpt-5.1"
+DETECTION_WINDOW_OUTPUT_BUDGET = {"gpt-5.1": 32000}  # Estimated completion tokens per window
+MAX_PARALLEL_DETECTION_WINDOWS = 4
+
+# Chapter scheduling - workload estimates and the global in-flight token budget
+# Calibrated against the raw responses in debug/ (~1,600 output chars per verse plus reasoning)
+PROMPT_OVERHEAD_TOKENS = 2500               # Static instructions + system message
+COMPLETION_TOKENS_PER_VERSE_ESTIMATE = 600  # Visible JSON + reasoning tokens per verse
+AVG_HEBREW_CHARS_PER_VERSE = 160            # Used when no cached Sefaria text is available
+AVG_ENGLISH_CHARS_PER_VERSE = 140
+REQUEST_OVERHEAD_SECONDS = 10.0             # Connection + time-to-first-token
+OUTPUT_TOKENS_PER_SECOND = 60.0             # Observed GPT-5.1 medium streaming rate
+INFLIGHT_TOKEN_BUDGET = 250000              # Max estimated tokens across concurrently running chapters
+
+# WriteQueue - queued chapters written per commit when the writer falls behind
+WRITE_QUEUE_MAX_COALESCED_CHAPTERS = 8
+WRITE_QUEUE_VALIDATION_WORKERS = 3          # Threads making validator calls for written chapters (off the writer)
+
+# Run controller - spend ceilings, tokens-per-minute target, stall handling and the live dashboard.
+# Ceilings and the target default to off; main() reads them from RUN_SOFT_COST_LIMIT,
+# RUN_HARD_COST_LIMIT and RUN_TOKENS_PER_MINUTE (RUN_DASHBOARD=0 turns the dashboard off).
+RUN_SOFT_COST_LIMIT = None                  # USD spent after which no new chapters start (the run drains)
+RUN_HARD_COST_LIMIT = None                  # USD the run's spend plus in-flight projections may never exceed
+RUN_TOKENS_PER_MINUTE = None                # Estimated tokens started per rolling minute
+STALL_FACTOR = 3.0                          # A chapter running this many times its predicted seconds is stalled...
+STALL_MIN_SECONDS = 300.0                   # ...once it has also run this long
+CONCURRENCY_COOLDOWN_SECONDS = 60.0         # Minimum time between two concurrency reductions
+CONCURRENCY_RECOVERY_CHAPTERS = 3           # Healthy completions before reduced concurrency grows by one
+DASHBOARD_REFRESH_SECONDS = 1.0             # Live dashboard redraw interval (terminal)
+DASHBOARD_LOG_SECONDS = 30.0                # [DASHBOARD] log line interval when stdout is not a terminal
+
+# Batch submission mode - detection and validation prompts go to provider batch jobs instead of
+# synchronous calls. Off by default; main() reads BATCH_API ('openai', or 'local' for the
+# file-based stand-in) and BATCH_POLL_SECONDS.
+BATCH_POLL_SECONDS = 60.0                   # Interval between job status checks
+BATCH_LOCAL_POLL_SECONDS = 2.0              # ...for the local stand-in
+BATCH_LOCAL_WORKERS = 4                     # Requests the local stand-in answers concurrently
+
 # Output directory for all pipeline outputs (databases, logs, manifests, debug files)
 # Located at project root level: Bible/output/
 OUTPUT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "output"))
 
+# On-disk TransformMemo store shared by all runs (non-sacred / stripped text outputs)
+TRANSFORM_MEMO_PATH = os.path.join(OUTPUT_DIR, "transform_memo.db")
+# Reported detection usage of earlier runs, used to calibrate the local token estimates per book
+TOKEN_USAGE_PATH = os.path.join(OUTPUT_DIR, "token_usage.db")
+# Sefaria chapter text (imports a legacy .sefaria_cache/ directory on first open)
+SEFARIA_TEXT_STORE_PATH = os.path.join(OUTPUT_DIR, "sefaria_texts.db")
+# Batch job files (and the local stand-in's jobs)
+BATCH_JOBS_DIR = os.path.join(OUTPUT_DIR, "batch_jobs")
+
+# Sefaria prefetch: fetch text for every queued chapter (and, with whole-book prefetch,
+# every other chapter of the selected books) before any chapter worker starts
+SEFARIA_PREFETCH_WHOLE_BOOKS = True
+
 from hebrew_figurative_db.text_extraction.sefaria_client import SefariaClient
+from hebrew_figurative_db.text_extraction.sefaria_text_store import SefariaTextStore
 from hebrew_figurative_db.database.db_manager import DatabaseManager
-from hebrew_figurative_db.text_extraction.hebrew_utils import HebrewTextProcessor
+from hebrew_figurative_db.database.records import EMPTY_JSON_LIST, InstanceRecord, ValidationRecord, VerseRecord
 from hebrew_figurative_db.text_extraction.hebrew_divine_names_modifier import HebrewDivineNamesModifier
+from hebrew_figurative_db.text_extraction.transform_memo import configure_transform_memo, get_transform_memo
 from hebrew_figurative_db.ai_analysis.metaphor_validator import MetaphorValidator
+from hebrew_figurative_db.ai_analysis.json_recovery import RECOVERY_CODE_FENCE, recover_json_array
+from hebrew_figurative_db.ai_analysis.structured_output import (
+    DETECTION_FIELD, DETECTION_FORMAT_NOTE, PYDANTIC_AVAILABLE, detection_response_format,
+    parse_structured_detection, recover_structured_array, structured_output_enabled,
+)
+from hebrew_figurative_db.ai_analysis.token_accounting import (
+    BATCH_PRICE_FACTOR, USAGE_ESTIMATED, USAGE_PARTIAL, USAGE_REPORTED, configure_token_estimator,
+    get_token_estimator, merge_token_metadata, token_cost, usage_to_token_metadata,
+)
+from hebrew_figurative_db.ai_analysis.batch_jobs import (
+    LocalBatchBackend, OpenAIBatchBackend, batch_request_line, wait_for_batches, write_batch_files,
+)
 
 # Import our flexible tagging client
 from flexible_tagging_gemini_client import FlexibleTaggingGeminiClient
+from pipeline_profiler import (
+    STAGE_ADMISSION_WAIT, STAGE_ASSEMBLE, STAGE_BUDGET_WAIT, STAGE_CHAPTER, STAGE_COMMIT, STAGE_FETCH, STAGE_FIRST_TOKEN, STAGE_PARSE,
+    STAGE_PROMPT, STAGE_QUEUE_WAIT, STAGE_REQUEST, STAGE_STREAM, STAGE_VALIDATION, STAGE_WRITE,
+    STAGE_WRITE_QUEUE_WAIT, STAGE_WRITER_LATENCY, configure_profiler, get_profiler,
+)
 
 # OpenAI import for batched processing
 from openai import OpenAI
 
-# Pydantic for JSON schema validation
-try:
-    from pydantic import BaseModel, Field, ValidationError
-    from typing import Literal
-    PYDANTIC_AVAILABLE = True
-except ImportError:
-    PYDANTIC_AVAILABLE = False
 
+def create_openai_client() -> OpenAI:
+    """Create the OpenAI client used for batched detection.
 
-# JSON Schema Models for LLM Response Validation
-if PYDANTIC_AVAILABLE:
-    class FigurativeInstance(BaseModel):
-        """Schema for a single figurative language instance from LLM.
+    Set OPENAI_BASE_URL (e.g. http://127.0.0.1:8765/v1 with mock_llm_server.py)
+    to run the pipeline against a local OpenAI-compatible server instead of the live API.
+    """
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"), base_url=os.getenv("OPENAI_BASE_URL") or None)
 
-        NOTE: For batched mode, the verse field is at the parent (verse result) level,
-        not at the instance level. Instances use 'english_text' not 'figurative_text'.
-        This schema validates the INSTANCE structure only (within verse.instances[]).
-        """
-        figurative_language: Optional[str] = Field(default="yes")
-        # The batched mode uses 'english_text' for the figurative expression text
-        english_text: Optional[str] = Field(default="", description="The figurative expression in English")
-        hebrew_text: Optional[str] = Field(default="", description="The figurative expression in Hebrew")
-        explanation: str = Field(..., min_length=1, description="Explanation of the figurative language")
-        confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score 0-1")
-        metaphor: Optional[Literal["yes", "no"]] = Field(default="no")
-        simile: Optional[Literal["yes", "no"]] = Field(default="no")
-        personification: Optional[Literal["yes", "no"]] = Field(default="no")
-        idiom: Optional[Literal["yes", "no"]] = Field(default="no")
-        hyperbole: Optional[Literal["yes", "no"]] = Field(default="no")
-        metonymy: Optional[Literal["yes", "no"]] = Field(default="no")
-        other: Optional[Literal["yes", "no"]] = Field(default="no")
-        # Optional hierarchical tagging fields
-        target: Optional[List[str]] = Field(default_factory=list)
-        vehicle: Optional[List[str]] = Field(default_factory=list)
-        ground: Optional[List[str]] = Field(default_factory=list)
-        posture: Optional[List[str]] = Field(default_factory=list)
-
-    class ChapterResponse(BaseModel):
-        """Schema for the complete chapter response from LLM."""
-        instances: List[FigurativeInstance] = Field(default_factory=list)
+# JSON Schema Models for LLM Response Validation (shared with structured-output mode)
+if PYDANTIC_AVAILABLE:
+    from pydantic import ValidationError
+    from hebrew_figurative_db.ai_analysis.structured_output import FigurativeInstance
 
     def validate_llm_response(response_data: List[Dict], logger=None) -> Tuple[List[Dict], List[str]]:
         """
@@ -247,6 +294,21 @@ class RunContext:
         # Model tracking
         self.models_used: Dict[str, int] = {}
 
+        # Scheduling (predicted vs actual makespan, set by process_chapters_parallel)
+        self.scheduling: Dict = {}
+
+        # Detection prompt input-token savings per chapter (vs. the legacy doubled-text prompt)
+        self.prompt_savings: List[Dict] = []
+
+        # Estimated vs reported tokens per chapter (the rows of chapter_token_usage)
+        self.token_usage: List[Dict] = []
+
+        # RunController settings and outcome (set by process_chapters_parallel)
+        self.run_controller: Dict = {}
+
+        # Batch job summary (set by process_chapters_batch_api)
+        self.batch: Dict = {}
+
     def add_chapter_failure(self, book: str, chapter: int, reason: str,
                            verses_attempted: int = 0, raw_response_file: str = None,
                            error_type: str = "unknown"):
@@ -323,6 +385,33 @@ class RunContext:
         # Track model usage
         self.models_used[model_used] = self.models_used.get(model_used, 0) + 1
 
+    def record_prompt_savings(self, book: str, chapter: int, savings: Dict):
+        """Record estimated detection input-token savings for a chapter."""
+        self.prompt_savings.append({"book": book, "chapter": chapter, **savings})
+
+    def record_token_usage(self, book: str, chapter: int, usage: Dict):
+        """Record a chapter's estimated and reported detection/validation tokens."""
+        self.token_usage.append({"book": book, "chapter": chapter, **usage})
+
+    def get_token_usage_summary(self) -> Dict:
+        """Run totals of estimated vs reported tokens, and how many chapters had reported usage."""
+        def total(key):
+            return sum(c.get(key) or 0 for c in self.token_usage)
+        sources = [c.get("usage_source") for c in self.token_usage]
+        summary = {
+            "token_method": get_token_estimator().method,
+            "chapters": len(self.token_usage),
+            "chapters_with_reported_usage": sources.count(USAGE_REPORTED),
+            "chapters_with_partial_usage": sources.count(USAGE_PARTIAL)
+        }
+        for key in ("estimated_input_tokens", "input_tokens", "cached_input_tokens", "estimated_output_tokens",
+                    "output_tokens", "reasoning_tokens", "validation_input_tokens",
+                    "validation_output_tokens", "validation_reasoning_tokens"):
+            summary[f"total_{key}"] = total(key)
+        summary["detection_cost"] = round(total("detection_cost"), 4)
+        summary["validation_cost"] = round(total("validation_cost"), 4)
+        return summary
+
     def track_model_usage(self, model: str):
         """Track which models were used."""
         self.models_used[model] = self.models_used.get(model, 0) + 1
@@ -377,7 +466,8 @@ class RunContext:
                 },
                 "max_completion_tokens_default": MAX_COMPLETION_TOKENS_DEFAULT,
                 "max_completion_tokens_prophetic": MAX_COMPLETION_TOKENS_PROPHETIC,
-                "batched_processing_books": BATCHED_PROCESSING_BOOKS
+                "batched_processing_books": BATCHED_PROCESSING_BOOKS,
+                "llm_base_url": os.getenv("OPENAI_BASE_URL") or "default"
             },
             "results": {
                 "total_verses_processed": self.total_verses_processed,
@@ -392,66 +482,321 @@ class RunContext:
                 )
             },
             "chapters_processed": self.processed_chapters,
+            "scheduling": self.scheduling,
+            "prompt_savings": {
+                "total_input_tokens": sum(c["input_tokens"] for c in self.prompt_savings),
+                "total_legacy_input_tokens": sum(c["legacy_input_tokens"] for c in self.prompt_savings),
+                "total_input_tokens_saved": sum(c["input_tokens_saved"] for c in self.prompt_savings),
+                "total_cacheable_prefix_tokens": sum(c["cacheable_prefix_tokens"] for c in self.prompt_savings),
+                "chapters": self.prompt_savings
+            },
+            "token_usage": self.get_token_usage_summary(),
+            "run_controller": self.run_controller,
+            "batch": self.batch or None,
             "failures_summary": {
                 "chapter_failures": len(self.failed_chapters),
                 "verse_failures": len(self.failed_verses),
                 "validation_issues": len(self.validation_issues)
-            }
+            },
+            "stage_profile": get_profiler().summary() if get_profiler().enabled else None
         }
 
     def save_processing_manifest(self, base_filename: str) -> str:
-        """Save the processing manifest to a JSON file."""
+        """Save the processing manifest to a JSON file (and the run timeline as {base}_trace.json)."""
         manifest = self.get_processing_manifest()
         manifest_file = f"{base_filename}_manifest.json"
         manifest_path = os.path.join(self.output_dir, manifest_file)
 
+        profiler = get_profiler()
+        if profiler.enabled:
+            trace_file = f"{base_filename}_trace.json"
+            profiler.save_chrome_trace(os.path.join(self.output_dir, trace_file))
+            manifest["stage_profile"]["chrome_trace"] = trace_file
+
         with open(manifest_path, 'w', encoding='utf-8') as f:
             json.dump(manifest, f, indent=2, ensure_ascii=False)
 
         return manifest_path
 
 
-class SefariaCache:
-    """Simple file-based cache for Sefaria API responses."""
+class RunJournal:
+    """
+    Durable, append-only journal of per-chapter pipeline stages.
 
-    def __init__(self, cache_dir: str = ".sefaria_cache"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
+    Stored as tables in the output database so a crashed run can be resumed with
+    `python interactive_parallel_processor.py --resume <db_path>`:
+    - run_journal: one row per stage transition (fetched, detected, written, validated, verified, failed)
+    - run_journal_payloads: cached detection output per chapter, so resumed chapters skip the LLM call
+    - run_journal_meta: run configuration (book selections, workers, base filename)
 
-    def _get_cache_key(self, reference: str) -> str:
-        """Generate a cache key from a reference."""
-        return hashlib.md5(reference.encode()).hexdigest()
+    The 'written' and 'validated' stages are recorded on the writer thread's cursor,
+    inside the same transaction as the chapter data they describe.
+    """
 
-    def _get_cache_path(self, reference: str) -> Path:
-        """Get the cache file path for a reference."""
-        return self.cache_dir / f"{self._get_cache_key(reference)}.json"
+    STAGES = ('fetched', 'detected', 'written', 'validated', 'verified')
+    STAGE_RANK = {stage: rank for rank, stage in enumerate(STAGES, start=1)}
 
-    def get(self, reference: str) -> Optional[Tuple[List[Dict], Any]]:
-        """Get cached data for a reference."""
-        cache_path = self._get_cache_path(reference)
-        if cache_path.exists():
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('verses_data'), data.get('metadata')
-            except (json.JSONDecodeError, KeyError):
+    def __init__(self, db_path: str, run_id: str, resume: bool = False):
+        self.db_path = db_path
+        self.run_id = run_id
+        self.resume = resume
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, timeout=60.0, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self._setup_tables()
+
+    def _setup_tables(self):
+        with self.lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS run_journal (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT NOT NULL,
+                    book TEXT NOT NULL,
+                    chapter INTEGER NOT NULL,
+                    stage TEXT NOT NULL,
+                    detail TEXT,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_run_journal_chapter ON run_journal(run_id, book, chapter)')
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS run_journal_payloads (
+                    run_id TEXT NOT NULL,
+                    book TEXT NOT NULL,
+                    chapter INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (run_id, book, chapter)
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS run_journal_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+            self.conn.commit()
+
+    @staticmethod
+    def _insert_event_sql() -> str:
+        return "INSERT INTO run_journal (run_id, book, chapter, stage, detail, created_at) VALUES (?, ?, ?, ?, ?, ?)"
+
+    def record(self, book: str, chapter: int, stage: str, detail: Any = None, cursor=None):
+        """
+        Record a stage transition for a chapter.
+
+        Args:
+            cursor: Optional cursor of another connection to the same database. When given,
+                    the event joins that connection's open transaction and the caller commits.
+        """
+        params = (self.run_id, book, chapter, stage,
+                  json.dumps(detail, ensure_ascii=False) if detail is not None else None,
+                  datetime.now().isoformat())
+        if cursor is not None:
+            cursor.execute(self._insert_event_sql(), params)
+            return
+
+        with self.lock:
+            self.conn.execute(self._insert_event_sql(), params)
+            self.conn.commit()
+
+    def save_detection(self, book: str, chapter: int, verses_data: List[VerseRecord],
+                       instances_data: List[Tuple[int, InstanceRecord]], metadata: Dict):
+        """Cache a chapter's prepared detection output and mark it 'detected'."""
+        payload = json.dumps({
+            'verses_data': [verse.to_dict() for verse in verses_data],
+            'instances_data': [[verse_idx, instance.to_dict()] for verse_idx, instance in instances_data],
+            'metadata': metadata
+        }, ensure_ascii=False)
+        now = datetime.now().isoformat()
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO run_journal_payloads (run_id, book, chapter, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+                (self.run_id, book, chapter, payload, now)
+            )
+            self.conn.execute(self._insert_event_sql(),
+                              (self.run_id, book, chapter, 'detected',
+                               json.dumps({'verses': len(verses_data), 'instances': len(instances_data)}), now))
+            self.conn.commit()
+
+    def load_detection(self, book: str, chapter: int) -> Optional[Tuple[List[VerseRecord], List[Tuple[int, InstanceRecord]], Dict]]:
+        """Return cached (verses_data, instances_data, metadata) for a chapter as records, or None."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT payload FROM run_journal_payloads WHERE run_id = ? AND book = ? AND chapter = ?",
+                (self.run_id, book, chapter)
+            ).fetchone()
+        if not row:
+            return None
+
+        payload = json.loads(row[0])
+        verses_data = [VerseRecord.from_dict(verse) for verse in payload['verses_data']]
+        instances_data = [(verse_idx, InstanceRecord.from_dict(instance)) for verse_idx, instance in payload['instances_data']]
+        return verses_data, instances_data, payload.get('metadata', {})
+
+    def spent_cost(self) -> float:
+        """
+        USD this run has already spent according to durable state: the detection cost cached
+        with every chapter's detection output plus the validation cost of chapters journaled
+        as 'validated' (their chapter_token_usage row is written in the same transaction).
+        Used to seed a resumed run's cost so totals and ceilings include the interrupted part.
+        """
+        with self.lock:
+            detection = self.conn.execute(
+                "SELECT COALESCE(SUM(json_extract(payload, '$.metadata.cost')), 0) FROM run_journal_payloads "
+                "WHERE run_id = ?", (self.run_id,)).fetchone()[0]
+            has_usage = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chapter_token_usage'").fetchone()
+            validation = 0.0
+            if has_usage:
+                validation = self.conn.execute("""
+                    SELECT COALESCE(SUM(u.validation_cost), 0) FROM chapter_token_usage u
+                    WHERE EXISTS (SELECT 1 FROM run_journal j WHERE j.run_id = ? AND j.book = u.book
+                                  AND j.chapter = u.chapter AND j.stage = 'validated')
+                """, (self.run_id,)).fetchone()[0]
+        return float(detection or 0.0) + float(validation or 0.0)
+
+    def get_chapter_stages(self) -> Dict[Tuple[str, int], str]:
+        """Return the furthest durable stage reached by each chapter in this run."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT book, chapter, stage FROM run_journal WHERE run_id = ?", (self.run_id,)
+            ).fetchall()
+
+        stages = {}
+        for book, chapter, stage in rows:
+            if stage not in self.STAGE_RANK:
+                continue  # 'failed' events do not move a chapter backwards
+            key = (book, chapter)
+            if key not in stages or self.STAGE_RANK[stage] > self.STAGE_RANK[stages[key]]:
+                stages[key] = stage
+        return stages
+
+    def plan_resume(self, chapter_tasks: List[Dict], logger) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Split chapter tasks into (tasks_to_run, tasks_skipped) based on journal state.
+
+        Chapters already written (or beyond) are skipped - any missing validation is picked up
+        by the post-run coverage check. Chapters with cached detection output are annotated with
+        'resume_stage' = 'detected' so the worker goes straight to the write queue.
+        """
+        if not self.resume:
+            return chapter_tasks, []
+
+        stages = self.get_chapter_stages()
+        to_run, skipped = [], []
+        for task in chapter_tasks:
+            stage = stages.get((task['book'], task['chapter']))
+            if stage and self.STAGE_RANK[stage] >= self.STAGE_RANK['written']:
+                skipped.append(task)
+                continue
+            if stage == 'detected':
+                task['resume_stage'] = 'detected'
+            to_run.append(task)
+
+        logger.info(f"[RunJournal] Resume plan: {len(skipped)} chapters already written, "
+                    f"{sum(1 for t in to_run if t.get('resume_stage') == 'detected')} resuming from cached detection, "
+                    f"{sum(1 for t in to_run if not t.get('resume_stage'))} starting fresh")
+        return to_run, skipped
+
+    def set_meta(self, key: str, value: Any):
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO run_journal_meta (key, value) VALUES (?, ?)",
+                              (key, json.dumps(value, ensure_ascii=False)))
+            self.conn.commit()
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM run_journal_meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def save_run_config(self, book_selections: Dict, max_workers: int, base_filename: str):
+        """Persist what this run was asked to do so --resume can rebuild it."""
+        self.set_meta('run_id', self.run_id)
+        self.set_meta('book_selections', {
+            book: chapters if chapters == 'FULL_BOOK' else {str(c): v for c, v in chapters.items()}
+            for book, chapters in book_selections.items()
+        })
+        self.set_meta('max_workers', max_workers)
+        self.set_meta('base_filename', base_filename)
+
+    @classmethod
+    def load_run_config(cls, db_path: str) -> Optional[Dict]:
+        """Read the configuration of the run journaled in db_path (None if there is none)."""
+        if not os.path.exists(db_path):
+            return None
+        journal = cls(db_path, run_id='', resume=True)
+        try:
+            run_id = journal.get_meta('run_id')
+            if not run_id:
                 return None
-        return None
+            book_selections = {
+                book: chapters if chapters == 'FULL_BOOK' else {int(c): v for c, v in chapters.items()}
+                for book, chapters in journal.get_meta('book_selections', {}).items()
+            }
+            return {
+                'run_id': run_id,
+                'book_selections': book_selections,
+                'max_workers': journal.get_meta('max_workers', 3),
+                'base_filename': journal.get_meta('base_filename')
+            }
+        finally:
+            journal.close()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
 
-    def set(self, reference: str, verses_data: List[Dict], metadata: Any = None):
-        """Cache data for a reference."""
-        cache_path = self._get_cache_path(reference)
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'reference': reference,
-                'verses_data': verses_data,
-                'metadata': metadata,
-                'cached_at': datetime.now().isoformat()
-            }, f, ensure_ascii=False, indent=2)
 
-    def has(self, reference: str) -> bool:
-        """Check if a reference is cached."""
-        return self._get_cache_path(reference).exists()
+def prefetch_chapter_texts(chapter_tasks: List[Dict], sefaria_cache: SefariaTextStore, sefaria_client,
+                           logger, whole_books: bool = SEFARIA_PREFETCH_WHOLE_BOOKS) -> Dict:
+    """
+    Warm the Sefaria cache before chapter workers start, so text fetching is off their critical path.
+
+    Queued chapters are fetched first; with whole_books, the remaining chapters of every
+    selected book follow in the same concurrent pass. Failures are logged and left to the
+    worker's own cache-miss fetch.
+
+    Returns:
+        Dict with 'cached', 'fetched' and 'failed' reference counts
+    """
+    references = []
+    seen = set()
+    for task in chapter_tasks:
+        reference = f"{task['book']}.{task['chapter']}"
+        if reference not in seen:
+            seen.add(reference)
+            references.append(reference)
+    if whole_books:
+        for book_name in dict.fromkeys(task['book'] for task in chapter_tasks):
+            for chapter in range(1, SUPPORTED_BOOKS.get(book_name, 0) + 1):
+                reference = f"{book_name}.{chapter}"
+                if reference not in seen:
+                    seen.add(reference)
+                    references.append(reference)
+
+    missing = [reference for reference in references if not sefaria_cache.has(reference)]
+    summary = {'cached': len(references) - len(missing), 'fetched': 0, 'failed': 0}
+    if not missing:
+        logger.info(f"[PREFETCH] All {len(references)} chapters already cached")
+        return summary
+
+    start = time.time()
+    results, errors = sefaria_client.fetch_chapters(missing)
+    for reference, (verses_data, _) in results.items():
+        if verses_data:
+            sefaria_cache.set(reference, verses_data, source_version=sefaria_client.get_source_version(reference))
+            summary['fetched'] += 1
+        else:
+            errors[reference] = "no verses returned"
+    summary['failed'] = len(errors)
+
+    logger.info(f"[PREFETCH] Fetched {summary['fetched']} chapters in {time.time() - start:.1f}s "
+                f"({summary['cached']} already cached, {summary['failed']} failed)")
+    for reference, error in sorted(errors.items()):
+        logger.warning(f"[PREFETCH] {reference}: {error} (worker will retry)")
+    return summary
 
 
 def get_recommended_batches(book_name: str, total_chapters: int = None, batch_size: int = 10) -> List[Tuple[int, int]]:
@@ -482,8 +827,8 @@ def get_recommended_batches(book_name: str, total_chapters: int = None, batch_si
     return batches
 
 
-def print_batch_recommendations(book_name: str):
-    """Print recommended batching strategy for a book."""
+def print_batch_recommendations(book_name: str, max_workers: int = 3):
+    """Print recommended batching strategy for a book, with estimated detection cost and time per batch."""
     total_chapters = SUPPORTED_BOOKS.get(book_name, 0)
     if total_chapters == 0:
         print(f"Book '{book_name}' not found in supported books.")
@@ -498,16 +843,559 @@ def print_batch_recommendations(book_name: str):
     print(f"Recommended batches: {len(batches)}")
     print()
 
+    # Per-chapter estimates from the (calibrated) token estimator, priced at GPT-5.1 rates
+    total_cost, total_seconds = 0.0, 0.0
     for i, (start, end) in enumerate(batches, 1):
         chapters_in_batch = end - start + 1
         estimated_batch_verses = int(estimated_verses * chapters_in_batch / total_chapters)
-        print(f"  Batch {i}: Chapters {start}-{end} ({chapters_in_batch} chapters, ~{estimated_batch_verses} verses)")
-
-    print(f"\nEstimated cost: ${len(batches) * 0.8:.2f} - ${len(batches) * 1.5:.2f}")
-    print(f"Estimated time: {len(batches) * 15}-{len(batches) * 30} minutes")
+        workloads = [estimate_chapter_workload(book_name, chapter) for chapter in range(start, end + 1)]
+        batch_cost = sum(estimate_chapter_cost(w) for w in workloads)
+        batch_seconds = predict_makespan(sorted(workloads, key=lambda w: w['predicted_seconds'], reverse=True),
+                                         max_workers, INFLIGHT_TOKEN_BUDGET)
+        total_cost += batch_cost
+        total_seconds += batch_seconds
+        print(f"  Batch {i}: Chapters {start}-{end} ({chapters_in_batch} chapters, ~{estimated_batch_verses} verses, "
+              f"~${batch_cost:.2f}, ~{batch_seconds / 60:.0f} min)")
+
+    print(f"\nEstimated detection cost: ${total_cost:.2f} (validation adds to this; cap a run with "
+          f"RUN_SOFT_COST_LIMIT / RUN_HARD_COST_LIMIT)")
+    print(f"Estimated time: ~{total_seconds / 60:.0f} minutes with {max_workers} workers")
     print()
 
 
+def estimate_chapter_workload(book_name: str, chapter: int, sefaria_cache=None,
+                              verse_selection: str = 'ALL_VERSES') -> Dict:
+    """
+    Estimate prompt/completion tokens and processing time for one chapter.
+
+    Uses the cached Sefaria text when available (actual verse lengths), otherwise
+    falls back to the per-book average from VERSE_ESTIMATES.
+    """
+    verses_data = None
+    if sefaria_cache is not None:
+        cached = sefaria_cache.get(f"{book_name}.{chapter}")
+        if cached and cached[0]:
+            verses_data = cached[0]
+
+    estimator = get_token_estimator()
+    if verses_data:
+        if verse_selection != 'ALL_VERSES' and isinstance(verse_selection, str):
+            parsed_verses = parse_selection(verse_selection, len(verses_data), "verse")
+            if parsed_verses:
+                verses_data = [v for v in verses_data if v.get('verse') in parsed_verses]
+        verse_count = len(verses_data)
+        text_tokens = estimator.count('\n'.join(f"{v.get('hebrew', '')}\n{v.get('english', '')}" for v in verses_data))
+        source = 'cached_text'
+    else:
+        verse_count = max(1, round(VERSE_ESTIMATES.get(book_name, 25 * SUPPORTED_BOOKS.get(book_name, 1)) /
+                                   max(1, SUPPORTED_BOOKS.get(book_name, 1))))
+        # Pointed Hebrew tokenizes at roughly 2 chars/token, English at roughly 4
+        text_tokens = verse_count * (AVG_HEBREW_CHARS_PER_VERSE // 2 + AVG_ENGLISH_CHARS_PER_VERSE // 4)
+        source = 'verse_estimates'
+
+    # The chapter text appears in the prompt once (anchored "Verse N:" blocks). Both estimates are
+    # calibrated against the usage reported for this book in earlier runs (token_usage.db).
+    prompt_tokens = estimator.estimate_input(book_name, tokens=PROMPT_OVERHEAD_TOKENS + text_tokens)
+    completion_tokens = round(verse_count * estimator.output_tokens_per_verse(book_name,
+                                                                              COMPLETION_TOKENS_PER_VERSE_ESTIMATE))
+
+    return {
+        'book': book_name,
+        'chapter': chapter,
+        'verse_count': verse_count,
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'total_tokens': prompt_tokens + completion_tokens,
+        'predicted_seconds': REQUEST_OVERHEAD_SECONDS + completion_tokens / OUTPUT_TOKENS_PER_SECOND,
+        'source': source
+    }
+
+
+def schedule_chapter_tasks(chapter_tasks: List[Dict], sefaria_cache=None) -> List[Dict]:
+    """
+    Order chapter tasks longest-processing-time-first (LPT).
+
+    Long chapters (Psalms 119, Ezekiel 16, ...) start first instead of dominating the
+    tail of the run. Each task gets a 'workload' dict from estimate_chapter_workload().
+    """
+    for task in chapter_tasks:
+        task['workload'] = estimate_chapter_workload(
+            task['book'], task['chapter'], sefaria_cache, task.get('verses', 'ALL_VERSES')
+        )
+    return sorted(chapter_tasks, key=lambda t: t['workload']['predicted_seconds'], reverse=True)
+
+
+def predict_makespan(workloads: List[Dict], max_workers: int, token_budget: int = None) -> float:
+    """
+    Simulate FIFO dispatch of workloads onto max_workers slots under an in-flight token budget.
+
+    Returns the predicted wall-clock seconds until the last chapter finishes.
+    """
+    running = []  # heap of (finish_time, tokens)
+    now = 0.0
+    in_flight = 0
+
+    for workload in workloads:
+        tokens = workload['total_tokens']
+        while running and (len(running) >= max_workers or
+                           (token_budget and in_flight + tokens > token_budget)):
+            finish_time, finished_tokens = heapq.heappop(running)
+            now = max(now, finish_time)
+            in_flight -= finished_tokens
+        heapq.heappush(running, (now + workload['predicted_seconds'], tokens))
+        in_flight += tokens
+
+    return max((finish_time for finish_time, _ in running), default=0.0)
+
+
+class TokenBudget:
+    """
+    Global in-flight token budget shared by chapter workers.
+
+    A worker reserves its chapter's estimated tokens before the LLM call and releases
+    them when the chapter is done. A chapter larger than the whole budget runs alone
+    rather than waiting forever.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.condition = threading.Condition()
+
+    def acquire(self, tokens: int):
+        with self.condition:
+            while self.in_flight > 0 and self.in_flight + tokens > self.limit:
+                self.condition.wait()
+            self.in_flight += tokens
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def release(self, tokens: int):
+        with self.condition:
+            self.in_flight -= tokens
+            self.condition.notify_all()
+
+
+def estimate_chapter_cost(workload: Dict) -> float:
+    """Detection cost (USD) of a chapter's estimated workload."""
+    return token_cost(workload['prompt_tokens'], workload['completion_tokens'])
+
+
+def env_number(name: str, default: Optional[float] = None) -> Optional[float]:
+    """Numeric setting from the environment (default if unset or not a number)."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"Ignoring {name}={value!r}: not a number")
+        return default
+
+
+def _format_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "--"
+    seconds = int(max(0, seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    return f"{seconds // 60}m{seconds % 60:02d}s"
+
+
+def _is_throttling_error(error: Optional[str]) -> bool:
+    """True for errors that mean the provider wants less load (rate limits, overload, timeouts)."""
+    return bool(error) and re.search(r'rate.?limit|\b429\b|\b503\b|overloaded|timed? ?out', error, re.I) is not None
+
+
+class _DashboardConsole:
+    """
+    Console stream that keeps the live dashboard block at the bottom of the terminal.
+
+    Anything written through it (log lines, prints) erases the block first; the next
+    redraw puts it back underneath.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.lock = threading.Lock()
+        self.block_lines = 0
+
+    def _erase(self):
+        if self.block_lines:
+            self.stream.write(f"\x1b[{self.block_lines}F\x1b[J")
+            self.block_lines = 0
+
+    def write(self, text):
+        with self.lock:
+            self._erase()
+            return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def draw(self, lines: List[str], keep: bool = False):
+        """Replace the block with lines (keep=True leaves them in the scrollback instead)."""
+        width = shutil.get_terminal_size().columns
+        with self.lock:
+            self._erase()
+            self.stream.write(''.join(line[:width - 1] + '\n' for line in lines))
+            self.stream.flush()
+            self.block_lines = 0 if keep else len(lines)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class RunController:
+    """
+    Admission control, spend ceilings and a live status dashboard for a parallel chapter run.
+
+    Every chapter passes admit() before it starts and finish() when it is done. A chapter
+    starts only when:
+    - fewer than `concurrency` chapters are running. This is max_workers at first, halved
+      when a chapter stalls or fails with a rate limit/overload error, and grown back by one
+      per CONCURRENCY_RECOVERY_CHAPTERS healthy completions
+    - its estimated tokens fit the rolling tokens-per-minute target
+    - spend so far, the projected cost of the running chapters and its own projected cost stay
+      under the hard ceiling. Projections are the calibrated detection estimates scaled by the
+      actual/projected cost ratio of finished chapters, so they include validation
+
+    Once spend reaches the soft ceiling the run drains: nothing new starts, running chapters
+    finish and are written, and the rest are reported as not started (a --resume of the run
+    picks them up). A chapter that alone would break the hard ceiling is not started either.
+
+    A monitor thread checks for stalls once a second and renders the dashboard (chapters in
+    flight, detection/write/validation queue depths, throughput, ETA, spend): redrawn in place
+    below the log when stdout is a terminal, as a [DASHBOARD] log line every
+    DASHBOARD_LOG_SECONDS otherwise.
+    """
+
+    def __init__(self, chapter_tasks: List[Dict], max_workers: int, logger,
+                 soft_cost_limit: float = None, hard_cost_limit: float = None,
+                 tokens_per_minute: float = None, write_queue: 'ChapterWriteQueue' = None,
+                 dashboard: bool = False, prior_cost: float = 0.0):
+        self.logger = logger
+        self.max_concurrency = max(1, max_workers)
+        self.concurrency = self.max_concurrency
+        self.soft_cost_limit = soft_cost_limit
+        self.hard_cost_limit = hard_cost_limit
+        self.tokens_per_minute = tokens_per_minute
+        self.write_queue = write_queue
+        self.dashboard = dashboard
+
+        self.condition = threading.Condition()
+        self.total_chapters = len(chapter_tasks)
+        self.pending = {(t['book'], t['chapter']): t['workload'] for t in chapter_tasks}
+        self.in_flight = {}           # (book, chapter) -> started, predicted_seconds, projected_cost, stalled
+        self.token_window = deque()   # (admitted_at, estimated tokens) for the tokens-per-minute target
+        self.started_at = time.time()
+        self.prior_cost = prior_cost  # Spent before a --resume (counts towards the ceilings)
+        self.spent = prior_cost
+        self.completed = 0
+        self.failed = 0
+        self.verses = 0
+        self.tokens = 0               # Reported tokens (detection + validation) of finished chapters
+        self.projected_done = 0.0     # Projected cost of finished chapters...
+        self.actual_done = 0.0        # ...and what they actually cost
+        self.predicted_done = 0.0     # Predicted seconds of finished chapters...
+        self.elapsed_done = 0.0       # ...and how long they actually took
+        self.healthy_streak = 0
+        self.last_reduction = 0.0
+        self.adjustments = []         # Concurrency changes
+        self.not_started = []
+        self.drain_reason = None
+
+        self._stop = threading.Event()
+        self._monitor = None
+        self._console = None
+        self._real_stdout = None
+        self._console_handlers = []
+
+        if soft_cost_limit is not None and self.spent >= soft_cost_limit:
+            self.drain(f"soft cost ceiling ${soft_cost_limit:.2f} already reached before resuming "
+                       f"(${self.spent:.2f} spent)")
+
+    # --- admission -----------------------------------------------------------------------
+
+    def admit(self, task: Dict) -> Optional[str]:
+        """Block until the chapter may start; returns None, or the reason it must not start."""
+        key = (task['book'], task['chapter'])
+        workload = task['workload']
+        tokens = workload['total_tokens']
+        projected_cost = estimate_chapter_cost(workload)
+        with self.condition:
+            while True:
+                if self.drain_reason:
+                    return self._not_started(key, self.drain_reason)
+                if len(self.in_flight) >= self.concurrency:
+                    wait = DASHBOARD_REFRESH_SECONDS   # finish() wakes us earlier
+                elif not self._fits_hard_limit(projected_cost):
+                    if not self.in_flight:
+                        return self._not_started(
+                            key, f"projected ${projected_cost * self._cost_scale():.2f} would exceed the "
+                                 f"hard cost ceiling ${self.hard_cost_limit:.2f} (${self.spent:.2f} spent)")
+                    wait = DASHBOARD_REFRESH_SECONDS
+                else:
+                    wait = self._tokens_per_minute_wait(tokens)
+                    if not wait:
+                        break
+                self.condition.wait(timeout=wait)
+
+            now = time.time()
+            self.pending.pop(key, None)
+            self.in_flight[key] = {'started': now, 'predicted_seconds': workload['predicted_seconds'],
+                                   'projected_cost': projected_cost, 'stalled': False}
+            self.token_window.append((now, tokens))
+            return None
+
+    def finish(self, task: Dict, result: Optional[Dict]):
+        """Account a finished chapter (result None if it raised) and adjust concurrency/draining."""
+        book, chapter = task['book'], task['chapter']
+        result = result or {'success': False, 'error': 'exception'}
+        with self.condition:
+            entry = self.in_flight.pop((book, chapter), None)
+            if entry is None:
+                return
+            elapsed = time.time() - entry['started']
+            cost = result.get('cost', 0.0) or 0.0
+            self.spent += cost
+            if result.get('success'):
+                self.completed += 1
+                self.verses += result.get('verses_stored', 0)
+                usage = result.get('token_usage') or {}
+                self.tokens += sum(usage.get(key) or 0 for key in (
+                    'input_tokens', 'output_tokens', 'validation_input_tokens', 'validation_output_tokens'))
+                self.projected_done += entry['projected_cost']
+                self.actual_done += cost
+                self.predicted_done += entry['predicted_seconds']
+                self.elapsed_done += elapsed
+            else:
+                self.failed += 1
+
+            if _is_throttling_error(result.get('error')):
+                self.healthy_streak = 0
+                self._reduce_concurrency(f"{book} {chapter} failed: {result['error'][:80]}")
+            elif result.get('success') and not entry['stalled']:
+                self.healthy_streak += 1
+                if self.concurrency < self.max_concurrency and self.healthy_streak >= CONCURRENCY_RECOVERY_CHAPTERS:
+                    self._set_concurrency(self.concurrency + 1, f"{self.healthy_streak} healthy chapters")
+                    self.healthy_streak = 0
+
+            if (self.soft_cost_limit is not None and self.spent >= self.soft_cost_limit
+                    and not self.drain_reason):
+                self.drain(f"soft cost ceiling ${self.soft_cost_limit:.2f} reached (${self.spent:.2f} spent)")
+            self.condition.notify_all()
+
+    def drain(self, reason: str):
+        """Stop starting chapters; running chapters finish and are written."""
+        with self.condition:
+            if self.drain_reason:
+                return
+            self.drain_reason = reason
+            self.logger.warning(f"[CONTROLLER] Draining: {reason}. Running chapters finish, "
+                                f"{len(self.pending)} queued chapters will not start")
+            self.condition.notify_all()
+
+    def check_stalls(self):
+        """Mark chapters running far past their prediction and back off concurrency for them."""
+        with self.condition:
+            now = time.time()
+            for (book, chapter), entry in self.in_flight.items():
+                elapsed = now - entry['started']
+                if not entry['stalled'] and elapsed > max(STALL_MIN_SECONDS, STALL_FACTOR * entry['predicted_seconds']):
+                    entry['stalled'] = True
+                    self.healthy_streak = 0
+                    self.logger.warning(f"[CONTROLLER] {book} {chapter} stalled: running {elapsed:.0f}s, "
+                                        f"predicted {entry['predicted_seconds']:.0f}s")
+                    self._reduce_concurrency(f"{book} {chapter} stalled")
+
+    def _not_started(self, key: Tuple[str, int], reason: str) -> str:
+        self.pending.pop(key, None)
+        self.not_started.append({'book': key[0], 'chapter': key[1], 'reason': reason})
+        self.logger.info(f"[CONTROLLER] Not starting {key[0]} {key[1]}: {reason}")
+        return reason
+
+    def _cost_scale(self) -> float:
+        """Actual / projected cost of finished chapters (1.0 until one has cost anything)."""
+        if self.projected_done > 0 and self.actual_done > 0:
+            return self.actual_done / self.projected_done
+        return 1.0
+
+    def _fits_hard_limit(self, projected_cost: float) -> bool:
+        if self.hard_cost_limit is None:
+            return True
+        scale = self._cost_scale()
+        committed = self.spent + scale * sum(e['projected_cost'] for e in self.in_flight.values())
+        return committed + scale * projected_cost <= self.hard_cost_limit
+
+    def _tokens_per_minute_wait(self, tokens: int) -> float:
+        """Seconds until tokens fit the rolling minute (0 if they fit now or the window is empty)."""
+        if not self.tokens_per_minute:
+            return 0.0
+        now = time.time()
+        while self.token_window and now - self.token_window[0][0] >= 60.0:
+            self.token_window.popleft()
+        used = sum(t for _, t in self.token_window)
+        if not self.token_window or used + tokens <= self.tokens_per_minute:
+            return 0.0   # A chapter larger than the whole target still starts, alone
+        freed = 0
+        for admitted_at, window_tokens in self.token_window:
+            freed += window_tokens
+            if used - freed + tokens <= self.tokens_per_minute or freed == used:
+                return max(0.05, admitted_at + 60.0 - now)
+        return DASHBOARD_REFRESH_SECONDS
+
+    def _reduce_concurrency(self, reason: str):
+        now = time.time()
+        if now - self.last_reduction < CONCURRENCY_COOLDOWN_SECONDS or self.concurrency == 1:
+            return
+        self.last_reduction = now
+        self._set_concurrency(max(1, self.concurrency // 2), reason)
+
+    def _set_concurrency(self, value: int, reason: str):
+        self.logger.warning(f"[CONTROLLER] Concurrency {self.concurrency} -> {value}: {reason}")
+        self.adjustments.append({'at_seconds': round(time.time() - self.started_at, 1),
+                                 'from': self.concurrency, 'to': value, 'reason': reason})
+        self.concurrency = value
+        self.condition.notify_all()
+
+    # --- status --------------------------------------------------------------------------
+
+    def status(self) -> Dict:
+        """Snapshot of progress, queues, throughput, ETA and spend."""
+        with self.condition:
+            now = time.time()
+            elapsed = now - self.started_at
+            scale = self._cost_scale()
+            in_flight_cost = scale * sum(e['projected_cost'] for e in self.in_flight.values())
+            pending_cost = 0.0 if self.drain_reason else scale * sum(
+                estimate_chapter_cost(w) for w in self.pending.values())
+            # Remaining predicted seconds, scaled by how long finished chapters took vs. their prediction
+            speed = self.elapsed_done / self.predicted_done if self.predicted_done else 1.0
+            remaining = sum(max(0.0, e['predicted_seconds'] - (now - e['started'])) for e in self.in_flight.values())
+            if not self.drain_reason:
+                remaining += sum(w['predicted_seconds'] for w in self.pending.values())
+            minutes = max(elapsed / 60.0, 1e-9)
+            running = sorted(self.in_flight.items(), key=lambda item: item[1]['started'])
+            return {
+                'elapsed_seconds': elapsed,
+                'eta_seconds': remaining * speed / self.concurrency,
+                'total_chapters': self.total_chapters,
+                'completed': self.completed,
+                'failed': self.failed,
+                'not_started': len(self.not_started),
+                'in_flight': [(book, chapter, now - e['started'], e['predicted_seconds'], e['stalled'])
+                              for (book, chapter), e in running],
+                'concurrency': self.concurrency,
+                'max_concurrency': self.max_concurrency,
+                'detection_queue': len(self.pending),
+                'write_queue': self.write_queue.queue.qsize() if self.write_queue else None,
+                'validation_queue': self.write_queue.pending_validations if self.write_queue else None,
+                'chapters_per_minute': self.completed / minutes,
+                'verses_per_minute': self.verses / minutes,
+                'tokens_per_minute': self.tokens / minutes,
+                'spent': self.spent,
+                'in_flight_cost': in_flight_cost,
+                'projected_cost': self.spent + in_flight_cost + pending_cost,
+                'drain_reason': self.drain_reason
+            }
+
+    def dashboard_rows(self) -> List[Tuple[str, str]]:
+        """The dashboard as (label, text) rows."""
+        s = self.status()
+        write_queues = "" if s['write_queue'] is None else \
+            f", write {s['write_queue']}, validation {s['validation_queue']}"
+        tokens = f"{s['tokens_per_minute']:,.0f} tokens/min"
+        if self.tokens_per_minute:
+            tokens += f" (target {self.tokens_per_minute:,.0f})"
+        limits = [f"{name} ${value:.2f}" for name, value in
+                  (("soft", self.soft_cost_limit), ("hard", self.hard_cost_limit)) if value is not None]
+        running = ", ".join(f"{book} {chapter} {_format_duration(elapsed)}/{_format_duration(predicted)}"
+                            + (" STALLED" if stalled else "")
+                            for book, chapter, elapsed, predicted, stalled in s['in_flight'][:4])
+        if len(s['in_flight']) > 4:
+            running += f", +{len(s['in_flight']) - 4} more"
+        return [
+            ("Chapters", f"{s['completed']}/{s['total_chapters']} done, {s['failed']} failed, "
+                         f"{s['not_started']} not started, {len(s['in_flight'])} in flight "
+                         f"(concurrency {s['concurrency']}/{s['max_concurrency']})"),
+            ("Queues", f"detection {s['detection_queue']}{write_queues}"),
+            ("Throughput", f"{s['chapters_per_minute']:.1f} chapters/min, {s['verses_per_minute']:.0f} verses/min, "
+                           f"{tokens}"),
+            ("Time", f"elapsed {_format_duration(s['elapsed_seconds'])}, ETA {_format_duration(s['eta_seconds'])}"),
+            ("Spend", f"${s['spent']:.2f} spent, ${s['in_flight_cost']:.2f} in flight, "
+                      f"projected ${s['projected_cost']:.2f}" + (f" ({', '.join(limits)})" if limits else "")),
+            ("Running", running or "-"),
+            ("Status", f"DRAINING - {s['drain_reason']}" if s['drain_reason'] else "running"),
+        ]
+
+    def format_dashboard(self) -> List[str]:
+        return ["-" * 72] + [f"{label:<12}{text}" for label, text in self.dashboard_rows()] + ["-" * 72]
+
+    def format_status_line(self) -> str:
+        return " | ".join(f"{label.lower()}: {text}" for label, text in self.dashboard_rows() if label != "Running")
+
+    def summary(self) -> Dict:
+        """Controller settings and outcome for the processing manifest."""
+        with self.condition:
+            return {
+                'soft_cost_limit': self.soft_cost_limit,
+                'hard_cost_limit': self.hard_cost_limit,
+                'tokens_per_minute_target': self.tokens_per_minute,
+                'max_concurrency': self.max_concurrency,
+                'final_concurrency': self.concurrency,
+                'prior_cost': round(self.prior_cost, 4),
+                'spent': round(self.spent, 4),
+                'cost_scale': round(self._cost_scale(), 3),
+                'drain_reason': self.drain_reason,
+                'not_started': list(self.not_started),
+                'concurrency_adjustments': list(self.adjustments)
+            }
+
+    # --- monitor thread ------------------------------------------------------------------
+
+    def start(self):
+        """Start the stall monitor (and the dashboard, if enabled)."""
+        if self.dashboard and sys.stdout.isatty():
+            self._real_stdout = sys.stdout
+            self._console = _DashboardConsole(self._real_stdout)
+            for handler in logging.getLogger().handlers:
+                if isinstance(handler, logging.StreamHandler) and handler.stream is self._real_stdout:
+                    handler.setStream(self._console)
+                    self._console_handlers.append(handler)
+            sys.stdout = self._console
+        self._stop.clear()
+        self._monitor = threading.Thread(target=self._monitor_loop, name='RunController', daemon=True)
+        self._monitor.start()
+
+    def stop(self):
+        """Stop the monitor; the final dashboard stays on screen (or is logged)."""
+        self._stop.set()
+        if self._monitor:
+            self._monitor.join(timeout=5.0)
+        if self._console:
+            self._console.draw(self.format_dashboard(), keep=True)
+            for handler in self._console_handlers:
+                handler.setStream(self._real_stdout)
+            sys.stdout = self._real_stdout
+            self._console = None
+        elif self.dashboard:
+            self.logger.info(f"[DASHBOARD] {self.format_status_line()}")
+
+    def _monitor_loop(self):
+        last_logged = time.time()
+        while not self._stop.wait(DASHBOARD_REFRESH_SECONDS):
+            try:
+                self.check_stalls()
+                if self._console:
+                    self._console.draw(self.format_dashboard())
+                elif self.dashboard and time.time() - last_logged >= DASHBOARD_LOG_SECONDS:
+                    last_logged = time.time()
+                    self.logger.info(f"[DASHBOARD] {self.format_status_line()}")
+            except Exception as e:
+                self.logger.warning(f"[CONTROLLER] Monitor error: {e}")
+
+
 def has_corrupted_hebrew(text):
     """Check if Hebrew text contains corruption patterns"""
     # Look for common corruption patterns seen in the logs
@@ -797,10 +1685,10 @@ def get_user_selection():
         'enable_debug': enable_debug
     }
 
-def save_raw_response(response_text, book_name, chapter):
-    """Save raw API response for debugging"""
+def save_raw_response(response_text, book_name, chapter, suffix=""):
+    """Save raw API response for debugging (suffix distinguishes verse windows, e.g. "_v1-44")"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"debug_response_{book_name}_{chapter}_{timestamp}.json"
+    filename = f"debug_response_{book_name}_{chapter}{suffix}_{timestamp}.json"
     debug_dir = os.path.join(OUTPUT_DIR, "debug")
     filepath = os.path.join(debug_dir, filename)
 
@@ -811,61 +1699,68 @@ def save_raw_response(response_text, book_name, chapter):
 
     return filepath
 
-def extract_individual_verses(json_text, logger):
-    """Extract individual verse objects from malformed JSON"""
-    verses = []
-
-    # Look for verse patterns in the JSON
-    verse_pattern = r'"verse":\s*(\d+)'
-    verse_matches = list(re.finditer(verse_pattern, json_text))
-
-    logger.info(f"Found {len(verse_matches)} verse patterns in malformed JSON")
-
-    for i, match in enumerate(verse_matches):
-        verse_num = match.group(1)
-        start_pos = match.start()
+def build_validation_data(validation_result: Dict, figurative_language_id: int, logger) -> ValidationRecord:
+    """
+    Map one validator result to the figurative_language validation/final_* columns.
 
-        # Find the start of this verse object
-        obj_start = json_text.rfind('{', 0, start_pos)
+    Args:
+        validation_result: Dict with 'instance_id' and 'validation_results'
+        figurative_language_id: Database ID of the instance the result belongs to
+        logger: Logger instance
 
-        # Find the end of this verse object
-        if i < len(verse_matches) - 1:
-            next_match = verse_matches[i + 1]
-            obj_end = json_text.rfind('}', 0, next_match.start())
-        else:
-            obj_end = json_text.rfind('}', start_pos)
+    Returns:
+        ValidationRecord for DatabaseManager.update_validation_records (final_* default to 'no')
+    """
+    instance_id = validation_result.get('instance_id')
+    results = validation_result.get('validation_results', {})
 
-        if obj_start != -1 and obj_end != -1 and obj_end > obj_start:
-            verse_json = json_text[obj_start:obj_end + 1]
+    any_valid = False
+    record = ValidationRecord(id=figurative_language_id)
 
-            # Try to complete this object
-            open_braces = verse_json.count('{')
-            close_braces = verse_json.count('}')
+    # Process each figurative type result
+    for fig_type, result in results.items():
+        decision = result.get('decision')
+        reason = result.get('reason', '')
+        reclassified_type = result.get('reclassified_type')
 
-            for _ in range(open_braces - close_braces):
-                verse_json += '}'
+        try:
+            if decision == 'RECLASSIFIED' and reclassified_type:
+                any_valid = True
+                setattr(record, f'validation_decision_{fig_type}', 'RECLASSIFIED')
+                setattr(record, f'validation_reason_{fig_type}', f"Reclassified to {reclassified_type}: {reason}")
+                setattr(record, f'final_{reclassified_type}', 'yes')
+                logger.debug(f"RECLASSIFIED: {fig_type} → {reclassified_type}")
+            elif decision == 'VALID':
+                any_valid = True
+                setattr(record, f'validation_decision_{fig_type}', 'VALID')
+                setattr(record, f'validation_reason_{fig_type}', reason)
+                setattr(record, f'final_{fig_type}', 'yes')
+                logger.debug(f"VALID: {fig_type}")
+            else:  # INVALID
+                setattr(record, f'validation_decision_{fig_type}', 'INVALID')
+                setattr(record, f'validation_reason_{fig_type}', reason)
+                logger.debug(f"INVALID: {fig_type}")
+        except AttributeError:
+            # A type name that is not a column; the fixed UPDATE column list never stored these
+            logger.warning(f"Ignoring unknown figurative type in validation result: {fig_type}")
+
+    record.final_figurative_language = 'yes' if any_valid else 'no'
+    record.validation_response = json.dumps({
+        'instance_id': instance_id,
+        'validation_results': results,
+        'timestamp': datetime.now().isoformat()
+    })
 
-            try:
-                verse_obj = json.loads(verse_json)
-                verses.append(verse_obj)
-                logger.debug(f"Successfully extracted verse {verse_num}")
-            except json.JSONDecodeError:
-                # Try to repair common issues
-                verse_json = verse_json.rstrip(',').rstrip()
-                try:
-                    verse_obj = json.loads(verse_json)
-                    verses.append(verse_obj)
-                    logger.debug(f"Successfully extracted verse {verse_num} after repair")
-                except:
-                    logger.warning(f"Could not parse verse {verse_num} object")
+    return record
 
-    return verses
 
 def process_validation_result(validation_result: Dict, instance_id_to_db_id: Dict,
                                db_manager, logger, db_lock: threading.Lock = None) -> Tuple[bool, Optional[int]]:
     """
     Process a single validation result and update the database.
 
+    Prefer apply_validation_results() for a whole validator response.
+
     Args:
         validation_result: Dict with 'instance_id' and 'validation_results'
         instance_id_to_db_id: Mapping from instance_id to database ID
@@ -877,88 +1772,68 @@ def process_validation_result(validation_result: Dict, instance_id_to_db_id: Dic
         Tuple of (success: bool, db_id: Optional[int])
     """
     instance_id = validation_result.get('instance_id')
-    results = validation_result.get('validation_results', {})
 
     db_id = instance_id_to_db_id.get(instance_id)
     if not db_id:
         logger.error(f"Could not find DB ID for instance_id {instance_id}")
         return False, None
 
-    any_valid = False
-    validation_data = {}
-
-    # Initialize all final fields to 'no'
-    for fig_type in ['simile', 'metaphor', 'personification', 'idiom',
-                     'hyperbole', 'metonymy', 'other']:
-        validation_data[f'final_{fig_type}'] = 'no'
-
-    # Process each figurative type result
-    for fig_type, result in results.items():
-        decision = result.get('decision')
-        reason = result.get('reason', '')
-        reclassified_type = result.get('reclassified_type')
-
-        if decision == 'RECLASSIFIED' and reclassified_type:
-            validation_data[f'validation_decision_{fig_type}'] = 'RECLASSIFIED'
-            validation_data[f'validation_reason_{fig_type}'] = f"Reclassified to {reclassified_type}: {reason}"
-            validation_data[f'final_{reclassified_type}'] = 'yes'
-            any_valid = True
-            logger.debug(f"RECLASSIFIED: {fig_type} → {reclassified_type}")
-        elif decision == 'VALID':
-            validation_data[f'validation_decision_{fig_type}'] = 'VALID'
-            validation_data[f'validation_reason_{fig_type}'] = reason
-            validation_data[f'final_{fig_type}'] = 'yes'
-            any_valid = True
-            logger.debug(f"VALID: {fig_type}")
-        else:  # INVALID
-            validation_data[f'validation_decision_{fig_type}'] = 'INVALID'
-            validation_data[f'validation_reason_{fig_type}'] = reason
-            logger.debug(f"INVALID: {fig_type}")
-
-    validation_data['final_figurative_language'] = 'yes' if any_valid else 'no'
-    validation_data['validation_response'] = json.dumps({
-        'instance_id': instance_id,
-        'validation_results': results,
-        'timestamp': datetime.now().isoformat()
-    })
-    validation_data['validation_error'] = None
+    record = build_validation_data(validation_result, db_id, logger)
 
     # Update database (thread-safe with optional lock)
     if db_lock:
         with db_lock:
-            db_manager.update_validation_data(db_id, validation_data)
+            db_manager.update_validation_records([record])
     else:
-        db_manager.update_validation_data(db_id, validation_data)
+        db_manager.update_validation_records([record])
     logger.debug(f"Validation data updated for DB ID: {db_id}")
 
     return True, db_id
 
 
-def recover_missing_validations(db_manager, validator, book_name: str, chapter: int,
-                                 logger) -> Dict:
+def apply_validation_results(validation_results: List[Dict], instance_id_to_db_id: Dict,
+                             db_manager, logger, db_lock: threading.Lock = None) -> set:
     """
-    Identify and recover missing validation data for a chapter.
+    Apply a whole validator response to the database in one batch update (no commit).
 
     Args:
+        validation_results: List of dicts with 'instance_id' and 'validation_results'
+        instance_id_to_db_id: Mapping from instance_id to database ID
         db_manager: DatabaseManager instance
-        validator: MetaphorValidator instance
-        book_name: Book name
-        chapter: Chapter number
         logger: Logger instance
+        db_lock: Optional threading.Lock for thread-safe database operations
 
     Returns:
-        Dict with recovery statistics
+        Set of instance_ids whose validation data was applied
     """
-    stats = {
-        'total_missing': 0,
-        'recovered': 0,
-        'failed': 0,
-        'cost': 0.0
-    }
+    records = []
+    applied_ids = set()
+    for validation_result in validation_results:
+        instance_id = validation_result.get('instance_id')
+        db_id = instance_id_to_db_id.get(instance_id)
+        if not db_id:
+            logger.error(f"Could not find DB ID for instance_id {instance_id}")
+            continue
+        records.append(build_validation_data(validation_result, db_id, logger))
+        applied_ids.add(instance_id)
 
-    logger.info(f"[RECOVERY] Checking for missing validations in {book_name} {chapter}")
+    if db_lock:
+        with db_lock:
+            db_manager.update_validation_records(records)
+    else:
+        db_manager.update_validation_records(records)
+    logger.debug(f"Validation data updated for {len(records)} instances")
 
-    # Query for instances missing validation
+    return applied_ids
+
+
+def load_unvalidated_instances(db_manager, book_name: str, chapter: int) -> Tuple[List[Dict], Dict]:
+    """
+    Load a chapter's instances that have no validation decision yet.
+
+    Returns:
+        Tuple of (validator payloads with instance_ids 1..n, instance_id -> database ID)
+    """
     db_manager.cursor.execute("""
         SELECT fl.id, fl.verse_id, fl.figurative_text, fl.figurative_text_in_hebrew,
                fl.explanation, fl.confidence,
@@ -979,20 +1854,11 @@ def recover_missing_validations(db_manager, validator, book_name: str, chapter:
         )
     """, (book_name, chapter))
 
-    missing_instances = db_manager.cursor.fetchall()
-    stats['total_missing'] = len(missing_instances)
-
-    if not missing_instances:
-        logger.info(f"[RECOVERY] No missing validations found for {book_name} {chapter}")
-        return stats
-
-    logger.warning(f"[RECOVERY] Found {len(missing_instances)} instances missing validation")
-
     # Prepare instances for validation
     instances_to_validate = []
     id_mapping = {}  # instance_id -> db_id
 
-    for i, row in enumerate(missing_instances):
+    for i, row in enumerate(db_manager.cursor.fetchall()):
         instance_id = i + 1
         id_mapping[instance_id] = row['id']
 
@@ -1013,31 +1879,54 @@ def recover_missing_validations(db_manager, validator, book_name: str, chapter:
         }
         instances_to_validate.append(instance)
 
-    # Validate in batches of 10
-    batch_size = 10
-    for i in range(0, len(instances_to_validate), batch_size):
-        batch = instances_to_validate[i:i + batch_size]
-        logger.info(f"[RECOVERY] Validating batch {i//batch_size + 1} ({len(batch)} instances)")
+    return instances_to_validate, id_mapping
 
-        try:
-            validation_results, validation_cost_metadata = validator.validate_chapter_instances(batch)
-            batch_cost = validation_cost_metadata.get('cost', 0)
-            stats['cost'] += batch_cost
 
-            logger.debug(f"[RECOVERY] Batch {i//batch_size + 1} cost: ${batch_cost:.4f}")
+def recover_missing_validations(db_manager, validator, book_name: str, chapter: int,
+                                 logger) -> Dict:
+    """
+    Identify and recover missing validation data for a chapter.
 
-            for result in validation_results:
-                success, db_id = process_validation_result(
-                    result, id_mapping, db_manager, logger
-                )
-                if success:
-                    stats['recovered'] += 1
-                else:
-                    stats['failed'] += 1
+    Args:
+        db_manager: DatabaseManager instance
+        validator: MetaphorValidator instance
+        book_name: Book name
+        chapter: Chapter number
+        logger: Logger instance
 
-        except Exception as e:
-            logger.error(f"[RECOVERY] Batch validation failed: {e}")
-            stats['failed'] += len(batch)
+    Returns:
+        Dict with recovery statistics
+    """
+    stats = {
+        'total_missing': 0,
+        'recovered': 0,
+        'failed': 0,
+        'cost': 0.0
+    }
+
+    logger.info(f"[RECOVERY] Checking for missing validations in {book_name} {chapter}")
+
+    instances_to_validate, id_mapping = load_unvalidated_instances(db_manager, book_name, chapter)
+    stats['total_missing'] = len(instances_to_validate)
+
+    if not instances_to_validate:
+        logger.info(f"[RECOVERY] No missing validations found for {book_name} {chapter}")
+        return stats
+
+    logger.warning(f"[RECOVERY] Found {len(instances_to_validate)} instances missing validation")
+
+    # Concurrent sub-batches keep the 1..n instance_ids above, so one id_mapping covers every batch
+    try:
+        validation_results, validation_cost_metadata = validator.validate_chapter_instances_concurrent(instances_to_validate)
+        stats['cost'] += validation_cost_metadata.get('cost', 0)
+
+        applied_ids = apply_validation_results(validation_results, id_mapping, db_manager, logger)
+        stats['recovered'] += len(applied_ids)
+        stats['failed'] += len(instances_to_validate) - len(applied_ids)
+
+    except Exception as e:
+        logger.error(f"[RECOVERY] Validation failed: {e}")
+        stats['failed'] += len(instances_to_validate)
 
     db_manager.commit()
 
@@ -1058,15 +1947,25 @@ class ChapterWriteQueue:
 
     Architecture:
     - Worker threads call submit_chapter() to queue chapter data
-    - Single writer thread processes queue, inserting all verses/instances and committing
-    - Workers can wait_for_result() to get write confirmation
+    - Single writer thread processes queue, inserting all verses/instances set-based and committing
+    - When the queue is deep, up to max_coalesced_chapters queued chapters share one commit
+      (each chapter in its own savepoint, so one bad chapter does not fail the others)
+    - With a validator, committed chapters are validated on a small thread pool (the LLM call), and the
+      results come back through the queue so the writer applies them; the writer never waits on the API
+    - Workers can wait_for_result() to get write confirmation; a chapter's result is ready as soon as
+      its own write (and validation, if any) is done, independent of the chapters it was coalesced with
+    - If a RunJournal is given, 'written'/'validated' are journaled in the same transaction as the data
     """
 
-    def __init__(self, db_path: str, logger, validator=None, divine_names_modifier=None):
+    def __init__(self, db_path: str, logger, validator=None, divine_names_modifier=None, run_journal=None,
+                 max_coalesced_chapters: int = WRITE_QUEUE_MAX_COALESCED_CHAPTERS,
+                 validation_workers: int = WRITE_QUEUE_VALIDATION_WORKERS):
         self.db_path = db_path
+        self.max_coalesced_chapters = max(1, max_coalesced_chapters)
         self.logger = logger
         self.validator = validator
         self.divine_names_modifier = divine_names_modifier
+        self.run_journal = run_journal
         self.queue = queue.Queue()
         self.results = {}  # chapter_key -> result dict
         self.results_lock = threading.Lock()
@@ -1074,11 +1973,17 @@ class ChapterWriteQueue:
         self.writer_thread = None
         self.stop_event = threading.Event()
         self.db_manager = None
+        self.validation_workers = max(1, validation_workers)
+        self.validation_executor = None
+        self.pending_validations = 0  # Written chapters whose validation is not applied yet (writer thread only)
 
     def start_writer(self):
         """Start the dedicated writer thread with its own database connection."""
         self.stop_event.clear()
-        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        if self.validator:
+            self.validation_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.validation_workers, thread_name_prefix='WriteQueueValidator')
+        self.writer_thread = threading.Thread(target=self._writer_loop, name='WriteQueueWriter', daemon=True)
         self.writer_thread.start()
         self.logger.info("[WriteQueue] Writer thread started")
 
@@ -1101,8 +2006,8 @@ class ChapterWriteQueue:
         Args:
             book: Book name
             chapter: Chapter number
-            verses_data: List of prepared verse dicts ready for insert_verse()
-            instances_data: List of (verse_index, instance_dict) tuples
+            verses_data: List of VerseRecords
+            instances_data: List of (verse_index, InstanceRecord) tuples
             metadata: Dict with processing metadata (cost, time, etc.)
 
         Returns:
@@ -1121,7 +2026,8 @@ class ChapterWriteQueue:
             'chapter': chapter,
             'verses_data': verses_data,
             'instances_data': instances_data,
-            'metadata': metadata
+            'metadata': metadata,
+            'submitted_at': get_profiler().now()
         })
 
         self.logger.debug(f"[WriteQueue] Submitted {book} {chapter} as {chapter_key}")
@@ -1165,33 +2071,60 @@ class ChapterWriteQueue:
                     try:
                         item = self.queue.get(timeout=1.0)
                     except queue.Empty:
-                        if self.stop_event.is_set() and self.queue.empty():
+                        if self.stop_event.is_set() and self.queue.empty() and not self.pending_validations:
                             self.logger.info("[WriteQueue] Stop signal received, queue empty, exiting")
                             break
                         continue
 
-                    # Process the write request
-                    chapter_key = item['chapter_key']
-                    book = item['book']
-                    chapter = item['chapter']
-
-                    self.logger.info(f"[WriteQueue] Processing write for {book} {chapter}")
+                    # Coalesce whatever else is already queued into the same commit
+                    items = [item]
+                    while len(items) < self.max_coalesced_chapters:
+                        try:
+                            items.append(self.queue.get_nowait())
+                        except queue.Empty:
+                            break
 
-                    result = self._write_chapter(item)
+                    # Validator responses handed back by the validation pool: apply them first
+                    write_items = [queued for queued in items if 'validation_results' not in queued]
+                    for validated in items:
+                        if 'validation_results' in validated:
+                            self._apply_validation(validated)
+                            self.pending_validations -= 1
+                            self._set_result(validated['chapter_key'], validated['result'])
+                            self.queue.task_done()
 
-                    # Store result and signal completion
-                    with self.results_lock:
-                        self.results[chapter_key] = result
-                        if chapter_key in self.results_ready:
-                            self.results_ready[chapter_key].set()
+                    if not write_items:
+                        continue
 
-                    self.queue.task_done()
+                    profiler = get_profiler()
+                    picked_up_at = profiler.now()
+                    for queued in write_items:
+                        profiler.add_span(STAGE_WRITE_QUEUE_WAIT, queued['book'], queued['chapter'],
+                                          queued['submitted_at'], picked_up_at, track='write queue')
 
-                    if result['success']:
-                        self.logger.info(f"[WriteQueue] Wrote {book} {chapter}: "
-                                        f"{result['verses_stored']} verses, {result['instances_stored']} instances")
+                    if len(write_items) > 1:
+                        self.logger.info(f"[WriteQueue] Coalescing {len(write_items)} chapters into one commit")
                     else:
-                        self.logger.error(f"[WriteQueue] Failed to write {book} {chapter}: {result.get('error')}")
+                        self.logger.info(f"[WriteQueue] Processing write for {write_items[0]['book']} "
+                                         f"{write_items[0]['chapter']}")
+
+                    results = self._write_chapters(write_items)
+
+                    for item, (result, validation_instances) in zip(write_items, results):
+                        if result['success']:
+                            self.logger.info(f"[WriteQueue] Wrote {item['book']} {item['chapter']}: "
+                                            f"{result['verses_stored']} verses, {result['instances_stored']} instances")
+                        else:
+                            self.logger.error(f"[WriteQueue] Failed to write {item['book']} {item['chapter']}: {result.get('error')}")
+
+                        if validation_instances:
+                            # The worker is released once this chapter's own validation is applied
+                            self.pending_validations += 1
+                            self.validation_executor.submit(self._run_validation, item, result, validation_instances)
+                        else:
+                            self._set_result(item['chapter_key'], result)
+
+                        self.queue.task_done()
 
                 except Exception as e:
                     self.logger.error(f"[WriteQueue] Error in writer loop: {e}")
@@ -1199,117 +2132,221 @@ class ChapterWriteQueue:
                     traceback.print_exc()
 
         finally:
+            if self.validation_executor:
+                self.validation_executor.shutdown(wait=True)
             # Close database connection
             if self.db_manager:
                 self.db_manager.close()
                 self.logger.info("[WriteQueue] Writer thread database connection closed")
 
-    def _write_chapter(self, item: dict) -> dict:
+    def _set_result(self, chapter_key: str, result: dict):
+        """Store a chapter's result and release the worker waiting on it."""
+        with self.results_lock:
+            self.results[chapter_key] = result
+            if chapter_key in self.results_ready:
+                self.results_ready[chapter_key].set()
+
+    def _write_chapters(self, items: List[dict]) -> List[Tuple[dict, list]]:
         """
-        Write a single chapter's data to the database.
+        Write one or more queued chapters in a single transaction.
 
         This runs in the writer thread - no locks needed since it's the only writer.
+        Each chapter is written inside its own savepoint; a failing chapter is rolled back
+        alone and reported as failed while the rest of the batch commits.
+
+        Returns:
+            (result, validation_instances) per item; validation_instances is empty unless the
+            chapter was committed and needs validation
+        """
+        results = []
+
+        # Explicit BEGIN so releasing a chapter savepoint does not commit on its own
+        if not self.db_manager.conn.in_transaction:
+            self.db_manager.cursor.execute('BEGIN')
+
+        profiler = get_profiler()
+        for item in items:
+            self.db_manager.cursor.execute('SAVEPOINT write_chapter')
+            try:
+                with profiler.span(STAGE_WRITE, item['book'], item['chapter']):
+                    result, validation_instances = self._write_chapter(item)
+                self.db_manager.cursor.execute('RELEASE write_chapter')
+            except Exception as e:
+                self.logger.error(f"[WriteQueue] Error writing {item['book']} {item['chapter']}: {e}")
+                import traceback
+                traceback.print_exc()
+                self.db_manager.cursor.execute('ROLLBACK TO write_chapter')
+                self.db_manager.cursor.execute('RELEASE write_chapter')
+                result = {'success': False, 'verses_stored': 0, 'instances_stored': 0, 'error': str(e)}
+                validation_instances = []
+            results.append((result, validation_instances))
+
+        try:
+            # Commit all inserts
+            with profiler.span(STAGE_COMMIT, chapters=len(items)):
+                self.db_manager.commit()
+        except Exception as e:
+            self.logger.error(f"[WriteQueue] Commit failed for {len(items)} chapters: {e}")
+            self.db_manager.rollback()
+            return [({'success': False, 'verses_stored': 0, 'instances_stored': 0, 'error': str(e)}, [])
+                    for _ in items]
+
+        self.logger.debug(f"[WriteQueue] Committed {sum(r['verses_stored'] for r, _ in results)} verses, "
+                          f"{sum(r['instances_stored'] for r, _ in results)} instances for {len(items)} chapters")
+
+        return results
+
+    def _write_chapter(self, item: dict) -> Tuple[dict, list]:
+        """
+        Insert a single chapter's verses and instances (no commit).
+
+        Returns:
+            Tuple of (result dict, validation_instances for batched validation)
         """
         book = item['book']
         chapter = item['chapter']
         verses_data = item['verses_data']
-        instances_data = item['instances_data']
         metadata = item['metadata']
 
-        verses_stored = 0
-        instances_stored = 0
-        validation_instances = []  # For batched validation
-
-        try:
-            # Insert all verses and their instances
-            for verse_idx, verse_dict in enumerate(verses_data):
-                # Insert verse
-                verse_id = self.db_manager.insert_verse(verse_dict)
-                verses_stored += 1
-
-                # Insert instances for this verse
-                verse_instances = [inst for v_idx, inst in instances_data if v_idx == verse_idx]
-                for instance_dict in verse_instances:
-                    fig_lang_id = self.db_manager.insert_figurative_language(verse_id, instance_dict)
-                    instances_stored += 1
-
-                    # Track for validation
-                    if self.validator:
-                        validation_instances.append({
-                            'db_id': fig_lang_id,
-                            'verse_ref': verse_dict['reference'],
-                            'instance_data': instance_dict,
-                            'hebrew_text': verse_dict['hebrew'],
-                            'english_text': verse_dict['english']
-                        })
+        verse_ids, inserted_instances = self.db_manager.insert_chapter_bulk(verses_data, item['instances_data'])
+        verses_stored = len(verse_ids)
+        instances_stored = len(inserted_instances)
+        if metadata.get('token_usage'):
+            self.db_manager.record_chapter_token_usage(book, chapter, metadata['token_usage'])
 
-            # Commit all inserts
-            self.db_manager.commit()
-            self.logger.debug(f"[WriteQueue] Committed {verses_stored} verses, {instances_stored} instances for {book} {chapter}")
+        # Track for validation: the inserted records themselves, now carrying their DB IDs
+        validation_instances = []
+        if self.validator:
+            validation_instances = [(verses_data[verse_idx], record) for verse_idx, _, record in inserted_instances]
 
-            # Run batched validation if validator available
-            if self.validator and validation_instances:
-                self._run_validation(book, chapter, validation_instances)
+        # Journal the stage in the same transaction so it is durable exactly when the data is
+        if self.run_journal:
+            self.run_journal.record(book, chapter, 'written',
+                                    {'verses': verses_stored, 'instances': instances_stored},
+                                    cursor=self.db_manager.cursor)
 
-            return {
-                'success': True,
-                'verses_stored': verses_stored,
-                'instances_stored': instances_stored,
-                'cost': metadata.get('cost', 0.0)
-            }
+        return {
+            'success': True,
+            'verses_stored': verses_stored,
+            'instances_stored': instances_stored,
+            'cost': metadata.get('cost', 0.0)
+        }, validation_instances
 
-        except Exception as e:
-            self.logger.error(f"[WriteQueue] Error writing {book} {chapter}: {e}")
-            import traceback
-            traceback.print_exc()
-            return {
-                'success': False,
-                'verses_stored': verses_stored,
-                'instances_stored': instances_stored,
-                'error': str(e)
-            }
+    def _run_validation(self, item: dict, result: dict, validation_instances: list):
+        """
+        Validate a committed chapter's instances (runs on the validation pool, no database access).
 
-    def _run_validation(self, book: str, chapter: int, validation_instances: list):
-        """Run batched validation for all instances in a chapter."""
+        The validator response is queued back to the writer, which applies it; it is queued even when
+        the call fails so the waiting worker is always released.
+        """
+        book, chapter = item['book'], item['chapter']
+        validation_results = []
+        validation_cost_metadata = None
+        instance_id_to_db_id = {}
         try:
             self.logger.info(f"[WriteQueue] Running validation for {len(validation_instances)} instances in {book} {chapter}")
 
-            # Prepare instances for validation API
+            # Prepare instances for validation API (only the fields the validator reads)
             all_chapter_instances = []
-            instance_id_to_db_id = {}
 
-            for idx, vi in enumerate(validation_instances):
-                instance = vi['instance_data'].copy()
-                instance['verse_reference'] = vi['verse_ref']
-                instance['hebrew_text'] = vi['hebrew_text']
-                instance['english_text'] = vi['english_text']
+            for idx, (verse, record) in enumerate(validation_instances):
+                instance = record.validation_payload(verse)
                 instance['instance_id'] = idx + 1
-                instance['db_id'] = vi['db_id']
                 all_chapter_instances.append(instance)
-                instance_id_to_db_id[idx + 1] = vi['db_id']
+                instance_id_to_db_id[idx + 1] = record.id
 
-            # Call validator
-            bulk_validation_results, validation_cost_metadata = self.validator.validate_chapter_instances(all_chapter_instances)
+            with get_profiler().span(STAGE_VALIDATION, book, chapter, instances=len(all_chapter_instances)):
+                validation_results, validation_cost_metadata = self.validator.validate_chapter_instances_concurrent(all_chapter_instances)
 
-            # Process validation results
-            for validation_result in bulk_validation_results:
-                process_validation_result(
-                    validation_result, instance_id_to_db_id,
-                    self.db_manager, self.logger, db_lock=None  # No lock needed - single writer
-                )
+        except Exception as e:
+            self.logger.error(f"[WriteQueue] Validation error for {book} {chapter}: {e}")
+
+        finally:
+            self.queue.put({
+                'chapter_key': item['chapter_key'],
+                'book': book,
+                'chapter': chapter,
+                'result': result,
+                'validation_results': validation_results,
+                'validation_cost_metadata': validation_cost_metadata,
+                'instance_id_to_db_id': instance_id_to_db_id
+            })
+
+    def _apply_validation(self, item: dict):
+        """Write a chapter's validator response to the database and commit (writer thread)."""
+        book, chapter, result = item['book'], item['chapter'], item['result']
+        validation_cost_metadata = item['validation_cost_metadata']
+        if not validation_cost_metadata:
+            return  # The validator call failed; the error is already logged
+
+        # The call is billed whether or not its results can be applied
+        result['validation_cost'] = validation_cost_metadata.get('cost', 0.0)
+        result['validation_usage'] = validation_cost_metadata
+        try:
+            # Process validation results (no lock needed - single writer)
+            apply_validation_results(item['validation_results'], item['instance_id_to_db_id'],
+                                     self.db_manager, self.logger)
+
+            self.db_manager.record_chapter_validation_usage(book, chapter, validation_cost_metadata)
+
+            if self.run_journal:
+                self.run_journal.record(book, chapter, 'validated',
+                                        {'results': len(item['validation_results'])},
+                                        cursor=self.db_manager.cursor)
 
             # Commit validation updates
-            self.db_manager.commit()
+            with get_profiler().span(STAGE_COMMIT, book, chapter):
+                self.db_manager.commit()
 
             self.logger.info(f"[WriteQueue] Validation complete for {book} {chapter}")
 
         except Exception as e:
             self.logger.error(f"[WriteQueue] Validation error for {book} {chapter}: {e}")
+            self.db_manager.rollback()
+
+
+def fetch_chapter_verses(book_name: str, chapter: int, verse_selection, sefaria_cache, sefaria_client,
+                         logger, log_prefix: str = "") -> List[Dict]:
+    """
+    Sefaria text of a chapter (text store first, then the API), filtered to the verse selection.
+
+    Raises:
+        ValueError: If Sefaria returned no text
+    """
+    reference = f"{book_name}.{chapter}"
+    with get_profiler().span(STAGE_FETCH, book_name, chapter) as fetch_args:
+        cached = sefaria_cache.get(reference)
+
+        if cached and cached[0]:
+            verses_data = cached[0]
+            fetch_args['source'] = 'store'
+            logger.info(f"{log_prefix} Using cached Sefaria data for {reference}")
+        else:
+            verses_data, _ = sefaria_client.extract_hebrew_text(reference)
+            fetch_args['source'] = 'sefaria'
+            if verses_data:
+                sefaria_cache.set(reference, verses_data,
+                                  source_version=sefaria_client.get_source_version(reference))
+                logger.debug(f"{log_prefix} Cached Sefaria data for {reference}")
+
+    if not verses_data:
+        raise ValueError(f"Failed to get text from Sefaria for {reference}")
+
+    # Filter verses if needed
+    if verse_selection != 'ALL_VERSES' and isinstance(verse_selection, str):
+        max_verses = len(verses_data)
+        parsed_verses = parse_selection(verse_selection, max_verses, "verse")
+        if parsed_verses:
+            verses_data = [v for v in verses_data if int(v['reference'].split(':')[1]) in parsed_verses]
+            logger.info(f"{log_prefix} Filtered to {len(verses_data)} verses")
+
+    return verses_data
 
 
 def process_single_chapter_task(task_data: Dict, sefaria_cache, validator, divine_names_modifier,
                                  db_path: str, logger, run_context: RunContext = None,
-                                 write_queue: ChapterWriteQueue = None) -> Dict:
+                                 write_queue: ChapterWriteQueue = None,
+                                 run_journal: RunJournal = None) -> Dict:
     """
     Process a single chapter - designed to be called from ThreadPoolExecutor.
 
@@ -1330,13 +2367,16 @@ def process_single_chapter_task(task_data: Dict, sefaria_cache, validator, divin
 
     Args:
         task_data: Dict with 'book', 'chapter', 'verses' (optional filter)
-        sefaria_cache: SefariaCache instance
+        sefaria_cache: SefariaTextStore instance
         validator: MetaphorValidator instance
         divine_names_modifier: HebrewDivineNamesModifier instance
         db_path: Path to the database file
         logger: Logger instance
         run_context: Optional RunContext for failure tracking
         write_queue: Optional ChapterWriteQueue for lock-free parallel processing
+        run_journal: Optional RunJournal for checkpointing stages (resumes from cached detection
+                     when task_data['resume_stage'] == 'detected'; task_data['batch_detection'] marks
+                     output a batch job produced in this run, whose cost counts towards the chapter)
 
     Returns:
         Dict with processing results
@@ -1359,6 +2399,8 @@ def process_single_chapter_task(task_data: Dict, sefaria_cache, validator, divin
     }
 
     start_time = time.time()
+    profiler = get_profiler()
+    chapter_started = profiler.now()
 
     # Only create thread-local DatabaseManager if NOT using write_queue
     db_manager = None
@@ -1372,39 +2414,46 @@ def process_single_chapter_task(task_data: Dict, sefaria_cache, validator, divin
     try:
         logger.info(f"[Worker {worker_id}] Starting {book_name} {chapter}")
 
-        # Fetch verses (with caching)
-        reference = f"{book_name}.{chapter}"
-        cached = sefaria_cache.get(reference)
-
-        if cached and cached[0]:
-            verses_data = cached[0]
-            logger.info(f"[Worker {worker_id}] Using cached Sefaria data for {reference}")
+        # Resume from cached detection output if the journal has it (skips the LLM call)
+        cached_detection = None
+        if run_journal and write_queue and task_data.get('resume_stage') == 'detected':
+            cached_detection = run_journal.load_detection(book_name, chapter)
+            if cached_detection and task_data.get('batch_detection'):
+                logger.info(f"[Worker {worker_id}] Writing {book_name} {chapter} from batch job detection output")
+            elif cached_detection:
+                logger.info(f"[Worker {worker_id}] Resuming {book_name} {chapter} from cached detection output")
+
+        if cached_detection:
+            verses_data = cached_detection[0]
         else:
-            verses_data, _ = sefaria_client.extract_hebrew_text(reference)
-            if verses_data:
-                sefaria_cache.set(reference, verses_data)
-                logger.debug(f"[Worker {worker_id}] Cached Sefaria data for {reference}")
+            verses_data = fetch_chapter_verses(book_name, chapter, verse_selection, sefaria_cache, sefaria_client,
+                                               logger, f"[Worker {worker_id}]")
 
-        if not verses_data:
-            raise ValueError(f"Failed to get text from Sefaria for {reference}")
-
-        # Filter verses if needed
-        if verse_selection != 'ALL_VERSES' and isinstance(verse_selection, str):
-            max_verses = len(verses_data)
-            parsed_verses = parse_selection(verse_selection, max_verses, "verse")
-            if parsed_verses:
-                verses_data = [v for v in verses_data if int(v['reference'].split(':')[1]) in parsed_verses]
-                logger.info(f"[Worker {worker_id}] Filtered to {len(verses_data)} verses")
+            if run_journal:
+                run_journal.record(book_name, chapter, 'fetched', {'verses': len(verses_data)})
 
         logger.info(f"[Worker {worker_id}] Processing {len(verses_data)} verses from {book_name} {chapter}")
 
         if write_queue:
             # NEW: Use WriteQueue for lock-free parallel processing
-            # Process chapter and get prepared data (no database writes yet)
-            collected_verses, collected_instances, proc_time, total_attempted, chapter_cost, batch_error = process_chapter_batched(
-                verses_data, book_name, chapter, validator, divine_names_modifier,
-                None, logger, run_context, db_lock=None, return_data_only=True
-            )
+            if cached_detection:
+                # Detection was already paid for in an earlier run (or by this run's batch job) - reuse it as-is
+                collected_verses, collected_instances, detection_metadata = cached_detection
+                chapter_cost = detection_metadata.get('cost', 0.0) if task_data.get('batch_detection') else 0.0
+                proc_time, total_attempted, batch_error = 0.0, len(collected_verses), None
+                token_usage = detection_metadata.get('token_usage')
+            else:
+                # Process chapter and get prepared data (no database writes yet)
+                (collected_verses, collected_instances, proc_time, total_attempted, chapter_cost, batch_error,
+                 token_usage) = process_chapter_batched(
+                    verses_data, book_name, chapter, validator, divine_names_modifier,
+                    None, logger, run_context, db_lock=None, return_data_only=True
+                )
+
+                if run_journal and not batch_error and collected_verses:
+                    run_journal.save_detection(book_name, chapter, collected_verses, collected_instances,
+                                               {'cost': chapter_cost, 'processing_time': proc_time,
+                                                'token_usage': token_usage})
 
             if batch_error:
                 # API call or JSON parsing failed
@@ -1442,23 +2491,30 @@ def process_single_chapter_task(task_data: Dict, sefaria_cache, validator, divin
                     )
             else:
                 # Success! Submit data to write queue
-                chapter_key = write_queue.submit_chapter(
-                    book_name, chapter,
-                    collected_verses, collected_instances,
-                    {'cost': chapter_cost, 'processing_time': proc_time}
-                )
+                with profiler.span(STAGE_WRITER_LATENCY, book_name, chapter):
+                    chapter_key = write_queue.submit_chapter(
+                        book_name, chapter,
+                        collected_verses, collected_instances,
+                        {'cost': chapter_cost, 'processing_time': proc_time, 'token_usage': token_usage}
+                    )
 
-                # Wait for write to complete
-                logger.info(f"[Worker {worker_id}] Submitted {book_name} {chapter} to WriteQueue, waiting for write...")
-                write_result = write_queue.wait_for_result(chapter_key, timeout=300.0)
+                    # Wait for write to complete
+                    logger.info(f"[Worker {worker_id}] Submitted {book_name} {chapter} to WriteQueue, waiting for write...")
+                    write_result = write_queue.wait_for_result(chapter_key, timeout=300.0)
 
                 if write_result['success']:
+                    # Validation ran in the WriteQueue; its cost belongs to this chapter
+                    chapter_cost += write_result.get('validation_cost', 0.0)
                     result['verses_stored'] = write_result['verses_stored']
                     result['instances_stored'] = write_result['instances_stored']
                     result['processing_time'] = time.time() - start_time
                     result['cost'] = chapter_cost
                     result['success'] = True
 
+                    if token_usage:
+                        result['token_usage'] = add_validation_token_usage(dict(token_usage),
+                                                                           write_result.get('validation_usage'))
+
                     if run_context:
                         run_context.record_chapter_success(
                             book_name, chapter,
@@ -1466,6 +2522,8 @@ def process_single_chapter_task(task_data: Dict, sefaria_cache, validator, divin
                             result['processing_time'], chapter_cost,
                             'gpt-5.1-medium-batched'
                         )
+                        if token_usage:
+                            run_context.record_token_usage(book_name, chapter, result['token_usage'])
 
                     logger.info(f"[Worker {worker_id}] Completed {book_name} {chapter}: "
                                f"{result['instances_stored']} instances from {result['verses_stored']} verses "
@@ -1488,7 +2546,7 @@ def process_single_chapter_task(task_data: Dict, sefaria_cache, validator, divin
             # Process chapter using batched mode WITHOUT holding the lock during API calls
             # This allows multiple workers to make API calls in parallel
             # Database inserts inside process_chapter_batched() are protected by db_lock
-            v, i, proc_time, total_attempted, chapter_cost, batch_error = process_chapter_batched(
+            v, i, proc_time, total_attempted, chapter_cost, batch_error, token_usage = process_chapter_batched(
                 verses_data, book_name, chapter, validator, divine_names_modifier,
                 db_manager, logger, run_context, db_lock=_db_lock
             )
@@ -1502,6 +2560,7 @@ def process_single_chapter_task(task_data: Dict, sefaria_cache, validator, divin
             result['instances_stored'] = i
             result['processing_time'] = time.time() - start_time
             result['cost'] = chapter_cost
+            result['token_usage'] = token_usage
             result['success'] = v > 0 or total_attempted == 0  # Success if we stored verses or there were none to store
 
             if v == 0 and total_attempted > 0:
@@ -1537,6 +2596,10 @@ def process_single_chapter_task(task_data: Dict, sefaria_cache, validator, divin
                         result['processing_time'], chapter_cost,
                         'gpt-5.1-medium-batched'
                     )
+                    if token_usage:
+                        run_context.record_token_usage(book_name, chapter, token_usage)
+                if run_journal:
+                    run_journal.record(book_name, chapter, 'written', {'verses': v, 'instances': i})
 
             logger.info(f"[Worker {worker_id}] Completed {book_name} {chapter}: {i} instances from {v} verses in {result['processing_time']:.1f}s (Cost: ${chapter_cost:.4f})")
 
@@ -1554,14 +2617,63 @@ def process_single_chapter_task(task_data: Dict, sefaria_cache, validator, divin
         # Always close this thread's database connection (if we created one)
         if db_manager:
             db_manager.close()
+        profiler.add_span(STAGE_CHAPTER, book_name, chapter, chapter_started, profiler.now(),
+                          success=result['success'], instances=result['instances_stored'])
+
+    if run_journal and not result['success']:
+        try:
+            run_journal.record(book_name, chapter, 'failed', {'error': result['error']})
+        except Exception as journal_error:
+            logger.warning(f"[Worker {worker_id}] Could not journal failure for {book_name} {chapter}: {journal_error}")
 
     return result
 
 
+def _run_budgeted_chapter_task(budget: Optional[TokenBudget], controller: Optional[RunController],
+                               task_data: Dict, *args) -> Dict:
+    """
+    Run process_single_chapter_task while holding the chapter's share of the token budget,
+    once the run controller admits it. A chapter the controller turns away returns a
+    'not_started' result instead.
+    """
+    profiler = get_profiler()
+    if 'submitted_at' in task_data:
+        profiler.add_span(STAGE_QUEUE_WAIT, task_data['book'], task_data['chapter'],
+                          task_data['submitted_at'], profiler.now(), track='executor queue')
+
+    tokens = task_data['workload']['total_tokens']
+    if budget is not None:
+        with profiler.span(STAGE_BUDGET_WAIT, task_data['book'], task_data['chapter'], tokens=tokens):
+            budget.acquire(tokens)
+    try:
+        if controller is None:
+            return process_single_chapter_task(task_data, *args)
+
+        with profiler.span(STAGE_ADMISSION_WAIT, task_data['book'], task_data['chapter']):
+            refusal = controller.admit(task_data)
+        if refusal:
+            return {'book': task_data['book'], 'chapter': task_data['chapter'], 'success': False,
+                    'not_started': True, 'error': refusal, 'verses_stored': 0, 'instances_stored': 0,
+                    'processing_time': 0, 'cost': 0.0}
+        result = None
+        try:
+            result = process_single_chapter_task(task_data, *args)
+            return result
+        finally:
+            controller.finish(task_data, result)
+    finally:
+        if budget is not None:
+            budget.release(tokens)
+
+
 def process_chapters_parallel(chapter_tasks: List[Dict], sefaria_cache, sefaria_client,
                                validator, divine_names_modifier, db_manager, logger,
                                max_workers: int, run_context: RunContext = None,
-                               use_write_queue: bool = True) -> Dict:
+                               use_write_queue: bool = True, run_journal: RunJournal = None,
+                               token_budget: int = None, schedule_longest_first: bool = True,
+                               soft_cost_limit: float = None, hard_cost_limit: float = None,
+                               tokens_per_minute: float = None, dashboard: bool = False,
+                               prior_cost: float = 0.0) -> Dict:
     """
     Process multiple chapters in parallel using ThreadPoolExecutor.
 
@@ -1575,7 +2687,7 @@ def process_chapters_parallel(chapter_tasks: List[Dict], sefaria_cache, sefaria_
 
     Args:
         chapter_tasks: List of dicts with 'book', 'chapter', optional 'verses'
-        sefaria_cache: SefariaCache instance for caching Sefaria responses
+        sefaria_cache: SefariaTextStore holding fetched Sefaria chapter text
         sefaria_client: SefariaClient instance for fetching text
         validator: MetaphorValidator instance
         divine_names_modifier: HebrewDivineNamesModifier instance
@@ -1585,6 +2697,18 @@ def process_chapters_parallel(chapter_tasks: List[Dict], sefaria_cache, sefaria_
         run_context: Optional RunContext for tracking
         use_write_queue: If True (default), use WriteQueue for lock-free writes.
                         If False, use legacy per-worker database connections.
+        run_journal: Optional RunJournal. Stages are checkpointed as chapters progress; when the
+                     journal is in resume mode, already-written chapters are skipped.
+        token_budget: Optional global in-flight token budget. max_workers stays the thread
+                      ceiling, but a chapter only starts once its estimated tokens fit.
+        schedule_longest_first: If True (default), run chapters longest-processing-time-first
+                                instead of in selection order.
+        soft_cost_limit: Optional USD spend after which the run drains (see RunController).
+        hard_cost_limit: Optional USD ceiling on spend plus projected in-flight cost.
+        tokens_per_minute: Optional target for estimated tokens started per rolling minute.
+        dashboard: If True, show the RunController's live dashboard (or log it when not a terminal).
+        prior_cost: USD a resumed run spent before the interruption; counts towards the cost ceilings
+                    but is not included in the returned total_cost.
 
     Returns:
         Dict with aggregated results
@@ -1597,9 +2721,15 @@ def process_chapters_parallel(chapter_tasks: List[Dict], sefaria_cache, sefaria_
         'total_instances': 0,
         'total_time': 0,
         'total_cost': 0.0,
+        'skipped_chapters': 0,
+        'not_started_chapters': [],
         'chapter_results': []
     }
 
+    if run_journal:
+        chapter_tasks, skipped_tasks = run_journal.plan_resume(chapter_tasks, logger)
+        total_results['skipped_chapters'] = len(skipped_tasks)
+
     if not chapter_tasks:
         return total_results
 
@@ -1614,6 +2744,24 @@ def process_chapters_parallel(chapter_tasks: List[Dict], sefaria_cache, sefaria_
 
     start_time = time.time()
 
+    # Order longest-first so long chapters don't start last and dominate the tail
+    if schedule_longest_first:
+        chapter_tasks = schedule_chapter_tasks(chapter_tasks, sefaria_cache)
+    else:
+        for task in chapter_tasks:
+            task['workload'] = estimate_chapter_workload(task['book'], task['chapter'], sefaria_cache,
+                                                         task.get('verses', 'ALL_VERSES'))
+
+    predicted_makespan = predict_makespan([t['workload'] for t in chapter_tasks], max_workers, token_budget)
+    logger.info(f"[SCHEDULER] {'Longest-first' if schedule_longest_first else 'Selection'} order, "
+                f"token budget: {token_budget or 'none'}, predicted makespan: {predicted_makespan:.0f}s")
+    for task in chapter_tasks[:5]:
+        workload = task['workload']
+        logger.debug(f"[SCHEDULER] {task['book']} {task['chapter']}: ~{workload['total_tokens']:,} tokens, "
+                     f"~{workload['predicted_seconds']:.0f}s ({workload['source']})")
+
+    budget = TokenBudget(token_budget) if token_budget else None
+
     # Add worker IDs and sefaria_client to tasks
     for i, task in enumerate(chapter_tasks):
         task['worker_id'] = (i % max_workers) + 1
@@ -1622,18 +2770,31 @@ def process_chapters_parallel(chapter_tasks: List[Dict], sefaria_cache, sefaria_
     # Create WriteQueue if enabled (eliminates database lock contention)
     write_queue = None
     if use_write_queue:
-        write_queue = ChapterWriteQueue(db_path, logger, validator=validator, divine_names_modifier=divine_names_modifier)
+        write_queue = ChapterWriteQueue(db_path, logger, validator=validator, divine_names_modifier=divine_names_modifier,
+                                        run_journal=run_journal)
         write_queue.start_writer()
         logger.info("[PARALLEL CHAPTERS] WriteQueue writer thread started")
 
+    controller = RunController(chapter_tasks, max_workers, logger, soft_cost_limit=soft_cost_limit,
+                               hard_cost_limit=hard_cost_limit, tokens_per_minute=tokens_per_minute,
+                               write_queue=write_queue, dashboard=dashboard, prior_cost=prior_cost)
+    if soft_cost_limit is not None or hard_cost_limit is not None or tokens_per_minute:
+        logger.info(f"[CONTROLLER] Soft cost ceiling: {soft_cost_limit or 'none'}, hard cost ceiling: "
+                    f"{hard_cost_limit or 'none'}, tokens/min target: {tokens_per_minute or 'none'}")
+    controller.start()
+
     try:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                   thread_name_prefix='ChapterWorker') as executor:
             # Submit all chapter processing tasks
+            submitted_at = get_profiler().now()
+            for task in chapter_tasks:
+                task['submitted_at'] = submitted_at
             future_to_task = {
                 executor.submit(
-                    process_single_chapter_task,
+                    _run_budgeted_chapter_task, budget, controller,
                     task, sefaria_cache, validator, divine_names_modifier,
-                    db_path, logger, run_context, write_queue
+                    db_path, logger, run_context, write_queue, run_journal
                 ): task
                 for task in chapter_tasks
             }
@@ -1643,6 +2804,9 @@ def process_chapters_parallel(chapter_tasks: List[Dict], sefaria_cache, sefaria_
                 task = future_to_task[future]
                 try:
                     result = future.result()
+                    if result.get('not_started'):
+                        total_results['not_started_chapters'].append(result)
+                        continue
                     total_results['chapter_results'].append(result)
 
                     if result['success']:
@@ -1673,9 +2837,39 @@ def process_chapters_parallel(chapter_tasks: List[Dict], sefaria_cache, sefaria_
         if write_queue:
             logger.info("[PARALLEL CHAPTERS] Stopping WriteQueue writer thread...")
             write_queue.stop_writer(timeout=300.0)
+        controller.stop()
 
     total_results['total_time'] = time.time() - start_time
 
+    # Predicted vs actual makespan for tuning the workload estimates
+    actual_times = {(r['book'], r['chapter']): r.get('processing_time', 0) for r in total_results['chapter_results']}
+    total_results['scheduling'] = {
+        'order': 'longest_first' if schedule_longest_first else 'selection',
+        'max_workers': max_workers,
+        'token_budget': token_budget,
+        'peak_in_flight_tokens': budget.peak_in_flight if budget else None,
+        'predicted_makespan_seconds': round(predicted_makespan, 1),
+        'actual_makespan_seconds': round(total_results['total_time'], 1),
+        'chapters': [
+            {
+                'book': task['book'],
+                'chapter': task['chapter'],
+                'estimated_tokens': task['workload']['total_tokens'],
+                'predicted_seconds': round(task['workload']['predicted_seconds'], 1),
+                'actual_seconds': round(actual_times.get((task['book'], task['chapter']), 0), 1)
+            }
+            for task in chapter_tasks
+        ]
+    }
+    total_results['run_controller'] = controller.summary()
+    if run_context:
+        run_context.scheduling = total_results['scheduling']
+        run_context.run_controller = total_results['run_controller']
+
+    logger.info(f"[SCHEDULER] Makespan: predicted {predicted_makespan:.0f}s, actual {total_results['total_time']:.0f}s")
+    if total_results['not_started_chapters']:
+        logger.warning(f"[CONTROLLER] {len(total_results['not_started_chapters'])} chapters not started: "
+                       f"{controller.drain_reason or 'hard cost ceiling'}")
     logger.info(f"[PARALLEL CHAPTERS] Complete: {total_results['successful_chapters']} succeeded, "
                 f"{total_results['failed_chapters']} failed, "
                 f"{total_results['total_instances']} instances from {total_results['total_verses']} verses, "
@@ -1684,90 +2878,347 @@ def process_chapters_parallel(chapter_tasks: List[Dict], sefaria_cache, sefaria_
     return total_results
 
 
-def process_chapter_batched(verses_data, book_name, chapter, validator, divine_names_modifier, db_manager, logger, run_context: RunContext = None, db_lock: threading.Lock = None, return_data_only: bool = False):
-    """Process an entire chapter in a single batched API call (GPT-5.1 MEDIUM)
+def _batch_response_text(result: Optional[Dict]) -> Tuple[Optional[str], Optional[str]]:
+    """(content, None) of a batch job result, or (None, reason) when it is unusable"""
+    if result is None:
+        return None, 'no result in the job output'
+    if result['error']:
+        return None, result['error']
+    choices = (result['body'] or {}).get('choices') or []
+    if not choices or not (choices[0].get('message') or {}).get('content'):
+        return None, 'empty response'
+    if choices[0].get('finish_reason') == 'length':
+        return None, 'truncated (finish_reason=length)'
+    return choices[0]['message']['content'], None
 
-    This approach sends all verses in ONE API call, achieving 95% token savings
-    compared to per-verse processing.
 
-    Args:
-        verses_data: List of verse dictionaries with 'hebrew', 'english', 'reference', 'verse'
-        book_name: Name of the book
-        chapter: Chapter number
-        validator: MetaphorValidator instance (uses GPT-5.1 MEDIUM)
-        divine_names_modifier: HebrewDivineNamesModifier instance
-        db_manager: DatabaseManager instance (not used when return_data_only=True)
-        logger: Logger instance
-        run_context: Optional RunContext for failure tracking
-        db_lock: Optional threading.Lock for thread-safe database operations
-        return_data_only: If True, return prepared data instead of writing to DB.
-                         Used by WriteQueue architecture to eliminate lock contention.
+def _run_batch_jobs(backend, run_journal: RunJournal, meta_key: str, lines: List[Dict],
+                    chapters: List[Tuple[str, int]], poll_seconds: float, logger, label: str) -> Dict[str, Dict]:
+    """
+    Submit request lines as batch jobs and wait for them; returns the results by custom_id.
+
+    The job ids are kept in the run journal under meta_key until the results are ingested, so an
+    interrupted run resumed with --resume polls the jobs it already paid for instead of resubmitting.
+    """
+    pending = run_journal.get_meta(meta_key) if run_journal.resume else None
+    if pending:
+        batch_ids = pending['ids']
+        logger.info(f"[BATCH] Resuming {len(batch_ids)} {label} jobs submitted by the interrupted run")
+    elif lines:
+        paths = write_batch_files(lines, BATCH_JOBS_DIR, f"{label}_{run_journal.run_id}")
+        batch_ids = [backend.submit(path, {'label': label, 'run_id': run_journal.run_id}) for path in paths]
+        logger.info(f"[BATCH] Submitted {len(lines)} {label} requests as {len(batch_ids)} {backend.name} jobs: "
+                    + ", ".join(batch_ids))
+        run_journal.set_meta(meta_key, {'ids': batch_ids, 'chapters': [list(key) for key in chapters]})
+    else:
+        return {}
+
+    statuses = wait_for_batches(backend, batch_ids, poll_seconds, logger, label)
+    results = {}
+    for batch_id in batch_ids:
+        if statuses[batch_id]['status'] != 'completed':
+            logger.warning(f"[BATCH] {label} job {batch_id} ended {statuses[batch_id]['status']}")
+        results.update(backend.results(batch_id))
+    return results
+
+
+def _ingest_batch_detection(task: Dict, verses_data: List[Dict], windows: List[Tuple[str, List[Dict], int]],
+                            results: Dict[str, Dict], divine_names_modifier, run_context: Optional[RunContext],
+                            run_journal: RunJournal, logger) -> Optional[str]:
+    """
+    Turn a chapter's detection job results into records and cache them in the run journal.
+
+    Goes through the same parse/assemble steps as process_chapter_batched. Returns None on
+    success, or why the chapter has to fall back to synchronous detection.
+    """
+    book_name, chapter = task['book'], task['chapter']
+    window_results = []
+    for custom_id, window_verses, prompt_tokens in windows:
+        response_text, reason = _batch_response_text(results.get(custom_id))
+        if reason:
+            return f"window {custom_id.rsplit('|', 1)[-1]}: {reason}"
+        windowed = len(window_verses) < len(verses_data)
+        label = f"{window_verses[0]['verse']}-{window_verses[-1]['verse']}"
+        save_raw_response(response_text, book_name, chapter, f"_v{label}_batch" if windowed else "_batch")
+
+        with get_profiler().span(STAGE_PARSE, book_name, chapter, window=label, chars=len(response_text)):
+            verse_results = parse_detection_response(response_text, logger, structured=structured_output_enabled())
+
+        # Keep only the verses this window asked for; references come from the verse anchor
+        wanted = {v['verse'] for v in window_verses}
+        verse_results = [vr for vr in verse_results if vr.get('verse') in wanted]
+        for vr in verse_results:
+            vr['reference'] = f"{book_name} {chapter}:{vr['verse']}"
+
+        window_results.append({
+            'verse_results': verse_results,
+            'token_metadata': usage_to_token_metadata(results[custom_id]['body'].get('usage'), BATCH_PRICE_FACTOR),
+            'skipped_verses': set(),
+            'corrupted_chunks': 0,
+            'windows': 1,
+            'prompt_tokens': prompt_tokens,
+            'calls': 1
+        })
+
+    detection = window_results[0] if len(window_results) == 1 else _merge_window_results(window_results)
+    detection['token_metadata']['streaming'] = False
+    if not detection['verse_results']:
+        return "no valid verse results found after filtering"
+
+    prompt_savings = measure_prompt_savings(verses_data, detection['prompt_tokens'], detection['calls'])
+    if run_context:
+        run_context.record_prompt_savings(book_name, chapter, prompt_savings)
+    token_usage = build_chapter_token_usage(verses_data, detection)
+    get_token_estimator().record(book_name, chapter, token_usage['verses'],
+                                 token_usage['estimated_input_tokens'], token_usage)
+
+    with get_profiler().span(STAGE_ASSEMBLE, book_name, chapter, verses=len(detection['verse_results'])):
+        chapter_records = assemble_chapter_records(detection['verse_results'], verses_data, book_name, chapter,
+                                                   divine_names_modifier, logger)
+    collected_verses = [verse_record for verse_record, _ in chapter_records]
+    collected_instances = [(verse_index, instance_record)
+                           for verse_index, (_, instance_records) in enumerate(chapter_records)
+                           for instance_record in instance_records]
+
+    detection_cost = detection['token_metadata'].get('cost', 0.0)
+    run_journal.save_detection(book_name, chapter, collected_verses, collected_instances,
+                               {'cost': detection_cost, 'processing_time': 0.0, 'token_usage': token_usage})
+    task['resume_stage'] = 'detected'
+    task['batch_detection'] = True
+    logger.info(f"[BATCH] {book_name} {chapter}: {len(collected_instances)} instances from "
+                f"{len(collected_verses)} verses (Cost: ${detection_cost:.4f})")
+    return None
+
+
+def _run_batch_validation(chapters: List[Tuple[str, int]], validator, db_manager, backend,
+                          run_journal: RunJournal, poll_seconds: float, logger) -> Tuple[Dict, int]:
+    """
+    Validate written chapters through a batch job.
 
     Returns:
-        If return_data_only=False (default):
-            Tuple of (verses_stored, instances_stored, processing_time, total_attempted, total_cost, error_msg)
-        If return_data_only=True:
-            Tuple of (verses_data_list, instances_data_list, processing_time, total_attempted, total_cost, error_msg)
-            where instances_data_list is List[(verse_index, instance_dict)]
+        Tuple of (validation cost metadata per (book, chapter), number of requests submitted)
+
+    Instances are sent with their database IDs as instance_ids, so results still match after a
+    restart. Instances a job left without a usable result keep their NULL decisions for the
+    post-run coverage check and auto-recovery.
+    """
+    chapter_instances = {}
+    lines = []
+    for book_name, chapter in chapters:
+        instances, id_mapping = load_unvalidated_instances(db_manager, book_name, chapter)
+        if not instances:
+            continue
+        for instance in instances:
+            instance['instance_id'] = id_mapping[instance['instance_id']]
+        chapter_instances[(book_name, chapter)] = instances
+        for k, (_, request) in enumerate(validator.chapter_validation_requests(instances), 1):
+            lines.append(batch_request_line(f"validate|{book_name}|{chapter}|{k}", request))
+
+    results = _run_batch_jobs(backend, run_journal, 'batch_validation_jobs', lines, list(chapter_instances),
+                              poll_seconds, logger, 'validation')
+
+    by_chapter = {}
+    for custom_id, result in results.items():
+        _, book_name, chapter, _ = custom_id.split('|')
+        by_chapter.setdefault((book_name, int(chapter)), []).append((custom_id, result))
+
+    validation_usage = {}
+    for key, instances in chapter_instances.items():
+        book_name, chapter = key
+        validation_results = []
+        cost_metadata = []
+        for custom_id, result in sorted(by_chapter.get(key, [])):
+            response_text, reason = _batch_response_text(result)
+            if result['body']:
+                cost_metadata.append(usage_to_token_metadata(result['body'].get('usage'), BATCH_PRICE_FACTOR))
+            if reason:
+                logger.warning(f"[BATCH] {custom_id}: {reason}")
+                continue
+            validation_results.extend(validator.parse_batch_validation_response(instances, response_text))
+
+        cost_metadata = merge_token_metadata(cost_metadata)
+        applied_ids = apply_validation_results(validation_results, {i['instance_id']: i['instance_id'] for i in instances},
+                                               db_manager, logger)
+        db_manager.record_chapter_validation_usage(book_name, chapter, cost_metadata)
+        if applied_ids:
+            run_journal.record(book_name, chapter, 'validated', {'results': len(applied_ids), 'batch': True},
+                               cursor=db_manager.cursor)
+        db_manager.commit()
+        validation_usage[key] = cost_metadata
+
+        if len(applied_ids) < len(instances):
+            logger.warning(f"[BATCH] {book_name} {chapter}: {len(instances) - len(applied_ids)} of {len(instances)} "
+                           f"instances without a validation result (left for recovery)")
+
+    run_journal.set_meta('batch_validation_jobs', None)
+    return validation_usage, len(lines)
+
+
+def process_chapters_batch_api(chapter_tasks: List[Dict], sefaria_cache, sefaria_client,
+                               validator, divine_names_modifier, db_manager, logger,
+                               max_workers: int, backend, run_context: RunContext = None,
+                               run_journal: RunJournal = None,
+                               poll_seconds: float = BATCH_POLL_SECONDS) -> Dict:
     """
-    start_time = time.time()
+    Process chapters through provider batch jobs instead of synchronous API calls.
 
-    if not verses_data:
-        if return_data_only:
-            return [], [], 0, 0, 0.0, None
-        return 0, 0, 0, 0, 0.0, None
+    For non-interactive full-book runs: batch jobs are billed at half the synchronous rate
+    but answered within the provider's completion window, so the run waits on them.
 
-    # Use increased token limit for prophetic books which have longer chapters
-    # Includes Former Prophets and Latter Prophets (Major and Minor)
-    PROPHETIC_BOOKS = [
-        # Former Prophets
-        "Joshua", "Judges", "1_Samuel", "2_Samuel", "1_Kings", "2_Kings",
-        # Latter Prophets - Major
-        "Isaiah", "Jeremiah", "Ezekiel",
-        # Latter Prophets - The Twelve (Minor Prophets)
-        "Hosea", "Joel", "Amos", "Obadiah", "Jonah", "Micah", "Nahum",
-        "Habakkuk", "Zephaniah", "Haggai", "Zechariah", "Malachi"
-    ]
-    max_tokens = MAX_COMPLETION_TOKENS_PROPHETIC if book_name in PROPHETIC_BOOKS else MAX_COMPLETION_TOKENS_DEFAULT
+    1. Detection: every chapter's window prompts (as process_chapter_batched builds them) go
+       into one job. Results are parsed and assembled like synchronous responses and cached
+       in the run journal as 'detected'. Chapters with a failed, truncated or unparseable
+       window fall back to synchronous detection in step 2.
+    2. Write: process_chapters_parallel writes the cached detection through the WriteQueue
+       (and runs the fallback chapters) with validation turned off.
+    3. Validation: the written chapters' instances go into a second job, and the results are
+       applied with the same path as synchronous validation.
 
-    logger.info(f"[BATCHED MODE] Processing {book_name} {chapter} with {len(verses_data)} verses in SINGLE API call")
-    logger.info(f"[BATCHED MODE] Using max_completion_tokens={max_tokens}")
+    Cost ceilings and the tokens/min target do not apply to the batch jobs.
 
-    # Build full chapter context (Hebrew + English)
-    chapter_hebrew = "\n".join([f"{v['verse']}. {v['hebrew']}" for v in verses_data])
-    chapter_english = "\n".join([f"{v['verse']}. {v['english']}" for v in verses_data])
-    full_chapter_context = f"""=== {book_name} Chapter {chapter} (FULL CHAPTER for context) ===
+    Args:
+        chapter_tasks: List of dicts with 'book', 'chapter', optional 'verses'
+        backend: OpenAIBatchBackend or LocalBatchBackend
+        run_journal: RunJournal (required - detection output and job ids are kept in it)
+        poll_seconds: Interval between job status checks
+        (other arguments as process_chapters_parallel)
 
-Hebrew:
-{chapter_hebrew}
+    Returns:
+        Dict with aggregated results (as process_chapters_parallel, plus a 'batch' summary)
+    """
+    all_tasks = list(chapter_tasks)
+    chapter_tasks, skipped_tasks = run_journal.plan_resume(chapter_tasks, logger)
+    batch_summary = {'backend': backend.name, 'detection_requests': 0, 'batch_detected_chapters': 0,
+                     'fallback_chapters': [], 'validation_requests': 0, 'batch_validated_chapters': 0,
+                     'validation_cost': 0.0}
+
+    # 1. Detection job for the chapters without cached detection output
+    logger.info(f"[BATCH] Building detection requests for {len(chapter_tasks)} chapters ({backend.name} backend)")
+    chapter_windows = {}
+    lines = []
+    for task in chapter_tasks:
+        if task.get('resume_stage') == 'detected':
+            continue
+        book_name, chapter = task['book'], task['chapter']
+        try:
+            verses_data = fetch_chapter_verses(book_name, chapter, task.get('verses', 'ALL_VERSES'),
+                                               sefaria_cache, sefaria_client, logger, "[BATCH]")
+        except Exception as e:
+            logger.warning(f"[BATCH] {book_name} {chapter}: {e} - left to the synchronous path")
+            continue
+        run_journal.record(book_name, chapter, 'fetched', {'verses': len(verses_data)})
+
+        max_tokens = detection_max_tokens(book_name)
+        windows = plan_detection_windows(verses_data, book_name)
+        planned = []
+        for window_verses in windows:
+            windowed = len(window_verses) < len(verses_data)
+            custom_id = f"detect|{book_name}|{chapter}|{window_verses[0]['verse']}-{window_verses[-1]['verse']}"
+            with get_profiler().span(STAGE_PROMPT, book_name, chapter, window=custom_id.rsplit('|', 1)[-1]):
+                prompt = build_detection_prompt(book_name, chapter, verses_data,
+                                                window_verses if windowed else None, logger)
+            lines.append(batch_request_line(custom_id, detection_request(prompt, max_tokens)))
+            planned.append((custom_id, window_verses,
+                            estimate_text_tokens(DETECTION_SYSTEM_PROMPT) + estimate_text_tokens(prompt)))
+        chapter_windows[(book_name, chapter)] = (task, verses_data, planned)
+
+    batch_summary['detection_requests'] = len(lines)
+    results = _run_batch_jobs(backend, run_journal, 'batch_detection_jobs', lines, list(chapter_windows),
+                              poll_seconds, logger, 'detection')
+
+    for (book_name, chapter), (task, verses_data, planned) in chapter_windows.items():
+        try:
+            reason = _ingest_batch_detection(task, verses_data, planned, results, divine_names_modifier,
+                                             run_context, run_journal, logger)
+        except Exception as e:
+            reason = str(e)
+        if reason:
+            logger.warning(f"[BATCH] {book_name} {chapter} falls back to synchronous detection: {reason}")
+            batch_summary['fallback_chapters'].append({'book': book_name, 'chapter': chapter, 'reason': reason})
+        else:
+            batch_summary['batch_detected_chapters'] += 1
+    run_journal.set_meta('batch_detection_jobs', None)
 
-English:
-{chapter_english}
-"""
+    # 2. Write the detected chapters (and run the fallback chapters) without validation
+    total_results = process_chapters_parallel(
+        chapter_tasks, sefaria_cache, sefaria_client, None, divine_names_modifier, db_manager, logger,
+        max_workers, run_context, run_journal=run_journal
+    )
+    total_results['total_chapters'] = len(all_tasks)
+    total_results['skipped_chapters'] = len(skipped_tasks)
+
+    # 3. Validation job for every written chapter not yet validated (including ones an interrupted run wrote)
+    if validator:
+        stages = run_journal.get_chapter_stages()
+        written = [(t['book'], t['chapter']) for t in all_tasks if stages.get((t['book'], t['chapter'])) == 'written']
+        validation_usage, batch_summary['validation_requests'] = _run_batch_validation(
+            written, validator, db_manager, backend, run_journal, poll_seconds, logger)
+        stages = run_journal.get_chapter_stages()
+        batch_summary['batch_validated_chapters'] = sum(1 for key in validation_usage if stages.get(key) == 'validated')
+
+        results_by_chapter = {(r['book'], r['chapter']): r for r in total_results['chapter_results']}
+        usage_by_chapter = {(u['book'], u['chapter']): u for u in run_context.token_usage} if run_context else {}
+        for key, cost_metadata in validation_usage.items():
+            cost = cost_metadata.get('cost', 0.0)
+            batch_summary['validation_cost'] += cost
+            total_results['total_cost'] += cost
+            if key in results_by_chapter:
+                results_by_chapter[key]['cost'] = results_by_chapter[key].get('cost', 0.0) + cost
+            if key in usage_by_chapter:
+                add_validation_token_usage(usage_by_chapter[key], cost_metadata)
+            if run_context:
+                run_context.total_cost += cost
+    batch_summary['validation_cost'] = round(batch_summary['validation_cost'], 4)
+
+    total_results['batch'] = batch_summary
+    if run_context:
+        run_context.batch = batch_summary
+
+    logger.info(f"[BATCH] Complete: {batch_summary['batch_detected_chapters']} chapters detected by batch job, "
+                f"{len(batch_summary['fallback_chapters'])} fell back to synchronous detection, "
+                f"{batch_summary['batch_validated_chapters']} validated by batch job "
+                f"(validation cost: ${batch_summary['validation_cost']:.4f})")
+    return total_results
 
-    logger.info(f"Chapter context: {len(full_chapter_context)} chars")
 
-    # Build verses to analyze section
-    verses_to_analyze = ""
-    for v in verses_data:
-        verses_to_analyze += f"\nVerse {v['verse']}:\n"
-        verses_to_analyze += f"Hebrew: {v['hebrew']}\n"
-        verses_to_analyze += f"English: {v['english']}\n"
+class DetectionWindowTruncated(Exception):
+    """Raised when a multi-verse detection window comes back truncated and should be split."""
 
-    # Build batched prompt
-    batched_prompt = f"""You are a biblical Hebrew scholar specializing in figurative language analysis. Your task is to analyze all verses from {book_name} Chapter {chapter} for figurative language.
+    def __init__(self, token_metadata: Dict):
+        super().__init__("Detection response truncated")
+        self.token_metadata = token_metadata
 
-{full_chapter_context}
 
-=== VERSES TO ANALYZE ===
-{verses_to_analyze}
+def _is_complete_json_array(text: str) -> bool:
+    """True if text is a syntactically complete JSON array (i.e. not cut off)."""
+    text = text.strip()
+    if not (text.startswith('[') and text.endswith(']')):
+        return False
+    try:
+        return isinstance(json.loads(text), list)
+    except json.JSONDecodeError:
+        return False
+
+
+def _is_complete_json_object(text: str) -> bool:
+    """True if text is a syntactically complete JSON object (a structured-output response not cut off)."""
+    text = text.strip()
+    if not (text.startswith('{') and text.endswith('}')):
+        return False
+    try:
+        return isinstance(json.loads(text, strict=False), dict)
+    except json.JSONDecodeError:
+        return False
+
 
-=== TASK ===
+# Static detection instructions, sent as the system message. Kept byte-identical across
+# chapters (no book/chapter interpolation) so provider prompt caching applies to the prefix.
+DETECTION_SYSTEM_PROMPT = """You are a biblical Hebrew scholar specializing in figurative language analysis. Always return valid JSON.
 
-Analyze EACH of the {len(verses_data)} verses above for figurative language.
+Your task is to analyze verses of a biblical chapter for figurative language. The user message contains the FULL CHAPTER once, with each verse anchored as "Verse N:" followed by its Hebrew and English text, and then a VERSES TO ANALYZE section naming the verse numbers to report on. Analyze EACH of those verses, using the rest of the chapter as context.
 
 CRITICAL TEXT EXTRACTION REQUIREMENT:
-When you identify figurative language, the "hebrew_text" and "english_text" fields MUST contain EXACT VERBATIM TEXT copied directly from the source verses above. Do NOT:
+When you identify figurative language, the "hebrew_text" and "english_text" fields MUST contain EXACT VERBATIM TEXT copied directly from the source verses in the chapter text. Do NOT:
 - Paraphrase or summarize the text
 - Use ellipses (...)
 - Add or remove words
@@ -1829,8 +3280,8 @@ For each detected instance, provide:
 6. **hyperbole**: "yes" or "no"
 7. **metonymy**: "yes" or "no"
 8. **other**: "yes" or "no"
-9. **hebrew_text**: EXACT VERBATIM TEXT copied directly from the Hebrew source above - do NOT paraphrase, summarize, or use ellipses (...). Copy the exact Hebrew words that contain the figurative expression.
-10. **english_text**: EXACT VERBATIM TEXT copied directly from the English source above - do NOT paraphrase, summarize, or use ellipses (...). Copy the exact English words that contain the figurative expression.
+9. **hebrew_text**: EXACT VERBATIM TEXT copied directly from the Hebrew source in the chapter text - do NOT paraphrase, summarize, or use ellipses (...). Copy the exact Hebrew words that contain the figurative expression.
+10. **english_text**: EXACT VERBATIM TEXT copied directly from the English source in the chapter text - do NOT paraphrase, summarize, or use ellipses (...). Copy the exact English words that contain the figurative expression.
 11. **target**: JSON array with 3 levels - [specific, category, domain]
 12. **vehicle**: JSON array with 3 levels - [specific, category, domain]
 13. **ground**: JSON array with 3 levels - [specific, category, domain]
@@ -1844,24 +3295,24 @@ For each detected instance, provide:
 
 Return a JSON array with ONE object per verse. Each object should have:
 - "verse": verse number
-- "reference": "{book_name} {chapter}:X"
+- "reference": "<book> <chapter>:<verse>" using the book and chapter named in the chapter header
 - "deliberation": Your brief analysis for THIS VERSE ONLY - what you considered and your reasoning
 - "instances": array of detected figurative language instances (empty array if none)
 
 Example structure showing ZERO, ONE, and MULTIPLE instances:
 [
-  {{
+  {
     "verse": 1,
-    "reference": "{book_name} {chapter}:1",
+    "reference": "Psalms 23:1",
     "deliberation": "Analyzed verse for figurative language. Found no metaphors, similes, or other figurative expressions. The language appears to be literal and straightforward.",
     "instances": []  // ZERO instances - empty array when no figurative language detected
-  }},
-  {{
+  },
+  {
     "verse": 2,
-    "reference": "{book_name} {chapter}:2",
+    "reference": "Psalms 23:2",
     "deliberation": "Identified one clear metaphor comparing divine discipline to a shepherd's guidance. No other figurative expressions present.",
     "instances": [
-      {{
+      {
         "figurative_language": "yes",
         "metaphor": "yes",
         "simile": "no",
@@ -1878,15 +3329,15 @@ Example structure showing ZERO, ONE, and MULTIPLE instances:
         "posture": ["specific", "category", "domain"],
         "explanation": "Divine guidance compared to shepherd's care",
         "confidence": 0.9
-      }}
+      }
     ]
-  }},
-  {{
+  },
+  {
     "verse": 3,
-    "reference": "{book_name} {chapter}:3",
+    "reference": "Psalms 23:3",
     "deliberation": "Found two distinct figurative expressions: 1) wisdom personified as a woman calling out, and 2) the heart described as a pathway. Both are separate figurative devices in the same verse.",
     "instances": [
-      {{
+      {
         "figurative_language": "yes",
         "metaphor": "no",
         "simile": "no",
@@ -1903,8 +3354,8 @@ Example structure showing ZERO, ONE, and MULTIPLE instances:
         "posture": ["specific", "category", "domain"],
         "explanation": "Wisdom personified as calling woman",
         "confidence": 0.95
-      }},
-      {{
+      },
+      {
         "figurative_language": "yes",
         "metaphor": "yes",
         "simile": "no",
@@ -1921,9 +3372,9 @@ Example structure showing ZERO, ONE, and MULTIPLE instances:
         "posture": ["specific", "category", "domain"],
         "explanation": "Heart described metaphorically as a pathway",
         "confidence": 0.85
-      }}
+      }
     ]
-  }}
+  }
 ]
 
 IMPORTANT:
@@ -1931,172 +3382,348 @@ IMPORTANT:
 - The "hebrew_text" and "english_text" values shown above are examples of EXACT VERBATIM text copied from verses. Always copy exact text - never paraphrase or use "..." placeholders.
 """
 
-    # Call GPT-5.1 MEDIUM
-    api_start = time.time()
-    openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-    try:
-        logger.info(f"Calling GPT-5.1 MEDIUM for {book_name} {chapter} (using streaming to avoid truncation)...")
+def build_detection_prompt(book_name: str, chapter: int, verses_data: List[Dict],
+                           window_verses: List[Dict] = None, logger=None) -> str:
+    """
+    Build the chapter-specific user message for batched detection.
 
-        # Use streaming to avoid the 1023-character truncation issue
-        # This ensures we capture the complete response without buffering limits
-        # Enhanced with corruption detection and recovery
-        max_stream_retries = 3
-        response_text = ""
-        skipped_verses = set()  # Track which verses had corruption
-        corrupted_chunks = 0    # Count total corrupted chunks
+    The chapter text is emitted once with "Verse N:" anchors; the static instructions live in
+    DETECTION_SYSTEM_PROMPT. If window_verses is given (a subset of verses_data), the model is
+    asked to analyze only the window's verse numbers against the same anchored chapter text.
+    """
+    chapter_text = format_anchored_chapter_text(verses_data)
 
-        for stream_attempt in range(max_stream_retries):
-            try:
-                logger.info(f"Stream attempt {stream_attempt + 1}/{max_stream_retries}")
-                stream = openai_client.chat.completions.create(
-                    model="gpt-5.1",
-                    messages=[
-                        {"role": "system", "content": "You are a biblical Hebrew scholar specializing in figurative language analysis. Always return valid JSON."},
-                        {"role": "user", "content": batched_prompt}
-                    ],
-                    max_completion_tokens=max_tokens,  # Use dynamic token limit
-                    reasoning_effort="medium",
-                    stream=True  # Enable streaming to avoid truncation
-                )
+    if window_verses:
+        verse_numbers = ", ".join(str(v['verse']) for v in window_verses)
+        verses_to_analyze = (f"Analyze ONLY these verses from the chapter above: {verse_numbers}\n"
+                             f"Do not include any other verses in your output.\n")
+    else:
+        verses_to_analyze = (f"Analyze ALL {len(verses_data)} verses of the chapter above "
+                             f"(verses {verses_data[0]['verse']}-{verses_data[-1]['verse']}).\n")
 
-                # Collect the streamed response with corruption detection
-                response_text = ""
-                chunk_count = 0
-                last_valid_content = ""
-                current_verse = None  # Track which verse we're currently parsing
+    prompt = f"""=== {book_name} Chapter {chapter} (FULL CHAPTER) ===
+{chapter_text}
+=== VERSES TO ANALYZE ===
+{verses_to_analyze}
+Use "reference": "{book_name} {chapter}:X" for each verse object.
+"""
 
-                for chunk in stream:
-                    if chunk.choices and chunk.choices[0].delta.content:
-                        content = chunk.choices[0].delta.content
+    if logger:
+        logger.info(f"Detection prompt: {len(prompt)} chars (+{len(DETECTION_SYSTEM_PROMPT)} chars static prefix)")
 
-                        # Check for corruption patterns
-                        if '\x00' in content or '�' in content or 'x�' in content:
-                            logger.warning(f"Detected corrupted chunk at chunk {chunk_count} - skipping")
-                            corrupted_chunks += 1
+    return prompt
 
-                            # Try to identify which verse was affected
-                            # Look for verse patterns in recent content
-                            verse_match = re.search(r'"verse":\s*(\d+)', last_valid_content[-200:] if last_valid_content else "")
-                            if verse_match:
-                                current_verse = int(verse_match.group(1))
-                                skipped_verses.add(current_verse)
-                                logger.warning(f"Marked verse {current_verse} as potentially corrupted")
-                            continue  # Skip corrupted chunk
 
-                        # Validate UTF-8 encoding
-                        try:
-                            content.encode('utf-8').decode('utf-8')
+def format_anchored_chapter_text(verses_data: List[Dict]) -> str:
+    """Format a chapter as "Verse N:" anchored blocks (Hebrew and English), emitted once per prompt."""
+    return "".join(f"\nVerse {v['verse']}:\nHebrew: {v['hebrew']}\nEnglish: {v['english']}\n"
+                   for v in verses_data)
 
-                            # Additional Hebrew text validation
-                            if has_corrupted_hebrew(content):
-                                logger.warning(f"Hebrew corruption detected in chunk {chunk_count} - skipping")
-                                corrupted_chunks += 1
-                                continue
 
-                            response_text += content
-                            last_valid_content = response_text
-                            chunk_count += 1
+def estimate_text_tokens(text: str) -> int:
+    """Uncalibrated local token count (tiktoken if installed, else ~2 chars/token Hebrew, ~4 otherwise)."""
+    return get_token_estimator().count(text)
 
-                            # Track current verse for better error reporting
-                            verse_match = re.search(r'"verse":\s*(\d+)', content)
-                            if verse_match:
-                                current_verse = int(verse_match.group(1))
 
-                        except UnicodeError as e:
-                            logger.warning(f"Unicode error in chunk {chunk_count}: {e}")
-                            corrupted_chunks += 1
-                            if current_verse:
-                                skipped_verses.add(current_verse)
-                            continue
+def measure_prompt_savings(verses_data: List[Dict], prompt_tokens: int, calls: int) -> Dict:
+    """
+    Compare a chapter's detection input against the legacy single-call prompt.
 
-                        # Log progress every 100 chunks
-                        if chunk_count % 100 == 0:
-                            logger.debug(f"Received {chunk_count} chunks, response length: {len(response_text)} chars")
+    The legacy prompt interpolated book/chapter into the instructions (no cacheable prefix) and
+    carried the chapter text twice (a numbered context block plus the per-verse blocks).
+    Verse windows each resend the chapter text, but it precedes the window-specific tail,
+    so every window after the first shares the static prefix and the chapter text.
+    """
+    chapter_text_tokens = estimate_text_tokens(format_anchored_chapter_text(verses_data))
+    static_tokens = estimate_text_tokens(DETECTION_SYSTEM_PROMPT)
+    legacy_tokens = static_tokens + 2 * chapter_text_tokens
+    return {
+        'detection_calls': calls,
+        'legacy_input_tokens': legacy_tokens,
+        'input_tokens': prompt_tokens,
+        'input_tokens_saved': legacy_tokens - prompt_tokens,
+        'cacheable_prefix_tokens': static_tokens * calls + chapter_text_tokens * (calls - 1)
+    }
 
-                # If we get here, streaming completed successfully
-                logger.info(f"Streaming completed in attempt {stream_attempt + 1}")
-                break  # Exit retry loop on success
 
-            except Exception as e:
-                logger.error(f"Streaming error on attempt {stream_attempt + 1}: {e}")
-                if stream_attempt < max_stream_retries - 1:
-                    logger.info(f"Retrying in 5 seconds...")
-                    time.sleep(5)
-                    continue
-                else:
-                    # All retries failed, try non-streaming fallback
-                    logger.warning("All streaming attempts failed - falling back to non-streaming mode")
-                    try:
-                        logger.info("Making non-streaming API call as fallback...")
-                        response = openai_client.chat.completions.create(
-                            model="gpt-5.1",
-                            messages=[
-                                {"role": "system", "content": "You are a biblical Hebrew scholar specializing in figurative language analysis. Always return valid JSON."},
-                                {"role": "user", "content": batched_prompt}
-                            ],
-                            max_completion_tokens=max_tokens,  # Use dynamic token limit
-                            reasoning_effort="medium",
-                            stream=False
-                        )
-                        response_text = response.choices[0].message.content
-                        logger.info("Non-streaming fallback successful")
-                    except Exception as fallback_error:
-                        logger.error(f"Non-streaming fallback also failed: {fallback_error}")
-                        response_text = last_valid_content if last_valid_content else ""
-                        logger.warning(f"Using last known good state ({len(response_text)} chars)")
+def build_chapter_token_usage(verses_data: List[Dict], detection: Dict) -> Dict:
+    """
+    A chapter's chapter_token_usage row: the local (uncalibrated) estimates for its detection
+    calls next to the usage the API reported for them. Validation columns are filled in by
+    add_validation_token_usage() once the chapter has been validated.
+    """
+    token_metadata = detection['token_metadata']
+    return {
+        'verses': len(verses_data),
+        'token_method': get_token_estimator().method,
+        'detection_calls': detection['calls'],
+        'estimated_input_tokens': detection['prompt_tokens'],
+        'estimated_output_tokens': len(verses_data) * COMPLETION_TOKENS_PER_VERSE_ESTIMATE,
+        'input_tokens': token_metadata.get('input_tokens', 0),
+        'output_tokens': token_metadata.get('output_tokens', 0),
+        'reasoning_tokens': token_metadata.get('reasoning_tokens', 0),
+        'cached_input_tokens': token_metadata.get('cached_input_tokens', 0),
+        'usage_source': token_metadata.get('usage_source', USAGE_ESTIMATED),
+        'detection_cost': token_metadata.get('cost', 0.0)
+    }
 
-        api_time = time.time() - api_start
 
-        logger.info(f"Streaming completed in {api_time:.1f}s ({chunk_count} chunks)")
-        logger.info(f"Total response length: {len(response_text)} characters")
+def add_validation_token_usage(token_usage: Optional[Dict], cost_metadata: Optional[Dict]) -> Optional[Dict]:
+    """Add the validator's reported usage for the chapter to its token usage row"""
+    if token_usage is None or not cost_metadata:
+        return token_usage
+    token_usage.update({
+        'validation_input_tokens': cost_metadata.get('input_tokens', 0),
+        'validation_output_tokens': cost_metadata.get('output_tokens', 0),
+        'validation_reasoning_tokens': cost_metadata.get('reasoning_tokens', 0),
+        'validation_cost': cost_metadata.get('cost', 0.0)
+    })
+    return token_usage
 
-        # Save raw response for debugging
-        saved_file = save_raw_response(response_text, book_name, chapter)
-        logger.info(f"Saved raw response to {saved_file}")
 
-        # Store original streaming text in case fallback overwrites it
-        original_streaming_text = response_text
+def detection_max_tokens(book_name: str) -> int:
+    """Completion token limit for a book's detection calls"""
+    # Use increased token limit for prophetic books which have longer chapters
+    # Includes Former Prophets and Latter Prophets (Major and Minor)
+    PROPHETIC_BOOKS = [
+        # Former Prophets
+        "Joshua", "Judges", "1_Samuel", "2_Samuel", "1_Kings", "2_Kings",
+        # Latter Prophets - Major
+        "Isaiah", "Jeremiah", "Ezekiel",
+        # Latter Prophets - The Twelve (Minor Prophets)
+        "Hosea", "Joel", "Amos", "Obadiah", "Jonah", "Micah", "Nahum",
+        "Habakkuk", "Zephaniah", "Haggai", "Zechariah", "Malachi"
+    ]
+    return MAX_COMPLETION_TOKENS_PROPHETIC if book_name in PROPHETIC_BOOKS else MAX_COMPLETION_TOKENS_DEFAULT
+
+
+def detection_request(batched_prompt: str, max_tokens: int) -> Dict:
+    """create() arguments of a detection call (streaming options are added by the caller)"""
+    structured = structured_output_enabled()
+    request = dict(
+        model="gpt-5.1",
+        messages=[
+            {"role": "system", "content": DETECTION_SYSTEM_PROMPT},
+            {"role": "user", "content": batched_prompt + DETECTION_FORMAT_NOTE if structured else batched_prompt}
+        ],
+        max_completion_tokens=max_tokens,  # Use dynamic token limit
+        reasoning_effort="medium"
+    )
+    if structured:
+        request['response_format'] = detection_response_format()
+    return request
 
-        # Deliberation is now extracted from verse-specific JSON fields, no need to extract separate deliberation section
-        logger.info("Deliberation will be extracted from verse-specific JSON fields")
 
-        # For streaming responses, we need to make a separate call to get usage data
-        # or estimate based on typical patterns
-        token_metadata = {
-            'input_tokens': len(batched_prompt) // 4,  # Rough estimate: 1 token ≈ 4 chars
-            'output_tokens': len(response_text) // 4,  # Rough estimate: 1 token ≈ 4 chars
-            'reasoning_tokens': 0,  # Not available in streaming mode
-            'total_tokens': (len(batched_prompt) + len(response_text)) // 4,
-            'streaming': True
-        }
+def call_detection_model(batched_prompt: str, book_name: str, chapter: int, max_tokens: int, logger,
+                         split_on_truncation: bool = False,
+                         raw_response_suffix: str = "") -> Tuple[str, Dict, set, int]:
+    """
+    Call GPT-5.1 MEDIUM with a detection prompt (streaming, with corruption detection and retries).
+
+    Args:
+        split_on_truncation: If True, a truncated response raises DetectionWindowTruncated so the
+                             caller can split the verse window, instead of the 16K non-streaming fallback.
+        raw_response_suffix: Appended to the chapter number in the saved debug response filename.
 
-        # GPT-5.1 pricing: $1.25/M input + $10.00/M output
-        cost = (token_metadata['input_tokens'] / 1_000_000 * 1.25 +
-               token_metadata['output_tokens'] / 1_000_000 * 10.0)
-        token_metadata['cost'] = cost
+    With STRUCTURED_OUTPUT=1 every request carries the DetectionResponse JSON Schema
+    (response_format), and truncation is judged only by finish_reason and whether the
+    object parses, since the schema fixes the response shape.
 
-        logger.info(f"Estimated token usage: {token_metadata.get('input_tokens', 0):,} input, "
-                   f"{token_metadata.get('output_tokens', 0):,} output")
-        logger.info(f"Estimated cost: ${token_metadata.get('cost', 0):.4f}")
+    Token usage comes from the stream's final usage chunk (stream_options include_usage) or the
+    fallback response's usage; only if the provider reports none is it estimated locally
+    (token_metadata['usage_source'] says which).
 
-        # Verify we got a complete response (check for truncation indicators)
-        if len(response_text) < 1500:
-            logger.warning(f"Response seems short ({len(response_text)} chars) - possible truncation still occurring")
-        else:
-            logger.info(f"Good response length ({len(response_text)} chars) - streaming likely avoided truncation")
+    Returns:
+        Tuple of (response_text, token_metadata, skipped_verses, corrupted_chunks)
+    """
+    api_start = time.time()
+    openai_client = create_openai_client()
+    chunk_count = 0
+    finish_reason = None
+
+    structured = structured_output_enabled()
+    request = detection_request(batched_prompt, max_tokens)
+    user_message = request['messages'][1]['content']
+
+    logger.info(f"Calling GPT-5.1 MEDIUM for {book_name} {chapter} (using streaming to avoid truncation)...")
+
+    # Use streaming to avoid the 1023-character truncation issue
+    # This ensures we capture the complete response without buffering limits
+    # Enhanced with corruption detection and recovery
+    max_stream_retries = 3
+    response_text = ""
+    skipped_verses = set()  # Track which verses had corruption
+    corrupted_chunks = 0    # Count total corrupted chunks
+    reported_usage = []     # Usage of every call made (failed attempts are billed too)
+    profiler = get_profiler()
+
+    for stream_attempt in range(max_stream_retries):
+        try:
+            logger.info(f"Stream attempt {stream_attempt + 1}/{max_stream_retries}")
+            attempt_started = profiler.now()
+            first_token_at = None
+            stream = openai_client.chat.completions.create(
+                **request,
+                stream=True,  # Enable streaming to avoid truncation
+                stream_options={"include_usage": True}  # Final chunk carries the token usage
+            )
+
+            # Collect the streamed response with corruption detection
+            response_text = ""
+            chunk_count = 0
+            last_valid_content = ""
+            current_verse = None  # Track which verse we're currently parsing
+
+            for chunk in stream:
+                if getattr(chunk, 'usage', None):
+                    reported_usage.append(usage_to_token_metadata(chunk.usage))
+                if chunk.choices and chunk.choices[0].finish_reason:
+                    finish_reason = chunk.choices[0].finish_reason
+                if chunk.choices and chunk.choices[0].delta.content:
+                    content = chunk.choices[0].delta.content
+                    if first_token_at is None:
+                        first_token_at = profiler.now()
+
+                    # Check for corruption patterns
+                    if '\x00' in content or '�' in content or 'x�' in content:
+                        logger.warning(f"Detected corrupted chunk at chunk {chunk_count} - skipping")
+                        corrupted_chunks += 1
+
+                        # Try to identify which verse was affected
+                        # Look for verse patterns in recent content
+                        verse_match = re.search(r'"verse":\s*(\d+)', last_valid_content[-200:] if last_valid_content else "")
+                        if verse_match:
+                            current_verse = int(verse_match.group(1))
+                            skipped_verses.add(current_verse)
+                            logger.warning(f"Marked verse {current_verse} as potentially corrupted")
+                        continue  # Skip corrupted chunk
+
+                    # Validate UTF-8 encoding
+                    try:
+                        content.encode('utf-8').decode('utf-8')
+
+                        # Additional Hebrew text validation
+                        if has_corrupted_hebrew(content):
+                            logger.warning(f"Hebrew corruption detected in chunk {chunk_count} - skipping")
+                            corrupted_chunks += 1
+                            continue
+
+                        response_text += content
+                        last_valid_content = response_text
+                        chunk_count += 1
+
+                        # Track current verse for better error reporting
+                        verse_match = re.search(r'"verse":\s*(\d+)', content)
+                        if verse_match:
+                            current_verse = int(verse_match.group(1))
 
-        # Parse JSON response
-        logger.debug(f"Response text preview: {response_text[:200]}...{response_text[-200:] if len(response_text) > 400 else response_text[-200:]}")
+                    except UnicodeError as e:
+                        logger.warning(f"Unicode error in chunk {chunk_count}: {e}")
+                        corrupted_chunks += 1
+                        if current_verse:
+                            skipped_verses.add(current_verse)
+                        continue
 
-        # TRUNCATION DETECTION: Check for common truncation patterns
-        # Clean response text by removing markdown code block markers for detection
-        clean_response = response_text.strip()
-        if clean_response.startswith('```'):
-            clean_response = '\n'.join(clean_response.split('\n')[1:])  # Remove first line with ```
-        if clean_response.endswith('```'):
-            clean_response = clean_response[:-3].rstrip()  # Remove trailing ```
+                    # Log progress every 100 chunks
+                    if chunk_count % 100 == 0:
+                        logger.debug(f"Received {chunk_count} chunks, response length: {len(response_text)} chars")
+
+            # If we get here, streaming completed successfully
+            logger.info(f"Streaming completed in attempt {stream_attempt + 1}")
+            if first_token_at is not None:
+                stream_ended = profiler.now()
+                output_tokens = estimate_text_tokens(response_text)
+                profiler.add_span(STAGE_FIRST_TOKEN, book_name, chapter, attempt_started, first_token_at,
+                                  attempt=stream_attempt + 1)
+                profiler.add_span(STAGE_STREAM, book_name, chapter, first_token_at, stream_ended,
+                                  chunks=chunk_count, output_tokens=output_tokens,
+                                  tokens_per_second=round(output_tokens / max(stream_ended - first_token_at, 1e-6), 1))
+            break  # Exit retry loop on success
 
+        except Exception as e:
+            logger.error(f"Streaming error on attempt {stream_attempt + 1}: {e}")
+            if stream_attempt < max_stream_retries - 1:
+                logger.info(f"Retrying in 5 seconds...")
+                time.sleep(5)
+                continue
+            else:
+                # All retries failed, try non-streaming fallback
+                logger.warning("All streaming attempts failed - falling back to non-streaming mode")
+                try:
+                    logger.info("Making non-streaming API call as fallback...")
+                    response = openai_client.chat.completions.create(**request, stream=False)
+                    response_text = response.choices[0].message.content
+                    if getattr(response, 'usage', None):
+                        reported_usage.append(usage_to_token_metadata(response.usage))
+                    logger.info("Non-streaming fallback successful")
+                except Exception as fallback_error:
+                    logger.error(f"Non-streaming fallback also failed: {fallback_error}")
+                    response_text = last_valid_content if last_valid_content else ""
+                    logger.warning(f"Using last known good state ({len(response_text)} chars)")
+
+    api_time = time.time() - api_start
+
+    logger.info(f"Streaming completed in {api_time:.1f}s ({chunk_count} chunks)")
+    logger.info(f"Total response length: {len(response_text)} characters")
+
+    # Save raw response for debugging
+    saved_file = save_raw_response(response_text, book_name, chapter, raw_response_suffix)
+    logger.info(f"Saved raw response to {saved_file}")
+
+    # Store original streaming text in case fallback overwrites it
+    original_streaming_text = response_text
+
+    # Deliberation is now extracted from verse-specific JSON fields, no need to extract separate deliberation section
+    logger.info("Deliberation will be extracted from verse-specific JSON fields")
+
+    if reported_usage:
+        token_metadata = merge_token_metadata(reported_usage)
+        logger.info(f"Token usage: {token_metadata['input_tokens']:,} input "
+                    f"({token_metadata['cached_input_tokens']:,} cached), {token_metadata['output_tokens']:,} output "
+                    f"({token_metadata['reasoning_tokens']:,} reasoning)")
+        logger.info(f"Cost: ${token_metadata['cost']:.4f}")
+    else:
+        # Provider reported no usage: estimate locally (reasoning tokens are unknown)
+        input_tokens = estimate_text_tokens(DETECTION_SYSTEM_PROMPT) + estimate_text_tokens(user_message)
+        output_tokens = estimate_text_tokens(response_text)
+        token_metadata = {
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'reasoning_tokens': 0,
+            'cached_input_tokens': 0,
+            'total_tokens': input_tokens + output_tokens,
+            'cost': token_cost(input_tokens, output_tokens),
+            'usage_source': USAGE_ESTIMATED
+        }
+        logger.info(f"Estimated token usage (none reported): {token_metadata['input_tokens']:,} input, "
+                    f"{token_metadata['output_tokens']:,} output")
+        logger.info(f"Estimated cost: ${token_metadata['cost']:.4f}")
+    token_metadata['streaming'] = True
+
+    # Verify we got a complete response (check for truncation indicators)
+    if len(response_text) < 1500:
+        logger.warning(f"Response seems short ({len(response_text)} chars) - possible truncation still occurring")
+    else:
+        logger.info(f"Good response length ({len(response_text)} chars) - streaming likely avoided truncation")
+
+    # Parse JSON response
+    logger.debug(f"Response text preview: {response_text[:200]}...{response_text[-200:] if len(response_text) > 400 else response_text[-200:]}")
+
+    # TRUNCATION DETECTION: Check for common truncation patterns
+    # Clean response text by removing markdown code block markers for detection
+    clean_response = response_text.strip()
+    if clean_response.startswith('```'):
+        clean_response = '\n'.join(clean_response.split('\n')[1:])  # Remove first line with ```
+    if clean_response.endswith('```'):
+        clean_response = clean_response[:-3].rstrip()  # Remove trailing ```
+
+    if structured:
+        # The schema fixes the shape, so a short or oddly ending response is not a truncation sign
+        response_complete = _is_complete_json_object(clean_response)
+        truncation_indicators = [not response_complete]
+    else:
+        response_complete = _is_complete_json_array(clean_response)
         truncation_indicators = [
             clean_response.endswith('...'),  # Incomplete sentence
             clean_response.endswith(',"'),   # Mid-JSON field
@@ -2105,445 +3732,437 @@ IMPORTANT:
             'confidence' in clean_response and not clean_response.rstrip().endswith(']') and not clean_response.rstrip().endswith('}'),  # Cut in confidence field
         ]
 
-        if any(truncation_indicators):
-            logger.error("TRUNCATION DETECTED! Response shows signs of being cut off")
-            logger.error(f"Response length: {len(response_text)} characters")
-            logger.error(f"Ends with: {repr(response_text[-50:])}")
+    if finish_reason == 'length':
+        truncation_indicators.append(True)  # Provider says the output limit was hit
+
+    if split_on_truncation and any(truncation_indicators):
+        if not response_complete:
+            logger.warning(f"TRUNCATION DETECTED for {book_name} {chapter} window ({len(response_text)} chars) - "
+                           f"splitting the window instead of the non-streaming fallback")
+            raise DetectionWindowTruncated(token_metadata)
+    elif any(truncation_indicators):
+        logger.error("TRUNCATION DETECTED! Response shows signs of being cut off")
+        logger.error(f"Response length: {len(response_text)} characters")
+        logger.error(f"Ends with: {repr(response_text[-50:])}")
+
+        # Try fallback with non-streaming request as backup
+        logger.info("Attempting fallback with non-streaming request...")
+        try:
+            # Same messages (DETECTION_SYSTEM_PROMPT + chapter text) and response_format as the
+            # streaming request; only the output limit differs
+            fallback_response = openai_client.chat.completions.create(
+                **dict(request, max_completion_tokens=16384)  # Use smaller limit for fallback
+            )
 
-            # Try fallback with non-streaming request as backup
-            logger.info("Attempting fallback with non-streaming request...")
-            try:
-                fallback_response = openai_client.chat.completions.create(
-                    model="gpt-5.1",
-                    messages=[
-                        {"role": "system", "content": "You are a biblical Hebrew scholar specializing in figurative language analysis."},
-                        {"role": "user", "content": batched_prompt}
-                    ],
-                    max_completion_tokens=16384,  # Use smaller limit for fallback
-                    reasoning_effort="medium"
-                )
+            # The fallback call is billed whether or not its response is used
+            if getattr(fallback_response, 'usage', None):
+                fallback_usage = usage_to_token_metadata(fallback_response.usage)
+                token_metadata = dict(merge_token_metadata([token_metadata, fallback_usage]), streaming=True)
+                logger.info(f"Added fallback token usage: {fallback_usage['input_tokens']:,} input, "
+                            f"{fallback_usage['output_tokens']:,} output")
+
+            fallback_text = fallback_response.choices[0].message.content
+            if len(fallback_text) > len(response_text):
+                logger.info(f"Fallback successful! Got {len(fallback_text)} chars vs {len(response_text)} chars")
+                response_text = fallback_text
+            else:
+                logger.warning("Fallback response also short or similar length")
 
-                fallback_text = fallback_response.choices[0].message.content
-                if len(fallback_text) > len(response_text):
-                    logger.info(f"Fallback successful! Got {len(fallback_text)} chars vs {len(response_text)} chars")
-                    response_text = fallback_text
-
-                    # Update token estimates with fallback data
-                    if hasattr(fallback_response, 'usage'):
-                        token_metadata['input_tokens'] = getattr(fallback_response.usage, 'prompt_tokens', 0)
-                        token_metadata['output_tokens'] = getattr(fallback_response.usage, 'completion_tokens', 0)
-                        token_metadata['reasoning_tokens'] = getattr(fallback_response.usage, 'reasoning_tokens', 0)
-                        cost = (token_metadata['input_tokens'] / 1_000_000 * 1.25 +
-                               token_metadata['output_tokens'] / 1_000_000 * 10.0)
-                        token_metadata['cost'] = cost
-                        logger.info(f"Updated token usage from fallback: {token_metadata.get('input_tokens', 0):,} input, "
-                                   f"{token_metadata.get('output_tokens', 0):,} output")
-                else:
-                    logger.warning("Fallback response also short or similar length")
+        except Exception as fallback_error:
+            logger.error(f"Fallback request failed: {fallback_error}")
+            logger.warning("Proceeding with possibly truncated response")
 
-            except Exception as fallback_error:
-                logger.error(f"Fallback request failed: {fallback_error}")
-                logger.warning("Proceeding with possibly truncated response")
+    return response_text, token_metadata, skipped_verses, corrupted_chunks
 
-        # Deliberation extraction is now handled per-verse in JSON parsing
 
-        # Modify for non-sacred version (replace divine names)
-        # chapter_deliberation_non_sacred is no longer needed since deliberation is now verse-specific
+def parse_detection_response(response_text: str, logger, structured: bool = False) -> List[Dict]:
+    """Extract, repair and schema-validate the array of verse results from a detection response.
 
-        # Extract JSON array from response (handle markdown wrappers)
-        json_text = response_text.strip()
+    A structured-output response (structured=True) is validated against DetectionResponse in one
+    step; only if that fails does it go through the recovery path below.
+    """
+    if structured:
+        try:
+            verse_results = parse_structured_detection(response_text)
+        except ValueError as e:
+            logger.warning(f"[STRUCTURED] Response does not match the detection schema "
+                           f"({str(e).splitlines()[0]}) - falling back to JSON recovery")
+        else:
+            if verse_results:
+                logger.info(f"[STRUCTURED] Parsed {len(verse_results)} verse results from the schema response")
+                return verse_results
+
+    # One pass over the response (json_recovery): skips deliberation/fences, repairs commas,
+    # and cuts a truncated array back to its last complete verse
+    recovered = recover_structured_array(response_text, DETECTION_FIELD) if structured else recover_json_array(response_text)
+    if recovered.value is None:
+        logger.error("JSON extraction failed - no content found")
+        logger.error(f"Response text (first 500 chars): {response_text[:500]}")
+        logger.error(f"Response text (last 500 chars): {response_text[-500:]}")
+        raise ValueError("Could not extract JSON from response")
+
+    verse_results = recovered.value
+    if set(recovered.recoveries) - {RECOVERY_CODE_FENCE}:
+        logger.warning(f"[JSON RECOVERY] Detection response repaired ({', '.join(recovered.recoveries)}), "
+                       f"{len(verse_results)} verse results kept")
+
+    if not isinstance(verse_results, list):
+        raise ValueError(f"Expected JSON array, got {type(verse_results)}")
+
+    logger.info(f"Parsed {len(verse_results)} verse results")
+
+    # Validate verse results before processing
+    if not verse_results:
+        raise ValueError("No verse results parsed from response")
+
+    # Validate verse structure with enhanced pydantic validation
+    valid_verses = []
+    schema_errors = []
+    for vr in verse_results:
+        if isinstance(vr, dict) and isinstance(vr.get('verse'), int):
+            # Validate instances within each verse using pydantic
+            if 'instances' in vr and vr['instances']:
+                validated_instances, instance_errors = validate_llm_response(vr['instances'], logger)
+                if instance_errors:
+                    schema_errors.extend(instance_errors)
+                vr['instances'] = validated_instances
+            valid_verses.append(vr)
+        else:
+            logger.warning(f"Skipping invalid verse result: {vr}")
+            schema_errors.append(f"Verse missing 'verse' field: {vr}")
 
-        # First, try to find the JSON array using regex pattern
-        # Look for JSON array that starts with [ and ends with ]
-        # FIX: Use greedy matching to capture the COMPLETE array, not just the first object
-        json_pattern = r'\[\s*\{.*\}\s*\]'  # Changed from .*? to .* for greedy matching
-        json_match = re.search(json_pattern, response_text, re.DOTALL)
+    verse_results = valid_verses
 
-        if json_match:
-            json_text = json_match.group(0)
-            logger.debug(f"Found JSON array using regex pattern: {len(json_text)} chars")
-        else:
-            # Fallback: Handle markdown wrappers
-            if json_text.startswith("```json"):
-                json_text = json_text[7:]
-            if json_text.startswith("```"):
-                json_text = json_text[3:]
-            if json_text.endswith("```"):
-                json_text = json_text[:-3]
-            json_text = json_text.strip()
-            logger.debug(f"Extracted JSON using markdown wrapper removal: {len(json_text)} chars")
-
-        # If still empty, try to find JSON brackets directly with proper bracket matching
-        if not json_text:
-            # Find the first [ and use bracket counting to find the matching ]
-            first_bracket = response_text.find('[')
-            if first_bracket != -1:
-                # Count brackets to find the matching closing bracket
-                bracket_count = 1
-                pos = first_bracket + 1
-                while pos < len(response_text) and bracket_count > 0:
-                    if response_text[pos] == '[':
-                        bracket_count += 1
-                    elif response_text[pos] == ']':
-                        bracket_count -= 1
-                    pos += 1
-
-                if bracket_count == 0:
-                    # Found matching bracket
-                    json_text = response_text[first_bracket:pos]
-                    logger.debug(f"Extracted JSON using bracket counting: {len(json_text)} chars")
-                else:
-                    # Fallback: use simple search but warn
-                    last_bracket = response_text.rfind(']')
-                    if last_bracket > first_bracket:
-                        json_text = response_text[first_bracket:last_bracket + 1]
-                        logger.warning(f"Extracted JSON using simple bracket search (uncounted brackets): {len(json_text)} chars")
-                    else:
-                        logger.error("Could not find matching JSON brackets")
+    if schema_errors:
+        logger.warning(f"[SCHEMA VALIDATION] {len(schema_errors)} validation errors found")
+        for err in schema_errors[:5]:  # Log first 5 errors
+            logger.warning(f"  - {err}")
+        if len(schema_errors) > 5:
+            logger.warning(f"  ... and {len(schema_errors) - 5} more errors")
 
-        # Debug logging if JSON is still empty
-        if not json_text:
-            logger.error("JSON extraction failed - no content found")
-            logger.error(f"Response text (first 500 chars): {response_text[:500]}")
-            logger.error(f"Response text (last 500 chars): {response_text[-500:]}")
-            raise ValueError("Could not extract JSON from response")
+    if not verse_results:
+        raise ValueError("No valid verse results found after filtering")
 
-        logger.debug(f"Final JSON text length: {len(json_text)} chars")
-        logger.debug(f"JSON text preview: {json_text[:200]}...{json_text[-200:] if len(json_text) > 400 else json_text[-200:]}")
+    logger.info(f"After validation: {len(verse_results)} valid verses (schema errors: {len(schema_errors)})")
 
-        # Normalize line endings to prevent JSON parsing failures on Windows
-        # Windows line endings (\r\n) can cause json.loads() to fail with misleading errors
-        json_text = json_text.replace('\r\n', '\n').replace('\r', '\n')
-        logger.debug(f"Normalized line endings in JSON text")
+    return verse_results
 
-        # Parse JSON with error handling
-        try:
-            verse_results = json.loads(json_text)
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing failed: {e}")
-            logger.error(f"Error at line {e.lineno}, column {e.colno}")
-            logger.error(f"JSON text length: {len(json_text)} chars")
-
-            # Show context around error
-            error_pos = e.colno - 1
-            context_start = max(0, error_pos - 100)
-            context_end = min(len(json_text), error_pos + 100)
-
-            logger.error(f"Context around error:")
-            logger.error(f"...{json_text[context_start:error_pos]}<ERROR>{json_text[error_pos:context_end]}...")
-            logger.error(f"JSON text (first 1000 chars): {json_text[:1000]}")
-            logger.error(f"JSON text (last 1000 chars): {json_text[-1000:] if len(json_text) > 1000 else json_text}")
-
-            # Try to repair and complete truncated JSON
-            logger.info("Attempting to repair and complete truncated JSON...")
-            repaired_json = json_text
-
-            # If JSON appears to be truncated, try to complete it
-            if e.msg in ["Expecting ',' delimiter", "Expecting property name enclosed in double quotes", "Unterminated string"]:
-                logger.info("JSON appears truncated - attempting intelligent completion...")
-
-                # Count braces and brackets to understand structure
-                open_braces = repaired_json.count('{')
-                close_braces = repaired_json.count('}')
-                open_brackets = repaired_json.count('[')
-                close_brackets = repaired_json.count(']')
-
-                logger.info(f"Structure analysis: {open_braces} {{ vs {close_braces} }}, {open_brackets} [ vs {close_brackets} ]")
-
-                # Find the last valid position in the JSON
-                if e.msg == "Unterminated string":
-                    logger.info("Attempting to fix unterminated string...")
-                    error_pos = e.colno - 1
-
-                    # Simple fix: just insert a quote at the error position
-                    # This is a common issue where the closing quote is missing
-                    repaired_json = repaired_json[:error_pos] + '"' + repaired_json[error_pos:]
-                    logger.info(f"Inserted quote at position {error_pos} to fix unterminated string")
-
-                    # Now close the structure
-                    missing_braces = open_braces - close_braces
-                    missing_brackets = open_brackets - close_brackets
-
-                    # Add closing brackets first (inner structures)
-                    for _ in range(missing_brackets):
-                        repaired_json += ']'
-
-                    # Add closing braces (outer structures)
-                    for _ in range(missing_braces):
-                        repaired_json += '}'
-
-                elif e.msg == "Expecting ',' delimiter":
-                    # Try to complete the current object/array
-                    pos = e.colno - 1  # Adjust for 0-based indexing
-                    # Look for the last complete property or value
-                    truncated_text = repaired_json[:pos]
-
-                    # Add missing comma and try to close the structure
-                    # First, try to find the last complete value
-                    last_complete = truncated_text.rstrip()
-                    if not last_complete.endswith(',') and not last_complete.endswith('[') and not last_complete.endswith('{'):
-                        # Likely need a comma
-                        truncated_text += ','
-
-                    # Add missing closing brackets and braces
-                    missing_braces = open_braces - close_braces
-                    missing_brackets = open_brackets - close_brackets
-
-                    # Add closing brackets first (inner structures)
-                    for _ in range(missing_brackets):
-                        truncated_text += ']'
-
-                    # Add closing braces (outer structures)
-                    for _ in range(missing_braces):
-                        truncated_text += '}'
-
-                    repaired_json = truncated_text
-                    logger.info(f"Added {missing_brackets} missing ] and {missing_braces} missing }}")
-
-                # Try parsing the repaired JSON
-                try:
-                    verse_results = json.loads(repaired_json)
-                    logger.info("JSON repair successful!")
-                    logger.info(f"Successfully parsed JSON with {len(verse_results)} verse results")
-                except json.JSONDecodeError as e2:
-                    logger.error(f"JSON repair failed: {e2}")
-                    logger.error(f"Repaired JSON (first 1000 chars): {repaired_json[:1000]}")
-                    logger.error(f"Repaired JSON (last 1000 chars): {repaired_json[-1000:] if len(repaired_json) > 1000 else repaired_json}")
-                    raise
-            else:
-                # For other JSON errors, try basic repair
-                logger.info("Trying basic JSON repair...")
 
-                # Fix missing commas between array elements and object properties
-                repaired_json = re.sub(r'\]\s*\n\s*\[', '], [', repaired_json)
-                repaired_json = re.sub(r'}\s*\n\s*{', '}, {', repaired_json)
+def plan_detection_windows(verses_data: List[Dict], book_name: str = None,
+                           model: str = DETECTION_MODEL) -> List[List[Dict]]:
+    """
+    Split a chapter into balanced verse windows sized against the model's output budget.
 
-                # Fix missing commas in nested structures
-                repaired_json = re.sub(r'"\]\s*\n\s*"', '"],\n    "', repaired_json)
+    Chapters whose estimated completion fits the budget stay a single window (one API call).
+    """
+    output_budget = DETECTION_WINDOW_OUTPUT_BUDGET.get(model, min(DETECTION_WINDOW_OUTPUT_BUDGET.values()))
+    max_verses_per_window = max(1, output_budget // COMPLETION_TOKENS_PER_VERSE_ESTIMATE)
+    if len(verses_data) <= max_verses_per_window:
+        return [verses_data]
 
-                # Fix common trailing comma issues
-                repaired_json = re.sub(r',\s*}', '}', repaired_json)
-                repaired_json = re.sub(r',\s*\]', ']', repaired_json)
+    window_count = -(-len(verses_data) // max_verses_per_window)
+    window_size = -(-len(verses_data) // window_count)
+    return [verses_data[i:i + window_size] for i in range(0, len(verses_data), window_size)]
 
-                # Try parsing the repaired JSON
-                try:
-                    verse_results = json.loads(repaired_json)
-                    logger.info("Basic JSON repair successful!")
-                except json.JSONDecodeError as e2:
-                    logger.error(f"Basic JSON repair failed: {e2}")
-                    logger.error(f"Repaired JSON (first 1000 chars): {repaired_json[:1000]}")
-                    logger.error(f"Repaired JSON (last 1000 chars): {repaired_json[-1000:] if len(repaired_json) > 1000 else repaired_json}")
-
-                    # If all repair attempts fail, try verse-level extraction
-                    logger.warning("JSON repair failed, attempting verse-level extraction...")
-                    verse_results = extract_individual_verses(json_text, logger)
-
-                    if verse_results:
-                        logger.info(f"Successfully extracted {len(verse_results)} verses using fallback method")
-                    else:
-                        logger.error("All JSON parsing strategies failed")
-                        raise ValueError("Could not parse JSON response with any strategy")
 
-        if not isinstance(verse_results, list):
-            raise ValueError(f"Expected JSON array, got {type(verse_results)}")
+def _merge_token_metadata(metadata_list: List[Dict]) -> Dict:
+    return dict(merge_token_metadata(metadata_list), streaming=True)
 
-        logger.info(f"Parsed {len(verse_results)} verse results")
 
-        # Validate verse results before processing
-        if not verse_results:
-            raise ValueError("No verse results parsed from response")
+def _merge_window_results(window_results: List[Dict]) -> Dict:
+    """Merge per-window detection results by verse number."""
+    by_verse = {}
+    for result in window_results:
+        for verse_result in result['verse_results']:
+            by_verse[verse_result['verse']] = verse_result
 
-        # Validate verse structure with enhanced pydantic validation
-        valid_verses = []
-        schema_errors = []
-        for vr in verse_results:
-            if 'verse' in vr and isinstance(vr['verse'], int):
-                # Validate instances within each verse using pydantic
-                if 'instances' in vr and vr['instances']:
-                    validated_instances, instance_errors = validate_llm_response(vr['instances'], logger)
-                    if instance_errors:
-                        schema_errors.extend(instance_errors)
-                    vr['instances'] = validated_instances
-                valid_verses.append(vr)
-            else:
-                logger.warning(f"Skipping invalid verse result: {vr}")
-                schema_errors.append(f"Verse missing 'verse' field: {vr}")
+    return {
+        'verse_results': [by_verse[verse_num] for verse_num in sorted(by_verse)],
+        'token_metadata': _merge_token_metadata([r['token_metadata'] for r in window_results]),
+        'skipped_verses': set().union(*(r['skipped_verses'] for r in window_results)),
+        'corrupted_chunks': sum(r['corrupted_chunks'] for r in window_results),
+        'windows': sum(r['windows'] for r in window_results),
+        'prompt_tokens': sum(r['prompt_tokens'] for r in window_results),
+        'calls': sum(r['calls'] for r in window_results)
+    }
 
-        verse_results = valid_verses
 
-        if schema_errors:
-            logger.warning(f"[SCHEMA VALIDATION] {len(schema_errors)} validation errors found")
-            for err in schema_errors[:5]:  # Log first 5 errors
-                logger.warning(f"  - {err}")
-            if len(schema_errors) > 5:
-                logger.warning(f"  ... and {len(schema_errors) - 5} more errors")
+def detect_verse_window(verses_data: List[Dict], window_verses: List[Dict], book_name: str,
+                        chapter: int, max_tokens: int, logger) -> Dict:
+    """
+    Run detection for one verse window of a chapter.
 
-        if not verse_results:
-            raise ValueError("No valid verse results found after filtering")
+    A truncated multi-verse window is split in half and retried, so chapters never
+    depend on the truncation-repair path.
+    """
+    windowed = len(window_verses) < len(verses_data)
+    label = f"{window_verses[0]['verse']}-{window_verses[-1]['verse']}"
+    profiler = get_profiler()
+    with profiler.span(STAGE_PROMPT, book_name, chapter, window=label):
+        prompt = build_detection_prompt(book_name, chapter, verses_data,
+                                        window_verses if windowed else None, logger)
+        prompt_tokens = estimate_text_tokens(DETECTION_SYSTEM_PROMPT) + estimate_text_tokens(prompt)
 
-        logger.info(f"After validation: {len(verse_results)} valid verses (schema errors: {len(schema_errors)})")
+    try:
+        with profiler.span(STAGE_REQUEST, book_name, chapter, window=label, prompt_tokens=prompt_tokens):
+            response_text, token_metadata, skipped_verses, corrupted_chunks = call_detection_model(
+                prompt, book_name, chapter, max_tokens, logger,
+                split_on_truncation=len(window_verses) > 1,
+                raw_response_suffix=f"_v{label}" if windowed else ""
+            )
+    except DetectionWindowTruncated as truncated:
+        middle = len(window_verses) // 2
+        logger.warning(f"[WINDOWS] {book_name} {chapter} verses {label} truncated - splitting into "
+                       f"{window_verses[0]['verse']}-{window_verses[middle - 1]['verse']} and "
+                       f"{window_verses[middle]['verse']}-{window_verses[-1]['verse']}")
+        merged = _merge_window_results([
+            detect_verse_window(verses_data, window_verses[:middle], book_name, chapter, max_tokens, logger),
+            detect_verse_window(verses_data, window_verses[middle:], book_name, chapter, max_tokens, logger)
+        ])
+        merged['token_metadata'] = _merge_token_metadata([truncated.token_metadata, merged['token_metadata']])
+        merged['prompt_tokens'] += prompt_tokens
+        merged['calls'] += 1
+        return merged
+
+    with profiler.span(STAGE_PARSE, book_name, chapter, window=label, chars=len(response_text)):
+        verse_results = parse_detection_response(response_text, logger, structured=structured_output_enabled())
+
+    # Keep only the verses this window asked for
+    wanted = {v['verse'] for v in window_verses}
+    verse_results = [vr for vr in verse_results if vr.get('verse') in wanted]
+
+    # The static instructions no longer name the chapter - derive references from the verse anchor
+    for vr in verse_results:
+        vr['reference'] = f"{book_name} {chapter}:{vr['verse']}"
 
-        # Calculate detection statistics
-        total_instances = sum(len(vr.get('instances', [])) for vr in verse_results)
-        detection_rate = total_instances / len(verse_results) if verse_results else 0
+    return {
+        'verse_results': verse_results,
+        'token_metadata': token_metadata,
+        'skipped_verses': set(skipped_verses),
+        'corrupted_chunks': corrupted_chunks,
+        'windows': 1,
+        'prompt_tokens': prompt_tokens,
+        'calls': 1
+    }
 
-        logger.info(f"Detected {total_instances} instances ({detection_rate:.2f} instances/verse)")
 
-        # Collect all instances for batched validation
-        all_instances_for_validation = []
-        verse_to_instances_map = {}  # Map verse_ref to list of instances
+def run_detection_windows(verses_data: List[Dict], windows: List[List[Dict]], book_name: str,
+                          chapter: int, max_tokens: int, logger) -> Dict:
+    """Run detection windows in parallel and merge their results by verse number."""
+    if len(windows) == 1:
+        return detect_verse_window(verses_data, windows[0], book_name, chapter, max_tokens, logger)
 
-        # For return_data_only mode: collect prepared data instead of writing
-        collected_verses_data = []  # List of verse dicts ready for insert_verse()
-        collected_instances_data = []  # List of (verse_index, instance_dict) tuples
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(windows), MAX_PARALLEL_DETECTION_WINDOWS)) as executor:
+        futures = [
+            executor.submit(detect_verse_window, verses_data, window, book_name, chapter, max_tokens, logger)
+            for window in windows
+        ]
+        window_results = [future.result() for future in futures]
 
-        # Store results in database (thread-safe with optional lock)
-        verses_stored = 0
-        instances_stored = 0
+    merged = _merge_window_results(window_results)
+    logger.info(f"[WINDOWS] Merged {merged['windows']} windows: {len(merged['verse_results'])} verses, "
+                f"estimated cost ${merged['token_metadata']['cost']:.4f}")
+    return merged
 
-        # Helper for thread-safe database operations (only used when not return_data_only)
-        def db_insert_verse(verse_data):
-            if db_lock:
-                with db_lock:
-                    return db_manager.insert_verse(verse_data)
-            return db_manager.insert_verse(verse_data)
 
-        def db_insert_figurative_language(verse_id, figurative_data):
-            if db_lock:
-                with db_lock:
-                    return db_manager.insert_figurative_language(verse_id, figurative_data)
-            return db_manager.insert_figurative_language(verse_id, figurative_data)
+def assemble_chapter_records(verse_results: List[Dict], verses_data: List[Dict], book_name: str,
+                             chapter: int, divine_names_modifier, logger) -> List[Tuple[VerseRecord, List[InstanceRecord]]]:
+    """
+    Turn parsed detection results into database-ready verse and instance records in one pass.
 
-        for vr in verse_results:
-            verse_num = vr.get('verse')
-            reference = vr.get('reference', f'{book_name} {chapter}:{verse_num}')
-            instances = vr.get('instances', [])
-
-            # Extract verse-specific deliberation from JSON
-            verse_specific_deliberation = vr.get('deliberation', '')
-            if verse_specific_deliberation:
-                logger.debug(f"Found verse-specific deliberation for {reference}: {len(verse_specific_deliberation)} chars")
-            else:
-                logger.warning(f"No deliberation found for {reference}, using empty string")
-                verse_specific_deliberation = None  # Use null as requested
+    Args:
+        verse_results: Parsed per-verse detection results
+        verses_data: Source verse dicts for the chapter (Sefaria text)
+        book_name: Name of the book
+        chapter: Chapter number
+        divine_names_modifier: HebrewDivineNamesModifier instance (transforms go through the
+            shared TransformMemo, which main() builds around it)
+        logger: Logger instance
 
-            # Find original verse data
-            original_verse = next((v for v in verses_data if v['verse'] == verse_num), None)
-            if not original_verse:
-                logger.warning(f"Could not find original verse data for {reference}")
-                continue
+    Returns:
+        List of (VerseRecord, [InstanceRecord, ...]) in verse_results order.
+        Verses with no matching source verse are skipped.
+    """
+    source_by_verse = {v['verse']: v for v in verses_data}
+    transforms = get_transform_memo()
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    records = []
+
+    for vr in verse_results:
+        verse_num = vr.get('verse')
+        reference = vr.get('reference', f'{book_name} {chapter}:{verse_num}')
+        instances = vr.get('instances', [])
+
+        # Extract verse-specific deliberation from JSON
+        verse_specific_deliberation = vr.get('deliberation', '')
+        if verse_specific_deliberation:
+            logger.debug("Found verse-specific deliberation for %s: %d chars", reference, len(verse_specific_deliberation))
+        else:
+            logger.warning("No deliberation found for %s, using empty string", reference)
+            verse_specific_deliberation = None  # Use null as requested
 
-            # Prepare verse data for database
-            hebrew_stripped = HebrewTextProcessor.strip_diacritics(original_verse['hebrew'])
-            hebrew_non_sacred = divine_names_modifier.modify_divine_names(original_verse['hebrew'])
-            english_non_sacred = divine_names_modifier.modify_english_with_hebrew_terms(original_verse['english'])
-            # english_text_clean is the same as english from Sefaria (already has footnotes removed)
-            english_text_clean = original_verse['english']
-            english_text_clean_non_sacred = divine_names_modifier.modify_english_with_hebrew_terms(english_text_clean)
+        # Find original verse data
+        original_verse = source_by_verse.get(verse_num)
+        if not original_verse:
+            logger.warning("Could not find original verse data for %s", reference)
+            continue
 
-            # Apply divine names modification to deliberation if present
-            verse_specific_deliberation_non_sacred = divine_names_modifier.modify_english_with_hebrew_terms(verse_specific_deliberation) if verse_specific_deliberation else None
+        hebrew = original_verse['hebrew']
+        # english_text_clean is the same as english from Sefaria (already has footnotes removed)
+        english = original_verse['english']
+        english_non_sacred = transforms.modify_english_with_hebrew_terms(english)
+
+        verse_record = VerseRecord(
+            reference=reference,
+            book=book_name,
+            chapter=chapter,
+            verse=verse_num,
+            hebrew_text=hebrew,
+            hebrew_text_stripped=transforms.strip_diacritics(hebrew),
+            hebrew_text_non_sacred=transforms.modify_divine_names(hebrew),
+            english_text=english,
+            english_text_clean=english,  # Clean English text (footnotes removed by Sefaria)
+            english_text_clean_non_sacred=english_non_sacred,  # Clean English with divine names modified
+            english_text_non_sacred=english_non_sacred,
+            word_count=len(hebrew.split()),
+            instances_detected=len(instances),
+            figurative_detection_deliberation=verse_specific_deliberation,  # Verse-specific deliberation
+            figurative_detection_deliberation_non_sacred=(
+                transforms.modify_english_with_hebrew_terms(verse_specific_deliberation) if verse_specific_deliberation else None
+            ),
+            model_used='gpt-5.1-medium-batched',
+            truncation_occurred='no',  # Batched mode doesn't have truncation issues
+            both_models_truncated='no'
+        )
 
-            # Calculate word count
-            hebrew_words = original_verse['hebrew'].split()
-            word_count = len([w for w in hebrew_words if w.strip()])
+        if debug_enabled:
+            logger.debug("Verse data for insertion: %s", json.dumps(verse_record.to_dict(), indent=2, ensure_ascii=False))
+
+        instance_records = []
+        for instance in instances:
+            # Get figurative text and apply divine names transformation
+            figurative_text = instance.get('english_text', '')
+            hebrew_text = instance.get('hebrew_text', '')
+
+            # Tag lists are serialized once here; the record carries the stored JSON from now on
+            instance_records.append(InstanceRecord(
+                figurative_language=instance.get('figurative_language', 'no'),
+                simile=instance.get('simile', 'no'),
+                metaphor=instance.get('metaphor', 'no'),
+                personification=instance.get('personification', 'no'),
+                idiom=instance.get('idiom', 'no'),
+                hyperbole=instance.get('hyperbole', 'no'),
+                metonymy=instance.get('metonymy', 'no'),
+                other=instance.get('other', 'no'),
+                confidence=instance.get('confidence', 0.5),
+                figurative_text=figurative_text,
+                figurative_text_non_sacred=transforms.modify_english_with_hebrew_terms(figurative_text) if figurative_text else '',  # English figurative text with divine names modified
+                figurative_text_in_hebrew=hebrew_text,
+                figurative_text_in_hebrew_stripped=transforms.strip_diacritics(hebrew_text),
+                figurative_text_in_hebrew_non_sacred=transforms.modify_divine_names(hebrew_text),
+                explanation=instance.get('explanation', ''),
+                speaker=instance.get('speaker', ''),
+                purpose=instance.get('purpose', ''),
+                target=json.dumps(instance['target']) if instance.get('target') else EMPTY_JSON_LIST,
+                vehicle=json.dumps(instance['vehicle']) if instance.get('vehicle') else EMPTY_JSON_LIST,
+                ground=json.dumps(instance['ground']) if instance.get('ground') else EMPTY_JSON_LIST,
+                posture=json.dumps(instance['posture']) if instance.get('posture') else EMPTY_JSON_LIST,
+                tagging_analysis_deliberation='',  # No per-instance deliberation in batched mode
+                model_used='gpt-5.1-medium-batched'
+            ))
 
-            verse_data = {
-                'reference': reference,
-                'book': book_name,
-                'chapter': chapter,
-                'verse': verse_num,
-                'hebrew': original_verse['hebrew'],
-                'hebrew_stripped': hebrew_stripped,
-                'hebrew_text_non_sacred': hebrew_non_sacred,  # Fixed: Match db_manager field name
-                'english': original_verse['english'],
-                'english_text_clean': english_text_clean,  # Clean English text (footnotes removed by Sefaria)
-                'english_text_clean_non_sacred': english_text_clean_non_sacred,  # Clean English with divine names modified
-                'english_text_non_sacred': english_non_sacred,  # Fixed: Match db_manager field name
-                'word_count': word_count,
-                'instances_detected': len(instances),
-                'figurative_detection_deliberation': verse_specific_deliberation,  # Verse-specific deliberation
-                'figurative_detection_deliberation_non_sacred': verse_specific_deliberation_non_sacred,
-                'model_used': 'gpt-5.1-medium-batched',
-                'truncation_occurred': 'no',  # Batched mode doesn't have truncation issues
-                'pro_model_used': 'no',
-                'both_models_truncated': 'no',
-                'tertiary_decomposed': 'no'
-            }
+        records.append((verse_record, instance_records))
 
-            logger.debug(f"Verse data for insertion: {json.dumps(verse_data, indent=2, ensure_ascii=False)}")
+    return records
 
-            # Track current verse index for return_data_only mode
-            current_verse_index = len(collected_verses_data)
 
-            if return_data_only:
-                # Collect verse data for later writing by WriteQueue
-                collected_verses_data.append(verse_data)
-                verses_stored += 1
-                verse_id = None  # Not written yet
-            else:
-                # Insert verse into database (thread-safe)
-                verse_id = db_insert_verse(verse_data)
-                verses_stored += 1
+def process_chapter_batched(verses_data, book_name, chapter, validator, divine_names_modifier, db_manager, logger, run_context: RunContext = None, db_lock: threading.Lock = None, return_data_only: bool = False):
+    """Process an entire chapter in a single batched API call (GPT-5.1 MEDIUM)
 
-            # Process instances for this verse
-            instances_with_db_ids = []
+    This approach sends all verses in ONE API call, achieving 95% token savings
+    compared to per-verse processing.
 
-            for j, instance in enumerate(instances):
-                # Prepare instance data for database
-                # Get figurative text and apply divine names transformation
-                figurative_text = instance.get('english_text', '')
-                figurative_text_non_sacred = divine_names_modifier.modify_english_with_hebrew_terms(figurative_text) if figurative_text else ''
+    Args:
+        verses_data: List of verse dictionaries with 'hebrew', 'english', 'reference', 'verse'
+        book_name: Name of the book
+        chapter: Chapter number
+        validator: MetaphorValidator instance (uses GPT-5.1 MEDIUM)
+        divine_names_modifier: HebrewDivineNamesModifier instance
+        db_manager: DatabaseManager instance (not used when return_data_only=True)
+        logger: Logger instance
+        run_context: Optional RunContext for failure tracking
+        db_lock: Optional threading.Lock for thread-safe database operations
+        return_data_only: If True, return prepared data instead of writing to DB.
+                         Used by WriteQueue architecture to eliminate lock contention.
 
-                figurative_data = {
-                    'figurative_language': instance.get('figurative_language', 'no'),
-                    'simile': instance.get('simile', 'no'),
-                    'metaphor': instance.get('metaphor', 'no'),
-                    'personification': instance.get('personification', 'no'),
-                    'idiom': instance.get('idiom', 'no'),
-                    'hyperbole': instance.get('hyperbole', 'no'),
-                    'metonymy': instance.get('metonymy', 'no'),
-                    'other': instance.get('other', 'no'),
-                    'confidence': instance.get('confidence', 0.5),
-                    'figurative_text': figurative_text,
-                    'figurative_text_non_sacred': figurative_text_non_sacred,  # English figurative text with divine names modified
-                    'figurative_text_in_hebrew': instance.get('hebrew_text', ''),
-                    'figurative_text_in_hebrew_stripped': HebrewTextProcessor.strip_diacritics(instance.get('hebrew_text', '')),
-                    'figurative_text_in_hebrew_non_sacred': divine_names_modifier.modify_divine_names(instance.get('hebrew_text', '')),
-                    'explanation': instance.get('explanation', ''),
-                    'speaker': instance.get('speaker', ''),
-                    'purpose': instance.get('purpose', ''),
-                    'target': json.dumps(instance.get('target', [])) if instance.get('target') else '[]',
-                    'vehicle': json.dumps(instance.get('vehicle', [])) if instance.get('vehicle') else '[]',
-                    'ground': json.dumps(instance.get('ground', [])) if instance.get('ground') else '[]',
-                    'posture': json.dumps(instance.get('posture', [])) if instance.get('posture') else '[]',
-                    'tagging_analysis_deliberation': '',  # No per-instance deliberation in batched mode
-                    'model_used': 'gpt-5.1-medium-batched'
-                }
+    Returns:
+        If return_data_only=False (default):
+            Tuple of (verses_stored, instances_stored, processing_time, total_attempted, total_cost, error_msg,
+                      token_usage)
+        If return_data_only=True:
+            Tuple of (verses_data_list, instances_data_list, processing_time, total_attempted, total_cost, error_msg,
+                      token_usage)
+            where instances_data_list is List[(verse_index, instance_dict)]
+        token_usage is the chapter's chapter_token_usage row (None if detection failed); with
+        return_data_only=True its validation columns are left to the WriteQueue.
+    """
+    start_time = time.time()
 
-                if return_data_only:
-                    # Collect instance data for later writing by WriteQueue
-                    collected_instances_data.append((current_verse_index, figurative_data))
-                    instances_stored += 1
-                else:
-                    # Insert instance into database (thread-safe)
-                    figurative_language_id = db_insert_figurative_language(verse_id, figurative_data)
-                    instances_stored += 1
-
-                    # Keep track for validation
-                    instance_copy = instance.copy()
-                    instance_copy['db_id'] = figurative_language_id
-                    instance_copy['verse_ref'] = reference
-                    instance_copy['instance_id'] = j + 1
-                    instances_with_db_ids.append(instance_copy)
-
-            # Map this verse to its instances for batched validation (only when not return_data_only)
-            if not return_data_only and instances_with_db_ids:
-                verse_to_instances_map[reference] = {
-                    'hebrew': original_verse['hebrew'],
-                    'english': original_verse['english'],
-                    'instances': instances_with_db_ids
-                }
+    if not verses_data:
+        if return_data_only:
+            return [], [], 0, 0, 0.0, None, None
+        return 0, 0, 0, 0, 0.0, None, None
+
+    max_tokens = detection_max_tokens(book_name)
+
+    logger.info(f"[BATCHED MODE] Processing {book_name} {chapter} with {len(verses_data)} verses in SINGLE API call")
+    logger.info(f"[BATCHED MODE] Using max_completion_tokens={max_tokens}")
+
+    windows = plan_detection_windows(verses_data, book_name)
+    if len(windows) > 1:
+        logger.info(f"[BATCHED MODE] Splitting {book_name} {chapter} into {len(windows)} verse windows: "
+                    + ", ".join(f"{w[0]['verse']}-{w[-1]['verse']}" for w in windows))
+
+    try:
+        detection = run_detection_windows(verses_data, windows, book_name, chapter, max_tokens, logger)
+        verse_results = detection['verse_results']
+        token_metadata = detection['token_metadata']
+        skipped_verses = detection['skipped_verses']
+        corrupted_chunks = detection['corrupted_chunks']
+
+        prompt_savings = measure_prompt_savings(verses_data, detection['prompt_tokens'], detection['calls'])
+        logger.info(f"[PROMPT] {book_name} {chapter}: ~{prompt_savings['input_tokens']:,} input tokens "
+                    f"(legacy ~{prompt_savings['legacy_input_tokens']:,}, "
+                    f"saved ~{prompt_savings['input_tokens_saved']:,}, "
+                    f"cacheable prefix ~{prompt_savings['cacheable_prefix_tokens']:,})")
+        if run_context:
+            run_context.record_prompt_savings(book_name, chapter, prompt_savings)
+
+        token_usage = build_chapter_token_usage(verses_data, detection)
+        get_token_estimator().record(book_name, chapter, token_usage['verses'],
+                                     token_usage['estimated_input_tokens'], token_usage)
+
+        if not verse_results:
+            raise ValueError("No valid verse results found after filtering")
+
+        # Calculate detection statistics
+        total_instances = sum(len(vr.get('instances', [])) for vr in verse_results)
+        detection_rate = total_instances / len(verse_results) if verse_results else 0
+
+        logger.info(f"Detected {total_instances} instances ({detection_rate:.2f} instances/verse)")
+
+        with get_profiler().span(STAGE_ASSEMBLE, book_name, chapter, verses=len(verse_results)):
+            chapter_records = assemble_chapter_records(verse_results, verses_data, book_name, chapter,
+                                                       divine_names_modifier, logger)
+
+        # The records are handed on as-is: to the WriteQueue, or to insert_chapter_bulk below
+        collected_verses_data = [verse_record for verse_record, _ in chapter_records]
+        collected_instances_data = [(verse_index, instance_record)
+                                    for verse_index, (_, instance_records) in enumerate(chapter_records)
+                                    for instance_record in instance_records]
+        verses_stored = len(collected_verses_data)
+        instances_stored = len(collected_instances_data)
 
         # For return_data_only mode: return the collected data now (validation handled by WriteQueue)
         if return_data_only:
@@ -2551,36 +4170,35 @@ IMPORTANT:
             # Note: total_cost not computed yet in this path, use detection cost from token_metadata
             detection_cost = token_metadata.get('cost', 0)
             logger.info(f"[BATCHED MODE] Prepared {verses_stored} verses with {instances_stored} instances for queue write (Cost: ${detection_cost:.4f})")
-            return collected_verses_data, collected_instances_data, processing_time, len(verses_data), detection_cost, None
+            return (collected_verses_data, collected_instances_data, processing_time, len(verses_data),
+                    detection_cost, None, token_usage)
+
+        # Insert the chapter set-based (thread-safe with optional lock); records get their DB IDs
+        if db_lock:
+            with db_lock:
+                _, inserted_instances = db_manager.insert_chapter_bulk(collected_verses_data, collected_instances_data)
+                db_manager.record_chapter_token_usage(book_name, chapter, token_usage)
+        else:
+            _, inserted_instances = db_manager.insert_chapter_bulk(collected_verses_data, collected_instances_data)
+            db_manager.record_chapter_token_usage(book_name, chapter, token_usage)
 
         # BATCHED VALIDATION - Validate all instances from all verses in a single API call
-        if validator and verse_to_instances_map:
-            total_instances = sum(len(v['instances']) for v in verse_to_instances_map.values())
-            logger.info(f"[BATCHED VALIDATION] Validating {total_instances} instances from {len(verse_to_instances_map)} verses in ONE API call")
+        if validator and inserted_instances:
+            verses_with_instances = len({verse_index for verse_index, _, _ in inserted_instances})
+            logger.info(f"[BATCHED VALIDATION] Validating {instances_stored} instances from {verses_with_instances} verses in ONE API call")
 
             validation_start = time.time()
 
-            # Collect all instances from all verses with their context
-            all_chapter_instances = []
-
-            for verse_ref, verse_info in verse_to_instances_map.items():
-                instances = verse_info['instances']
-                hebrew_text = verse_info['hebrew']
-                english_text = verse_info['english']
-
-                logger.debug(f"Preparing {len(instances)} instances from {verse_ref} for batch validation")
-
-                for instance in instances:
-                    # Add verse context to each instance
-                    instance['verse_reference'] = verse_ref
-                    instance['hebrew_text'] = hebrew_text
-                    instance['english_text'] = english_text
-                    all_chapter_instances.append(instance)
+            # Only the fields the validator reads, with each instance's verse text as context
+            all_chapter_instances = [record.validation_payload(collected_verses_data[verse_index])
+                                     for verse_index, _, record in inserted_instances]
 
-            # Make a single validation call for all instances in the chapter
+            # Validate all instances in the chapter (concurrent sub-batches for large chapters)
+            validation_cost_metadata = {'cost': 0, 'input_tokens': 0, 'output_tokens': 0, 'reasoning_tokens': 0}
             try:
-                logger.info(f"Making single validation API call for {len(all_chapter_instances)} instances")
-                bulk_validation_results, validation_cost_metadata = validator.validate_chapter_instances(all_chapter_instances)
+                logger.info(f"Validating {len(all_chapter_instances)} instances for chapter {chapter}")
+                with get_profiler().span(STAGE_VALIDATION, book_name, chapter, instances=len(all_chapter_instances)):
+                    bulk_validation_results, validation_cost_metadata = validator.validate_chapter_instances_concurrent(all_chapter_instances)
 
                 # VALIDATION PREVENTION MEASURES: Check for validation system failures
                 validation_success_count = 0
@@ -2614,16 +4232,10 @@ IMPORTANT:
                 for instance in all_chapter_instances:
                     instance_id_to_db_id[instance.get('instance_id')] = instance.get('db_id')
 
-                # Track validation processing using shared function
-                processed_validation_ids = set()
-
-                # Process validation results using shared function (thread-safe)
-                for validation_result in bulk_validation_results:
-                    success, db_id = process_validation_result(
-                        validation_result, instance_id_to_db_id, db_manager, logger, db_lock
-                    )
-                    if success:
-                        processed_validation_ids.add(validation_result.get('instance_id'))
+                # Process validation results in one batch update (thread-safe)
+                processed_validation_ids = apply_validation_results(
+                    bulk_validation_results, instance_id_to_db_id, db_manager, logger, db_lock
+                )
 
                 # Check for missing validation IDs
                 expected_instance_ids = set(instance_id_to_db_id.keys())
@@ -2639,7 +4251,7 @@ IMPORTANT:
                         db_id = instance_id_to_db_id.get(missing_id)
                         logger.error(f"  Instance ID {missing_id} (DB ID: {db_id}) did not receive validation")
 
-                logger.info(f"[BATCHED VALIDATION] Completed single API call for {total_instances} instances")
+                logger.info(f"[BATCHED VALIDATION] Completed validation for {instances_stored} instances")
                 logger.info(f"[BATCHED VALIDATION] Processed {len(processed_validation_ids)} validation results")
                 if missing_validation_ids:
                     logger.error(f"[BATCHED VALIDATION] WARNING: {len(missing_validation_ids)} instances did not receive validation")
@@ -2674,6 +4286,13 @@ IMPORTANT:
                 logger.error(f"Batch validation failed for chapter {chapter}: {e}")
                 logger.error(f"RECOMMENDATION: Run universal_validation_recovery.py on this database after processing completes")
 
+            add_validation_token_usage(token_usage, validation_cost_metadata)
+            if db_lock:
+                with db_lock:
+                    db_manager.record_chapter_validation_usage(book_name, chapter, validation_cost_metadata)
+            else:
+                db_manager.record_chapter_validation_usage(book_name, chapter, validation_cost_metadata)
+
             validation_time = time.time() - validation_start
             logger.info(f"[BATCHED VALIDATION] Completed in {validation_time:.1f}s")
         else:
@@ -2699,7 +4318,7 @@ IMPORTANT:
         elif corrupted_chunks == 0:
             logger.info("No corruption detected - all verses processed successfully")
 
-        return verses_stored, instances_stored, processing_time, len(verses_data), total_cost, None
+        return verses_stored, instances_stored, processing_time, len(verses_data), total_cost, None, token_usage
 
     except Exception as e:
         error_msg = str(e)
@@ -2707,8 +4326,8 @@ IMPORTANT:
         import traceback
         traceback.print_exc()
         if return_data_only:
-            return [], [], time.time() - start_time, len(verses_data), 0.0, error_msg
-        return 0, 0, time.time() - start_time, len(verses_data), 0.0, error_msg
+            return [], [], time.time() - start_time, len(verses_data), 0.0, error_msg, None
+        return 0, 0, time.time() - start_time, len(verses_data), 0.0, error_msg, None
 
 def process_single_verse(verse_data, book_name, chapter, flexible_client, validator, divine_names_modifier, logger, worker_id, chapter_context=None):
     """Process a single verse for parallel execution
@@ -2786,12 +4405,13 @@ def process_single_verse(verse_data, book_name, chapter, flexible_client, valida
                 truncation_occurred = True
 
         # Prepare verse data
-        hebrew_stripped = HebrewTextProcessor.strip_diacritics(heb_verse)
-        hebrew_non_sacred = divine_names_modifier.modify_divine_names(heb_verse)
-        english_non_sacred = divine_names_modifier.modify_english_with_hebrew_terms(eng_verse)
+        transforms = get_transform_memo()
+        hebrew_stripped = transforms.strip_diacritics(heb_verse)
+        hebrew_non_sacred = transforms.modify_divine_names(heb_verse)
+        english_non_sacred = transforms.modify_english_with_hebrew_terms(eng_verse)
         instances_count = len(metadata.get('flexible_instances', []))
         figurative_detection = metadata.get('figurative_detection_deliberation', '')
-        figurative_detection_non_sacred = divine_names_modifier.modify_divine_names(figurative_detection) if figurative_detection else ''
+        figurative_detection_non_sacred = transforms.modify_divine_names(figurative_detection) if figurative_detection else ''
 
         # SAFEGUARD: Ensure we don't have truncated deliberation from fallback scenarios
         # If we used Pro model or Claude fallback, verify the deliberation is complete
@@ -2879,6 +4499,7 @@ def process_verses_parallel(verses_to_process, book_name, chapter, flexible_clie
 
     all_verse_results = []
     all_instance_results = []
+    transforms = get_transform_memo()
 
     start_time = time.time()
 
@@ -2965,8 +4586,8 @@ def process_verses_parallel(verses_to_process, book_name, chapter, flexible_clie
                     'confidence': instance_data.get('confidence', 0.5),
                     'figurative_text': instance_data.get('english_text', ''),
                     'figurative_text_in_hebrew': instance_data.get('hebrew_text', ''),
-                    'figurative_text_in_hebrew_stripped': HebrewTextProcessor.strip_diacritics(instance_data.get('hebrew_text', '')),
-                    'figurative_text_in_hebrew_non_sacred': divine_names_modifier.modify_divine_names(instance_data.get('hebrew_text', '')),
+                    'figurative_text_in_hebrew_stripped': transforms.strip_diacritics(instance_data.get('hebrew_text', '')),
+                    'figurative_text_in_hebrew_non_sacred': transforms.modify_divine_names(instance_data.get('hebrew_text', '')),
                     'explanation': instance_data.get('explanation', ''),
                     'speaker': instance_data.get('speaker', ''),
                     'purpose': instance_data.get('purpose', ''),
@@ -3064,7 +4685,22 @@ def main():
     was_loaded = load_dotenv(dotenv_path=dotenv_path)
 
     # Check for command-line arguments
-    if len(sys.argv) == 3:
+    resume_config = None
+    if len(sys.argv) == 3 and sys.argv[1] == '--resume':
+        # Resume mode: python script.py --resume path/to/run.db
+        db_name = os.path.abspath(sys.argv[2])
+        resume_config = RunJournal.load_run_config(db_name)
+        if not resume_config:
+            print(f"Error: No run journal found in {db_name}")
+            return
+
+        selection = {
+            'book_selections': resume_config['book_selections'],
+            'max_workers': resume_config['max_workers'],
+            'enable_debug': False
+        }
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+    elif len(sys.argv) == 3:
         # Command-line mode: python script.py BookName ChapterNumber
         book_name = sys.argv[1]
         chapter_num = int(sys.argv[2])
@@ -3164,8 +4800,8 @@ def main():
         log_file = os.path.join(OUTPUT_DIR, f"{base_filename}_log.txt")
         json_file = os.path.join(OUTPUT_DIR, f"{base_filename}_results.json")
     else:
-        # For command-line mode with specific db_name
-        base_filename = os.path.basename(db_name).replace('.db', '')
+        # For command-line and resume modes with specific db_name
+        base_filename = (resume_config or {}).get('base_filename') or os.path.basename(db_name).replace('.db', '')
         log_file = os.path.join(OUTPUT_DIR, f"{base_filename}_log.txt")
         json_file = os.path.join(OUTPUT_DIR, f"{base_filename}_results.json")
 
@@ -3205,8 +4841,10 @@ def main():
     print(f"Output files: {base_filename}.*")
     print(f"Database: {db_name}")
 
-    # Skip confirmation for command-line mode
-    if len(sys.argv) == 3:
+    # Skip confirmation for command-line and resume modes
+    if resume_config:
+        print(f"\nResuming run {resume_config['run_id']} from {db_name}...")
+    elif len(sys.argv) == 3:
         print(f"\nProcessing {book_name} {chapter_num} (command-line mode)...")
     else:
         proceed = input("\nProceed with parallel processing? (y/n): ").strip().lower()
@@ -3223,6 +4861,9 @@ def main():
 
     # Initialize run context for tracking
     run_context = RunContext(book_selections, output_dir=OUTPUT_DIR)
+    if resume_config:
+        # Keep the original run ID so journal entries and manifests stay with the same run
+        run_context.run_id = resume_config['run_id']
 
     # Log processing summary with run ID
     logger.info(f"=== MULTI-BOOK PARALLEL PROCESSING STARTED ===")
@@ -3231,6 +4872,8 @@ def main():
     logger.info(f"Total books: {len(book_selections)}")
     logger.info(f"Estimated verses: ~{total_tasks}")
     logger.info(f"Workers: {max_workers}")
+    if os.getenv("OPENAI_BASE_URL"):
+        logger.info(f"LLM base URL override: {os.getenv('OPENAI_BASE_URL')} (offline/replay mode)")
     for book_name, chapters in book_selections.items():
         if chapters == 'FULL_BOOK':
             logger.info(f"Book: {book_name} - FULL BOOK")
@@ -3239,8 +4882,8 @@ def main():
 
     start_time = time.time()
 
-    # Initialize Sefaria cache for faster reruns
-    sefaria_cache = SefariaCache()
+    # Sefaria text store for faster reruns
+    sefaria_cache = SefariaTextStore(SEFARIA_TEXT_STORE_PATH, logger=logger)
 
     try:
         api_key = os.environ.get("GEMINI_API_KEY")
@@ -3277,6 +4920,16 @@ def main():
         """)
         db_manager.commit()
 
+        # Durable per-chapter journal so a crashed run can be resumed with --resume
+        run_journal = RunJournal(db_name, run_context.run_id, resume=bool(resume_config))
+        prior_cost = 0.0
+        if resume_config:
+            prior_cost = run_journal.spent_cost()
+            logger.info(f"[RunJournal] Resuming run {run_context.run_id} "
+                        f"(${prior_cost:.4f} spent before the interruption)")
+        else:
+            run_journal.save_run_config(book_selections, max_workers, base_filename)
+
         logger.info("Initializing MetaphorValidator with GPT-5.1 MEDIUM...")
         # MetaphorValidator now uses OpenAI GPT-5.1, not Gemini
         validator = MetaphorValidator(db_manager=db_manager, logger=logger)
@@ -3286,6 +4939,9 @@ def main():
 
         logger.info("Initializing Hebrew Divine Names Modifier...")
         divine_names_modifier = HebrewDivineNamesModifier(logger=logger)
+        transform_memo = configure_transform_memo(divine_names_modifier, store_path=TRANSFORM_MEMO_PATH, logger=logger)
+        token_estimator = configure_token_estimator(TOKEN_USAGE_PATH, logger=logger)
+        profiler = configure_profiler()
 
         total_verses, total_instances, total_errors = 0, 0, 0
         all_results = []
@@ -3323,26 +4979,61 @@ def main():
         logger.info(f"{'='*60}")
         logger.info(f"Total chapters to process: {len(chapter_tasks)}")
         logger.info(f"Parallel workers: {max_workers}")
-        logger.info(f"Processing mode: Batched (one API call per chapter)")
+        batch_api = os.getenv('BATCH_API', '').strip().lower()
+        if batch_api:
+            logger.info(f"Processing mode: Provider batch jobs ({batch_api} backend, detection and validation)")
+        else:
+            logger.info(f"Processing mode: Batched (one API call per chapter)")
         logger.info(f"{'='*60}\n")
 
-        # Process all chapters in parallel using batched mode
-        parallel_results = process_chapters_parallel(
-            chapter_tasks,
-            sefaria_cache,
-            sefaria,  # sefaria_client
-            validator,
-            divine_names_modifier,
-            db_manager,
-            logger,
-            max_workers,
-            run_context
-        )
+        # Fetch all chapter text up front (also gives the scheduler exact verse counts)
+        prefetch_chapter_texts(chapter_tasks, sefaria_cache, sefaria, logger)
+
+        if batch_api:
+            # Non-interactive runs: half-price batch jobs, answered within the provider's completion window
+            if batch_api == 'local':
+                backend = LocalBatchBackend(os.path.join(BATCH_JOBS_DIR, 'local'), create_openai_client(),
+                                            max_workers=BATCH_LOCAL_WORKERS)
+                poll_default = BATCH_LOCAL_POLL_SECONDS
+            else:
+                backend = OpenAIBatchBackend(create_openai_client())
+                poll_default = BATCH_POLL_SECONDS
+            parallel_results = process_chapters_batch_api(
+                chapter_tasks, sefaria_cache, sefaria, validator, divine_names_modifier, db_manager, logger,
+                max_workers, backend, run_context, run_journal=run_journal,
+                poll_seconds=env_number('BATCH_POLL_SECONDS', poll_default)
+            )
+        else:
+            # Process all chapters in parallel using batched mode
+            parallel_results = process_chapters_parallel(
+                chapter_tasks,
+                sefaria_cache,
+                sefaria,  # sefaria_client
+                validator,
+                divine_names_modifier,
+                db_manager,
+                logger,
+                max_workers,
+                run_context,
+                run_journal=run_journal,
+                token_budget=INFLIGHT_TOKEN_BUDGET,
+                soft_cost_limit=env_number('RUN_SOFT_COST_LIMIT', RUN_SOFT_COST_LIMIT),
+                hard_cost_limit=env_number('RUN_HARD_COST_LIMIT', RUN_HARD_COST_LIMIT),
+                tokens_per_minute=env_number('RUN_TOKENS_PER_MINUTE', RUN_TOKENS_PER_MINUTE),
+                dashboard=os.getenv('RUN_DASHBOARD', '1').strip().lower() not in ('0', 'false', 'no', 'off'),
+                prior_cost=prior_cost
+            )
 
         # Aggregate results
         total_verses = parallel_results['total_verses']
         total_instances = parallel_results['total_instances']
-        run_context.total_cost = parallel_results['total_cost']
+        run_context.total_cost = prior_cost + parallel_results['total_cost']
+        if parallel_results.get('skipped_chapters'):
+            print(f"Skipped {parallel_results['skipped_chapters']} chapters already completed in this run")
+        not_started = parallel_results.get('not_started_chapters', [])
+        if not_started:
+            print(f"\nRun drained: {len(not_started)} chapters were not started ({not_started[0]['error']})")
+            print(f"Continue later with: python interactive_parallel_processor.py --resume {db_name}")
 
         # Track failed chapters from parallel results
         for result in parallel_results['chapter_results']:
@@ -3372,6 +5063,10 @@ def main():
             print(f"Average time per verse: N/A (no verses processed)")
             print(f"Figurative language detection rate: N/A")
         print(f"Parallel chapters: {max_workers}")
+        scheduling = parallel_results.get('scheduling')
+        if scheduling:
+            print(f"Makespan: predicted {scheduling['predicted_makespan_seconds']:.0f}s, "
+                  f"actual {scheduling['actual_makespan_seconds']:.0f}s ({scheduling['order']} order)")
         print(f"** TOTAL COST: ${run_context.total_cost:.4f}")
         print(f"\n==> Processed {total_verses} verses from {len(book_selections)} books ({len(chapter_tasks)} chapters)")
         print(f"** Total time: {total_time:.1f} seconds with {max_workers} parallel chapter workers")
@@ -3379,8 +5074,9 @@ def main():
         # Display validation error summary
         validation_issues = []
 
-        # Check validation coverage for all processed chapters
-        if validator and db_manager and total_verses > 0:
+        # Check validation coverage for all processed chapters (including ones completed before a resume)
+        journal_stages = run_journal.get_chapter_stages()
+        if validator and db_manager and (total_verses > 0 or journal_stages):
             print(f"\n{'='*60}")
             print(f"VALIDATION COVERAGE CHECK")
             print(f"{'='*60}")
@@ -3388,29 +5084,35 @@ def main():
             for book_name, chapters in book_selections.items():
                 if chapters == 'FULL_BOOK':
                     max_chapters = SUPPORTED_BOOKS[book_name]
-                    chapters_to_check = range(1, max_chapters + 1)
+                    chapters_to_check = list(range(1, max_chapters + 1))
                 else:
-                    chapters_to_check = chapters.keys()
+                    chapters_to_check = list(chapters.keys())
 
-                for chapter in chapters_to_check:
-                    try:
-                        verification = db_manager.verify_validation_data_for_chapter(book_name, chapter)
-                        if verification.get('needs_recovery', False):
-                            # Use decision coverage as primary metric, response coverage as secondary
-                            coverage_rate = max(
-                                verification.get('validation_coverage_rate', 0),  # Based on validation_response
-                                verification.get('decision_coverage_rate', 0)      # Based on validation_decision_*
-                            )
-                            validation_issues.append({
-                                'book': book_name,
-                                'chapter': chapter,
-                                'coverage': coverage_rate,
-                                'total': verification.get('total_instances', 0),
-                                'validated': verification.get('instances_with_decisions', verification.get('instances_with_validation', 0))
-                            })
-                    except:
-                        # Skip chapters that couldn't be verified
-                        pass
+                try:
+                    # One aggregated query per book instead of two per chapter
+                    verifications = db_manager.verify_validation_data_for_chapters(book_name, chapters_to_check)
+                except Exception as verify_error:
+                    # Skip books that couldn't be verified
+                    logger.warning(f"Could not verify validation coverage for {book_name}: {verify_error}")
+                    continue
+
+                for (_, chapter), verification in verifications.items():
+                    if not verification.get('needs_recovery', False):
+                        if journal_stages.get((book_name, chapter)) in ('written', 'validated'):
+                            run_journal.record(book_name, chapter, 'verified')
+                    else:
+                        # Use decision coverage as primary metric, response coverage as secondary
+                        coverage_rate = max(
+                            verification.get('validation_coverage_rate', 0),  # Based on validation_response
+                            verification.get('decision_coverage_rate', 0)      # Based on validation_decision_*
+                        )
+                        validation_issues.append({
+                            'book': book_name,
+                            'chapter': chapter,
+                            'coverage': coverage_rate,
+                            'total': verification.get('total_instances', 0),
+                            'validated': verification.get('instances_with_decisions', verification.get('instances_with_validation', 0))
+                        })
 
             if validation_issues:
                 print(f"\nVALIDATION ISSUES FOUND IN {len(validation_issues)} CHAPTER(S)")
@@ -3448,10 +5150,13 @@ def main():
                 if total_recovered > 0:
                     print(f"\n[POST-RECOVERY VERIFICATION]")
                     still_missing = 0
+                    rechecks = {}
+                    for book_name in dict.fromkeys(issue['book'] for issue in validation_issues):
+                        rechecks.update(db_manager.verify_validation_data_for_chapters(
+                            book_name, [issue['chapter'] for issue in validation_issues if issue['book'] == book_name]
+                        ))
                     for issue in validation_issues:
-                        recheck = db_manager.verify_validation_data_for_chapter(
-                            issue['book'], issue['chapter']
-                        )
+                        recheck = rechecks[(issue['book'], issue['chapter'])]
                         if recheck.get('needs_recovery', False):
                             coverage = max(
                                 recheck.get('validation_coverage_rate', 0),
@@ -3459,6 +5164,8 @@ def main():
                             )
                             print(f"   {issue['book']} {issue['chapter']}: {coverage:.1f}% coverage")
                             still_missing += 1
+                        else:
+                            run_journal.record(issue['book'], issue['chapter'], 'verified')
 
                     if still_missing == 0:
                         print(f"   All validation issues resolved!")
@@ -3486,6 +5193,8 @@ def main():
             print(f"To retry failed chapters, run the processor again with:")
             for failure in failed_chapters:
                 print(f"  python interactive_parallel_processor.py {failure['book']} {failure['chapter']}")
+            print(f"Or resume the whole run (completed chapters are skipped):")
+            print(f"  python interactive_parallel_processor.py --resume {db_name}")
             print(f"{'='*60}")
             logger.error(f"FAILED CHAPTERS SUMMARY: {len(failed_chapters)} chapter(s) failed")
             for failure in failed_chapters:
@@ -3526,6 +5235,9 @@ def main():
         processing_manifest_path = run_context.save_processing_manifest(base_filename)
         print(f"Processing manifest saved: {processing_manifest_path}")
         logger.info(f"Processing manifest saved: {processing_manifest_path}")
+        for line in profiler.format_summary():
+            logger.info(f"[PROFILE] {line}")
+        print(f"Run timeline saved: {base_filename}_trace.json (open in https://ui.perfetto.dev)")
 
         # Record processing run in database
         try:
@@ -3561,7 +5273,32 @@ def main():
         except Exception as db_error:
             logger.warning(f"Could not record processing run in database: {db_error}")
 
-        # Close database connection
+        memo_stats = transform_memo.get_stats()
+        logger.info(f"[MEMO] {memo_stats['lookups']} text transforms: {memo_stats['memory_hits']} memory hits, "
+                    f"{memo_stats['store_hits']} store hits, {memo_stats['computed']} computed")
+        transform_memo.close()
+
+        token_summary = run_context.get_token_usage_summary()
+        logger.info(f"[TOKENS] {token_summary['chapters_with_reported_usage']}/{token_summary['chapters']} chapters "
+                    f"with reported usage: input {token_summary['total_input_tokens']:,} "
+                    f"(estimated {token_summary['total_estimated_input_tokens']:,}, "
+                    f"cached {token_summary['total_cached_input_tokens']:,}), "
+                    f"output {token_summary['total_output_tokens']:,} "
+                    f"(estimated {token_summary['total_estimated_output_tokens']:,}, "
+                    f"reasoning {token_summary['total_reasoning_tokens']:,})")
+        token_stats = token_estimator.get_stats()
+        logger.info(f"[TOKENS] Calibration: {token_stats['calibration_chapters']} chapters over "
+                    f"{token_stats['calibrated_books']} books ({token_stats['method']}, "
+                    f"input factor {token_stats['input_factor']})")
+        token_estimator.close()
+
+        text_stats = sefaria_cache.get_stats()
+        logger.info(f"[TEXT_STORE] {text_stats['hits']} chapter reads from {text_stats['chapters']} stored chapters "
+                    f"({text_stats['misses']} misses, {text_stats['corrupt']} failed integrity checks)")
+        sefaria_cache.close()
+
+        # Close database connections
+        run_journal.close()
         if db_manager:
             db_manager.close()
 
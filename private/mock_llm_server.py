@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+"""
+Mock LLM Server - offline replay for pipeline throughput testing
+
+A local, OpenAI-compatible stand-in for the chat completions endpoint used by
+interactive_parallel_processor.py and MetaphorValidator. It lets the whole
+pipeline (Sefaria fetch -> detection -> parsing -> WriteQueue -> validation)
+run end to end without API keys, so orchestration and non-API bottlenecks can
+be benchmarked on a laptop.
+
+Responses are produced in one of two ways:
+- Replay: detection prompts for a book/chapter with a recorded raw response in
+  the replay directory (debug_response_{Book}_{chapter}_{timestamp}.json, as
+  written by save_raw_response) get that response back, restricted to the
+  requested verses.
+- Synthesis: everything else gets a schema-valid response generated from the
+  prompt itself (detection results per "Verse N:" block, validation decisions
+  per instance_id).
+
+Fault injection (latency, chunk size, corrupted chunks, truncation) is
+configurable so the streaming recovery paths can be exercised too.
+
+Requests with response_format {"type": "json_schema"} (structured-output mode) get
+what a constrained decoder would produce: the response is wrapped in the schema's
+root object and conformed to it (unknown keys dropped, missing required keys filled
+with null/empty values, enums clamped). A strict schema that a provider would reject
+(root not an object, a property missing from "required", additionalProperties not
+false) gets a 400, as it would from the live API. Truncation still applies afterwards.
+
+Usage is reported as the live API reports it: in the response body, or for a stream
+opened with stream_options={"include_usage": true} in a final chunk with empty choices.
+Token counts are chars/4; --reasoning-ratio adds hidden reasoning tokens (counted in
+completion_tokens and itemized under completion_tokens_details).
+
+It also stubs the Sefaria texts endpoint (GET /api/texts/{Book}.{chapter}) with
+synthetic chapters in Sefaria's response shape (footnote and <br> markup
+included), with optional latency and 503 injection, so the fetch layer
+(SefariaClient session, retry, prefetch) runs offline as well.
+
+Usage:
+    python mock_llm_server.py --port 8765
+    python mock_llm_server.py --latency 2.0 --chunk-size 64 --corruption-rate 0.05
+
+Then point the pipeline at it:
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 SEFARIA_BASE_URL=http://127.0.0.1:8765/api \\
+        OPENAI_API_KEY=mock GEMINI_API_KEY=mock python interactive_parallel_processor.py Ezekiel 10
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPLAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "debug")
+
+FIGURATIVE_TYPES = ['metaphor', 'simile', 'personification', 'idiom', 'hyperbole', 'metonymy', 'other']
+
+# Prompt markers used by the pipeline
+DETECTION_HEADER_PATTERN = re.compile(r'=== (.+?) Chapter (\d+) \(FULL CHAPTER')
+VERSE_BLOCK_PATTERN = re.compile(r'^Verse (\d+):\nHebrew: (.*)\nEnglish: (.*)$', re.MULTILINE)
+WINDOW_VERSES_PATTERN = re.compile(r'Analyze ONLY these verses from the chapter above: ([\d, ]+)')
+JSON_BLOCK_PATTERN = re.compile(r'```json\s*(.*?)```', re.DOTALL)
+# Instances block of a validation prompt (the system prompt's example block comes earlier)
+VALIDATION_INSTANCES_PATTERN = re.compile(r'DETECTED INSTANCES:\s*```json\s*(.*?)```', re.DOTALL)
+REPLAY_FILENAME_PATTERN = re.compile(r'debug_response_(.+)_(\d+)_(\d{8}_\d{6})\.json$')
+SEFARIA_TEXTS_PATTERN = re.compile(r'^/api/texts/([^/?]+?)\.(\d+)(?:[.?].*)?$')
+
+# Stub chapter text: verses cycle through these, with a divine name in each
+STUB_HEBREW_VERSES = [
+    'בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים אֵ֥ת הַשָּׁמַ֖יִם וְאֵ֥ת הָאָֽרֶץ׃',
+    'יְהוָ֥ה רֹ֝עִ֗י לֹ֣א אֶחְסָֽר׃',
+    'כִּ֤י אֵ֣ל שַׁדַּ֔י הֵמַ֖ר לִ֣י מְאֹֽד׃',
+]
+STUB_ENGLISH_VERSES = [
+    'When God began to create heaven and earth<sup class="footnote-marker">a</sup><i class="footnote">Or "In the beginning"</i>',
+    'The LORD is my shepherd;<br>I lack nothing.',
+    'For <b>Shaddai</b> has made my lot very bitter.',
+]
+
+
+def strict_schema_problems(schema: Dict, path: str = "#") -> List[str]:
+    """Reasons a provider would reject schema for strict structured output (empty if none)."""
+    problems = []
+    if not isinstance(schema, dict):
+        return [f"{path}: schema must be an object"]
+    if path == "#" and schema.get('type') != 'object':
+        problems.append("#: root schema must be of type object")
+    if 'properties' in schema:
+        missing = sorted(set(schema['properties']) - set(schema.get('required', [])))
+        if missing:
+            problems.append(f"{path}: 'required' must list every property (missing {', '.join(missing)})")
+        if schema.get('additionalProperties') is not False:
+            problems.append(f"{path}: 'additionalProperties' must be false")
+        for name, subschema in schema['properties'].items():
+            problems.extend(strict_schema_problems(subschema, f"{path}/properties/{name}"))
+    for keyword in ('anyOf', 'allOf'):
+        for i, subschema in enumerate(schema.get(keyword, [])):
+            problems.extend(strict_schema_problems(subschema, f"{path}/{keyword}/{i}"))
+    if isinstance(schema.get('items'), dict):
+        problems.extend(strict_schema_problems(schema['items'], f"{path}/items"))
+    for name, subschema in schema.get('$defs', {}).items():
+        problems.extend(strict_schema_problems(subschema, f"#/$defs/{name}"))
+    return problems
+
+
+def conform_to_schema(response_text: str, schema: Dict) -> str:
+    """Rewrite a free-form response the way a schema-constrained decoder would have produced it.
+
+    The JSON is taken from the response (inside a ```json block if there is one); an array is
+    wrapped in the root object's array property, then every value is conformed to the schema.
+    """
+    block = JSON_BLOCK_PATTERN.search(response_text)
+    try:
+        value = json.loads(block.group(1) if block else response_text)
+    except json.JSONDecodeError:
+        value = None
+    defs = schema.get('$defs', {})
+    if isinstance(value, list):
+        array_properties = [name for name, subschema in schema.get('properties', {}).items()
+                            if _resolve_ref(subschema, defs).get('type') == 'array']
+        value = {array_properties[0]: value} if array_properties else {}
+    return json.dumps(_conform(value, schema, defs), ensure_ascii=False)
+
+
+def _resolve_ref(schema: Dict, defs: Dict) -> Dict:
+    while '$ref' in schema:
+        schema = defs.get(schema['$ref'].rsplit('/', 1)[-1], {})
+    return schema
+
+
+def _conform(value, schema: Dict, defs: Dict):
+    schema = _resolve_ref(schema, defs)
+    if 'anyOf' in schema:
+        options = [_resolve_ref(option, defs) for option in schema['anyOf']]
+        if value is None and any(option.get('type') == 'null' for option in options):
+            return None
+        matching = [option for option in options if option.get('type') == _json_type(value)]
+        return _conform(value, (matching or [o for o in options if o.get('type') != 'null'] or options)[0], defs)
+    if 'enum' in schema:
+        return value if value in schema['enum'] else schema['enum'][0]
+
+    schema_type = schema.get('type')
+    if schema_type == 'object':
+        value = value if isinstance(value, dict) else {}
+        return {name: _conform(value.get(name), subschema, defs)
+                for name, subschema in schema.get('properties', {}).items()}
+    if schema_type == 'array':
+        items = value if isinstance(value, list) else []
+        return [_conform(item, schema.get('items', {}), defs) for item in items]
+    if schema_type == 'string':
+        return value if isinstance(value, str) else ('' if value is None else str(value))
+    if schema_type in ('integer', 'number'):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            value = 0
+        value = max(schema.get('minimum', value), min(schema.get('maximum', value), value))
+        return int(value) if schema_type == 'integer' else value
+    if schema_type == 'boolean':
+        return bool(value)
+    if schema_type == 'null':
+        return None
+    return value
+
+
+def _json_type(value) -> str:
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    return {dict: 'object', list: 'array', str: 'string', float: 'number'}.get(type(value), 'string')
+
+
+class MockServerConfig:
+    """Runtime behaviour of the mock server (latency, chunking, fault injection)."""
+
+    def __init__(self, replay_dir: Optional[str] = DEFAULT_REPLAY_DIR, latency: float = 0.0,
+                 chunk_size: int = 48, chunk_delay: float = 0.0, corruption_rate: float = 0.0,
+                 truncation_rate: float = 0.0, instance_rate: float = 0.3, seed: Optional[int] = None,
+                 sefaria_latency: float = 0.0, sefaria_error_rate: float = 0.0, reasoning_ratio: float = 0.0):
+        self.replay_dir = replay_dir
+        self.latency = latency
+        self.chunk_size = max(1, chunk_size)
+        self.chunk_delay = chunk_delay
+        self.corruption_rate = corruption_rate
+        self.truncation_rate = truncation_rate
+        self.instance_rate = instance_rate
+        self.sefaria_latency = sefaria_latency
+        self.sefaria_error_rate = sefaria_error_rate
+        self.reasoning_ratio = reasoning_ratio
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+    def roll(self, probability: float) -> bool:
+        """Thread-safe Bernoulli draw."""
+        if probability <= 0:
+            return False
+        with self.rng_lock:
+            return self.rng.random() < probability
+
+    def uniform(self, low: float, high: float) -> float:
+        with self.rng_lock:
+            return self.rng.uniform(low, high)
+
+
+class ReplayLibrary:
+    """Index of recorded raw detection responses keyed by (book, chapter)."""
+
+    def __init__(self, replay_dir: Optional[str]):
+        self.files: Dict[Tuple[str, int], str] = {}
+        if not replay_dir or not os.path.isdir(replay_dir):
+            return
+
+        # Keep the most recent recording for each chapter
+        for path in sorted(glob.glob(os.path.join(replay_dir, "debug_response_*.json"))):
+            match = REPLAY_FILENAME_PATTERN.search(os.path.basename(path))
+            if match:
+                self.files[(match.group(1), int(match.group(2)))] = path
+
+    def __len__(self):
+        return len(self.files)
+
+    def lookup(self, book: str, chapter: int, verse_numbers: List[int]) -> Optional[str]:
+        """Return the recorded response for a chapter, restricted to the requested verses."""
+        path = self.files.get((book, chapter))
+        if not path:
+            return None
+
+        with open(path, 'r', encoding='utf-8') as f:
+            raw_text = f.read()
+
+        try:
+            recorded = json.loads(raw_text)
+        except json.JSONDecodeError:
+            # Malformed recordings are replayed verbatim - that is what the parser saw
+            return raw_text
+
+        if not isinstance(recorded, list) or not verse_numbers:
+            return raw_text
+
+        wanted = set(verse_numbers)
+        selected = [v for v in recorded if isinstance(v, dict) and v.get('verse') in wanted]
+        if not selected:
+            return None
+        return json.dumps(selected, ensure_ascii=False, indent=2)
+
+
+class MockResponseFactory:
+    """Builds response text for a chat completions request."""
+
+    def __init__(self, config: MockServerConfig, library: ReplayLibrary):
+        self.config = config
+        self.library = library
+
+    def build(self, messages: List[Dict]) -> Tuple[str, str]:
+        """Return (response_text, source) for the given messages."""
+        prompt = "\n".join(self._message_text(m) for m in messages)
+
+        if "DETECTED INSTANCES" in prompt:
+            return self._synthesize_validation(prompt), "synthesized_validation"
+
+        verses = self._parse_verses(prompt)
+        book, chapter = self._parse_book_chapter(prompt)
+
+        if verses:
+            if book and chapter:
+                replayed = self.library.lookup(book, chapter, [v[0] for v in verses])
+                if replayed is not None:
+                    return replayed, "replay"
+            return self._synthesize_detection(book or "Unknown", chapter or 0, verses), "synthesized_detection"
+
+        return json.dumps([]), "empty"
+
+    @staticmethod
+    def _message_text(message: Dict) -> str:
+        content = message.get('content', '')
+        if isinstance(content, list):
+            return "\n".join(part.get('text', '') for part in content if isinstance(part, dict))
+        return content or ''
+
+    @staticmethod
+    def _parse_verses(prompt: str) -> List[Tuple[int, str, str]]:
+        """Return (verse, hebrew, english) for each verse the prompt asks to analyze."""
+        verses = [(int(n), hebrew, english) for n, hebrew, english in VERSE_BLOCK_PATTERN.findall(prompt)]
+
+        window = WINDOW_VERSES_PATTERN.search(prompt)
+        if window:
+            # Verse windows refer to the anchored chapter text by verse number
+            wanted = {int(n) for n in re.findall(r'\d+', window.group(1))}
+            return [v for v in verses if v[0] in wanted]
+
+        return verses
+
+    @staticmethod
+    def _parse_book_chapter(prompt: str) -> Tuple[Optional[str], Optional[int]]:
+        match = DETECTION_HEADER_PATTERN.search(prompt)
+        if match:
+            return match.group(1), int(match.group(2))
+        return None, None
+
+    def _synthesize_detection(self, book: str, chapter: int, verses: List[Tuple[int, str, str]]) -> str:
+        results = []
+        for verse_num, hebrew, english in verses:
+            instances = []
+            if self.config.roll(self.config.instance_rate):
+                hebrew_words = hebrew.split()
+                english_words = english.split()
+                instances.append({
+                    "figurative_language": "yes",
+                    "metaphor": "yes",
+                    "simile": "no",
+                    "personification": "no",
+                    "idiom": "no",
+                    "hyperbole": "no",
+                    "metonymy": "no",
+                    "other": "no",
+                    "hebrew_text": " ".join(hebrew_words[:3]),
+                    "english_text": " ".join(english_words[:5]),
+                    "target": ["mock target", "mock target category", "mock domain"],
+                    "vehicle": ["mock vehicle", "mock vehicle category", "mock domain"],
+                    "ground": ["mock ground", "mock ground category", "mock domain"],
+                    "posture": ["mock posture", "mock posture category", "mock domain"],
+                    "explanation": "Synthesized instance from the mock LLM server.",
+                    "speaker": "Narrator",
+                    "purpose": "Mock purpose",
+                    "confidence": 0.8,
+                    "tagging_analysis_deliberation": "Synthesized by mock server."
+                })
+            results.append({
+                "verse": verse_num,
+                "reference": f"{book} {chapter}:{verse_num}",
+                "deliberation": "Synthesized deliberation from the mock LLM server.",
+                "instances": instances
+            })
+        return json.dumps(results, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def _synthesize_validation(prompt: str) -> str:
+        match = VALIDATION_INSTANCES_PATTERN.search(prompt) or JSON_BLOCK_PATTERN.search(prompt)
+        try:
+            instances = json.loads(match.group(1)) if match else []
+        except json.JSONDecodeError:
+            instances = []
+
+        results = []
+        for instance in instances:
+            validation_results = {}
+            for fig_type in instance.get('types', []) or ['other']:
+                validation_results[fig_type] = {
+                    "decision": "VALID",
+                    "reason": "Mock validation: accepted as detected."
+                }
+            results.append({
+                "instance_id": instance.get('instance_id'),
+                "validation_results": validation_results
+            })
+        return "```json\n" + json.dumps(results, ensure_ascii=False, indent=2) + "\n```"
+
+
+class MockServerStats:
+    """Counters exposed at GET /stats."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+
+    def increment(self, key: str, amount: int = 1):
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def snapshot(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.counters)
+
+
+class MockLLMRequestHandler(BaseHTTPRequestHandler):
+    """Handles /v1/chat/completions (streaming and non-streaming), /api/texts/ and /stats."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self):
+        if self.path.rstrip('/') in ('/stats', '/v1/stats'):
+            self._send_json(200, self.server.stats.snapshot())
+        elif self.path.rstrip('/') in ('/health', '/v1/models'):
+            self._send_json(200, {"object": "list", "data": [{"id": "gpt-5.1", "object": "model"}]})
+        elif SEFARIA_TEXTS_PATTERN.match(self.path):
+            self._send_sefaria_text()
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def _send_sefaria_text(self):
+        """Synthetic chapter in the shape of Sefaria's /api/texts response"""
+        config: MockServerConfig = self.server.config
+        stats: MockServerStats = self.server.stats
+        match = SEFARIA_TEXTS_PATTERN.match(self.path)
+        book, chapter = match.group(1).replace('%20', ' '), int(match.group(2))
+        stats.increment('sefaria_requests')
+
+        if config.sefaria_latency > 0:
+            time.sleep(config.sefaria_latency)
+        if config.roll(config.sefaria_error_rate):
+            stats.increment('sefaria_errors')
+            self._send_json(503, {"error": "Service temporarily unavailable"})
+            return
+
+        # Deterministic per chapter, 10-29 verses
+        verse_count = 10 + (sum(map(ord, book)) * 31 + chapter * 7) % 20
+        hebrew = [STUB_HEBREW_VERSES[(chapter + n) % len(STUB_HEBREW_VERSES)] for n in range(verse_count)]
+        english = [f"{STUB_ENGLISH_VERSES[(chapter + n) % len(STUB_ENGLISH_VERSES)]} ({book} {chapter}:{n + 1})"
+                   for n in range(verse_count)]
+        self._send_json(200, {"ref": f"{book} {chapter}", "book": book, "sections": [chapter],
+                              "versionTitle": "Mock English", "heVersionTitle": "Mock Hebrew",
+                              "he": hebrew, "text": english})
+
+    def do_POST(self):
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError as e:
+            self._send_json(400, {"error": {"message": f"Invalid JSON body: {e}"}})
+            return
+
+        config: MockServerConfig = self.server.config
+        stats: MockServerStats = self.server.stats
+
+        schema = None
+        response_format = request.get('response_format') or {}
+        if response_format.get('type') == 'json_schema':
+            json_schema = response_format.get('json_schema') or {}
+            schema = json_schema.get('schema') or {}
+            problems = strict_schema_problems(schema) if json_schema.get('strict') else []
+            if problems:
+                stats.increment('schema_rejected')
+                self._send_json(400, {"error": {
+                    "message": f"Invalid schema for response_format '{json_schema.get('name')}': {problems[0]}",
+                    "type": "invalid_request_error", "param": "response_format"}})
+                return
+
+        response_text, source = self.server.factory.build(request.get('messages', []))
+        stats.increment('requests')
+        stats.increment(f'source_{source}')
+        if schema is not None:
+            response_text = conform_to_schema(response_text, schema)
+            stats.increment('structured_responses')
+
+        finish_reason = "stop"
+        if response_text and config.roll(config.truncation_rate):
+            cut = int(len(response_text) * config.uniform(0.4, 0.9))
+            response_text = response_text[:cut]
+            finish_reason = "length"
+            stats.increment('truncated')
+
+        prompt_chars = sum(len(MockResponseFactory._message_text(m)) for m in request.get('messages', []))
+        reasoning_tokens = int(len(response_text) // 4 * config.reasoning_ratio)
+        usage = {
+            "prompt_tokens": prompt_chars // 4,
+            "completion_tokens": len(response_text) // 4 + reasoning_tokens,
+            "total_tokens": (prompt_chars + len(response_text)) // 4 + reasoning_tokens,
+            "prompt_tokens_details": {"cached_tokens": 0},
+            "completion_tokens_details": {"reasoning_tokens": reasoning_tokens}
+        }
+
+        if config.latency > 0:
+            time.sleep(config.latency)
+
+        model = request.get('model', 'gpt-5.1')
+        if request.get('stream'):
+            include_usage = bool((request.get('stream_options') or {}).get('include_usage'))
+            self._stream_response(model, response_text, finish_reason, usage if include_usage else None)
+        else:
+            self._send_json(200, {
+                "id": f"chatcmpl-mock-{uuid.uuid4().hex[:12]}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": response_text},
+                    "finish_reason": finish_reason
+                }],
+                "usage": usage
+            })
+
+    def _stream_response(self, model: str, response_text: str, finish_reason: str, usage: Optional[Dict] = None):
+        config: MockServerConfig = self.server.config
+        completion_id = f"chatcmpl-mock-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        def send_chunk(delta: Dict, finish: Optional[str] = None):
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish}]
+            }
+            self.wfile.write(f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+
+        try:
+            send_chunk({"role": "assistant", "content": ""})
+            for start in range(0, len(response_text), config.chunk_size):
+                content = response_text[start:start + config.chunk_size]
+                if config.roll(config.corruption_rate):
+                    # Simulate the replacement-character corruption seen on long streams
+                    content = content[:len(content) // 2] + '�' + content[len(content) // 2:]
+                    self.server.stats.increment('corrupted_chunks')
+                send_chunk({"content": content})
+                if config.chunk_delay > 0:
+                    time.sleep(config.chunk_delay)
+            send_chunk({}, finish_reason)
+            if usage is not None:
+                # stream_options.include_usage: one last chunk with no choices
+                payload = {"id": completion_id, "object": "chat.completion.chunk", "created": created,
+                           "model": model, "choices": [], "usage": usage}
+                self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode('utf-8'))
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            self.server.stats.increment('client_disconnects')
+
+    def _send_json(self, status: int, body: Dict):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def create_mock_server(host: str = "127.0.0.1", port: int = 8765,
+                       config: Optional[MockServerConfig] = None) -> ThreadingHTTPServer:
+    """Create (but do not start) a mock server. Use port=0 for an ephemeral port."""
+    config = config or MockServerConfig()
+    server = ThreadingHTTPServer((host, port), MockLLMRequestHandler)
+    server.daemon_threads = True
+    server.config = config
+    server.library = ReplayLibrary(config.replay_dir)
+    server.factory = MockResponseFactory(config, server.library)
+    server.stats = MockServerStats()
+    return server
+
+
+def start_mock_server_in_thread(host: str = "127.0.0.1", port: int = 0,
+                                config: Optional[MockServerConfig] = None) -> Tuple[ThreadingHTTPServer, str]:
+    """Start a mock server on a background thread and return (server, base_url)."""
+    server = create_mock_server(host, port, config)
+    thread = threading.Thread(target=server.serve_forever, name="mock-llm-server", daemon=True)
+    thread.start()
+    base_url = f"http://{server.server_address[0]}:{server.server_address[1]}/v1"
+    return server, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OpenAI-compatible mock LLM server for offline pipeline runs')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port (default: 8765)')
+    parser.add_argument('--replay-dir', default=DEFAULT_REPLAY_DIR,
+                        help='Directory of debug_response_*.json recordings (default: private/debug)')
+    parser.add_argument('--no-replay', action='store_true', help='Always synthesize responses')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds to wait before responding')
+    parser.add_argument('--chunk-size', type=int, default=48, help='Characters per streamed chunk')
+    parser.add_argument('--chunk-delay', type=float, default=0.0, help='Seconds between streamed chunks')
+    parser.add_argument('--corruption-rate', type=float, default=0.0,
+                        help='Probability that a streamed chunk is corrupted (0-1)')
+    parser.add_argument('--truncation-rate', type=float, default=0.0,
+                        help='Probability that a response is cut short (0-1)')
+    parser.add_argument('--instance-rate', type=float, default=0.3,
+                        help='Probability that a synthesized verse gets a figurative instance (0-1)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible runs')
+    parser.add_argument('--sefaria-latency', type=float, default=0.0,
+                        help='Seconds to wait before answering /api/texts/ requests')
+    parser.add_argument('--sefaria-error-rate', type=float, default=0.0,
+                        help='Probability that an /api/texts/ request gets a 503 (0-1)')
+    parser.add_argument('--reasoning-ratio', type=float, default=0.0,
+                        help='Reported reasoning tokens per visible completion token (default: 0)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    config = MockServerConfig(
+        replay_dir=None if args.no_replay else args.replay_dir,
+        latency=args.latency,
+        chunk_size=args.chunk_size,
+        chunk_delay=args.chunk_delay,
+        corruption_rate=args.corruption_rate,
+        truncation_rate=args.truncation_rate,
+        instance_rate=args.instance_rate,
+        seed=args.seed,
+        sefaria_latency=args.sefaria_latency,
+        sefaria_error_rate=args.sefaria_error_rate,
+        reasoning_ratio=args.reasoning_ratio
+    )
+    server = create_mock_server(args.host, args.port, config)
+
+    base_url = f"http://{args.host}:{server.server_address[1]}/v1"
+    logger.info(f"Mock LLM server listening on {base_url}")
+    logger.info(f"Replay recordings loaded: {len(server.library)}")
+    logger.info(f"Point the pipeline at it with: OPENAI_BASE_URL={base_url} "
+                f"SEFARIA_BASE_URL={base_url[:-len('/v1')]}/api")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info(f"Shutting down. Stats: {server.stats.snapshot()}")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-stage pipeline profiler and run timeline
+
+Records a span for each stage a chapter goes through (executor queue wait, token budget
+and run controller waits, Sefaria fetch, prompt build, detection request with first-token latency and
+streaming rate, JSON parse, record assembly, write-queue wait, write, validation) with
+the thread it ran on. At the end of a run the spans are exported as a Chrome trace
+(load the *_trace.json file in https://ui.perfetto.dev or chrome://tracing) and
+summarized per stage for the processing manifest.
+
+The summary's writer_busy_fraction and worker_writer_wait_fraction say whether more
+workers would help: when the single writer thread is busy most of the run, or workers
+spend most of their time waiting on it, extra workers only lengthen the write queue.
+
+interactive_parallel_processor.main() installs an enabled profiler with
+configure_profiler(); until then get_profiler() returns a disabled one whose spans are
+no-ops, so library callers pay nothing.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Stages, roughly in pipeline order
+STAGE_QUEUE_WAIT = 'queue_wait'              # chapter submitted to the executor -> worker starts it
+STAGE_BUDGET_WAIT = 'budget_wait'            # waiting for the in-flight token budget
+STAGE_ADMISSION_WAIT = 'admission_wait'      # waiting for the run controller (concurrency, tokens/min, cost)
+STAGE_FETCH = 'fetch'                        # Sefaria text (store hit or network fetch)
+STAGE_PROMPT = 'prompt_build'
+STAGE_REQUEST = 'detection_request'          # whole detection call, retries and fallbacks included
+STAGE_FIRST_TOKEN = 'first_token'            # request sent -> first streamed content chunk
+STAGE_STREAM = 'stream'                      # first chunk -> end of stream (args: tokens_per_second)
+STAGE_PARSE = 'parse'
+STAGE_ASSEMBLE = 'assemble'                  # verse/instance records incl. divine-names/diacritics transforms
+STAGE_WRITE_QUEUE_WAIT = 'write_queue_wait'  # submitted to the WriteQueue -> writer picks it up
+STAGE_WRITE = 'write'                        # set-based insert of one chapter
+STAGE_COMMIT = 'commit'                      # one commit for a coalesced batch of chapters
+STAGE_VALIDATION = 'validation'
+STAGE_WRITER_LATENCY = 'writer_latency'      # worker side: submit -> write (and validation) result
+STAGE_CHAPTER = 'chapter'                    # whole chapter on its worker
+
+STAGE_ORDER = (STAGE_QUEUE_WAIT, STAGE_BUDGET_WAIT, STAGE_ADMISSION_WAIT, STAGE_FETCH, STAGE_PROMPT, STAGE_REQUEST,
+               STAGE_FIRST_TOKEN, STAGE_STREAM, STAGE_PARSE, STAGE_ASSEMBLE, STAGE_WRITE_QUEUE_WAIT,
+               STAGE_WRITE, STAGE_COMMIT, STAGE_VALIDATION, STAGE_WRITER_LATENCY, STAGE_CHAPTER)
+
+# Stages that run on the single writer thread (validator calls run on the WriteQueue's validation pool)
+WRITER_STAGES = (STAGE_WRITE, STAGE_COMMIT)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class PipelineProfiler:
+    """Thread-safe collector of stage spans for one run"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self._spans = []   # (stage, book, chapter, start, end, track_key, track_name, args)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def now() -> float:
+        """Timestamp on the profiler's clock (for spans measured across threads)"""
+        return time.perf_counter()
+
+    def add_span(self, stage: str, book: Optional[str], chapter: Optional[int],
+                 start: float, end: float, track: Optional[str] = None, **args):
+        """Record a span measured by the caller (start/end from now())
+
+        Spans default to the current thread's track; waits that began before this thread
+        took the work (queue waits) pass a named track so they do not overlap its other spans.
+        """
+        if not self.enabled:
+            return
+        if track is None:
+            thread = threading.current_thread()
+            track_key, track = thread.ident, thread.name
+        else:
+            track_key = track
+        with self._lock:
+            self._spans.append((stage, book, chapter, start, max(start, end), track_key, track, args))
+
+    @contextmanager
+    def span(self, stage: str, book: Optional[str] = None, chapter: Optional[int] = None, **args):
+        """Time the enclosed block; yields the args dict so the block can attach results to it"""
+        if not self.enabled:
+            yield args
+            return
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.add_span(stage, book, chapter, start, time.perf_counter(), **args)
+
+    def spans(self) -> List[Dict]:
+        """Recorded spans as dicts (seconds relative to the profiler's start)"""
+        with self._lock:
+            spans = list(self._spans)
+        return [{'stage': stage, 'book': book, 'chapter': chapter,
+                 'start': start - self.origin, 'duration': end - start, 'track': track_name, 'args': args}
+                for stage, book, chapter, start, end, _, track_name, args in spans]
+
+    def to_chrome_trace(self) -> Dict:
+        """Chrome trace event format
+
+        Thread spans are "X" complete events on their thread's track. Named-track spans
+        (queue waits, which overlap each other) are async "b"/"e" pairs, which the viewer
+        lays out in separate lanes.
+        """
+        with self._lock:
+            spans = list(self._spans)
+
+        thread_ids = {}
+        events = []
+        for async_id, (stage, book, chapter, start, end, track_key, track_name, args) in enumerate(spans, 1):
+            label = f"{book} {chapter}" if book is not None else None
+            event_args = dict(args, chapter=label) if label else dict(args)
+            ts = round((start - self.origin) * 1e6, 1)
+            if isinstance(track_key, str):
+                name = f"{stage} {label}" if label else stage
+                events.append({'name': name, 'cat': track_name, 'ph': 'b', 'id': async_id, 'ts': ts,
+                               'pid': 1, 'args': event_args})
+                events.append({'name': name, 'cat': track_name, 'ph': 'e', 'id': async_id,
+                               'ts': round((end - self.origin) * 1e6, 1), 'pid': 1})
+                continue
+            if track_key not in thread_ids:
+                thread_ids[track_key] = len(thread_ids) + 1
+                events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': thread_ids[track_key],
+                               'args': {'name': track_name}})
+            events.append({
+                'name': label if stage == STAGE_CHAPTER and label else stage,
+                'cat': stage,
+                'ph': 'X',
+                'ts': ts,
+                'dur': round((end - start) * 1e6, 1),
+                'pid': 1,
+                'tid': thread_ids[track_key],
+                'args': event_args
+            })
+        events.append({'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': 'figurative-language pipeline'}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save_chrome_trace(self, path: str) -> str:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        return path
+
+    def summary(self) -> Dict:
+        """Per-stage count/total/mean/p50/p95/max plus the worker-scaling indicators"""
+        with self._lock:
+            spans = list(self._spans)
+        if not spans:
+            return {'wall_seconds': 0.0, 'stages': {}}
+
+        durations = {}
+        for stage, _, _, start, end, _, _, _ in spans:
+            durations.setdefault(stage, []).append(end - start)
+        wall = max(span[4] for span in spans) - min(span[3] for span in spans)
+
+        stages = {}
+        for stage in sorted(durations, key=lambda s: STAGE_ORDER.index(s) if s in STAGE_ORDER else len(STAGE_ORDER)):
+            values = sorted(durations[stage])
+            total = sum(values)
+            stages[stage] = {
+                'count': len(values),
+                'total_seconds': round(total, 3),
+                'mean_ms': round(total / len(values) * 1000, 1),
+                'p50_ms': round(_percentile(values, 0.50) * 1000, 1),
+                'p95_ms': round(_percentile(values, 0.95) * 1000, 1),
+                'max_ms': round(values[-1] * 1000, 1)
+            }
+
+        rates = [span[7]['tokens_per_second'] for span in spans
+                 if span[0] == STAGE_STREAM and span[7].get('tokens_per_second')]
+        writer_busy = sum(durations.get(stage) and sum(durations[stage]) or 0.0 for stage in WRITER_STAGES)
+        chapter_total = sum(durations.get(STAGE_CHAPTER, []))
+        writer_wait = sum(durations.get(STAGE_WRITER_LATENCY, []))
+
+        return {
+            'wall_seconds': round(wall, 3),
+            'stages': stages,
+            'first_token_seconds_mean': (round(stages[STAGE_FIRST_TOKEN]['mean_ms'] / 1000, 3)
+                                         if STAGE_FIRST_TOKEN in stages else None),
+            'output_tokens_per_second_mean': round(sum(rates) / len(rates), 1) if rates else None,
+            'writer_busy_fraction': round(writer_busy / wall, 3) if wall else None,
+            'worker_writer_wait_fraction': round(writer_wait / chapter_total, 3) if chapter_total else None
+        }
+
+    def format_summary(self) -> List[str]:
+        """The summary as log lines (a stage table and the scaling indicators)"""
+        summary = self.summary()
+        if not summary['stages']:
+            return ["No spans recorded"]
+        lines = [f"{'Stage':<18}{'Count':>7}{'Total s':>10}{'Mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'Max ms':>10}"]
+        for stage, stats in summary['stages'].items():
+            lines.append(f"{stage:<18}{stats['count']:>7}{stats['total_seconds']:>10.1f}{stats['mean_ms']:>10.1f}"
+                         f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+        indicators = [f"wall {summary['wall_seconds']:.1f}s"]
+        if summary['first_token_seconds_mean'] is not None:
+            indicators.append(f"first token {summary['first_token_seconds_mean']:.2f}s mean")
+        if summary['output_tokens_per_second_mean'] is not None:
+            indicators.append(f"{summary['output_tokens_per_second_mean']:.0f} output tokens/s mean")
+        if summary['writer_busy_fraction'] is not None:
+            indicators.append(f"writer busy {summary['writer_busy_fraction']:.0%} of the run")
+        if summary['worker_writer_wait_fraction'] is not None:
+            indicators.append(f"workers waiting on the writer {summary['worker_writer_wait_fraction']:.0%} of chapter time")
+        lines.append(", ".join(indicators))
+        return lines
+
+
+_shared_profiler = PipelineProfiler(enabled=False)
+_shared_lock = threading.Lock()
+
+
+def configure_profiler(enabled: bool = True) -> PipelineProfiler:
+    """Replace the process-wide profiler with a fresh one and return it"""
+    global _shared_profiler
+    with _shared_lock:
+        _shared_profiler = PipelineProfiler(enabled=enabled)
+        return _shared_profiler
+
+
+def get_profiler() -> PipelineProfiler:
+    """Process-wide profiler (disabled unless configure_profiler() installed one)"""
+    return _shared_profiler
@@ -2,5 +2,6 @@
 # Current production modules
 from .gemini_api_multi_model import MultiModelGeminiClient
 from .metaphor_validator import MetaphorValidator
+from .json_recovery import RecoveredJSON, recover_json_array
 
-__all__ = ['MultiModelGeminiClient', 'MetaphorValidator']
\ No newline at end of file
+__all__ = ['MultiModelGeminiClient', 'MetaphorValidator', 'RecoveredJSON', 'recover_json_array']
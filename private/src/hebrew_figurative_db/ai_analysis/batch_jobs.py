@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Provider batch jobs for non-interactive runs
+
+Chat completion requests are written one per line to a JSONL job file in the OpenAI Batch
+API input format:
+
+    {"custom_id": "...", "method": "POST", "url": "/v1/chat/completions", "body": {create() kwargs}}
+
+and submitted as one job. The provider answers within its completion window (24h) at half
+the synchronous token price; results come back keyed by custom_id in any order.
+
+Two backends with the same interface (submit / retrieve / results / cancel):
+- OpenAIBatchBackend: the provider's Files + Batches API
+- LocalBatchBackend: a file-based stand-in for testing. Jobs live in a directory
+  (input.jsonl, status.json, output.jsonl per job), and each request is answered by a
+  synchronous chat completion on the client it is given - with OPENAI_BASE_URL pointing at
+  mock_llm_server.py the whole batch path runs offline. A job interrupted by the end of
+  the process is picked up again (answered requests are kept) the next time it is polled.
+
+retrieve() returns a normalized status dict (id, status, total, completed, failed), and
+results() a dict custom_id -> {'body': chat completion dict or None, 'error': str or None}.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_MAX_REQUESTS = 50000                  # Provider limit of requests per job
+BATCH_MAX_FILE_BYTES = 190 * 1024 * 1024    # Provider limit is 200 MB per input file
+
+TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+
+def batch_request_line(custom_id: str, body: Dict) -> Dict:
+    """One job-file line for a chat completion request (body: create() kwargs, no streaming)"""
+    return {"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}
+
+
+def write_batch_files(lines: List[Dict], directory: str, prefix: str) -> List[str]:
+    """Write request lines to one or more JSONL job files within the provider's per-job limits"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    handle = None
+    count = size = 0
+    for line in lines:
+        encoded = (json.dumps(line, ensure_ascii=False) + "\n").encode('utf-8')
+        if handle is None or count >= BATCH_MAX_REQUESTS or size + len(encoded) > BATCH_MAX_FILE_BYTES:
+            if handle:
+                handle.close()
+            paths.append(os.path.join(directory, f"{prefix}_{len(paths) + 1}.jsonl"))
+            handle = open(paths[-1], 'wb')
+            count = size = 0
+        handle.write(encoded)
+        count += 1
+        size += len(encoded)
+    if handle:
+        handle.close()
+    return paths
+
+
+def _result_from_line(line: Dict) -> Dict:
+    """{'body', 'error'} from one provider output/error-file line"""
+    response = line.get('response') or {}
+    error = line.get('error')
+    if error:
+        message = error.get('message') if isinstance(error, dict) else str(error)
+        return {'body': None, 'error': message or 'request failed'}
+    if response.get('status_code') != 200:
+        body = response.get('body') or {}
+        message = (body.get('error') or {}).get('message') if isinstance(body, dict) else None
+        return {'body': None, 'error': message or f"HTTP {response.get('status_code')}"}
+    return {'body': response.get('body'), 'error': None}
+
+
+def _read_jsonl(text: str) -> List[Dict]:
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class OpenAIBatchBackend:
+    """OpenAI Files + Batches API"""
+
+    name = 'openai'
+
+    def __init__(self, client):
+        self.client = client
+
+    def submit(self, path: str, metadata: Optional[Dict] = None) -> str:
+        with open(path, 'rb') as f:
+            input_file = self.client.files.create(file=f, purpose="batch")
+        batch = self.client.batches.create(input_file_id=input_file.id, endpoint=BATCH_ENDPOINT,
+                                           completion_window=BATCH_COMPLETION_WINDOW,
+                                           metadata={k: str(v) for k, v in (metadata or {}).items()})
+        return batch.id
+
+    def retrieve(self, batch_id: str) -> Dict:
+        batch = self.client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        return {
+            'id': batch.id,
+            'status': batch.status,
+            'total': getattr(counts, 'total', 0) if counts else 0,
+            'completed': getattr(counts, 'completed', 0) if counts else 0,
+            'failed': getattr(counts, 'failed', 0) if counts else 0
+        }
+
+    def results(self, batch_id: str) -> Dict[str, Dict]:
+        batch = self.client.batches.retrieve(batch_id)
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                for line in _read_jsonl(self.client.files.content(file_id).text):
+                    results[line['custom_id']] = _result_from_line(line)
+        return results
+
+    def cancel(self, batch_id: str):
+        self.client.batches.cancel(batch_id)
+
+
+class LocalBatchBackend:
+    """File-based stand-in for the provider batch API, answered by synchronous chat completions"""
+
+    name = 'local'
+
+    def __init__(self, directory: str, client, max_workers: int = 4):
+        self.directory = directory
+        self.client = client
+        self.max_workers = max(1, max_workers)
+        self._lock = threading.Lock()
+        self._running = {}   # batch_id -> worker thread
+        os.makedirs(directory, exist_ok=True)
+
+    def _job_path(self, batch_id: str, name: str) -> str:
+        return os.path.join(self.directory, batch_id, name)
+
+    def _read_status(self, batch_id: str) -> Dict:
+        with open(self._job_path(batch_id, 'status.json'), encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_status(self, batch_id: str, status: Dict):
+        path = self._job_path(batch_id, 'status.json')
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(status, f, indent=2)
+        os.replace(path + '.tmp', path)
+
+    def submit(self, path: str, metadata: Optional[Dict] = None) -> str:
+        batch_id = f"batch_local_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        os.makedirs(os.path.join(self.directory, batch_id))
+        with open(path, encoding='utf-8') as source:
+            lines = source.read()
+        with open(self._job_path(batch_id, 'input.jsonl'), 'w', encoding='utf-8') as f:
+            f.write(lines)
+        self._write_status(batch_id, {
+            'id': batch_id, 'status': 'validating', 'total': len(_read_jsonl(lines)), 'completed': 0, 'failed': 0,
+            'metadata': metadata or {}, 'created_at': datetime.now().isoformat(), 'completed_at': None
+        })
+        self._ensure_running(batch_id)
+        return batch_id
+
+    def _ensure_running(self, batch_id: str):
+        """Start answering a job's outstanding requests unless a thread already is"""
+        with self._lock:
+            thread = self._running.get(batch_id)
+            if thread and thread.is_alive():
+                return
+            thread = threading.Thread(target=self._run_job, args=(batch_id,), name=f"LocalBatch-{batch_id[-8:]}",
+                                      daemon=True)
+            self._running[batch_id] = thread
+            thread.start()
+
+    def _run_job(self, batch_id: str):
+        with open(self._job_path(batch_id, 'input.jsonl'), encoding='utf-8') as f:
+            requests = _read_jsonl(f.read())
+        output_path = self._job_path(batch_id, 'output.jsonl')
+        answered = set()
+        if os.path.exists(output_path):
+            with open(output_path, encoding='utf-8') as f:
+                answered = {line['custom_id'] for line in _read_jsonl(f.read())}
+        pending = [request for request in requests if request['custom_id'] not in answered]
+
+        status = self._read_status(batch_id)
+        status['status'] = 'in_progress'
+        self._write_status(batch_id, status)
+        write_lock = threading.Lock()
+
+        def answer(request):
+            try:
+                response = self.client.chat.completions.create(**request['body'])
+                line = {'custom_id': request['custom_id'],
+                        'response': {'status_code': 200, 'body': response.model_dump()}, 'error': None}
+            except Exception as e:
+                line = {'custom_id': request['custom_id'], 'response': None,
+                        'error': {'code': type(e).__name__, 'message': str(e)}}
+            with write_lock:
+                with open(output_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(line, ensure_ascii=False) + "\n")
+                status['completed' if line['error'] is None else 'failed'] += 1
+                self._write_status(batch_id, status)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(answer, pending))
+
+        status['status'] = 'completed'
+        status['completed_at'] = datetime.now().isoformat()
+        self._write_status(batch_id, status)
+
+    def retrieve(self, batch_id: str) -> Dict:
+        status = self._read_status(batch_id)
+        if status['status'] not in TERMINAL_STATUSES:
+            self._ensure_running(batch_id)
+        return {key: status[key] for key in ('id', 'status', 'total', 'completed', 'failed')}
+
+    def results(self, batch_id: str) -> Dict[str, Dict]:
+        output_path = self._job_path(batch_id, 'output.jsonl')
+        if not os.path.exists(output_path):
+            return {}
+        with open(output_path, encoding='utf-8') as f:
+            return {line['custom_id']: _result_from_line(line) for line in _read_jsonl(f.read())}
+
+    def cancel(self, batch_id: str):
+        status = self._read_status(batch_id)
+        status['status'] = 'cancelled'
+        self._write_status(batch_id, status)
+
+
+def wait_for_batches(backend, batch_ids: List[str], poll_seconds: float, logger, label: str = "batch") -> Dict[str, Dict]:
+    """Poll jobs until each reaches a terminal status; returns the last status of each"""
+    statuses = {}
+    last_logged = {}
+    while True:
+        for batch_id in batch_ids:
+            if batch_id in statuses and statuses[batch_id]['status'] in TERMINAL_STATUSES:
+                continue
+            status = backend.retrieve(batch_id)
+            statuses[batch_id] = status
+            progress = (status['status'], status['completed'], status['failed'])
+            if last_logged.get(batch_id) != progress:
+                last_logged[batch_id] = progress
+                logger.info(f"[BATCH] {label} job {batch_id}: {status['status']} "
+                            f"({status['completed']}/{status['total']} done, {status['failed']} failed)")
+        if all(statuses[batch_id]['status'] in TERMINAL_STATUSES for batch_id in batch_ids):
+            return statuses
+        time.sleep(poll_seconds)
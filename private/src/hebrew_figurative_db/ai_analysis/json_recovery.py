@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Single-pass recovering JSON scanner shared by the LLM response parsers
+
+Model responses wrap their JSON in prose, code fences and deliberation text, and
+sometimes end mid-value (max_tokens) or carry trailing/missing commas.
+scan_json_values() walks a response once, left to right:
+
+- between values it jumps to the next '[' / '{' / ``` with one regex search
+  (fences are tracked so values inside them can be preferred)
+- each candidate is first handed to the C decoder (JSONDecoder.raw_decode)
+- if that fails, a top-level array is walked element by element: elements still go
+  through the C decoder, stray/missing commas between them are fixed in passing, and
+  only an element the decoder rejects is re-read by a string-aware tokenizer
+- the tokenizer drops trailing and doubled commas, inserts missing ones, and
+  remembers the last point where every open array had just completed an element; a
+  value that ends early (end of text, a closing fence, prose, a mismatched bracket)
+  is cut back to that point and closed, and a closed element that still does not
+  parse is dropped from its array
+
+Every character is decoded a bounded number of times, so cost is linear in the
+response length, and each recovered value says which repairs it needed
+(RECOVERY_* labels). recover_json_array() picks the array a parser wants;
+iter_json_objects() yields every complete top-level object.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+RECOVERY_CODE_FENCE = 'code_fence'            # value came from inside a ``` block
+RECOVERY_TRAILING_COMMA = 'trailing_comma'    # ',' before a closing bracket dropped
+RECOVERY_EXTRA_COMMA = 'extra_comma'          # leading or doubled ',' dropped
+RECOVERY_MISSING_COMMA = 'missing_comma'      # ',' inserted between adjacent values
+RECOVERY_TRUNCATED = 'truncated'              # text ended mid-value; cut to the last complete element
+RECOVERY_CUT_AT_INVALID = 'cut_at_invalid'    # non-JSON text or bad bracket mid-value; cut as above
+RECOVERY_ELEMENT_SALVAGE = 'element_salvage'  # an unrepairable element was dropped from its array
+RECOVERY_BARE_OBJECTS = 'bare_objects'        # no array found; top-level objects collected instead
+
+CLOSERS = {'[': ']', '{': '}'}
+LITERALS = ('true', 'false', 'null')
+
+_DECODER = json.JSONDecoder(strict=False)  # strict=False: raw newlines/tabs inside strings are accepted
+_CANDIDATE_START = re.compile(r'[\[{]|```')
+_WHITESPACE = re.compile(r'\s*')
+_TOKEN = re.compile(r'''\s*(?:
+    (?P<string>"(?:[^"\\]|\\.)*)(?P<quote>")?
+  | (?P<open>[\[{])
+  | (?P<close>[\]}])
+  | (?P<comma>,)
+  | (?P<colon>:)
+  | (?P<atom>-?[\d.][\w.+\-]*|[A-Za-z_]+)
+  | (?P<fence>```)
+  | (?P<other>.)
+)''', re.VERBOSE | re.DOTALL)
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?(?:[eE][+\-]?\d+)?$')
+
+
+class RecoveredJSON(NamedTuple):
+    """One top-level JSON value recovered from a response"""
+    value: Any                    # parsed value (None if nothing was recovered)
+    text: str                     # JSON text that parsed to value, repairs applied
+    recoveries: Tuple[str, ...]   # RECOVERY_* labels, empty for clean JSON
+    start: int                    # offset of the value in the response (-1 if none)
+
+
+NOT_FOUND = RecoveredJSON(None, '', (), -1)
+
+
+def scan_json_values(response_text: str) -> List[RecoveredJSON]:
+    """Every top-level JSON array/object in response_text, in order, repaired where needed"""
+    values = []
+    if not response_text:
+        return values
+
+    pos = 0
+    in_fence = False
+    while True:
+        match = _CANDIDATE_START.search(response_text, pos)
+        if not match:
+            break
+        if match.group() == '```':
+            in_fence = not in_fence
+            pos = match.end()
+            continue
+
+        start = match.start()
+        fence = (RECOVERY_CODE_FENCE,) if in_fence else ()
+        try:
+            value, end = _DECODER.raw_decode(response_text, start)
+            values.append(RecoveredJSON(value, response_text[start:end], fence, start))
+            pos = end
+            continue
+        except ValueError:
+            pass
+
+        if response_text[start] == '[':
+            recovered, pos = _scan_array(response_text, start)
+        else:
+            recovered, pos, _ = _scan_candidate(response_text, start)
+        pos = max(pos, start + 1)
+        if recovered is not None:
+            values.append(recovered._replace(recoveries=fence + recovered.recoveries))
+    return values
+
+
+def recover_json_array(response_text: str) -> RecoveredJSON:
+    """The JSON array a response parser should use.
+
+    Preference: the last array of objects inside a code fence, then the last array of
+    objects anywhere, then the last array; failing that, all top-level objects as a
+    list (RECOVERY_BARE_OBJECTS). Returns NOT_FOUND (value None) if there is no JSON.
+    """
+    values = scan_json_values(response_text)
+    arrays = [v for v in values if isinstance(v.value, list)]
+    with_objects = [v for v in arrays if any(isinstance(item, dict) for item in v.value)]
+    fenced = [v for v in with_objects if RECOVERY_CODE_FENCE in v.recoveries]
+    for candidates in (fenced, with_objects, arrays):
+        if candidates:
+            return candidates[-1]
+
+    objects = [v for v in values if isinstance(v.value, dict)]
+    if objects:
+        recoveries = {label for v in objects for label in v.recoveries}
+        return RecoveredJSON([v.value for v in objects],
+                             '[' + ','.join(v.text for v in objects) + ']',
+                             tuple(sorted(recoveries | {RECOVERY_BARE_OBJECTS})), objects[0].start)
+    return NOT_FOUND
+
+
+def iter_json_objects(response_text: str) -> Iterator[Dict]:
+    """Every complete top-level object: objects at the top level and the object elements of top-level arrays"""
+    for recovered in scan_json_values(response_text):
+        if isinstance(recovered.value, dict):
+            yield recovered.value
+        elif isinstance(recovered.value, list):
+            for item in recovered.value:
+                if isinstance(item, dict):
+                    yield item
+
+
+def _render(text: str, start: int, end: int, edits: List[Tuple[int, str]]) -> str:
+    """text[start:end] with edits applied: (pos, '') drops text[pos], (pos, s) inserts s before it"""
+    pieces = []
+    cursor = start
+    for pos, insert in edits:
+        if pos >= end:
+            break
+        pieces.append(text[cursor:pos])
+        if insert:
+            pieces.append(insert)
+            cursor = pos
+        else:
+            cursor = pos + 1
+    pieces.append(text[cursor:end])
+    return ''.join(pieces)
+
+
+def _scan_array(text: str, start: int) -> Tuple[Optional[RecoveredJSON], int]:
+    """Top-level array at text[start]: elements go through the C decoder, only damaged ones are tokenized.
+
+    Returns (recovered or None, resume position).
+    """
+    values = []
+    texts = []
+    recoveries = set()
+    stop_reason = None
+    prev = 'open'   # open | value | comma
+    pos = start + 1
+    length = len(text)
+
+    while True:
+        pos = _WHITESPACE.match(text, pos).end()
+        if pos >= length:
+            stop_reason = RECOVERY_TRUNCATED
+            break
+        char = text[pos]
+        if char == ']':
+            if prev == 'comma':
+                recoveries.add(RECOVERY_TRAILING_COMMA)
+            pos += 1
+            break
+        if char == ',':
+            if prev == 'value':
+                prev = 'comma'
+            else:
+                recoveries.add(RECOVERY_EXTRA_COMMA)
+            pos += 1
+            continue
+        if prev == 'value':
+            recoveries.add(RECOVERY_MISSING_COMMA)
+
+        try:
+            value, end = _DECODER.raw_decode(text, pos)
+        except ValueError:
+            pass
+        else:
+            values.append(value)
+            texts.append(text[pos:end])
+            pos = end
+            prev = 'value'
+            continue
+
+        if char in '[{':
+            element, end, status = _scan_candidate(text, pos)
+            if element is not None:
+                values.append(element.value)
+                texts.append(element.text)
+                recoveries.update(element.recoveries)
+            elif status == 'complete':   # closed but unrepairable (e.g. a missing ':'): drop it
+                recoveries.add(RECOVERY_ELEMENT_SALVAGE)
+            pos = end
+            prev = 'value'
+            if status != 'complete':
+                stop_reason = status
+                break
+            continue
+
+        # A scalar the decoder rejected: cut short by the end of the text, or not JSON at all
+        token = _TOKEN.match(text, pos)
+        stop_reason = (RECOVERY_TRUNCATED if token is None or token.lastgroup == 'string' or token.end() == length
+                       else RECOVERY_CUT_AT_INVALID)
+        break
+
+    if stop_reason:
+        if stop_reason == RECOVERY_CUT_AT_INVALID and not values:
+            return None, pos   # prose such as "[see above]"
+        recoveries.add(stop_reason)
+    return RecoveredJSON(values, '[' + ','.join(texts) + ']', tuple(sorted(recoveries)), start), pos
+
+
+def _scan_candidate(text: str, start: int) -> Tuple[Optional[RecoveredJSON], int, str]:
+    """Tokenize the array/object at text[start] with repairs.
+
+    Returns (recovered or None, resume position, status), status being 'complete' if the
+    value's closing bracket was reached, otherwise RECOVERY_TRUNCATED / RECOVERY_CUT_AT_INVALID.
+    """
+    stack = [text[start]]
+    edits = []                 # (position, '' to drop | ',' to insert), in position order
+    recoveries = set()
+    prev = 'open'              # open | value | comma | colon
+    last_comma = -1
+    safe = (start + 1, ']') if stack[0] == '[' else None   # (cut position, closing suffix)
+    initial_safe = safe
+    end = None
+    status = RECOVERY_TRUNCATED
+    pos = start + 1
+    length = len(text)
+
+    while True:
+        match = _TOKEN.match(text, pos)
+        if match is None:      # only whitespace left
+            pos = length
+            break
+        kind = match.lastgroup
+        token_start = match.start('string' if kind == 'quote' else kind)
+
+        if kind == 'string':   # no closing quote: the text ended inside this string
+            pos = length
+            break
+        if kind == 'atom':
+            word = match.group(kind)
+            if match.end() == length:   # possibly cut short ('12' of '123', 'tru' of 'true')
+                pos = length
+                break
+            if not (word in LITERALS or _NUMBER.match(word)):
+                status = RECOVERY_CUT_AT_INVALID
+                pos = token_start
+                break
+
+        if kind in ('quote', 'atom', 'open') and prev == 'value':
+            edits.append((token_start, ','))
+            recoveries.add(RECOVERY_MISSING_COMMA)
+
+        if kind in ('quote', 'atom'):
+            prev = 'value'
+            if stack[-1] == '[':
+                safe = (match.end(), ''.join(CLOSERS[c] for c in reversed(stack)))
+        elif kind == 'open':
+            stack.append(match.group(kind))
+            prev = 'open'
+        elif kind == 'close':
+            if CLOSERS[stack[-1]] != match.group(kind):
+                status = RECOVERY_CUT_AT_INVALID
+                pos = token_start
+                break
+            if prev == 'comma':
+                edits.append((last_comma, ''))
+                recoveries.add(RECOVERY_TRAILING_COMMA)
+            stack.pop()
+            prev = 'value'
+            if not stack:
+                end = pos = match.end()
+                status = 'complete'
+                break
+            if stack[-1] == '[':
+                safe = (match.end(), ''.join(CLOSERS[c] for c in reversed(stack)))
+        elif kind == 'comma':
+            if prev in ('comma', 'open'):
+                edits.append((token_start, ''))
+                recoveries.add(RECOVERY_EXTRA_COMMA)
+            else:
+                prev = 'comma'
+                last_comma = token_start
+        elif kind == 'colon':
+            prev = 'colon'
+        else:   # fence or other text: the value stops here
+            status = RECOVERY_CUT_AT_INVALID
+            pos = token_start
+            break
+        pos = match.end()
+
+    pos = max(pos, start + 1)
+    if end is not None:
+        repaired = _render(text, start, end, edits)
+    elif safe is None or (safe == initial_safe and status == RECOVERY_CUT_AT_INVALID):
+        return None, pos, status   # nothing complete before the cut (e.g. prose like "[see above]")
+    else:
+        recoveries.add(status)
+        repaired = _render(text, start, safe[0], edits) + safe[1]
+
+    try:
+        value = _DECODER.decode(repaired)
+    except ValueError:
+        return None, pos, status
+    return RecoveredJSON(value, repaired, tuple(sorted(recoveries)), start), pos, status
@@ -9,9 +9,24 @@ This provides better quality validation with reasonable cost-effectiveness.
 import os
 import json
 import time
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import List, Dict, Optional, Tuple
 
+try:
+    from .json_recovery import RECOVERY_CODE_FENCE, recover_json_array
+    from .structured_output import (VALIDATION_FIELD, VALIDATION_FORMAT_NOTE, parse_structured_validation,
+                                    recover_structured_array, structured_output_enabled,
+                                    structured_validation_items, validation_response_format)
+    from .token_accounting import usage_to_token_metadata
+except ImportError:
+    # Imported as a top-level module (ai_analysis/ on sys.path, e.g. universal_validation_recovery.py)
+    from json_recovery import RECOVERY_CODE_FENCE, recover_json_array
+    from structured_output import (VALIDATION_FIELD, VALIDATION_FORMAT_NOTE, parse_structured_validation,
+                                   recover_structured_array, structured_output_enabled,
+                                   structured_validation_items, validation_response_format)
+    from token_accounting import usage_to_token_metadata
+
 # OpenAI imports for GPT-5.1
 try:
     from openai import OpenAI
@@ -21,6 +36,69 @@ except ImportError:
     raise ImportError("OpenAI library not available. Please install: pip install openai")
 
 
+VALIDATION_TYPES = ['simile', 'metaphor', 'personification', 'idiom', 'hyperbole', 'metonymy', 'other']
+
+# Concurrent chapter validation (validate_chapter_instances_concurrent)
+VALIDATION_SUB_BATCH_SIZE = 20           # Largest sub-batch sent in one call; bigger chapters are split up front
+VALIDATION_MAX_CONCURRENT_BATCHES = 4    # Sub-batch calls in flight per chapter
+VALIDATION_SINGLE_INSTANCE_ATTEMPTS = 2  # Tries for an instance left on its own after bisection
+
+# Static instructions for chapter validation, sent as the system message so every chapter
+# shares one cacheable prefix; the per-chapter user message carries only the compact payload
+CHAPTER_VALIDATION_SYSTEM_PROMPT = """You are a biblical Hebrew scholar specializing in figurative language validation for an entire chapter.
+
+You will receive:
+- VERSES: a JSON object mapping each verse reference to its Hebrew ("he") and English ("en") text
+- DETECTED INSTANCES: a JSON array of detected figurative language instances; each instance's "verse" is a key of VERSES
+
+TASK:
+Review each instance in the DETECTED INSTANCES array. For each instance, validate each of the detected `types`. For each type, you must provide a validation decision.
+
+VALIDATION GUIDELINES:
+- Cross-domain comparisons where A is described as B (Egypt = iron furnace) are VALID METAPHORS
+- Divine body parts (God's hand, arm, face) are VALID METAPHORS (God is incorporeal)
+- Abstract concepts acting as agents (dread and fear...put upon) are VALID PERSONIFICATION
+- Natural phenomena acting human-like (mountains skipped, sea fled) are VALID PERSONIFICATION
+- Similes using "like/as" for unlike things (like a lion) are VALID SIMILES
+- Literal historical references, standard biblical terminology, and technical religious terms are INVALID
+- Divine actions (speaking, blessing, smiting) are LITERAL in ANE context, not figurative
+
+RESPONSE FORMAT:
+You MUST return a valid JSON array of validation objects inside a JSON code block. Each object in the array must contain:
+1.  `instance_id`: The ID of the instance you are validating.
+2.  `validation_results`: An object where keys are the original figurative types (e.g., "metaphor", "idiom") and values are validation objects with the fields: `decision` (must be "VALID", "INVALID", or "RECLASSIFIED"), `reason` (a brief explanation), and, if reclassifying, `reclassified_type`.
+
+EXAMPLE OUTPUT:
+```json
+[
+  {
+    "instance_id": 1,
+    "validation_results": {
+      "metaphor": {
+        "decision": "VALID",
+        "reason": "This is a valid metaphor because it compares an abstract concept to a concrete object."
+      },
+      "idiom": {
+        "decision": "RECLASSIFIED",
+        "reason": "This is not an idiom, but rather a simile because of the use of 'like'.",
+        "reclassified_type": "simile"
+      }
+    }
+  },
+  {
+    "instance_id": 2,
+    "validation_results": {
+      "hyperbole": {
+        "decision": "INVALID",
+        "reason": "This is a literal statement, not an exaggeration."
+      }
+    }
+  }
+]
+```
+"""
+
+
 class MetaphorValidator:
     """
     Stage 2 validator for metaphor detection to eliminate false positives
@@ -30,7 +108,8 @@ class MetaphorValidator:
     with reasonable cost-effectiveness.
     """
 
-    def __init__(self, api_key: str = None, db_manager=None, logger=None):
+    def __init__(self, api_key: str = None, db_manager=None, logger=None, base_url: str = None,
+                 structured_output: bool = None):
         """
         Initialize the validator with GPT-5.1
 
@@ -38,6 +117,9 @@ class MetaphorValidator:
             api_key: OpenAI API key (optional - will read from env if not provided)
             db_manager: DatabaseManager instance for logging deliberations
             logger: Logger instance
+            base_url: OpenAI-compatible endpoint (optional - reads OPENAI_BASE_URL, e.g. a local mock server)
+            structured_output: Send the ValidationResponse JSON Schema with chapter/verse validation
+                               requests (optional - reads STRUCTURED_OUTPUT; needs pydantic)
         """
         self.db_manager = db_manager
         self.logger = logger
@@ -53,234 +135,188 @@ class MetaphorValidator:
 
         # Initialize OpenAI client for GPT-5.1
         self.api_key = api_key
-        self.openai_client = OpenAI(api_key=api_key)
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
+        self.openai_client = OpenAI(api_key=api_key, base_url=self.base_url)
         self.model_name = "gpt-5.1"
         self.reasoning_effort = "medium"  # User preferred setting based on Session 8 testing
+        self.sub_batch_size = VALIDATION_SUB_BATCH_SIZE
+        self.max_concurrent_batches = VALIDATION_MAX_CONCURRENT_BATCHES
+        self.structured_output = structured_output_enabled(structured_output)
 
         if self.logger:
             self.logger.info(f"[OK] MetaphorValidator initialized with GPT-5.1 (reasoning_effort={self.reasoning_effort})")
+            if self.base_url:
+                self.logger.info(f"[OK] MetaphorValidator using base URL: {self.base_url}")
+            if self.structured_output:
+                self.logger.info("[OK] MetaphorValidator using structured output (ValidationResponse schema)")
 
-        # Tracking counters
+        # Tracking counters (sub-batches update them from executor threads - go through _increment())
+        self._stats_lock = threading.Lock()
         self.validation_count = 0
         self.type_validation_count = 0
         self.chapter_validation_count = 0
         self.verse_validation_count = 0
         self.validation_success_count = 0
         self.validation_failure_count = 0
-        self.json_extraction_successes = {"strategy_1": 0, "strategy_2": 0, "strategy_3": 0, "strategy_4": 0, "strategy_5": 0, "strategy_6": 0, "strategy_7": 0, "strategy_8": 0, "strategy_9": 0, "strategy_10": 0}
+        self.json_extraction_successes = {}  # Responses parsed, keyed by recoveries applied ('clean' if none)
         self.validation_errors = []  # Track recent validation errors for debugging
 
-    def validate_chapter_instances_with_retry(self, chapter_instances: List[Dict]) -> List[Dict]:
-        """Enhanced chapter validation with multiple retry attempts and fallback strategies."""
-        if not chapter_instances:
-            return []
-
-        # Add a temporary unique ID to each instance for correlation
-        for i, instance in enumerate(chapter_instances):
-            instance['instance_id'] = i + 1
-
-        # First attempt: Standard validation with all 10 JSON extraction strategies
-        if self.logger:
-            self.logger.info(f"[CHAPTER VALIDATION RETRY] Attempt 1: Standard validation for {len(chapter_instances)} instances")
+    def _increment(self, counter: str):
+        """Add one to a tracking counter (thread-safe)"""
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
 
-        first_result = self._attempt_standard_validation(chapter_instances)
-        if first_result and not self._is_error_result(first_result):
-            if self.logger:
-                self.logger.info(f"[CHAPTER VALIDATION RETRY] Attempt 1 SUCCESS: Validated {len(first_result)} instances")
-            return first_result
-
-        # Second attempt: Simplified validation prompt
-        if self.logger:
-            self.logger.info(f"[CHAPTER VALIDATION RETRY] Attempt 2: Simplified validation prompt")
-
-        second_result = self._attempt_simplified_validation(chapter_instances)
-        if second_result and not self._is_error_result(second_result):
-            if self.logger:
-                self.logger.info(f"[CHAPTER VALIDATION RETRY] Attempt 2 SUCCESS: Validated {len(second_result)} instances")
-            return second_result
+    def _record_extraction(self, key: str):
+        """Count a parsed response by the recoveries applied (thread-safe)"""
+        with self._stats_lock:
+            self.json_extraction_successes[key] = self.json_extraction_successes.get(key, 0) + 1
 
-        # Third attempt: Split into smaller batches
-        if self.logger:
-            self.logger.info(f"[CHAPTER VALIDATION RETRY] Attempt 3: Batch validation (smaller groups)")
-
-        batch_size = min(10, len(chapter_instances))  # Process in smaller batches
-        batch_results = []
-        for i in range(0, len(chapter_instances), batch_size):
-            batch = chapter_instances[i:i + batch_size]
-            batch_result = self._attempt_standard_validation(batch)
-            if batch_result and not self._is_error_result(batch_result):
-                batch_results.extend(batch_result)
-            else:
-                # If batch fails, create minimal validation for this batch
-                for j, instance in enumerate(batch):
-                    batch_results.append({
-                        'instance_id': i + j + 1,
-                        'validation_results': {},
-                        'fallback_validation': 'BATCH_FAILED'
-                    })
-
-        if batch_results:
-            if self.logger:
-                self.logger.info(f"[CHAPTER VALIDATION RETRY] Attempt 3 PARTIAL SUCCESS: Validated {len(batch_results)} instances from batches")
-            return batch_results
+    def validate_chapter_instances_with_retry(self, chapter_instances: List[Dict]) -> List[Dict]:
+        """Validate a chapter with sub-batch retries; one result per instance, in instance order.
 
-        # Final fallback: Individual instance validation
-        if self.logger:
-            self.logger.info(f"[CHAPTER VALIDATION RETRY] Attempt 4: Individual instance validation")
+        Instances that could not be validated get a placeholder with
+        'fallback_validation': 'BISECTION_FAILED' so positional callers stay aligned.
+        """
+        if not chapter_instances:
+            return []
 
-        individual_results = []
-        for i, instance in enumerate(chapter_instances):
-            try:
-                # Try to validate single instance
-                single_result = self._attempt_individual_validation(instance, i + 1)
-                individual_results.append(single_result)
-            except Exception as e:
-                if self.logger:
-                    self.logger.warning(f"Individual validation failed for instance {i + 1}: {e}")
-                # Create minimal validation
-                individual_results.append({
-                    'instance_id': i + 1,
+        results, _ = self.validate_chapter_instances_concurrent(chapter_instances)
+        validated = {result['instance_id'] for result in results}
+        for instance in chapter_instances:
+            if instance['instance_id'] not in validated:
+                results.append({
+                    'instance_id': instance['instance_id'],
                     'validation_results': {},
-                    'fallback_validation': 'INDIVIDUAL_FAILED'
+                    'fallback_validation': 'BISECTION_FAILED'
                 })
-
-        if self.logger:
-            self.logger.info(f"[CHAPTER VALIDATION RETRY] Attempt 4 COMPLETE: {len(individual_results)} instances processed individually")
-        return individual_results
-
-    def _attempt_standard_validation(self, instances: List[Dict]) -> List[Dict]:
-        """Attempt standard validation with the original method."""
-        results, _ = self.validate_chapter_instances(instances)  # Ignore cost metadata in retry logic
+        results.sort(key=lambda result: result['instance_id'])
         return results
 
-    def _attempt_simplified_validation(self, instances: List[Dict]) -> List[Dict]:
-        """Attempt validation with a simplified prompt that's easier to parse."""
-        prompt = self._create_simplified_validation_prompt(instances)
-
-        try:
-            if self.logger:
-                self.logger.debug(f"[SIMPLIFIED VALIDATION] Attempting validation for {len(instances)} instances")
-
-            response = self.openai_client.chat.completions.create(
-                model="gpt-5.1",
-                messages=[
-                    {"role": "system", "content": "You are a biblical Hebrew scholar. Return ONLY valid JSON arrays with no explanations."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_completion_tokens=12000,
-                reasoning_effort="low"  # Use low effort for simpler response
-            )
-
-            if response.choices and response.choices[0].message.content:
-                response_text = response.choices[0].message.content
-                if self.logger:
-                    self.logger.debug(f"Simplified validation response length: {len(response_text)} characters")
-
-                # Try all extraction strategies
-                validation_results = self._extract_json_with_fallbacks(response_text, "simplified validation")
-                return validation_results if validation_results else []
-            else:
-                if self.logger:
-                    self.logger.warning("Empty response from simplified validation")
-                return []
-
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Simplified validation failed: {e}")
-            return []
-
-    def _attempt_individual_validation(self, instance: Dict, instance_id: int) -> Dict:
-        """Attempt validation for a single instance."""
-        prompt = f"""Validate this figurative language instance.
-
-Instance {instance_id}:
-- Type: {instance.get('metaphor', 'yes') if instance.get('metaphor') == 'yes' else instance.get('simile', 'yes') if instance.get('simile') == 'yes' else 'unknown'}
-- Text: "{instance.get('figurative_text', '')}"
-- Explanation: {instance.get('explanation', '')}
-
-Return JSON: {{"decision": "VALID" or "INVALID", "reason": "brief reason"}}"""
-
-        try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-5.1",
-                messages=[
-                    {"role": "system", "content": "You are a biblical Hebrew scholar. Return ONLY valid JSON objects."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_completion_tokens=500,
-                reasoning_effort="low"
-            )
+    def validate_chapter_instances_concurrent(self, chapter_instances: List[Dict],
+                                              sub_batch_size: Optional[int] = None,
+                                              max_concurrency: Optional[int] = None) -> Tuple[List[Dict], Dict]:
+        """Validate a chapter as concurrent sub-batches, retrying only the instances that failed.
 
-            if response.choices and response.choices[0].message.content:
-                response_text = response.choices[0].message.content
-                try:
-                    # Try to extract a simple JSON object
-                    json_match = re.search(r'\{[^}]*\}', response_text)
-                    if json_match:
-                        validation_obj = json.loads(json_match.group(0))
-                        return {
-                            'instance_id': instance_id,
-                            'validation_results': {
-                                'fallback': validation_obj
-                            }
-                        }
-                except json.JSONDecodeError:
-                    pass
-
-            # Fallback: create minimal validation
-            return {
-                'instance_id': instance_id,
-                'validation_results': {},
-                'fallback_validation': 'PARSE_FAILED'
-            }
+        Instances are numbered 1..n (instance_id) and split up front into balanced sub-batches of
+        at most sub_batch_size, cut between verses where possible so verse text is not repeated,
+        which run on up to max_concurrency threads. When a sub-batch call fails or its response omits
+        instances, only the unvalidated instances are resubmitted, bisected in halves, down to
+        single instances (each given VALIDATION_SINGLE_INSTANCE_ATTEMPTS tries). Retries start as
+        soon as their sub-batch returns, so a bad chapter costs about one extra parallel round
+        per halving rather than a chain of sequential whole-chapter retries.
 
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Individual validation failed for instance {instance_id}: {e}")
-            return {
-                'instance_id': instance_id,
-                'validation_results': {},
-                'fallback_validation': 'API_FAILED'
-            }
+        Returns:
+            Tuple of (validation_results, cost_metadata): one result per validated instance,
+            sorted by instance_id (instances that never validated are omitted, leaving their
+            rows for recovery), and cost summed over every call made
+        """
+        cost_metadata = {'cost': 0, 'input_tokens': 0, 'output_tokens': 0, 'reasoning_tokens': 0,
+                         'cached_input_tokens': 0}
+        if not chapter_instances:
+            return [], cost_metadata
 
-    def _create_simplified_validation_prompt(self, instances: List[Dict]) -> str:
-        """Create a simplified validation prompt for easier parsing."""
-        simplified_instances = []
-        for instance in instances:
-            simplified_instances.append({
-                "id": instance['instance_id'],
-                "text": instance.get('figurative_text', ''),
-                "type": self._get_primary_type(instance),
-                "explanation": instance.get('explanation', '')
-            })
+        for i, instance in enumerate(chapter_instances):
+            instance['instance_id'] = i + 1
 
-        prompt = f"""Validate these figurative language instances. Return ONLY a JSON array.
+        sub_batches = self._plan_sub_batches(chapter_instances, sub_batch_size or self.sub_batch_size)
+        workers = max(1, min(max_concurrency or self.max_concurrent_batches, len(sub_batches)))
+        if self.logger and len(sub_batches) > 1:
+            self.logger.info(f"[VALIDATION BATCHES] {len(chapter_instances)} instances in {len(sub_batches)} sub-batches "
+                             f"({', '.join(str(len(batch)) for batch in sub_batches)}), {workers} concurrent")
+
+        merged = {}
+        unvalidated = []
+        calls = retried_calls = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = {executor.submit(self._request_chapter_validation, batch): (batch, 1) for batch in sub_batches}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch, attempt = pending.pop(future)
+                    calls += 1
+                    try:
+                        results, batch_cost = future.result()
+                    except Exception as e:
+                        if self.logger:
+                            self.logger.warning(f"[VALIDATION BATCHES] Sub-batch of {len(batch)} raised {type(e).__name__}: {e}")
+                        results, batch_cost = [], {}
+                    for key in cost_metadata:
+                        cost_metadata[key] += batch_cost.get(key, 0) or 0
+
+                    accepted = self._accept_sub_batch_results(batch, results, merged)
+                    failed = [instance for instance in batch if instance['instance_id'] not in accepted]
+                    if not failed:
+                        continue
 
-INSTANCES:
-{json.dumps(simplified_instances, indent=2)}
+                    if len(failed) == 1 and (len(batch) > 1 or attempt < VALIDATION_SINGLE_INSTANCE_ATTEMPTS):
+                        retries = [(failed, attempt + 1 if len(batch) == 1 else 1)]
+                    elif len(failed) == 1:
+                        unvalidated.extend(failed)
+                        continue
+                    elif len(failed) < len(batch):
+                        # Partial response: the missing instances get a fresh attempt together
+                        retries = [(failed, 1)]
+                    else:
+                        middle = len(failed) // 2
+                        retries = [(failed[:middle], 1), (failed[middle:], 1)]
 
-For each instance, return:
-{{"id": <number>, "decision": "VALID" or "INVALID", "reason": "brief reason"}}"""
-        return prompt
+                    if self.logger:
+                        self.logger.warning(f"[VALIDATION BATCHES] {len(failed)}/{len(batch)} instances unvalidated "
+                                            f"(ids {failed[0]['instance_id']}-{failed[-1]['instance_id']}); "
+                                            f"retrying as {'+'.join(str(len(part)) for part, _ in retries)}")
+                    for part, part_attempt in retries:
+                        retried_calls += 1
+                        pending[executor.submit(self._request_chapter_validation, part)] = (part, part_attempt)
 
-    def _get_primary_type(self, instance: Dict) -> str:
-        """Get the primary figurative language type for an instance."""
-        for fig_type in ['metaphor', 'simile', 'personification', 'idiom', 'hyperbole', 'metonymy', 'other']:
-            if instance.get(fig_type) == 'yes':
-                return fig_type
-        return 'unknown'
+        if self.logger and (retried_calls or unvalidated):
+            self.logger.info(f"[VALIDATION BATCHES] {len(merged)}/{len(chapter_instances)} validated in {calls} calls "
+                             f"({retried_calls} retries); unvalidated ids: {sorted(i['instance_id'] for i in unvalidated)}")
 
-    def _is_error_result(self, result: List[Dict]) -> bool:
-        """Check if validation result indicates an error."""
-        if not result:
-            return True
+        return [merged[instance_id] for instance_id in sorted(merged)], cost_metadata
 
-        # Check for structured error results
-        for item in result:
-            if 'error' in item or 'fallback_validation' in item:
-                return True
+    @staticmethod
+    def _plan_sub_batches(instances: List[Dict], sub_batch_size: int) -> List[List[Dict]]:
+        """Split instances into balanced sub-batches of at most sub_batch_size.
 
-        return False
+        Each cut goes at the verse boundary nearest the balanced position (mid-verse only when
+        one verse alone has more than sub_batch_size instances).
+        """
+        sub_batch_size = max(1, sub_batch_size)
+        total = len(instances)
+        boundaries = [i for i in range(1, total)
+                      if instances[i].get('verse_reference') != instances[i - 1].get('verse_reference')]
+
+        cuts = [0]
+        while total - cuts[-1] > sub_batch_size:
+            start = cuts[-1]
+            remaining = total - start
+            ideal = start + remaining / -(-remaining // sub_batch_size)
+            candidates = [b for b in boundaries if start < b <= start + sub_batch_size]
+            cuts.append(min(candidates, key=lambda b: abs(b - ideal)) if candidates else start + sub_batch_size)
+        cuts.append(total)
+        return [instances[start:end] for start, end in zip(cuts, cuts[1:])]
+
+    @staticmethod
+    def _accept_sub_batch_results(batch: List[Dict], results: List[Dict], merged: Dict) -> set:
+        """Move usable results for this sub-batch's instances into merged (keyed by instance_id).
+
+        Error entries, results for instance_ids outside the sub-batch and duplicates are dropped.
+        Returns the instance_ids accepted from this response.
+        """
+        batch_ids = {instance['instance_id'] for instance in batch}
+        accepted = set()
+        for result in results or []:
+            if not isinstance(result, dict) or 'error' in result or 'fallback_validation' in result:
+                continue
+            try:
+                instance_id = int(result.get('instance_id'))
+            except (TypeError, ValueError):
+                continue
+            if instance_id in batch_ids and instance_id not in accepted:
+                result['instance_id'] = instance_id
+                merged[instance_id] = result
+                accepted.add(instance_id)
+        return accepted
 
     def validate_chapter_instances(self, chapter_instances: List[Dict]) -> Tuple[List[Dict], Dict]:
         """Validate all instances from all verses in a chapter with one API call using GPT-5.1 MEDIUM.
@@ -295,23 +331,57 @@ For each instance, return:
         for i, instance in enumerate(chapter_instances):
             instance['instance_id'] = i + 1
 
-        prompt = self._create_chapter_validation_prompt(chapter_instances)
+        return self._request_chapter_validation(chapter_instances)
+
+    def chapter_validation_request(self, chapter_instances: List[Dict]) -> Dict:
+        """create() arguments of a chapter validation call for instances that already carry their instance_id."""
+        prompt, format_args = self._format_request(self._create_chapter_validation_prompt(chapter_instances))
+        return dict(
+            model="gpt-5.1",
+            messages=[
+                {"role": "system", "content": CHAPTER_VALIDATION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_completion_tokens=15000,
+            reasoning_effort=self.reasoning_effort,
+            **format_args
+        )
+
+    def chapter_validation_requests(self, chapter_instances: List[Dict]) -> List[Tuple[List[Dict], Dict]]:
+        """A chapter's sub-batches with the create() arguments for each, for submission as a batch job.
+
+        Instances keep the instance_id they carry (the batch pipeline uses their database IDs,
+        so results can be matched after a restart).
+        """
+        return [(batch, self.chapter_validation_request(batch))
+                for batch in self._plan_sub_batches(chapter_instances, self.sub_batch_size)]
 
+    def parse_batch_validation_response(self, chapter_instances: List[Dict], response_text: str) -> List[Dict]:
+        """Usable validation results for chapter_instances from a response returned by a batch job.
+
+        Results for other instance_ids, error entries and duplicates are dropped; instances
+        without a result are left for recovery.
+        """
+        self._increment('chapter_validation_count')
+        self._increment('validation_count')
+        results = self._parse_validation_response(response_text or "", "batch validation")
+        if results is None:
+            self._increment('validation_failure_count')
+            return []
+        self._increment('validation_success_count')
+        merged = {}
+        self._accept_sub_batch_results(chapter_instances, results, merged)
+        return [merged[instance_id] for instance_id in sorted(merged)]
+
+    def _request_chapter_validation(self, chapter_instances: List[Dict]) -> Tuple[List[Dict], Dict]:
+        """One chapter validation API call for instances that already carry their instance_id."""
         try:
-            self.chapter_validation_count += 1
+            self._increment('chapter_validation_count')
             if self.logger:
                 self.logger.info(f"[CHAPTER VALIDATION] Starting validation for {len(chapter_instances)} instances from multiple verses")
 
-            response = self.openai_client.chat.completions.create(
-                model="gpt-5.1",
-                messages=[
-                    {"role": "system", "content": "You are a biblical Hebrew scholar specializing in figurative language validation for an entire chapter."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_completion_tokens=15000,
-                reasoning_effort=self.reasoning_effort
-            )
-            self.validation_count += 1
+            response = self.openai_client.chat.completions.create(**self.chapter_validation_request(chapter_instances))
+            self._increment('validation_count')
 
             # Extract cost metadata from response
             cost_metadata = self._extract_cost_metadata(response)
@@ -324,15 +394,15 @@ For each instance, return:
                     self.logger.debug(f"Validation cost: ${cost_metadata['cost']:.4f} ({cost_metadata['input_tokens']} in, {cost_metadata['output_tokens']} out)")
 
                 # Enhanced JSON extraction with multiple fallback strategies
-                validation_results = self._extract_json_with_fallbacks(response_text, "chapter validation")
+                validation_results = self._parse_validation_response(response_text, "chapter validation")
                 if validation_results is not None:
-                    self.validation_success_count += 1
+                    self._increment('validation_success_count')
                     if self.logger:
                         self.logger.info(f"[CHAPTER VALIDATION] SUCCESS: Validated {len(validation_results)} instances (Cost: ${cost_metadata['cost']:.4f})")
                     return validation_results, cost_metadata
                 else:
                     # All extraction strategies failed
-                    self.validation_failure_count += 1
+                    self._increment('validation_failure_count')
                     if self.logger:
                         self.logger.error("[CHAPTER VALIDATION] FAILED: All JSON extraction strategies failed")
                         self.logger.error(f"Raw response: {response_text}")
@@ -345,7 +415,7 @@ For each instance, return:
         except Exception as e:
             # Enhanced error handling with detailed context and structured error results
             from datetime import datetime
-            self.validation_failure_count += 1
+            self._increment('validation_failure_count')
 
             error_details = {
                 'error_type': type(e).__name__,
@@ -357,16 +427,15 @@ For each instance, return:
                 'reasoning_effort': self.reasoning_effort
             }
 
-            # Track error for debugging
-            self.validation_errors.append({
-                'timestamp': error_details['timestamp'],
-                'context': 'chapter_validation',
-                'error': error_details
-            })
-
-            # Keep only recent 10 errors to avoid memory bloat
-            if len(self.validation_errors) > 10:
-                self.validation_errors = self.validation_errors[-10:]
+            # Track error for debugging (keep only recent 10 errors to avoid memory bloat)
+            with self._stats_lock:
+                self.validation_errors.append({
+                    'timestamp': error_details['timestamp'],
+                    'context': 'chapter_validation',
+                    'error': error_details
+                })
+                if len(self.validation_errors) > 10:
+                    self.validation_errors = self.validation_errors[-10:]
 
             if self.logger:
                 self.logger.error(f"[CRITICAL] Chapter validation failed with {error_details['error_type']}: {error_details['error_message']}")
@@ -398,7 +467,7 @@ For each instance, return:
         for i, instance in enumerate(instances):
             instance['instance_id'] = i + 1
 
-        prompt = self._create_bulk_validation_prompt(instances, hebrew_text, english_text)
+        prompt, format_args = self._format_request(self._create_bulk_validation_prompt(instances, hebrew_text, english_text))
 
         try:
             response = self.openai_client.chat.completions.create(
@@ -408,9 +477,10 @@ For each instance, return:
                     {"role": "user", "content": prompt}
                 ],
                 max_completion_tokens=15000,
-                reasoning_effort=self.reasoning_effort
+                reasoning_effort=self.reasoning_effort,
+                **format_args
             )
-            self.validation_count += 1
+            self._increment('validation_count')
 
             # Extract cost metadata from response
             cost_metadata = self._extract_cost_metadata(response)
@@ -422,7 +492,7 @@ For each instance, return:
                     self.logger.debug(f"Verse validation cost: ${cost_metadata['cost']:.4f}")
 
                 # Enhanced JSON extraction with multiple fallback strategies
-                validation_results = self._extract_json_with_fallbacks(response_text, "bulk validation")
+                validation_results = self._parse_validation_response(response_text, "bulk validation")
                 if validation_results is not None:
                     return validation_results, cost_metadata
                 else:
@@ -441,86 +511,42 @@ For each instance, return:
             return [], {'cost': 0, 'input_tokens': 0, 'output_tokens': 0, 'reasoning_tokens': 0}
 
     def _create_chapter_validation_prompt(self, chapter_instances: List[Dict]) -> str:
-        """Create a prompt to validate all instances from all verses in a chapter in a single call."""
+        """
+        Create the user message validating all instances from all verses in a chapter in a single call.
 
-        # Prepare a simplified list of instances for the prompt, including verse context
+        Compact payload: each verse's Hebrew/English appears once in a VERSES table keyed by
+        reference and instances point at it by "verse"; JSON is unindented with Hebrew unescaped.
+        All instructions live in CHAPTER_VALIDATION_SYSTEM_PROMPT, a static prefix the provider
+        can cache across chapters.
+        """
+        verses = {}
         prompt_instances = []
         for instance in chapter_instances:
-            types_to_validate = []
-            for fig_type in ['simile', 'metaphor', 'personification', 'idiom', 'hyperbole', 'metonymy', 'other']:
-                if instance.get(fig_type) == 'yes':
-                    types_to_validate.append(fig_type)
+            reference = instance.get('verse_reference', '')
+            if reference not in verses:
+                verses[reference] = {"he": instance.get('hebrew_text', ''), "en": instance.get('english_text', '')}
 
             prompt_instances.append({
                 "instance_id": instance['instance_id'],
-                "verse_reference": instance.get('verse_reference', ''),
-                "hebrew_text": instance.get('hebrew_text', ''),
-                "english_text": instance.get('english_text', ''),
+                "verse": reference,
                 "figurative_text": instance.get('figurative_text', ''),
-                "english_text": instance.get('english_text', ''),
                 "explanation": instance.get('explanation', ''),
                 "confidence": instance.get('confidence', 0.0),
-                "types": types_to_validate
+                "types": [fig_type for fig_type in VALIDATION_TYPES if instance.get(fig_type) == 'yes']
             })
 
-        prompt = f"""You are a biblical Hebrew scholar validating a list of detected figurative language instances from an entire chapter.
-
-DETECTED INSTANCES FROM ALL VERSES:
+        return f"""VERSES:
 ```json
-{json.dumps(prompt_instances, indent=2)}
+{json.dumps(verses, ensure_ascii=False, separators=(',', ':'))}
 ```
 
-TASK:
-Review each instance in the JSON array above. For each instance, validate each of the detected `types`. For each type, you must provide a validation decision.
-
-VALIDATION GUIDELINES:
-- Cross-domain comparisons where A is described as B (Egypt = iron furnace) are VALID METAPHORS
-- Divine body parts (God's hand, arm, face) are VALID METAPHORS (God is incorporeal)
-- Abstract concepts acting as agents (dread and fear...put upon) are VALID PERSONIFICATION
-- Natural phenomena acting human-like (mountains skipped, sea fled) are VALID PERSONIFICATION
-- Similes using "like/as" for unlike things (like a lion) are VALID SIMILES
-- Literal historical references, standard biblical terminology, and technical religious terms are INVALID
-- Divine actions (speaking, blessing, smiting) are LITERAL in ANE context, not figurative
-
-RESPONSE FORMAT:
-You MUST return a valid JSON array of validation objects inside a JSON code block. Each object in the array must contain:
-1.  `instance_id`: The ID of the instance you are validating.
-2.  `validation_results`: An object where keys are the original figurative types (e.g., "metaphor", "idiom") and values are validation objects with the fields: `decision` (must be "VALID", "INVALID", or "RECLASSIFIED"), `reason` (a brief explanation), and, if reclassifying, `reclassified_type`.
-
-EXAMPLE OUTPUT:
+DETECTED INSTANCES:
 ```json
-[
-  {{
-    "instance_id": 1,
-    "validation_results": {{
-      "metaphor": {{
-        "decision": "VALID",
-        "reason": "This is a valid metaphor because it compares an abstract concept to a concrete object."
-      }},
-      "idiom": {{
-        "decision": "RECLASSIFIED",
-        "reason": "This is not an idiom, but rather a simile because of the use of 'like'.",
-        "reclassified_type": "simile"
-      }}
-    }}
-  }},
-  {{
-    "instance_id": 2,
-    "validation_results": {{
-      "hyperbole": {{
-        "decision": "INVALID",
-        "reason": "This is a literal statement, not an exaggeration."
-      }}
-    }}
-  }}
-]
+{json.dumps(prompt_instances, ensure_ascii=False, separators=(',', ':'))}
 ```
 
-Provide your validation output below.
-
 VALIDATION:
 """
-        return prompt
 
     def _create_bulk_validation_prompt(self, instances: List[Dict], hebrew_text: str, english_text: str) -> str:
         """Create a prompt to validate all instances from a verse in a single call."""
@@ -641,7 +667,7 @@ VALIDATION:
                 reasoning_effort=self.reasoning_effort
             )
 
-            self.validation_count += 1
+            self._increment('validation_count')
 
             if response.choices and response.choices[0].message.content:
                 # Parse the validation response
@@ -751,7 +777,7 @@ VALIDATION:
                 reasoning_effort=self.reasoning_effort
             )
 
-            self.type_validation_count += 1
+            self._increment('type_validation_count')
 
             if response.choices and response.choices[0].message.content:
                 # Parse the validation response
@@ -1069,425 +1095,54 @@ VALIDATION:"""
                 else:
                     print(f"Warning: Failed to log validation data: {e}")
 
-    def _extract_json_with_fallbacks(self, response_text: str, context: str) -> Optional[List[Dict]]:
-        """Extract JSON from response text using multiple fallback strategies"""
-
-        # Strategy 1: Standard markdown JSON block extraction
-        json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response_text, re.DOTALL)
-        if json_match:
-            json_string = json_match.group(1).strip()
-            try:
-                validation_results = json.loads(json_string)
-                self.json_extraction_successes["strategy_1"] += 1
-                if self.logger:
-                    self.logger.debug(f"Strategy 1 (markdown JSON) successful for {context}")
-                return validation_results
-            except json.JSONDecodeError as e:
-                if self.logger:
-                    self.logger.warning(f"Strategy 1 failed for {context}: {e}")
+    def _format_request(self, prompt: str) -> Tuple[str, Dict]:
+        """User message and extra create() arguments for a chapter/verse validation request."""
+        if not self.structured_output:
+            return prompt, {}
+        return prompt + VALIDATION_FORMAT_NOTE, {"response_format": validation_response_format()}
 
-        # Strategy 2: Code block without json specifier
-        json_match = re.search(r'```\s*([\s\S]*?)\s*```', response_text, re.DOTALL)
-        if json_match:
-            json_string = json_match.group(1).strip()
-            try:
-                validation_results = json.loads(json_string)
-                self.json_extraction_successes["strategy_2"] += 1
-                if self.logger:
-                    self.logger.debug(f"Strategy 2 (generic code block) successful for {context}")
-                return validation_results
-            except json.JSONDecodeError as e:
-                if self.logger:
-                    self.logger.warning(f"Strategy 2 failed for {context}: {e}")
-
-        # Strategy 3: Bracket counting algorithm - find JSON array directly
-        first_bracket = response_text.find('[')
-        if first_bracket != -1:
-            bracket_count = 1
-            pos = first_bracket + 1
-            while pos < len(response_text) and bracket_count > 0:
-                if response_text[pos] == '[':
-                    bracket_count += 1
-                elif response_text[pos] == ']':
-                    bracket_count -= 1
-                pos += 1
-
-            if bracket_count == 0:
-                json_string = response_text[first_bracket:pos]
-                try:
-                    validation_results = json.loads(json_string)
-                    self.json_extraction_successes["strategy_3"] += 1
-                    if self.logger:
-                        self.logger.debug(f"Strategy 3 (bracket counting) successful for {context}")
-                    return validation_results
-                except json.JSONDecodeError as e:
-                    if self.logger:
-                        self.logger.warning(f"Strategy 3 failed for {context}: {e}")
-
-        # Strategy 4: Greedy JSON array matching
-        json_pattern = r'\[\s*\{[\s\S]*\}\s*\]'  # More permissive pattern
-        json_match = re.search(json_pattern, response_text)
-        if json_match:
-            json_string = json_match.group(0)
-            try:
-                validation_results = json.loads(json_string)
-                self.json_extraction_successes["strategy_4"] += 1
-                if self.logger:
-                    self.logger.debug(f"Strategy 4 (greedy matching) successful for {context}")
-                return validation_results
-            except json.JSONDecodeError as e:
-                if self.logger:
-                    self.logger.warning(f"Strategy 4 failed for {context}: {e}")
-
-        # Strategy 5: JSON repair attempt for truncated responses
-        if self.logger:
-            self.logger.info(f"Attempting JSON repair for {context}")
-
-        # Try to find truncated JSON and complete it
-        first_bracket = response_text.find('[')
-        if first_bracket != -1:
-            truncated_json = response_text[first_bracket:]
-
-            # Count braces and brackets to identify missing closings
-            open_braces = truncated_json.count('{')
-            close_braces = truncated_json.count('}')
-            open_brackets = truncated_json.count('[')
-            close_brackets = truncated_json.count(']')
-
-            if self.logger:
-                self.logger.debug(f"JSON structure analysis for {context}: "
-                               f"{open_braces} {{ vs {close_braces} }}, "
-                               f"{open_brackets} [ vs {close_brackets} ]")
-
-            # Add missing closing brackets and braces
-            missing_braces = open_braces - close_braces
-            missing_brackets = open_brackets - close_brackets
-
-            repaired_json = truncated_json
-            # Add closing brackets first (inner structures)
-            for _ in range(missing_brackets):
-                repaired_json += ']'
-            # Add closing braces (outer structures)
-            for _ in range(missing_braces):
-                repaired_json += '}'
+    def _parse_validation_response(self, response_text: str, context: str) -> Optional[List[Dict]]:
+        """Validation results from a response: typed parse in structured mode, JSON recovery otherwise.
 
+        A structured response that fails schema validation (e.g. cut off) is recovered like a
+        free-form one.
+        """
+        if self.structured_output:
             try:
-                validation_results = json.loads(repaired_json)
-                self.json_extraction_successes["strategy_5"] += 1
+                validation_results = parse_structured_validation(response_text)
+            except ValueError as e:
                 if self.logger:
-                    self.logger.info(f"Strategy 5 (JSON repair) successful for {context} "
-                                   f"- added {missing_brackets} ] and {missing_braces} }}")
+                    self.logger.warning(f"[STRUCTURED] {context} response does not match the validation schema "
+                                        f"({str(e).splitlines()[0]}) - falling back to JSON recovery")
+            else:
+                self._record_extraction('structured')
                 return validation_results
-            except json.JSONDecodeError as e:
-                if self.logger:
-                    self.logger.warning(f"Strategy 5 failed for {context}: {e}")
-
-        # Strategy 6: Last resort - try to extract individual objects manually
-        if self.logger:
-            self.logger.info(f"Attempting manual object extraction for {context}")
-
-        try:
-            # Look for individual objects in the response
-            object_pattern = r'\{\s*"instance_id"\s*:\s*\d+[\s\S]*?\}'
-            objects = re.findall(object_pattern, response_text)
-
-            if objects:
-                # Try to parse each object individually
-                valid_objects = []
-                for i, obj_str in enumerate(objects):
-                    try:
-                        # Try to complete the object if truncated
-                        if not obj_str.rstrip().endswith('}'):
-                            obj_str += '}'
-                        obj = json.loads(obj_str)
-                        obj['instance_id'] = i + 1  # Ensure sequential IDs
-                        valid_objects.append(obj)
-                    except json.JSONDecodeError:
-                        continue
-
-                if valid_objects:
-                    # Create validation results structure manually
-                    validation_results = []
-                    for obj in valid_objects:
-                        validation_results.append({
-                            'instance_id': obj.get('instance_id', 1),
-                            'validation_results': obj.get('validation_results', {})
-                        })
-
-                    self.json_extraction_successes["strategy_6"] += 1
-                    if self.logger:
-                        self.logger.info(f"Strategy 6 (manual extraction) successful for {context} "
-                                       f"- extracted {len(validation_results)} objects")
-                    return validation_results
-
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 6 failed for {context}: {e}")
-
-        # Strategy 7: Advanced JSON Repair with String Escaping Fix
-        if self.logger:
-            self.logger.info(f"Attempting advanced JSON repair for {context}")
-
-        try:
-            first_bracket = response_text.find('[')
-            if first_bracket != -1:
-                json_candidate = response_text[first_bracket:]
-
-                # Advanced string escaping fixes
-                json_candidate = re.sub(r'(?<!\\)"([^"\\]*(?:\\.[^"\\]*)*)"', lambda m: '"' + m.group(1).replace('\\', '\\\\').replace('"', '\\"') + '"', json_candidate)
-
-                # Fix common JSON corruption patterns
-                # 1. Fix unescaped quotes in strings
-                json_candidate = re.sub(r':\s*"([^"]*)"([^,\]\}])', r': "\1"\\2', json_candidate)
-
-                # 2. Fix missing commas between objects
-                json_candidate = re.sub(r'\}\s*\{', '},{', json_candidate)
-
-                # 3. Fix trailing commas
-                json_candidate = re.sub(r',(\s*[}\]])', r'\1', json_candidate)
-
-                # 4. Fix missing quotes around property names
-                json_candidate = re.sub(r'(\{|\,)\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:', r'\1 "\2":', json_candidate)
-
-                # Count and fix brackets/braces
-                open_braces = json_candidate.count('{')
-                close_braces = json_candidate.count('}')
-                open_brackets = json_candidate.count('[')
-                close_brackets = json_candidate.count(']')
-
-                # Add missing closing brackets
-                missing_braces = open_braces - close_braces
-                missing_brackets = open_brackets - close_brackets
-
-                # Smart completion - add missing structure
-                if missing_braces > 0 or missing_brackets > 0:
-                    # Try to complete the last object if it appears truncated
-                    if not json_candidate.rstrip().endswith('}') or not json_candidate.rstrip().endswith(']'):
-                        # Add minimal completion for the last object
-                        last_obj_start = json_candidate.rfind('{')
-                        if last_obj_start != -1:
-                            after_obj = json_candidate[last_obj_start:]
-                            if 'validation_results' in after_obj and not after_obj.rstrip().endswith('}'):
-                                json_candidate += '}'
-
-                    # Add missing brackets/braces
-                    for _ in range(missing_brackets):
-                        json_candidate += ']'
-                    for _ in range(missing_braces):
-                        json_candidate += '}'
-
-                try:
-                    validation_results = json.loads(json_candidate)
-                    self.json_extraction_successes["strategy_7"] += 1
-                    if self.logger:
-                        self.logger.info(f"Strategy 7 (advanced JSON repair) successful for {context}")
-                    return validation_results
-                except json.JSONDecodeError as e:
-                    if self.logger:
-                        self.logger.warning(f"Strategy 7 failed for {context}: {e}")
-
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 7 failed for {context}: {e}")
-
-        # Strategy 8: Response Pre-processing & Sanitization
-        if self.logger:
-            self.logger.info(f"Attempting response sanitization for {context}")
+        return self._extract_json_with_fallbacks(response_text, context)
 
-        try:
-            # Clean the response text before extraction
-            cleaned_response = response_text
-
-            # Remove markdown formatting artifacts
-            cleaned_response = re.sub(r'```[a-zA-Z]*\s*', '', cleaned_response)
-            cleaned_response = re.sub(r'```\s*$', '', cleaned_response)
-
-            # Remove common non-JSON text patterns
-            cleaned_response = re.sub(r'VALIDATION:\s*', '', cleaned_response, flags=re.IGNORECASE)
-            cleaned_response = re.sub(r'Here\'s the validation.*?(?=\[)', '', cleaned_response, flags=re.IGNORECASE|re.DOTALL)
-            cleaned_response = re.sub(r'```.*?```\s*', '', cleaned_response, flags=re.DOTALL)
-
-            # Normalize whitespace
-            cleaned_response = re.sub(r'\s+', ' ', cleaned_response)
-            cleaned_response = cleaned_response.strip()
-
-            # Try standard extraction on cleaned text
-            if '[' in cleaned_response:
-                json_match = re.search(r'\[.*\]', cleaned_response, re.DOTALL)
-                if json_match:
-                    json_string = json_match.group(0)
-                    try:
-                        validation_results = json.loads(json_string)
-                        self.json_extraction_successes["strategy_8"] += 1
-                        if self.logger:
-                            self.logger.info(f"Strategy 8 (sanitization) successful for {context}")
-                        return validation_results
-                    except json.JSONDecodeError as e:
-                        if self.logger:
-                            self.logger.warning(f"Strategy 8 JSON parse failed for {context}: {e}")
-
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 8 failed for {context}: {e}")
-
-        # Strategy 9: Progressive Parsing with Validation Checkpoints
-        if self.logger:
-            self.logger.info(f"Attempting progressive parsing for {context}")
-
-        try:
-            # Extract JSON piece by piece with validation
-            first_bracket = response_text.find('[')
-            if first_bracket != -1:
-                # Find all object starts
-                object_starts = []
-                pos = first_bracket
-                depth = 0
-
-                while pos < len(response_text):
-                    if response_text[pos] == '{':
-                        if depth == 0:
-                            object_starts.append(pos)
-                        depth += 1
-                    elif response_text[pos] == '}':
-                        depth -= 1
-                    elif response_text[pos] == ']' and depth == 0:
-                        break
-                    pos += 1
-
-                validation_results = []
-
-                # Parse each object individually
-                for i, obj_start in enumerate(object_starts):
-                    try:
-                        # Find the end of this object
-                        obj_end = obj_start
-                        brace_depth = 1
-
-                        while obj_end < len(response_text) - 1 and brace_depth > 0:
-                            obj_end += 1
-                            if response_text[obj_end] == '{':
-                                brace_depth += 1
-                            elif response_text[obj_end] == '}':
-                                brace_depth -= 1
-
-                        obj_str = response_text[obj_start:obj_end + 1]
-
-                        # Try to parse the object
-                        obj = json.loads(obj_str)
-
-                        # Validate required structure
-                        if 'instance_id' in obj and 'validation_results' in obj:
-                            # Ensure validation_results is a proper dict
-                            if isinstance(obj['validation_results'], dict):
-                                validation_results.append(obj)
-                            else:
-                                # Create minimal validation_results
-                                obj['validation_results'] = {}
-                                validation_results.append(obj)
-                        else:
-                            # Create minimal structure if missing
-                            if 'instance_id' not in obj:
-                                obj['instance_id'] = i + 1
-                            if 'validation_results' not in obj:
-                                obj['validation_results'] = {}
-                            validation_results.append(obj)
-
-                    except (json.JSONDecodeError, Exception) as e:
-                        # Create minimal object for this instance
-                        minimal_obj = {
-                            'instance_id': i + 1,
-                            'validation_results': {}
-                        }
-                        validation_results.append(minimal_obj)
-                        if self.logger:
-                            self.logger.debug(f"Created minimal object for instance {i + 1} due to: {e}")
-
-                if validation_results:
-                    self.json_extraction_successes["strategy_9"] += 1
-                    if self.logger:
-                        self.logger.info(f"Strategy 9 (progressive parsing) successful for {context} - extracted {len(validation_results)} objects")
-                    return validation_results
-
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Strategy 9 failed for {context}: {e}")
-
-        # Strategy 10: Manual Validation Extraction (Last Resort)
-        if self.logger:
-            self.logger.info(f"Attempting manual validation extraction for {context}")
-
-        try:
-            # Extract validation information using regex patterns
-            validation_results = []
-
-            # Look for instance identifiers and validation decisions
-            instance_pattern = r'(?:instance[_\s]*id\s*[:=]\s*(\d+)|\b(\d+)\b).*?validation[_\s]*results'
-            validation_pattern = r'(VALID|INVALID|RECLASSIFIED)[^:]*:([^,\n]+)'
-
-            # Find all instance-like sections
-            instance_sections = re.split(r'(?:instance[_\s]*id\s*[:=]\s*\d+|\b\d+\b)[^a-zA-Z]', response_text, flags=re.IGNORECASE)
-
-            # Extract validation decisions from each section
-            for i, section in enumerate(instance_sections):
-                if 'validation' in section.lower() or any(word in section.lower() for word in ['valid', 'invalid', 'reclass']):
-                    validation_info = {}
-
-                    # Extract validation decisions for different types
-                    fig_types = ['metaphor', 'simile', 'personification', 'idiom', 'hyperbole', 'metonymy', 'other']
-
-                    for fig_type in fig_types:
-                        type_pattern = rf'{fig_type}[^:]*:\s*(VALID|INVALID|RECLASSIFIED)(?:\s*-\s*([^,\n]+))?'
-                        type_match = re.search(type_pattern, section, re.IGNORECASE)
-                        if type_match:
-                            decision = type_match.group(1).upper()
-                            reason = type_match.group(2) if type_match.group(2) else f"Manual extraction: {decision} for {fig_type}"
-
-                            validation_info[fig_type] = {
-                                'decision': decision,
-                                'reason': reason
-                            }
-
-                    # If we found any validation info, create an object
-                    if validation_info:
-                        validation_results.append({
-                            'instance_id': i + 1,
-                            'validation_results': validation_info
-                        })
-
-            # If we still have no results but have instances, create minimal validation
-            if not validation_results:
-                # Count estimated instances by looking for instance markers
-                instance_markers = len(re.findall(r'instance[_\s]*id\s*[:=]\s*\d+', response_text, re.IGNORECASE))
-                if instance_markers == 0:
-                    # Fallback: look for patterns suggesting multiple objects
-                    instance_markers = len(re.findall(r'\{[^}]*instance_id[^}]*\}', response_text, re.IGNORECASE))
-
-                if instance_markers == 0:
-                    instance_markers = 1  # At least one instance
-
-                for i in range(instance_markers):
-                    validation_results.append({
-                        'instance_id': i + 1,
-                        'validation_results': {}
-                    })
-
-            if validation_results:
-                self.json_extraction_successes["strategy_10"] += 1
-                if self.logger:
-                    self.logger.info(f"Strategy 10 (manual extraction) successful for {context} - extracted {len(validation_results)} validation objects")
-                return validation_results
+    def _extract_json_with_fallbacks(self, response_text: str, context: str) -> Optional[List[Dict]]:
+        """Extract the validation array from a response with the shared recovering scanner (json_recovery).
 
-        except Exception as e:
+        Returns None if the response holds no JSON array or objects. Responses are counted in
+        json_extraction_successes by the recoveries applied (code fence, truncation, comma repairs, ...).
+        """
+        if self.structured_output:
+            recovered = recover_structured_array(response_text, VALIDATION_FIELD)
+        else:
+            recovered = recover_json_array(response_text)
+        if recovered.value is None:
             if self.logger:
-                self.logger.warning(f"Strategy 10 failed for {context}: {e}")
-
-        # All strategies failed
-        if self.logger:
-            self.logger.error(f"All JSON extraction strategies failed for {context}")
-            self.logger.error(f"Response length: {len(response_text)} characters")
-            self.logger.error(f"Response preview: {response_text[:500]}...{response_text[-500:] if len(response_text) > 1000 else response_text[-500:]}")
-
-        return None
+                self.logger.error(f"No JSON found in {context} response ({len(response_text)} chars)")
+            return None
+
+        key = '+'.join(recovered.recoveries) or 'clean'
+        self._record_extraction(key)
+        if self.logger and set(recovered.recoveries) - {RECOVERY_CODE_FENCE}:
+            self.logger.warning(f"Recovered {len(recovered.value)} results for {context} "
+                                f"({', '.join(recovered.recoveries)})")
+        if self.structured_output:
+            # Same shape as a typed parse: null type entries dropped, malformed objects skipped
+            return structured_validation_items(recovered.value)
+        return [item for item in recovered.value if isinstance(item, dict)]
 
     def _extract_cost_metadata(self, response) -> Dict:
         """Extract cost metadata from OpenAI API response.
@@ -1496,28 +1151,10 @@ VALIDATION:"""
             response: OpenAI API response object
 
         Returns:
-            Dict with cost, input_tokens, output_tokens, reasoning_tokens
+            Dict with cost, input_tokens, output_tokens, reasoning_tokens, cached_input_tokens
+            (reasoning and cached tokens come from the usage details; cost uses GPT-5.1 pricing)
         """
-        cost_metadata = {
-            'input_tokens': 0,
-            'output_tokens': 0,
-            'reasoning_tokens': 0,
-            'cost': 0.0
-        }
-
-        if hasattr(response, 'usage'):
-            usage = response.usage
-            cost_metadata['input_tokens'] = getattr(usage, 'prompt_tokens', 0)
-            cost_metadata['output_tokens'] = getattr(usage, 'completion_tokens', 0)
-            cost_metadata['reasoning_tokens'] = getattr(usage, 'reasoning_tokens', 0)
-
-            # GPT-5.1 pricing: $1.25/M input + $10.00/M output
-            cost_metadata['cost'] = (
-                cost_metadata['input_tokens'] / 1_000_000 * 1.25 +
-                cost_metadata['output_tokens'] / 1_000_000 * 10.0
-            )
-
-        return cost_metadata
+        return usage_to_token_metadata(getattr(response, 'usage', None))
 
     def get_validation_stats(self) -> Dict:
         """Get comprehensive validation statistics"""
@@ -1556,12 +1193,11 @@ Total Validations: {self.validation_count}
 Successes: {self.validation_success_count}
 Failures: {self.validation_failure_count}
 
-JSON Extraction Strategy Usage:
+JSON Extraction (recoveries applied):
 """
-        for strategy, count in self.json_extraction_successes.items():
-            strategy_name = strategy.replace('_', ' ').title()
+        for recoveries, count in self.json_extraction_successes.items():
             percentage = (count / total_extractions * 100) if total_extractions > 0 else 0
-            report += f"  {strategy_name}: {count} ({percentage:.1f}%)\n"
+            report += f"  {recoveries}: {count} ({percentage:.1f}%)\n"
 
         if self.validation_errors:
             report += "\nRecent Errors (Last 5):\n"
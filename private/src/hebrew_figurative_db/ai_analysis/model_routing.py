@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rolling per-model latency and error statistics for UnifiedLLMClient's routing
+
+ModelRouteStats keeps the most recent calls of each model in the fallback chain:
+- latencies of successful calls, whose p95 is how long a request may run before the
+  client hedges it with a second request to the next model in the chain
+- outcomes (success/failure), whose rate decides whether a model is unhealthy and is
+  moved behind the healthy ones in the routing order; UNHEALTHY_COOLDOWN_SECONDS after
+  its last failure it is routed first again, so a recovered model gets its place back
+
+A model is not hedged until it has HEDGE_MIN_SAMPLES successful calls, and never after
+less than HEDGE_MIN_DELAY_SECONDS, so a cold start or a few quick responses do not turn
+every request into two. A request that loses a hedge is recorded with the time it had
+run when it was cancelled (a lower bound of its latency); it has no outcome.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+ROUTE_WINDOW = 50                # Recent calls kept per model
+HEDGE_MIN_SAMPLES = 5            # Successful calls a model needs before it is hedged
+HEDGE_MIN_DELAY_SECONDS = 20.0   # Floor of the hedge delay
+HEDGE_PERCENTILE = 0.95
+UNHEALTHY_MIN_CALLS = 4          # Outcomes a model needs before it can be marked unhealthy
+UNHEALTHY_ERROR_RATE = 0.5
+UNHEALTHY_COOLDOWN_SECONDS = 300.0
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class ModelRouteStats:
+    """Thread-safe rolling latency/error window per model"""
+
+    def __init__(self, window: int = ROUTE_WINDOW):
+        self.window = window
+        self._latencies = {}   # model -> deque of seconds
+        self._outcomes = {}    # model -> deque of bools
+        self._last_failure = {}   # model -> time.monotonic() of its last failure
+        self._lock = threading.Lock()
+
+    def record(self, model: str, seconds: float, ok: Optional[bool]):
+        """Add a call; ok=None records only the latency (a cancelled hedge loser)"""
+        with self._lock:
+            if ok is not False:
+                self._latencies.setdefault(model, deque(maxlen=self.window)).append(seconds)
+            if ok is not None:
+                self._outcomes.setdefault(model, deque(maxlen=self.window)).append(ok)
+            if ok is False:
+                self._last_failure[model] = time.monotonic()
+
+    def p95(self, model: str) -> Optional[float]:
+        """p95 latency in seconds, or None with fewer than HEDGE_MIN_SAMPLES samples"""
+        with self._lock:
+            latencies = sorted(self._latencies.get(model, ()))
+        if len(latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        return _percentile(latencies, HEDGE_PERCENTILE)
+
+    def hedge_delay(self, model: str) -> Optional[float]:
+        """Seconds a request to model may run before it is hedged (None: do not hedge yet)"""
+        p95 = self.p95(model)
+        if p95 is None:
+            return None
+        return max(HEDGE_MIN_DELAY_SECONDS, p95)
+
+    def error_rate(self, model: str) -> float:
+        with self._lock:
+            outcomes = list(self._outcomes.get(model, ()))
+        if not outcomes:
+            return 0.0
+        return outcomes.count(False) / len(outcomes)
+
+    def is_healthy(self, model: str) -> bool:
+        with self._lock:
+            calls = len(self._outcomes.get(model, ()))
+            last_failure = self._last_failure.get(model)
+        if calls < UNHEALTHY_MIN_CALLS or self.error_rate(model) < UNHEALTHY_ERROR_RATE:
+            return True
+        return last_failure is not None and time.monotonic() - last_failure > UNHEALTHY_COOLDOWN_SECONDS
+
+    def order(self, models: List[str]) -> List[str]:
+        """models with the unhealthy ones moved to the end (order otherwise kept)"""
+        healthy = [m for m in models if self.is_healthy(m)]
+        return healthy + [m for m in models if m not in healthy]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            models = sorted(set(self._latencies) | set(self._outcomes))
+            latencies = {m: sorted(self._latencies.get(m, ())) for m in models}
+            calls = {m: len(self._outcomes.get(m, ())) for m in models}
+        stats = {}
+        for model in models:
+            values = latencies[model]
+            p95 = self.p95(model)
+            stats[model] = {
+                'calls': calls[model],
+                'error_rate': round(self.error_rate(model), 3),
+                'healthy': self.is_healthy(model),
+                'p50_seconds': round(_percentile(values, 0.50), 2) if values else None,
+                'p95_seconds': round(p95, 2) if p95 is not None else None,
+            }
+        return stats
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Structured-output mode for detection and validation requests
+
+Opt-in (STRUCTURED_OUTPUT=1, or structured_output=True on MetaphorValidator): requests carry
+response_format {"type": "json_schema", "strict": true} built from the Pydantic response models
+below, so the provider (and mock_llm_server.py) constrains the completion to the schema and the
+response parses straight into typed objects with one model_validate_json() call - no
+extraction, comma repair or per-instance schema pass.
+
+Strict schemas must have an object at the root, list every property as required and set
+additionalProperties to false, so:
+- the verse / validation arrays are wrapped in an object ({"verses": [...]}, {"validations": [...]})
+- fields with defaults become required (nullable where the model allows None)
+- keywords strict mode rejects (default, minLength, ...) are left out of the schema and enforced
+  only by the local Pydantic validation
+- validation_results has one nullable entry per figurative type instead of free-form keys
+
+A response that does not validate (cut off at max tokens, or a provider that ignored the
+format) raises ValueError; callers then fall back to recover_structured_array(), which runs the
+json_recovery scanner and unwraps the top-level object.
+"""
+
+import functools
+import os
+from typing import Dict, List, Optional
+
+try:
+    from .json_recovery import NOT_FOUND, RECOVERY_BARE_OBJECTS, RecoveredJSON, recover_json_array
+except ImportError:
+    # Imported as a top-level module (ai_analysis/ on sys.path, e.g. universal_validation_recovery.py)
+    from json_recovery import NOT_FOUND, RECOVERY_BARE_OBJECTS, RecoveredJSON, recover_json_array
+
+try:
+    from pydantic import BaseModel, Field, ValidationError
+    from typing import Literal
+    PYDANTIC_AVAILABLE = True
+except ImportError:
+    PYDANTIC_AVAILABLE = False
+
+STRUCTURED_OUTPUT_ENV = "STRUCTURED_OUTPUT"
+
+# Response field holding the array in each structured response
+DETECTION_FIELD = "verses"
+VALIDATION_FIELD = "validations"
+
+# Appended to the user message in structured mode; the static system prompts (and their cached
+# prefix) stay identical in both modes
+DETECTION_FORMAT_NOTE = (f'\nRespond with a JSON object whose "{DETECTION_FIELD}" field is the array of '
+                         f'verse objects described in the instructions.\n')
+VALIDATION_FORMAT_NOTE = (f'\nRespond with a JSON object whose "{VALIDATION_FIELD}" field is the array of '
+                          f'validation objects; set validation_results entries for types not in an '
+                          f'instance\'s "types" to null.\n')
+
+# Keywords strict mode rejects; the local Pydantic validation still applies them
+STRICT_UNSUPPORTED_KEYWORDS = ('default', 'minLength', 'maxLength')
+
+
+if PYDANTIC_AVAILABLE:
+    class FigurativeInstance(BaseModel):
+        """Schema for a single figurative language instance from LLM.
+
+        NOTE: For batched mode, the verse field is at the parent (verse result) level,
+        not at the instance level. Instances use 'english_text' not 'figurative_text'.
+        This schema validates the INSTANCE structure only (within verse.instances[]).
+        """
+        figurative_language: Optional[str] = Field(default="yes")
+        # The batched mode uses 'english_text' for the figurative expression text
+        english_text: Optional[str] = Field(default="", description="The figurative expression in English")
+        hebrew_text: Optional[str] = Field(default="", description="The figurative expression in Hebrew")
+        explanation: str = Field(..., min_length=1, description="Explanation of the figurative language")
+        confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score 0-1")
+        metaphor: Optional[Literal["yes", "no"]] = Field(default="no")
+        simile: Optional[Literal["yes", "no"]] = Field(default="no")
+        personification: Optional[Literal["yes", "no"]] = Field(default="no")
+        idiom: Optional[Literal["yes", "no"]] = Field(default="no")
+        hyperbole: Optional[Literal["yes", "no"]] = Field(default="no")
+        metonymy: Optional[Literal["yes", "no"]] = Field(default="no")
+        other: Optional[Literal["yes", "no"]] = Field(default="no")
+        # Optional hierarchical tagging fields
+        target: Optional[List[str]] = Field(default_factory=list)
+        vehicle: Optional[List[str]] = Field(default_factory=list)
+        ground: Optional[List[str]] = Field(default_factory=list)
+        posture: Optional[List[str]] = Field(default_factory=list)
+
+    class ChapterResponse(BaseModel):
+        """Schema for the complete chapter response from LLM."""
+        instances: List[FigurativeInstance] = Field(default_factory=list)
+
+    class VerseDetection(BaseModel):
+        """One verse object of a detection response."""
+        verse: int
+        reference: str = ""
+        deliberation: str = ""
+        instances: List[FigurativeInstance] = Field(default_factory=list)
+
+    class DetectionResponse(BaseModel):
+        """Structured detection response: the verse array under DETECTION_FIELD."""
+        verses: List[VerseDetection]
+
+    class TypeValidation(BaseModel):
+        """Decision for one figurative type of one instance."""
+        decision: Literal["VALID", "INVALID", "RECLASSIFIED"]
+        reason: str
+        reclassified_type: Optional[Literal["simile", "metaphor", "personification", "idiom",
+                                            "hyperbole", "metonymy", "other"]] = None
+
+    class TypeValidations(BaseModel):
+        """validation_results of one instance: a decision for each type that was detected, else null."""
+        simile: Optional[TypeValidation] = None
+        metaphor: Optional[TypeValidation] = None
+        personification: Optional[TypeValidation] = None
+        idiom: Optional[TypeValidation] = None
+        hyperbole: Optional[TypeValidation] = None
+        metonymy: Optional[TypeValidation] = None
+        other: Optional[TypeValidation] = None
+
+    class InstanceValidation(BaseModel):
+        """Validation of one detected instance."""
+        instance_id: int
+        validation_results: TypeValidations
+
+    class ValidationResponse(BaseModel):
+        """Structured validation response: the validation array under VALIDATION_FIELD."""
+        validations: List[InstanceValidation]
+
+
+def structured_output_enabled(flag: Optional[bool] = None) -> bool:
+    """True if structured output is requested (flag, else STRUCTURED_OUTPUT=1) and Pydantic is installed."""
+    if flag is None:
+        flag = os.getenv(STRUCTURED_OUTPUT_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+    return bool(flag) and PYDANTIC_AVAILABLE
+
+
+def strict_json_schema(model) -> Dict:
+    """model's JSON Schema in the form strict structured output accepts."""
+    return _make_strict(model.model_json_schema())
+
+
+def _make_strict(node):
+    if isinstance(node, list):
+        return [_make_strict(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    strict = {key: _make_strict(value) for key, value in node.items()
+              if key not in STRICT_UNSUPPORTED_KEYWORDS}
+    if 'properties' in node:
+        # Property names are data, not keywords: rebuild them without the keyword filter
+        strict['properties'] = {name: _make_strict(schema) for name, schema in node['properties'].items()}
+        strict['required'] = list(node['properties'])
+        strict['additionalProperties'] = False
+    return strict
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_response_format(model) -> Dict:
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": model.__name__, "strict": True, "schema": strict_json_schema(model)}
+    }
+
+
+def detection_response_format() -> Dict:
+    """response_format for batched detection requests."""
+    return _cached_response_format(DetectionResponse)
+
+
+def validation_response_format() -> Dict:
+    """response_format for chapter and verse validation requests."""
+    return _cached_response_format(ValidationResponse)
+
+
+def parse_structured_detection(response_text: str) -> List[Dict]:
+    """Verse results (dicts, as parse_detection_response returns them) from a structured response.
+
+    Fields the model set to null are left out, so the callers' .get(field, default) applies.
+    Raises ValueError (pydantic.ValidationError) if the response does not match the schema.
+    """
+    parsed = DetectionResponse.model_validate_json(response_text)
+    return [verse.model_dump(exclude_none=True) for verse in parsed.verses]
+
+
+def parse_structured_validation(response_text: str) -> List[Dict]:
+    """Validation results in the free-form shape ({instance_id, validation_results: {type: decision}}).
+
+    Types the model set to null are left out, as are null reclassified_type fields.
+    Raises ValueError (pydantic.ValidationError) if the response does not match the schema.
+    """
+    parsed = ValidationResponse.model_validate_json(response_text)
+    return [_validation_dict(item) for item in parsed.validations]
+
+
+def structured_validation_items(items: List[Dict]) -> List[Dict]:
+    """Recovered validation objects in the free-form shape; objects that fail InstanceValidation are dropped."""
+    results = []
+    for item in items:
+        try:
+            results.append(_validation_dict(InstanceValidation.model_validate(item)))
+        except ValidationError:
+            continue
+    return results
+
+
+def _validation_dict(item) -> Dict:
+    return {'instance_id': item.instance_id,
+            'validation_results': item.validation_results.model_dump(exclude_none=True)}
+
+
+def recover_structured_array(response_text: str, field: str) -> RecoveredJSON:
+    """recover_json_array() for a structured response: the array under field of the wrapper object.
+
+    Used when a structured response fails validation (e.g. truncated): the scanner cuts it back
+    to its last complete element. Responses without the wrapper are returned as recovered.
+    """
+    recovered = recover_json_array(response_text)
+    if recovered is NOT_FOUND or not isinstance(recovered.value, list) or len(recovered.value) != 1:
+        return recovered
+    wrapper = recovered.value[0]
+    if isinstance(wrapper, dict) and isinstance(wrapper.get(field), list):
+        return recovered._replace(value=wrapper[field],
+                                  recoveries=tuple(r for r in recovered.recoveries if r != RECOVERY_BARE_OBJECTS))
+    return recovered
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Token and cost accounting for GPT-5.1 requests
+
+- usage_to_token_metadata() reads the usage a provider reports: the final chunk of a
+  stream opened with stream_options={"include_usage": True}, or response.usage of a
+  non-streaming call. completion_tokens includes the reasoning tokens, which are
+  reported separately under completion_tokens_details; cached prompt tokens are under
+  prompt_tokens_details and are billed at the cached-input rate.
+- TokenEstimator counts tokens locally before a request is made (tiktoken's o200k_base
+  encoding when tiktoken is installed, otherwise the character heuristic: pointed Hebrew
+  at ~2 chars/token, everything else at ~4) and calibrates those counts per book against
+  the usage reported in earlier runs. The scheduler and the in-flight token budget use
+  the calibrated estimates.
+
+Calibration observations are kept in an optional SQLite store (the pipeline uses
+output/token_usage.db). Observations are tied to the counting method, so installing or
+removing tiktoken starts a fresh calibration instead of mixing the two.
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+TOKENIZER_ENCODING = "o200k_base"   # GPT-4o / GPT-5 family
+
+# GPT-5.1 pricing, USD per million tokens
+INPUT_PRICE_PER_M = 1.25
+CACHED_INPUT_PRICE_PER_M = 0.125
+OUTPUT_PRICE_PER_M = 10.0
+BATCH_PRICE_FACTOR = 0.5   # Batch API jobs are billed at half the synchronous rates
+
+TOKEN_FIELDS = ('input_tokens', 'output_tokens', 'reasoning_tokens', 'cached_input_tokens', 'total_tokens')
+
+# Usage sources, best first: all calls reported usage / some did / none did
+USAGE_REPORTED = 'reported'
+USAGE_PARTIAL = 'partial'
+USAGE_ESTIMATED = 'estimated'
+
+MIN_CALIBRATION_CHAPTERS = 3   # Reported chapters a book needs before its own factors replace the global ones
+
+
+def token_cost(input_tokens: int, output_tokens: int, cached_input_tokens: int = 0) -> float:
+    """USD cost of one or more calls (output_tokens includes reasoning tokens)"""
+    uncached = max(0, input_tokens - cached_input_tokens)
+    return (uncached / 1_000_000 * INPUT_PRICE_PER_M +
+            cached_input_tokens / 1_000_000 * CACHED_INPUT_PRICE_PER_M +
+            output_tokens / 1_000_000 * OUTPUT_PRICE_PER_M)
+
+
+def _field(obj, name):
+    """Attribute of an SDK usage object, or key of its dict form"""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def usage_to_token_metadata(usage, price_factor: float = 1.0) -> Dict:
+    """Token metadata (input/output/reasoning/cached tokens, cost) from a reported usage object or dict
+
+    Without usage (None) every count is zero and usage_source is 'estimated'. price_factor
+    scales the cost (BATCH_PRICE_FACTOR for requests answered by a batch job).
+    """
+    if usage is None:
+        return dict({field: 0 for field in TOKEN_FIELDS}, cost=0.0, usage_source=USAGE_ESTIMATED)
+    input_tokens = _field(usage, 'prompt_tokens') or 0
+    output_tokens = _field(usage, 'completion_tokens') or 0
+    reasoning_tokens = _field(_field(usage, 'completion_tokens_details'), 'reasoning_tokens') or 0
+    cached_input_tokens = _field(_field(usage, 'prompt_tokens_details'), 'cached_tokens') or 0
+    return {
+        'input_tokens': input_tokens,
+        'output_tokens': output_tokens,
+        'reasoning_tokens': reasoning_tokens,
+        'cached_input_tokens': cached_input_tokens,
+        'total_tokens': _field(usage, 'total_tokens') or input_tokens + output_tokens,
+        'cost': token_cost(input_tokens, output_tokens, cached_input_tokens) * price_factor,
+        'usage_source': USAGE_REPORTED
+    }
+
+
+def merge_token_metadata(metadata_list) -> Dict:
+    """Sum token metadata of several calls; usage_source is 'partial' if only some reported usage"""
+    merged = {field: 0 for field in TOKEN_FIELDS}
+    merged['cost'] = 0.0
+    sources = set()
+    for metadata in metadata_list:
+        for key in TOKEN_FIELDS + ('cost',):
+            merged[key] += metadata.get(key, 0) or 0
+        sources.add(metadata.get('usage_source', USAGE_ESTIMATED))
+    if not sources or sources == {USAGE_ESTIMATED}:
+        merged['usage_source'] = USAGE_ESTIMATED
+    else:
+        merged['usage_source'] = USAGE_REPORTED if sources == {USAGE_REPORTED} else USAGE_PARTIAL
+    return merged
+
+
+def heuristic_token_count(text: str) -> int:
+    """Rough token estimate: pointed Hebrew at ~2 chars/token, everything else at ~4."""
+    hebrew_chars = sum(1 for ch in text if '\u0590' <= ch <= '\u05ff')
+    return hebrew_chars // 2 + (len(text) - hebrew_chars) // 4
+
+
+class TokenEstimator:
+    """Local token counts, calibrated per book against reported usage; safe to share across threads"""
+
+    def __init__(self, store_path: Optional[str] = None, logger: Optional[logging.Logger] = None,
+                 use_tiktoken: bool = True):
+        self.logger = logger or logging.getLogger(__name__)
+        self._encoding = None
+        if use_tiktoken and TIKTOKEN_AVAILABLE:
+            self._encoding = tiktoken.get_encoding(TOKENIZER_ENCODING)
+        self.method = f"tiktoken:{TOKENIZER_ENCODING}" if self._encoding else 'heuristic'
+
+        self._lock = threading.Lock()
+        self._totals = {}   # book -> [chapters, estimated_input, input, verses, output]
+        self.store_path = store_path
+        self._store = None
+        if store_path:
+            self._open_store(store_path)
+
+    def _open_store(self, store_path: str):
+        self._store = sqlite3.connect(store_path, check_same_thread=False)
+        self._store.execute("""
+            CREATE TABLE IF NOT EXISTS token_calibration (
+                book TEXT NOT NULL,
+                chapter INTEGER NOT NULL,
+                method TEXT NOT NULL,
+                verses INTEGER NOT NULL,
+                estimated_input_tokens INTEGER NOT NULL,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                reasoning_tokens INTEGER NOT NULL,
+                recorded_at TEXT NOT NULL,
+                PRIMARY KEY (book, chapter, method)
+            ) WITHOUT ROWID
+        """)
+        self._store.commit()
+        rows = self._store.execute(
+            "SELECT book, COUNT(*), SUM(estimated_input_tokens), SUM(input_tokens), SUM(verses), SUM(output_tokens) "
+            "FROM token_calibration WHERE method = ? GROUP BY book", (self.method,)).fetchall()
+        for book, *totals in rows:
+            self._totals[book] = list(totals)
+        if rows:
+            self.logger.info(f"[TOKENS] Loaded calibration for {len(rows)} books "
+                             f"({sum(t[0] for t in self._totals.values())} chapters, {self.method})")
+
+    def count(self, text: str) -> int:
+        """Uncalibrated token count of text"""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return heuristic_token_count(text)
+
+    def _book_totals(self, book: Optional[str]):
+        """Calibration totals for book, or across all books if it has too few observations"""
+        with self._lock:
+            totals = self._totals.get(book)
+            if totals and totals[0] >= MIN_CALIBRATION_CHAPTERS:
+                return list(totals)
+            if not self._totals:
+                return None
+            return [sum(t[i] for t in self._totals.values()) for i in range(5)]
+
+    def input_factor(self, book: Optional[str] = None) -> float:
+        """Reported / locally counted input tokens (1.0 until usage has been reported)"""
+        totals = self._book_totals(book)
+        if not totals or not totals[1] or not totals[2]:
+            return 1.0
+        return totals[2] / totals[1]
+
+    def estimate_input(self, book: Optional[str], text: str = None, tokens: int = None) -> int:
+        """Calibrated input tokens for a prompt (text, or an uncalibrated count)"""
+        raw = self.count(text) if tokens is None else tokens
+        return round(raw * self.input_factor(book))
+
+    def output_tokens_per_verse(self, book: Optional[str] = None, default: int = 600) -> float:
+        """Reported completion tokens (reasoning included) per verse, or default without observations"""
+        totals = self._book_totals(book)
+        if not totals or not totals[3] or not totals[4]:
+            return default
+        return totals[4] / totals[3]
+
+    def record(self, book: str, chapter: int, verses: int, estimated_input_tokens: int, usage: Dict):
+        """Add a chapter's reported detection usage to the calibration (estimates must be uncalibrated)"""
+        if usage.get('usage_source') != USAGE_REPORTED or not verses or not estimated_input_tokens:
+            return
+        row = (book, chapter, self.method, verses, estimated_input_tokens, usage['input_tokens'],
+               usage['output_tokens'], usage.get('reasoning_tokens', 0), datetime.now().isoformat())
+        with self._lock:
+            if self._store is not None:
+                previous = self._store.execute(
+                    "SELECT estimated_input_tokens, input_tokens, verses, output_tokens FROM token_calibration "
+                    "WHERE book = ? AND chapter = ? AND method = ?", (book, chapter, self.method)).fetchone()
+                self._store.execute("INSERT OR REPLACE INTO token_calibration VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+                self._store.commit()
+            else:
+                previous = None
+            totals = self._totals.setdefault(book, [0, 0, 0, 0, 0])
+            if previous:
+                # A re-run of the chapter replaces its earlier observation
+                totals[0] -= 1
+                for i, value in enumerate(previous, 1):
+                    totals[i] -= value
+            totals[0] += 1
+            totals[1] += estimated_input_tokens
+            totals[2] += usage['input_tokens']
+            totals[3] += verses
+            totals[4] += usage['output_tokens']
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            books = len(self._totals)
+            chapters = sum(t[0] for t in self._totals.values())
+        return {
+            'method': self.method,
+            'calibrated_books': books,
+            'calibration_chapters': chapters,
+            'input_factor': round(self.input_factor(), 3),
+            'store_path': self.store_path,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+                self._store = None
+
+
+_shared_estimator = None
+_shared_lock = threading.Lock()
+
+
+def configure_token_estimator(store_path: Optional[str] = None,
+                              logger: Optional[logging.Logger] = None) -> TokenEstimator:
+    """Replace the process-wide estimator (closing the previous one) and return it"""
+    global _shared_estimator
+    with _shared_lock:
+        if _shared_estimator is not None:
+            _shared_estimator.close()
+        _shared_estimator = TokenEstimator(store_path, logger)
+        return _shared_estimator
+
+
+def get_token_estimator() -> TokenEstimator:
+    """Process-wide estimator (uncalibrated unless configure_token_estimator() gave it a store)"""
+    global _shared_estimator
+    with _shared_lock:
+        if _shared_estimator is None:
+            _shared_estimator = TokenEstimator()
+        return _shared_estimator
@@ -14,6 +14,8 @@ figurative language analysis in biblical Hebrew texts.
 
 import os
 import json
+import queue
+import threading
 import time
 import re
 from typing import List, Dict, Optional, Tuple
@@ -42,12 +44,26 @@ except ImportError:
 
 # Import for Hebrew text processing
 try:
-    from ..text_extraction.hebrew_utils import HebrewTextProcessor
+    from ..text_extraction.transform_memo import get_transform_memo
 except ImportError:
     # Fallback for when running as main
     import sys
     sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-    from text_extraction.hebrew_utils import HebrewTextProcessor
+    from text_extraction.transform_memo import get_transform_memo
+
+try:
+    from .json_recovery import RECOVERY_CODE_FENCE, recover_json_array
+except ImportError:
+    import sys
+    sys.path.append(os.path.dirname(__file__))
+    from json_recovery import RECOVERY_CODE_FENCE, recover_json_array
+
+try:
+    from .model_routing import ModelRouteStats
+except ImportError:
+    import sys
+    sys.path.append(os.path.dirname(__file__))
+    from model_routing import ModelRouteStats
 
 
 class TextContext(Enum):
@@ -65,10 +81,11 @@ class UnifiedLLMClient:
     Unified client for GPT-5.1, Claude Opus 4.5, and Gemini 3.0 Pro
 
     Handles model-specific parameter translation and three-tier fallback logic
-    with automatic retry on failures.
+    with automatic retry on failures. Requests that run past their model's p95 latency
+    are hedged with the next model in the chain (see _route_request()).
     """
 
-    def __init__(self, validator=None, logger=None, db_manager=None):
+    def __init__(self, validator=None, logger=None, db_manager=None, hedge_requests: bool = None):
         """
         Initialize the unified LLM client with all three models
 
@@ -76,10 +93,16 @@ class UnifiedLLMClient:
             validator: MetaphorValidator instance for two-stage validation
             logger: Logger instance for debugging and monitoring
             db_manager: DatabaseManager instance for logging
+            hedge_requests: Hedge slow requests with the next model (default: on unless
+                LLM_HEDGE_REQUESTS=0)
         """
         self.validator = validator
         self.logger = logger
         self.db_manager = db_manager
+        if hedge_requests is None:
+            hedge_requests = os.getenv("LLM_HEDGE_REQUESTS", "1") != "0"
+        self.hedge_requests = hedge_requests
+        self.route_stats = ModelRouteStats()
 
         # Initialize OpenAI client (GPT-5.1)
         self.openai_client = None
@@ -87,7 +110,8 @@ class UnifiedLLMClient:
             try:
                 openai_api_key = os.getenv("OPENAI_API_KEY")
                 if openai_api_key:
-                    self.openai_client = OpenAI(api_key=openai_api_key)
+                    self.openai_client = OpenAI(api_key=openai_api_key,
+                                                base_url=os.getenv("OPENAI_BASE_URL") or None)
                     if self.logger:
                         self.logger.info("[OK] OpenAI GPT-5.1 client initialized")
                 else:
@@ -149,7 +173,10 @@ class UnifiedLLMClient:
         self.gemini_success_count = 0
         self.gpt_fallback_count = 0
         self.claude_fallback_count = 0
+        self.hedge_count = 0
+        self.hedge_win_count = 0
         self.total_cost = 0.0
+        self._usage_lock = threading.Lock()   # Hedged calls update the counters from two threads
 
         # Token tracking by model
         self.gpt_tokens = {'input': 0, 'output': 0, 'reasoning': 0}
@@ -170,63 +197,15 @@ class UnifiedLLMClient:
         Returns:
             Tuple of (response_text, error, metadata)
         """
-        # Try GPT-5.1 first
-        if self.openai_client:
-            result, error, metadata = self._call_gpt51_with_prompt(custom_prompt)
-            if not error:
-                self.gpt_success_count += 1
-                metadata['primary_model'] = 'gpt-5.1'
-                metadata['fallback_used'] = False
-                metadata['total_cost'] = self.total_cost
-                return result, None, metadata
-            else:
-                if self.logger:
-                    self.logger.warning(f"[WARNING] GPT-5.1 failed: {error}. Trying Claude Opus 4.5...")
-                self.gpt_fallback_count += 1
-
-        # Fallback to Claude Opus 4.5
-        if self.anthropic_client:
-            result, error, metadata = self._call_claude_opus45_with_prompt(custom_prompt)
-            if not error:
-                self.claude_success_count += 1
-                metadata['primary_model'] = 'claude-opus-4-5'
-                metadata['fallback_used'] = True
-                metadata['fallback_reason'] = 'gpt_failure'
-                metadata['total_cost'] = self.total_cost
-                return result, None, metadata
-            else:
-                if self.logger:
-                    self.logger.warning(f"[WARNING] Claude Opus 4.5 failed: {error}. Trying Gemini 3.0 Pro...")
-                self.claude_fallback_count += 1
-
-        # Final fallback to Gemini 3.0 Pro
-        if self.gemini_client:
-            result, error, metadata = self._call_gemini3_pro_with_prompt(custom_prompt)
-            if not error:
-                self.gemini_success_count += 1
-                metadata['primary_model'] = self.gemini_model_name
-                metadata['fallback_used'] = True
-                metadata['fallback_reason'] = 'gpt_and_claude_failure'
-                metadata['total_cost'] = self.total_cost
-                return result, None, metadata
-            else:
-                if self.logger:
-                    self.logger.error(f"[ERROR] All three models failed. Last error: {error}")
-
-        # All models failed
-        return "[]", "All models failed", {
-            'error': True,
-            'fallback_used': True,
-            'all_models_failed': True,
-            'total_cost': self.total_cost
-        }
+        return self._route_request(custom_prompt, "", "")
 
     def analyze_figurative_language(self, hebrew_text: str, english_text: str,
                                    book: str = "", chapter: int = 0, chapter_context: str = None) -> Tuple[str, Optional[str], Dict]:
         """
         Analyze Hebrew text for figurative language using three-tier fallback chain
 
-        Tries models in order: GPT-5.1 → Claude Opus 4.5 → Gemini 3.0 Pro
+        Tries models in order: GPT-5.1 → Claude Opus 4.5 → Gemini 3.0 Pro (see _route_request()
+        for hedging of slow requests and demotion of failing models)
 
         Args:
             hebrew_text: Original Hebrew text
@@ -246,56 +225,152 @@ class UnifiedLLMClient:
         # Build the analysis prompt (shared across all models)
         prompt = self._build_prompt(hebrew_text, english_text, text_context, chapter_context)
 
-        # Try GPT-5.1 first
-        if self.openai_client:
-            result, error, metadata = self._call_gpt51(prompt, hebrew_text, english_text)
-            if not error:
-                self.gpt_success_count += 1
-                metadata['primary_model'] = 'gpt-5.1'
-                metadata['fallback_used'] = False
-                metadata['total_cost'] = self.total_cost
-                return result, None, metadata
-            else:
-                if self.logger:
-                    self.logger.warning(f"[WARNING] GPT-5.1 failed: {error}. Trying Claude Opus 4.5...")
-                self.gpt_fallback_count += 1
+        return self._route_request(prompt, hebrew_text, english_text)
 
-        # Fallback to Claude Opus 4.5
+    def _model_chain(self) -> List[Tuple[str, str, str]]:
+        """Available models in fallback order as (route key, display name, short name)"""
+        chain = []
+        if self.openai_client:
+            chain.append(('gpt-5.1', 'GPT-5.1', 'gpt'))
         if self.anthropic_client:
-            result, error, metadata = self._call_claude_opus45(prompt, hebrew_text, english_text)
-            if not error:
-                self.claude_success_count += 1
-                metadata['primary_model'] = 'claude-opus-4-5'
-                metadata['fallback_used'] = True
-                metadata['fallback_reason'] = 'gpt_failure'
-                metadata['total_cost'] = self.total_cost
-                return result, None, metadata
-            else:
-                if self.logger:
-                    self.logger.warning(f"[WARNING] Claude Opus 4.5 failed: {error}. Trying Gemini 3.0 Pro...")
-                self.claude_fallback_count += 1
-
-        # Final fallback to Gemini 3.0 Pro
+            chain.append(('claude-opus-4-5', 'Claude Opus 4.5', 'claude'))
         if self.gemini_client:
-            result, error, metadata = self._call_gemini3_pro(prompt, hebrew_text, english_text)
+            chain.append((self.gemini_model_name, 'Gemini 3.0 Pro', 'gemini'))
+        return chain
+
+    def _call_model(self, key: str, prompt: str, hebrew_text: str, english_text: str,
+                    cancel: threading.Event) -> Tuple[str, Optional[str], Dict]:
+        if key == 'gpt-5.1':
+            return self._call_gpt51(prompt, hebrew_text, english_text, cancel)
+        if key == 'claude-opus-4-5':
+            return self._call_claude_opus45(prompt, hebrew_text, english_text, cancel)
+        return self._call_gemini3_pro(prompt, hebrew_text, english_text, cancel)
+
+    def _route_request(self, prompt: str, hebrew_text: str, english_text: str) -> Tuple[str, Optional[str], Dict]:
+        """
+        Run a prompt through the fallback chain, hedging requests that run past their model's p95
+
+        Models are tried in chain order, with models whose recent error rate is high moved
+        to the end. Each call runs on its own thread; when the running call exceeds the p95
+        latency of its model (ModelRouteStats.hedge_delay()), the next model is started as
+        well and the first valid result wins. The losing call is cancelled: it makes no
+        further retries and its result is discarded (its tokens are still counted, as the
+        provider bills them). When a call fails and nothing else is running, the next model
+        is tried, as before.
+        """
+        chain = self._model_chain()
+        configured_primary = chain[0][0] if chain else None
+        order = self.route_stats.order([key for key, _, _ in chain])
+        chain.sort(key=lambda entry: order.index(entry[0]))
+
+        results = queue.Queue()
+        running = {}   # route key -> (display name, short name, cancel event, start time)
+        failed = []
+        next_index = 0
+        hedged = False
+        hedge_key = None   # Route key of the hedged launch
+        last_error = None
+
+        def run(key, cancel, start):
+            try:
+                outcome = self._call_model(key, prompt, hebrew_text, english_text, cancel)
+            except Exception as e:
+                outcome = ("[]", f"{key} error: {e}", {})
+            results.put((key, outcome, time.perf_counter() - start))
+
+        def launch(entry):
+            key, name, short = entry
+            cancel = threading.Event()
+            start = time.perf_counter()
+            running[key] = (name, short, cancel, start)
+            threading.Thread(target=run, args=(key, cancel, start), name=f"llm-{short}", daemon=True).start()
+
+        if chain:
+            launch(chain[0])
+            next_index = 1
+
+        while running:
+            timeout = None
+            if self.hedge_requests and not hedged and len(running) == 1 and next_index < len(chain):
+                key = next(iter(running))
+                delay = self.route_stats.hedge_delay(key)
+                if delay is not None:
+                    timeout = max(0.0, running[key][3] + delay - time.perf_counter())
+            try:
+                key, (result, error, metadata), elapsed = results.get(timeout=timeout)
+            except queue.Empty:
+                slow_name = next(iter(running.values()))[0]
+                hedged = True
+                with self._usage_lock:
+                    self.hedge_count += 1
+                if self.logger:
+                    self.logger.info(f"[HEDGE] {slow_name} exceeded its p95 latency ({delay:.0f}s). "
+                                     f"Also trying {chain[next_index][1]}...")
+                hedge_key = chain[next_index][0]
+                launch(chain[next_index])
+                next_index += 1
+                continue
+
+            name, short, _, _ = running.pop(key)
             if not error:
-                self.gemini_success_count += 1
-                metadata['primary_model'] = self.gemini_model_name
-                metadata['fallback_used'] = True
-                metadata['fallback_reason'] = 'gpt_and_claude_failure'
+                self.route_stats.record(key, elapsed, ok=True)
+                now = time.perf_counter()
+                for other_key, (_, _, other_cancel, other_start) in running.items():
+                    other_cancel.set()
+                    self.route_stats.record(other_key, now - other_start, ok=None)
+                winner_is_hedge = key == hedge_key
+                with self._usage_lock:
+                    setattr(self, f"{short}_success_count", getattr(self, f"{short}_success_count") + 1)
+                    if winner_is_hedge:
+                        self.hedge_win_count += 1
+                metadata['primary_model'] = key
+                metadata['fallback_used'] = key != configured_primary
+                if metadata['fallback_used']:
+                    if winner_is_hedge and not failed:
+                        metadata['fallback_reason'] = 'primary_slow'
+                    elif failed:
+                        metadata['fallback_reason'] = '_and_'.join(failed) + '_failure'
+                    else:
+                        metadata['fallback_reason'] = 'primary_unhealthy'
+                metadata['hedged'] = hedged
+                metadata['latency_seconds'] = round(elapsed, 2)
                 metadata['total_cost'] = self.total_cost
                 return result, None, metadata
-            else:
+
+            self.route_stats.record(key, elapsed, ok=False)
+            failed.append(short)
+            last_error = error
+            if short in ('gpt', 'claude'):
+                with self._usage_lock:
+                    setattr(self, f"{short}_fallback_count", getattr(self, f"{short}_fallback_count") + 1)
+            if running:
+                if self.logger:
+                    self.logger.warning(f"[WARNING] {name} failed: {error}. Waiting for {next(iter(running.values()))[0]}...")
+            elif next_index < len(chain):
                 if self.logger:
-                    self.logger.error(f"[ERROR] All three models failed. Last error: {error}")
+                    self.logger.warning(f"[WARNING] {name} failed: {error}. Trying {chain[next_index][1]}...")
+                launch(chain[next_index])
+                next_index += 1
+
+        if self.logger and last_error:
+            self.logger.error(f"[ERROR] All models failed. Last error: {last_error}")
 
         # All models failed
         return "[]", "All models failed", {
             'error': True,
             'fallback_used': True,
-            'all_models_failed': True
+            'all_models_failed': True,
+            'total_cost': self.total_cost
         }
 
+    @staticmethod
+    def _wait_for_retry(wait_time: float, cancel: threading.Event = None) -> bool:
+        """Sleep before a retry; False if the call was cancelled (it lost a hedge) meanwhile"""
+        if cancel is None:
+            time.sleep(wait_time)
+            return True
+        return not cancel.wait(wait_time)
+
     def _call_gpt51_with_prompt(self, custom_prompt: str) -> Tuple[str, Optional[str], Dict]:
         """Wrapper for custom prompt calls"""
         return self._call_gpt51(custom_prompt, "", "")
@@ -308,7 +383,8 @@ class UnifiedLLMClient:
         """Wrapper for custom prompt calls"""
         return self._call_gemini3_pro(custom_prompt, "", "")
 
-    def _call_gpt51(self, prompt: str, hebrew_text: str, english_text: str) -> Tuple[str, Optional[str], Dict]:
+    def _call_gpt51(self, prompt: str, hebrew_text: str, english_text: str,
+                    cancel: threading.Event = None) -> Tuple[str, Optional[str], Dict]:
         """
         Call GPT-5.1 with reasoning_effort="high"
 
@@ -336,14 +412,14 @@ class UnifiedLLMClient:
                     metadata['reasoning_tokens'] = getattr(response.usage, 'reasoning_tokens', 0)
 
                     # Update totals
-                    self.gpt_tokens['input'] += metadata['input_tokens']
-                    self.gpt_tokens['output'] += metadata['output_tokens']
-                    self.gpt_tokens['reasoning'] += metadata['reasoning_tokens']
-
                     # Calculate cost (from plan: $1.25/M input, $10/M output)
                     cost = (metadata['input_tokens'] / 1_000_000 * 1.25 +
                            metadata['output_tokens'] / 1_000_000 * 10.0)
-                    self.total_cost += cost
+                    with self._usage_lock:
+                        self.gpt_tokens['input'] += metadata['input_tokens']
+                        self.gpt_tokens['output'] += metadata['output_tokens']
+                        self.gpt_tokens['reasoning'] += metadata['reasoning_tokens']
+                        self.total_cost += cost
                     metadata['cost'] = cost
 
                 # Extract response text
@@ -369,14 +445,15 @@ class UnifiedLLMClient:
                         wait_time = (2 ** attempt) * 5
                         if self.logger:
                             self.logger.info(f"Rate limit hit. Retrying in {wait_time}s... (Attempt {attempt + 1}/{max_retries})")
-                        time.sleep(wait_time)
-                        continue
+                        if self._wait_for_retry(wait_time, cancel):
+                            continue
 
                 return "[]", f"GPT-5.1 error: {error_msg}", {'retries': attempt + 1}
 
         return "[]", "GPT-5.1 failed after retries", {'retries': max_retries}
 
-    def _call_claude_opus45(self, prompt: str, hebrew_text: str, english_text: str) -> Tuple[str, Optional[str], Dict]:
+    def _call_claude_opus45(self, prompt: str, hebrew_text: str, english_text: str,
+                            cancel: threading.Event = None) -> Tuple[str, Optional[str], Dict]:
         """
         Call Claude Opus 4.5 with effort="high"
 
@@ -402,14 +479,14 @@ class UnifiedLLMClient:
                     metadata['output_tokens'] = getattr(response.usage, 'output_tokens', 0)
 
                     # Update totals
-                    self.claude_tokens['input'] += metadata['input_tokens']
-                    self.claude_tokens['output'] += metadata['output_tokens']
-
                     # Calculate cost (from plan: $5/M input, $25/M output, $25/M thinking)
                     # Note: thinking tokens may be reported separately in future SDK versions
                     cost = (metadata['input_tokens'] / 1_000_000 * 5.0 +
                            metadata['output_tokens'] / 1_000_000 * 25.0)
-                    self.total_cost += cost
+                    with self._usage_lock:
+                        self.claude_tokens['input'] += metadata['input_tokens']
+                        self.claude_tokens['output'] += metadata['output_tokens']
+                        self.total_cost += cost
                     metadata['cost'] = cost
 
                 # Extract response text
@@ -435,14 +512,15 @@ class UnifiedLLMClient:
                         wait_time = (2 ** attempt) * 5
                         if self.logger:
                             self.logger.info(f"Rate limit hit. Retrying in {wait_time}s... (Attempt {attempt + 1}/{max_retries})")
-                        time.sleep(wait_time)
-                        continue
+                        if self._wait_for_retry(wait_time, cancel):
+                            continue
 
                 return "[]", f"Claude Opus 4.5 error: {error_msg}", {'retries': attempt + 1}
 
         return "[]", "Claude Opus 4.5 failed after retries", {'retries': max_retries}
 
-    def _call_gemini3_pro(self, prompt: str, hebrew_text: str, english_text: str) -> Tuple[str, Optional[str], Dict]:
+    def _call_gemini3_pro(self, prompt: str, hebrew_text: str, english_text: str,
+                          cancel: threading.Event = None) -> Tuple[str, Optional[str], Dict]:
         """
         Call Gemini 3.0 Pro with thinking_level="high"
 
@@ -473,14 +551,14 @@ class UnifiedLLMClient:
                     metadata['output_tokens'] = getattr(response.usage_metadata, 'candidates_token_count', 0)
 
                     # Update totals
-                    self.gemini_tokens['input'] += metadata['input_tokens']
-                    self.gemini_tokens['output'] += metadata['output_tokens']
-
                     # Note: Gemini pricing varies by region/tier
                     # Using approximate values - adjust based on actual pricing
                     cost = (metadata['input_tokens'] / 1_000_000 * 0.50 +
                            metadata['output_tokens'] / 1_000_000 * 2.0)
-                    self.total_cost += cost
+                    with self._usage_lock:
+                        self.gemini_tokens['input'] += metadata['input_tokens']
+                        self.gemini_tokens['output'] += metadata['output_tokens']
+                        self.total_cost += cost
                     metadata['cost'] = cost
 
                 # Check for safety restrictions
@@ -513,8 +591,8 @@ class UnifiedLLMClient:
                         wait_time = (2 ** attempt) * 5
                         if self.logger:
                             self.logger.info(f"Rate limit hit. Retrying in {wait_time}s... (Attempt {attempt + 1}/{max_retries})")
-                        time.sleep(wait_time)
-                        continue
+                        if self._wait_for_retry(wait_time, cancel):
+                            continue
 
                 return "[]", f"Gemini 3.0 Pro error: {error_msg}", {'retries': attempt + 1}
 
@@ -792,7 +870,7 @@ Analysis:"""
 
         # Try to parse JSON
         try:
-            data = json.loads(json_string)
+            data = json.loads(json_string, strict=False)
 
             if not isinstance(data, list):
                 return "[]", [], deliberation, truncation_info
@@ -839,68 +917,17 @@ Analysis:"""
 
     def _extract_json_array(self, response_text: str) -> str:
         """
-        Extract JSON array from response text
+        Extract the JSON array from response text with the shared recovering scanner
 
-        FIXED: Now finds the LAST/LARGEST array with content, not the first empty array
+        Prefers the last array of objects (fenced first), repaired if truncated or
+        comma-damaged; "[]" if the response holds none.
         """
-
-        # Try to find JSON in code block first
-        json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response_text)
-        if json_match:
-            return json_match.group(1).strip()
-
-        # Look for JSON OUTPUT section
-        json_output_match = re.search(r'JSON OUTPUT:\s*([\s\S]*?)(?:\s*$)', response_text, re.IGNORECASE)
-        if json_output_match:
-            json_section = json_output_match.group(1).strip()
-            array_match = re.search(r'(\[[\s\S]*\])', json_section)  # Changed to greedy
-            if array_match:
-                return array_match.group(1).strip()
-
-        # BUG FIX #2: Use proper bracket matching to find complete arrays
-        # Find ALL opening brackets, then match each with proper closing bracket
-        def find_complete_arrays(text):
-            """Find all complete JSON arrays using bracket counting"""
-            arrays = []
-            i = 0
-            while i < len(text):
-                if text[i] == '[':
-                    # Found opening bracket, find matching closing bracket
-                    bracket_count = 1
-                    j = i + 1
-                    while j < len(text) and bracket_count > 0:
-                        if text[j] == '[':
-                            bracket_count += 1
-                        elif text[j] == ']':
-                            bracket_count -= 1
-                        j += 1
-
-                    if bracket_count == 0:  # Found complete array
-                        array_text = text[i:j]
-                        arrays.append((i, array_text))
-                i += 1
-            return arrays
-
-        all_arrays = find_complete_arrays(response_text)
-
-        if all_arrays:
-            # Separate arrays with objects from empty/simple arrays
-            content_arrays = [(pos, arr) for pos, arr in all_arrays if '{' in arr and '}' in arr]
-
-            # Prefer the LAST array with objects (usually the final JSON output)
-            if content_arrays:
-                return content_arrays[-1][1].strip()
-
-            # If no content arrays, check for explicit empty array
-            empty_arrays = [(pos, arr) for pos, arr in all_arrays if arr.strip() == '[]']
-            if empty_arrays:
-                return "[]"
-
-        # Check for empty array or "no figurative language" statement
-        if '[]' in response_text or 'no figurative language' in response_text.lower():
+        recovered = recover_json_array(response_text)
+        if recovered.value is None:
             return "[]"
-
-        return "[]"
+        if self.logger and set(recovered.recoveries) - {RECOVERY_CODE_FENCE}:
+            self.logger.warning(f"JSON recovered from response ({', '.join(recovered.recoveries)})")
+        return recovered.text
 
     def _is_restriction_reason(self, finish_reason) -> bool:
         """Check if finish reason indicates content restriction (Gemini-specific)"""
@@ -926,7 +953,7 @@ Analysis:"""
             # Strip diacritics from Hebrew figurative text if it exists
             hebrew_figurative_stripped = None
             if item.get('hebrew_text'):
-                hebrew_figurative_stripped = HebrewTextProcessor.strip_diacritics(item.get('hebrew_text'))
+                hebrew_figurative_stripped = get_transform_memo().strip_diacritics(item.get('hebrew_text'))
 
             # Prepare figurative data
             figurative_data = {
@@ -1023,6 +1050,8 @@ Analysis:"""
             'gpt_success_rate': self.gpt_success_count / max(1, self.request_count),
             'claude_success_rate': self.claude_success_count / max(1, self.request_count),
             'gemini_success_rate': self.gemini_success_count / max(1, self.request_count),
+            'hedge_count': self.hedge_count,
+            'hedge_win_count': self.hedge_win_count,
             'total_cost': self.total_cost,
             'gpt_tokens': self.gpt_tokens.copy(),
             'claude_tokens': self.claude_tokens.copy(),
@@ -1031,7 +1060,8 @@ Analysis:"""
                 'gpt-5.1': self.openai_client is not None,
                 'claude-opus-4.5': self.anthropic_client is not None,
                 'gemini-3.0-pro': self.gemini_client is not None
-            }
+            },
+            'route_stats': self.route_stats.get_stats()
         }
 
     def test_api_connections(self) -> Dict:
@@ -1,4 +1,5 @@
 """Database management module"""
 from .db_manager import DatabaseManager
+from .records import InstanceRecord, ValidationRecord, VerseRecord
 
-__all__ = ['DatabaseManager']
\ No newline at end of file
+__all__ = ['DatabaseManager', 'InstanceRecord', 'ValidationRecord', 'VerseRecord']
@@ -8,8 +8,58 @@ import logging
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
+from .records import (
+    FIGURATIVE_FLAG_COLUMNS, VALIDATION_DECISION_COLUMNS, VALIDATION_FINAL_COLUMNS,
+    InstanceRecord, ValidationRecord, VerseRecord,
+)
+
 logger = logging.getLogger(__name__)
 
+VERSE_INSERT_SQL = '''
+    INSERT INTO verses (reference, book, chapter, verse, hebrew_text, hebrew_text_stripped, hebrew_text_non_sacred, english_text, english_text_clean, english_text_clean_non_sacred, english_text_non_sacred, word_count, llm_restriction_error, figurative_detection_deliberation, figurative_detection_deliberation_non_sacred, instances_detected, instances_recovered, instances_lost_to_truncation, truncation_occurred, both_models_truncated, model_used)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+FIGURATIVE_INSERT_SQL = '''
+    INSERT INTO figurative_language
+    (verse_id, figurative_language, simile, metaphor, personification, idiom, hyperbole, metonymy, other,
+     final_figurative_language, final_simile, final_metaphor, final_personification, final_idiom,
+     final_hyperbole, final_metonymy, final_other,
+     target, vehicle, ground, posture,
+     confidence, figurative_text, figurative_text_non_sacred, figurative_text_in_hebrew, figurative_text_in_hebrew_stripped, figurative_text_in_hebrew_non_sacred,
+     explanation, speaker, purpose,
+     tagging_analysis_deliberation, model_used)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+VALIDATION_UPDATE_SQL = '''
+    UPDATE figurative_language
+    SET validation_decision_simile = ?, validation_decision_metaphor = ?, validation_decision_personification = ?,
+        validation_decision_idiom = ?, validation_decision_hyperbole = ?, validation_decision_metonymy = ?, validation_decision_other = ?,
+        validation_reason_simile = ?, validation_reason_metaphor = ?, validation_reason_personification = ?,
+        validation_reason_idiom = ?, validation_reason_hyperbole = ?, validation_reason_metonymy = ?, validation_reason_other = ?,
+        final_figurative_language = ?, final_simile = ?, final_metaphor = ?, final_personification = ?,
+        final_idiom = ?, final_hyperbole = ?, final_metonymy = ?, final_other = ?,
+        validation_response = ?, validation_error = ?
+    WHERE id = ?
+'''
+
+# Detection columns of chapter_token_usage (a re-recorded chapter replaces its row)
+CHAPTER_TOKEN_USAGE_COLUMNS = (
+    'book', 'chapter', 'verses', 'token_method', 'detection_calls',
+    'estimated_input_tokens', 'estimated_output_tokens',
+    'input_tokens', 'output_tokens', 'reasoning_tokens', 'cached_input_tokens', 'usage_source', 'detection_cost',
+)
+CHAPTER_TOKEN_USAGE_SQL = f'''
+    INSERT OR REPLACE INTO chapter_token_usage ({', '.join(CHAPTER_TOKEN_USAGE_COLUMNS)})
+    VALUES ({', '.join('?' for _ in CHAPTER_TOKEN_USAGE_COLUMNS)})
+'''
+CHAPTER_VALIDATION_USAGE_SQL = '''
+    UPDATE chapter_token_usage
+    SET validation_input_tokens = ?, validation_output_tokens = ?, validation_reasoning_tokens = ?,
+        validation_cost = ?
+    WHERE book = ? AND chapter = ?
+'''
+
 
 class DatabaseManager:
     """SQLite database manager for Hebrew figurative language data"""
@@ -46,6 +96,7 @@ class DatabaseManager:
         if drop_existing:
             self.cursor.execute('DROP TABLE IF EXISTS figurative_language')
             self.cursor.execute('DROP TABLE IF EXISTS verses')
+            self.cursor.execute('DROP TABLE IF EXISTS chapter_token_usage')
 
         # Create verses table
         self.cursor.execute('''
@@ -160,6 +211,31 @@ class DatabaseManager:
         self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_figurative_purpose ON figurative_language (purpose)')
         self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_figurative_model_used ON figurative_language (model_used)')
 
+        # Per-chapter token accounting: local estimates (uncalibrated) next to the usage the API reported
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS chapter_token_usage (
+                book TEXT NOT NULL,
+                chapter INTEGER NOT NULL,
+                verses INTEGER,
+                token_method TEXT,  -- 'tiktoken:o200k_base' or 'heuristic' (estimated_* columns)
+                detection_calls INTEGER,
+                estimated_input_tokens INTEGER,
+                estimated_output_tokens INTEGER,
+                input_tokens INTEGER,
+                output_tokens INTEGER,  -- includes reasoning_tokens
+                reasoning_tokens INTEGER,
+                cached_input_tokens INTEGER,
+                usage_source TEXT CHECK(usage_source IN ('reported', 'partial', 'estimated')),
+                detection_cost REAL,
+                validation_input_tokens INTEGER,
+                validation_output_tokens INTEGER,
+                validation_reasoning_tokens INTEGER,
+                validation_cost REAL,
+                recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (book, chapter)
+            )
+        ''')
+
         self.conn.commit()
 
     def insert_verse(self, verse_data: Dict) -> int:
@@ -552,91 +628,7 @@ class DatabaseManager:
             - final_fields_consistency: Whether final_* fields match validation decisions
         """
         try:
-            # Get total instances and validation coverage
-            self.cursor.execute("""
-                SELECT
-                    COUNT(*) as total_instances,
-                    COUNT(CASE WHEN fl.validation_response IS NOT NULL AND fl.validation_response != '' THEN 1 END) as instances_with_validation,
-                    COUNT(CASE WHEN
-                        fl.validation_decision_simile IS NOT NULL OR
-                        fl.validation_decision_metaphor IS NOT NULL OR
-                        fl.validation_decision_personification IS NOT NULL OR
-                        fl.validation_decision_idiom IS NOT NULL OR
-                        fl.validation_decision_hyperbole IS NOT NULL OR
-                        fl.validation_decision_metonymy IS NOT NULL OR
-                        fl.validation_decision_other IS NOT NULL
-                    THEN 1 END) as instances_with_decisions,
-                    COUNT(CASE WHEN
-                        fl.final_figurative_language IS NOT NULL AND fl.final_figurative_language != ''
-                    THEN 1 END) as instances_with_final_fields
-                FROM figurative_language fl
-                JOIN verses v ON fl.verse_id = v.id
-                WHERE v.book = ? AND v.chapter = ?
-            """, (book_name, chapter))
-
-            result = self.cursor.fetchone()
-
-            # Ensure we have a valid result
-            if not result:
-                logger.warning(f"No instances found for {book_name} chapter {chapter}")
-                return {
-                    'book': book_name,
-                    'chapter': chapter,
-                    'total_instances': 0,
-                    'instances_with_validation': 0,
-                    'instances_with_decisions': 0,
-                    'instances_with_final_fields': 0,
-                    'validation_coverage_rate': 100.0,
-                    'decision_coverage_rate': 100.0,
-                    'final_fields_coverage_rate': 100.0,
-                    'inconsistent_final_fields': 0,
-                    'needs_recovery': False
-                }
-
-            total_instances = result['total_instances']
-            instances_with_validation = result['instances_with_validation']
-            instances_with_decisions = result['instances_with_decisions']
-            instances_with_final_fields = result['instances_with_final_fields']
-
-            # Calculate coverage rates
-            validation_coverage_rate = (instances_with_validation / total_instances * 100) if total_instances > 0 else 100
-            decision_coverage_rate = (instances_with_decisions / total_instances * 100) if total_instances > 0 else 100
-            final_fields_coverage_rate = (instances_with_final_fields / total_instances * 100) if total_instances > 0 else 100
-
-            # Check for final fields consistency issues
-            self.cursor.execute("""
-                SELECT COUNT(*) as inconsistent_final_fields
-                FROM figurative_language fl
-                JOIN verses v ON fl.verse_id = v.id
-                WHERE v.book = ? AND v.chapter = ?
-                AND (
-                    (fl.validation_response IS NOT NULL AND fl.validation_response != '') AND
-                    (fl.final_figurative_language IS NULL OR fl.final_figurative_language = '')
-                )
-            """, (book_name, chapter))
-
-            inconsistent_final = self.cursor.fetchone()['inconsistent_final_fields']
-
-            verification_results = {
-                'book': book_name,
-                'chapter': chapter,
-                'total_instances': total_instances,
-                'instances_with_validation': instances_with_validation,
-                'instances_with_decisions': instances_with_decisions,
-                'instances_with_final_fields': instances_with_final_fields,
-                'validation_coverage_rate': validation_coverage_rate,
-                'decision_coverage_rate': decision_coverage_rate,
-                'final_fields_coverage_rate': final_fields_coverage_rate,
-                'inconsistent_final_fields': inconsistent_final,
-                'needs_recovery': (
-                    validation_coverage_rate < 95.0 or
-                    decision_coverage_rate < 95.0 or
-                    final_fields_coverage_rate < 95.0 or
-                    inconsistent_final > 0
-                )
-            }
-
-            return verification_results
+            return self.verify_validation_data_for_chapters(book_name, [chapter])[(book_name, chapter)]
 
         except Exception as e:
             # Return error information
@@ -647,6 +639,107 @@ class DatabaseManager:
                 'needs_recovery': True  # Assume recovery needed if we can't verify
             }
 
+    def verify_validation_data_for_chapters(self, book_name: Optional[str] = None,
+                                            chapters: Optional[List[int]] = None) -> Dict[Tuple[str, int], Dict]:
+        """
+        Verify validation data coverage for many chapters in one aggregated pass.
+
+        Coverage, decision and final-field consistency counts for every chapter come from
+        a single GROUP BY query instead of two JOIN queries per chapter.
+
+        Args:
+            book_name: Only this book (default: all books)
+            chapters: Only these chapters of book_name; each one gets an entry even if it
+                has no instances (requires book_name)
+
+        Returns:
+            {(book, chapter): verification dict} with the same fields as
+            verify_validation_data_for_chapter(), ordered by book and chapter
+        """
+        if chapters is not None and book_name is None:
+            raise ValueError("chapters filter requires book_name")
+
+        conditions, params = [], []
+        if book_name is not None:
+            conditions.append("v.book = ?")
+            params.append(book_name)
+        if chapters is not None:
+            chapters = sorted(set(chapters))
+            conditions.append(f"v.chapter IN ({', '.join('?' for _ in chapters)})")
+            params.extend(chapters)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        cursor = self.conn.execute(f"""
+            SELECT
+                v.book,
+                v.chapter,
+                COUNT(*) as total_instances,
+                COUNT(CASE WHEN fl.validation_response IS NOT NULL AND fl.validation_response != '' THEN 1 END) as instances_with_validation,
+                COUNT(CASE WHEN
+                    fl.validation_decision_simile IS NOT NULL OR
+                    fl.validation_decision_metaphor IS NOT NULL OR
+                    fl.validation_decision_personification IS NOT NULL OR
+                    fl.validation_decision_idiom IS NOT NULL OR
+                    fl.validation_decision_hyperbole IS NOT NULL OR
+                    fl.validation_decision_metonymy IS NOT NULL OR
+                    fl.validation_decision_other IS NOT NULL
+                THEN 1 END) as instances_with_decisions,
+                COUNT(CASE WHEN
+                    fl.final_figurative_language IS NOT NULL AND fl.final_figurative_language != ''
+                THEN 1 END) as instances_with_final_fields,
+                COUNT(CASE WHEN
+                    (fl.validation_response IS NOT NULL AND fl.validation_response != '') AND
+                    (fl.final_figurative_language IS NULL OR fl.final_figurative_language = '')
+                THEN 1 END) as inconsistent_final_fields
+            FROM figurative_language fl
+            JOIN verses v ON fl.verse_id = v.id
+            {where}
+            GROUP BY v.book, v.chapter
+            ORDER BY v.book, v.chapter
+        """, params)
+
+        results = {}
+        for row in cursor:
+            results[(row[0], row[1])] = self._build_verification_result(*row)
+
+        # Requested chapters with no instances are trivially complete
+        for chapter in chapters or []:
+            if (book_name, chapter) not in results:
+                results[(book_name, chapter)] = self._build_verification_result(book_name, chapter, 0, 0, 0, 0, 0)
+        if chapters:
+            results = dict(sorted(results.items()))
+
+        return results
+
+    @staticmethod
+    def _build_verification_result(book_name: str, chapter: int, total_instances: int,
+                                   instances_with_validation: int, instances_with_decisions: int,
+                                   instances_with_final_fields: int, inconsistent_final: int) -> Dict:
+        """Coverage rates and recovery flag for one chapter's validation counts"""
+        # Calculate coverage rates
+        validation_coverage_rate = (instances_with_validation / total_instances * 100) if total_instances > 0 else 100
+        decision_coverage_rate = (instances_with_decisions / total_instances * 100) if total_instances > 0 else 100
+        final_fields_coverage_rate = (instances_with_final_fields / total_instances * 100) if total_instances > 0 else 100
+
+        return {
+            'book': book_name,
+            'chapter': chapter,
+            'total_instances': total_instances,
+            'instances_with_validation': instances_with_validation,
+            'instances_with_decisions': instances_with_decisions,
+            'instances_with_final_fields': instances_with_final_fields,
+            'validation_coverage_rate': validation_coverage_rate,
+            'decision_coverage_rate': decision_coverage_rate,
+            'final_fields_coverage_rate': final_fields_coverage_rate,
+            'inconsistent_final_fields': inconsistent_final,
+            'needs_recovery': (
+                validation_coverage_rate < 95.0 or
+                decision_coverage_rate < 95.0 or
+                final_fields_coverage_rate < 95.0 or
+                inconsistent_final > 0
+            )
+        }
+
     def get_statistics(self) -> Dict:
         """Get processing statistics"""
         # Count records
@@ -712,184 +805,251 @@ class DatabaseManager:
 
         return self.cursor.fetchall()
 
+    @staticmethod
+    def _verse_row(verse_data: Dict) -> Tuple:
+        """Build the VERSE_INSERT_SQL parameter tuple for a prepared verse dict"""
+        return (
+            verse_data['reference'],
+            verse_data['book'],
+            verse_data['chapter'],
+            verse_data['verse'],
+            verse_data['hebrew'],
+            verse_data.get('hebrew_stripped'),
+            verse_data.get('hebrew_text_non_sacred'),
+            verse_data['english'],
+            verse_data.get('english_text_clean'),
+            verse_data.get('english_text_clean_non_sacred'),
+            verse_data.get('english_text_non_sacred'),
+            verse_data['word_count'],
+            verse_data.get('llm_restriction_error'),
+            verse_data.get('figurative_detection_deliberation'),
+            verse_data.get('figurative_detection_deliberation_non_sacred'),
+            verse_data.get('instances_detected'),
+            verse_data.get('instances_recovered'),
+            verse_data.get('instances_lost_to_truncation'),
+            verse_data.get('truncation_occurred', 'no'),
+            verse_data.get('both_models_truncated', 'no'),
+            verse_data.get('model_used', 'gemini-2.5-flash')
+        )
+
+    @staticmethod
+    def _figurative_row(verse_id: int, figurative_data: Dict) -> Tuple:
+        """Build the FIGURATIVE_INSERT_SQL parameter tuple for an instance dict"""
+        return (
+            verse_id,
+            figurative_data.get('figurative_language', 'no'),
+            figurative_data.get('simile', 'no'),
+            figurative_data.get('metaphor', 'no'),
+            figurative_data.get('personification', 'no'),
+            figurative_data.get('idiom', 'no'),
+            figurative_data.get('hyperbole', 'no'),
+            figurative_data.get('metonymy', 'no'),
+            figurative_data.get('other', 'no'),
+            figurative_data.get('final_figurative_language', 'no'),
+            figurative_data.get('final_simile', 'no'),
+            figurative_data.get('final_metaphor', 'no'),
+            figurative_data.get('final_personification', 'no'),
+            figurative_data.get('final_idiom', 'no'),
+            figurative_data.get('final_hyperbole', 'no'),
+            figurative_data.get('final_metonymy', 'no'),
+            figurative_data.get('final_other', 'no'),
+            figurative_data.get('target', '[]'),
+            figurative_data.get('vehicle', '[]'),
+            figurative_data.get('ground', '[]'),
+            figurative_data.get('posture', '[]'),
+            figurative_data['confidence'],
+            figurative_data.get('figurative_text'),
+            figurative_data.get('figurative_text_non_sacred'),
+            figurative_data.get('figurative_text_in_hebrew'),
+            figurative_data.get('figurative_text_in_hebrew_stripped'),
+            figurative_data.get('figurative_text_in_hebrew_non_sacred'),
+            figurative_data.get('explanation'),
+            figurative_data.get('speaker'),
+            figurative_data.get('purpose'),
+            figurative_data.get('tagging_analysis_deliberation', ''),
+            figurative_data.get('model_used', 'gemini-2.5-flash')
+        )
+
+    def _insert_rows_contiguous(self, sql: str, rows: List[Tuple]) -> List[int]:
+        """executemany an INSERT and return the new row IDs.
+
+        Both tables use INTEGER PRIMARY KEY AUTOINCREMENT and this connection holds the
+        write lock for the whole statement, so the new IDs are the contiguous range ending
+        at last_insert_rowid() (cursor.lastrowid is not set by executemany).
+        """
+        if not rows:
+            return []
+        self.cursor.executemany(sql, rows)
+        if self.cursor.rowcount != len(rows):
+            raise sqlite3.DatabaseError(f"executemany inserted {self.cursor.rowcount} of {len(rows)} rows")
+        last_id = self.cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    @staticmethod
+    def _sanitize_instance_record(record: InstanceRecord) -> InstanceRecord:
+        """_sanitize_figurative_data for an InstanceRecord, applied in place"""
+        for field in FIGURATIVE_FLAG_COLUMNS:
+            value = getattr(record, field)
+            if value != 'yes' and value != 'no':
+                setattr(record, field, 'yes' if str(value).strip().lower() == 'yes' else 'no')
+        if not isinstance(record.confidence, float):
+            try:
+                record.confidence = float(record.confidence)
+            except (ValueError, TypeError):
+                record.confidence = 0.0
+        return record
+
+    def insert_chapter_bulk(self, verses: List[VerseRecord],
+                            instances: List[Tuple[int, InstanceRecord]]) -> Tuple[List[int], List[Tuple[int, int, InstanceRecord]]]:
+        """Insert a chapter's verses and instances set-based, without committing.
+
+        The instance records are sanitized in place and get their verse_id and id set;
+        the same objects are returned, so callers can hand them straight to validation.
+
+        Args:
+            verses: VerseRecords for the chapter
+            instances: List of (verse_index, InstanceRecord) tuples
+
+        Returns:
+            Tuple of (verse_ids, instances) where instances is a list of
+            (verse_index, figurative_language_id, record) in verse order
+        """
+        verse_ids = self._insert_rows_contiguous(VERSE_INSERT_SQL, [v.row() for v in verses])
+
+        # Group instances by verse once, keeping per-verse order
+        instances_by_verse = {}
+        for verse_idx, record in instances:
+            instances_by_verse.setdefault(verse_idx, []).append(record)
+        ordered = [(verse_idx, record)
+                   for verse_idx in sorted(instances_by_verse)
+                   for record in instances_by_verse[verse_idx]]
+
+        for verse_idx, record in ordered:
+            record.verse_id = verse_ids[verse_idx]
+            self._sanitize_instance_record(record)
+
+        self.cursor.execute('SAVEPOINT bulk_figurative_language')
+        try:
+            try:
+                instance_ids = self._insert_rows_contiguous(FIGURATIVE_INSERT_SQL, [record.row() for _, record in ordered])
+            except sqlite3.IntegrityError as e:
+                # Only a constraint violation needs the per-row path (with its minimal-data recovery)
+                logger.warning(f"Bulk instance insert failed ({e}) - falling back to per-row inserts")
+                self.cursor.execute('ROLLBACK TO bulk_figurative_language')
+                instance_ids = [self.insert_figurative_language(record.verse_id, record.to_dict())
+                                for _, record in ordered]
+        except BaseException:
+            # Any other error: undo the instances and close the savepoint before the caller sees it
+            self.cursor.execute('ROLLBACK TO bulk_figurative_language')
+            self.cursor.execute('RELEASE bulk_figurative_language')
+            raise
+        self.cursor.execute('RELEASE bulk_figurative_language')
+
+        for (_, record), instance_id in zip(ordered, instance_ids):
+            record.id = instance_id
+        return verse_ids, [(verse_idx, record.id, record) for verse_idx, record in ordered]
+
     def batch_insert_verses(self, verse_data_list: List[Dict]) -> List[int]:
         """Batch insert multiple verses and return their IDs"""
         if not verse_data_list:
             return []
 
-        verse_ids = []
         try:
-            # Use executemany for efficient batch insert
-            verse_tuples = []
-            for verse_data in verse_data_list:
-                verse_tuples.append((
-                    verse_data['reference'],
-                    verse_data['book'],
-                    verse_data['chapter'],
-                    verse_data['verse'],
-                    verse_data['hebrew'],
-                    verse_data.get('hebrew_stripped'),
-                    verse_data.get('hebrew_text_non_sacred'),
-                    verse_data['english'],
-                    verse_data.get('english_text_clean'),
-                    verse_data.get('english_text_clean_non_sacred'),
-                    verse_data.get('english_text_non_sacred'),
-                    verse_data['word_count'],
-                    verse_data.get('llm_restriction_error'),
-                    verse_data.get('figurative_detection_deliberation'),
-                    verse_data.get('figurative_detection_deliberation_non_sacred'),
-                    verse_data.get('instances_detected'),
-                    verse_data.get('instances_recovered'),
-                    verse_data.get('instances_lost_to_truncation'),
-                    verse_data.get('truncation_occurred', 'no'),
-                    verse_data.get('both_models_truncated', 'no'),
-                    verse_data.get('model_used', 'gemini-2.5-flash')
-                ))
-
-            self.cursor.executemany('''
-                INSERT INTO verses (reference, book, chapter, verse, hebrew_text, hebrew_text_stripped, hebrew_text_non_sacred, english_text, english_text_clean, english_text_clean_non_sacred, english_text_non_sacred, word_count, llm_restriction_error, figurative_detection_deliberation, figurative_detection_deliberation_non_sacred, instances_detected, instances_recovered, instances_lost_to_truncation, truncation_occurred, both_models_truncated, model_used)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', verse_tuples)
-
-            # Get the IDs of inserted verses
-            for verse_data in verse_data_list:
-                self.cursor.execute('SELECT id FROM verses WHERE reference = ?', (verse_data['reference'],))
-                result = self.cursor.fetchone()
-                if result:
-                    verse_ids.append(result[0])
-
+            return self._insert_rows_contiguous(VERSE_INSERT_SQL, [self._verse_row(v) for v in verse_data_list])
         except Exception as e:
             # Fallback to individual inserts if batch fails
-            verse_ids = []
-            for verse_data in verse_data_list:
-                verse_id = self.insert_verse(verse_data)
-                verse_ids.append(verse_id)
-
-        return verse_ids
+            return [self.insert_verse(verse_data) for verse_data in verse_data_list]
 
     def batch_insert_figurative_language(self, instance_data_list: List[Tuple[int, Dict]]) -> List[int]:
         """Batch insert multiple figurative language instances and return their IDs"""
         if not instance_data_list:
             return []
 
-        instance_ids = []
         try:
-            # Prepare tuples for batch insert
-            instance_tuples = []
-            for verse_id, figurative_data in instance_data_list:
-                instance_tuples.append((
-                    verse_id,
-                    figurative_data.get('figurative_language', 'no'),
-                    figurative_data.get('simile', 'no'),
-                    figurative_data.get('metaphor', 'no'),
-                    figurative_data.get('personification', 'no'),
-                    figurative_data.get('idiom', 'no'),
-                    figurative_data.get('hyperbole', 'no'),
-                    figurative_data.get('metonymy', 'no'),
-                    figurative_data.get('other', 'no'),
-                    figurative_data.get('final_figurative_language', 'no'),
-                    figurative_data.get('final_simile', 'no'),
-                    figurative_data.get('final_metaphor', 'no'),
-                    figurative_data.get('final_personification', 'no'),
-                    figurative_data.get('final_idiom', 'no'),
-                    figurative_data.get('final_hyperbole', 'no'),
-                    figurative_data.get('final_metonymy', 'no'),
-                    figurative_data.get('final_other', 'no'),
-                    figurative_data.get('target', '[]'),
-                    figurative_data.get('vehicle', '[]'),
-                    figurative_data.get('ground', '[]'),
-                    figurative_data.get('posture', '[]'),
-                    figurative_data['confidence'],
-                    figurative_data.get('figurative_text'),
-                    figurative_data.get('figurative_text_non_sacred'),
-                    figurative_data.get('figurative_text_in_hebrew'),
-                    figurative_data.get('figurative_text_in_hebrew_stripped'),
-                    figurative_data.get('figurative_text_in_hebrew_non_sacred'),
-                    figurative_data.get('explanation'),
-                    figurative_data.get('speaker'),
-                    figurative_data.get('purpose'),
-                    figurative_data.get('tagging_analysis_deliberation', ''),
-                    figurative_data.get('model_used', 'gemini-2.5-flash')
-                ))
-
-            self.cursor.executemany('''
-                INSERT INTO figurative_language
-                (verse_id, figurative_language, simile, metaphor, personification, idiom, hyperbole, metonymy, other,
-                 final_figurative_language, final_simile, final_metaphor, final_personification, final_idiom,
-                 final_hyperbole, final_metonymy, final_other,
-                 target, vehicle, ground, posture,
-                 confidence, figurative_text, figurative_text_non_sacred, figurative_text_in_hebrew, figurative_text_in_hebrew_stripped, figurative_text_in_hebrew_non_sacred,
-                 explanation, speaker, purpose,
-                 tagging_analysis_deliberation, model_used)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', instance_tuples)
-
-            # Get the IDs of inserted instances
-            start_id = self.cursor.lastrowid - len(instance_tuples) + 1
-            instance_ids = list(range(start_id, start_id + len(instance_tuples)))
-
+            return self._insert_rows_contiguous(
+                FIGURATIVE_INSERT_SQL,
+                [self._figurative_row(verse_id, figurative_data) for verse_id, figurative_data in instance_data_list]
+            )
         except Exception as e:
             # Fallback to individual inserts if batch fails
-            instance_ids = []
-            for verse_id, figurative_data in instance_data_list:
-                instance_id = self.insert_figurative_language(verse_id, figurative_data)
-                instance_ids.append(instance_id)
+            return [self.insert_figurative_language(verse_id, figurative_data)
+                    for verse_id, figurative_data in instance_data_list]
 
-        return instance_ids
+    def batch_update_validation_data(self, validation_updates: List[Tuple[int, Dict]]) -> int:
+        """Apply validation data dicts for many figurative language entries in one pass (no commit).
 
-    def batch_update_validation_data(self, validation_updates: List[Tuple[int, Dict]]):
-        """Batch update validation data for multiple figurative language entries"""
-        if not validation_updates:
-            return
+        Returns:
+            Number of rows updated
+        """
+        return self.update_validation_records([ValidationRecord.from_dict(figurative_language_id, validation_data)
+                                               for figurative_language_id, validation_data in validation_updates])
+
+    @staticmethod
+    def _sanitize_validation_record(record: ValidationRecord) -> ValidationRecord:
+        """_sanitize_validation_data for a ValidationRecord, applied in place"""
+        for field in VALIDATION_FINAL_COLUMNS:
+            value = getattr(record, field)
+            if value != 'yes' and value != 'no':
+                setattr(record, field, 'yes' if str(value).strip().lower() == 'yes' else 'no')
+        for field in VALIDATION_DECISION_COLUMNS:
+            if getattr(record, field) not in ('VALID', 'INVALID', 'RECLASSIFIED', None, ''):
+                setattr(record, field, None)
+        return record
+
+    def update_validation_records(self, records: List[ValidationRecord]) -> int:
+        """Apply ValidationRecords in one pass (no commit).
+
+        The whole batch is sanitized in place and applied with executemany. If that hits a
+        constraint violation, the batch is rolled back to a savepoint and re-applied row by
+        row, so only the offending rows fall back to minimal safe data.
 
-        try:
-            # Prepare tuples for batch update
-            update_tuples = []
-            for figurative_language_id, validation_data in validation_updates:
-                update_tuples.append((
-                    validation_data.get('validation_decision_simile'),
-                    validation_data.get('validation_decision_metaphor'),
-                    validation_data.get('validation_decision_personification'),
-                    validation_data.get('validation_decision_idiom'),
-                    validation_data.get('validation_decision_hyperbole'),
-                    validation_data.get('validation_decision_metonymy'),
-                    validation_data.get('validation_decision_other'),
-                    validation_data.get('validation_reason_simile'),
-                    validation_data.get('validation_reason_metaphor'),
-                    validation_data.get('validation_reason_personification'),
-                    validation_data.get('validation_reason_idiom'),
-                    validation_data.get('validation_reason_hyperbole'),
-                    validation_data.get('validation_reason_metonymy'),
-                    validation_data.get('validation_reason_other'),
-                    validation_data.get('final_figurative_language'),
-                    validation_data.get('final_simile'),
-                    validation_data.get('final_metaphor'),
-                    validation_data.get('final_personification'),
-                    validation_data.get('final_idiom'),
-                    validation_data.get('final_hyperbole'),
-                    validation_data.get('final_metonymy'),
-                    validation_data.get('final_other'),
-                    validation_data.get('validation_response'),
-                    validation_data.get('validation_error'),
-                    figurative_language_id
-                ))
-
-            self.cursor.executemany('''
-                UPDATE figurative_language
-                SET validation_decision_simile = ?, validation_decision_metaphor = ?, validation_decision_personification = ?,
-                    validation_decision_idiom = ?, validation_decision_hyperbole = ?, validation_decision_metonymy = ?, validation_decision_other = ?,
-                    validation_reason_simile = ?, validation_reason_metaphor = ?, validation_reason_personification = ?,
-                    validation_reason_idiom = ?, validation_reason_hyperbole = ?, validation_reason_metonymy = ?, validation_reason_other = ?,
-                    final_figurative_language = ?, final_simile = ?, final_metaphor = ?, final_personification = ?,
-                    final_idiom = ?, final_hyperbole = ?, final_metonymy = ?, final_other = ?,
-                    validation_response = ?, validation_error = ?
-                WHERE id = ?
-            ''', update_tuples)
+        Returns:
+            Number of rows updated
+        """
+        if not records:
+            return 0
 
-        except Exception as e:
-            # Fallback to individual updates if batch fails
-            for figurative_language_id, validation_data in validation_updates:
-                self.update_validation_data(figurative_language_id, validation_data)
+        rows = [self._sanitize_validation_record(record).row() for record in records]
+
+        self.cursor.execute('SAVEPOINT batch_validation')
+        try:
+            try:
+                self.cursor.executemany(VALIDATION_UPDATE_SQL, rows)
+                updated = self.cursor.rowcount
+            except sqlite3.IntegrityError as e:
+                logger.warning(f"Batch validation update failed ({e}) - re-applying row by row")
+                self.cursor.execute('ROLLBACK TO batch_validation')
+                updated = 0
+                for row, record in zip(rows, records):
+                    try:
+                        self.cursor.execute(VALIDATION_UPDATE_SQL, row)
+                    except sqlite3.IntegrityError as row_error:
+                        logger.error(f"Constraint violation updating validation for ID {record.id}: {row_error}")
+                        minimal_data = self._create_minimal_validation_data(record.to_dict())
+                        minimal_data['validation_response'] = 'Constraint violation recovery'
+                        minimal_data['validation_error'] = f'Original error: {row_error}'
+                        self.cursor.execute(VALIDATION_UPDATE_SQL, ValidationRecord.from_dict(record.id, minimal_data).row())
+                    updated += self.cursor.rowcount
+        except BaseException:
+            # Any other error (e.g. "database is locked"): undo the batch and close the savepoint
+            # so the connection is not left in a nested transaction, then let the caller handle it
+            self.cursor.execute('ROLLBACK TO batch_validation')
+            self.cursor.execute('RELEASE batch_validation')
+            raise
+        self.cursor.execute('RELEASE batch_validation')
+
+        return updated
+
+    def record_chapter_token_usage(self, book: str, chapter: int, usage: Dict):
+        """Store a chapter's estimated and actual detection tokens (no commit; replaces an earlier row)"""
+        row = dict(usage, book=book, chapter=chapter)
+        self.cursor.execute(CHAPTER_TOKEN_USAGE_SQL, tuple(row.get(column) for column in CHAPTER_TOKEN_USAGE_COLUMNS))
+
+    def record_chapter_validation_usage(self, book: str, chapter: int, cost_metadata: Dict):
+        """Add the validator's token usage to a chapter's chapter_token_usage row (no commit)"""
+        self.cursor.execute(CHAPTER_VALIDATION_USAGE_SQL, (
+            cost_metadata.get('input_tokens', 0), cost_metadata.get('output_tokens', 0),
+            cost_metadata.get('reasoning_tokens', 0), cost_metadata.get('cost', 0.0), book, chapter))
 
     def begin_transaction(self):
         """Start a database transaction for batch operations"""
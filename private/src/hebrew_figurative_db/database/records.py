@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Slotted record classes for verses, instances and validation updates
+
+A chapter's verses and instances are built once by assemble_chapter_records() and the
+same objects travel through the write queue, the bulk insert and validation:
+
+- attributes are named after their database columns, and row() returns the parameter
+  tuple for the matching INSERT/UPDATE straight from the slots (one attrgetter call),
+  so executemany needs no per-column dict lookups
+- DatabaseManager sets verse_id / id on the instance records it inserts instead of
+  handing back copies, and sanitizes them in place
+- target/vehicle/ground/posture are held as the JSON strings that are stored
+
+__slots__ keeps each record a fixed-size object instead of a per-record dict of
+25-32 string keys. The dataclass(slots=True) option needs Python 3.10, so _slotted()
+rebuilds each class with __slots__ the same way.
+"""
+
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Dict, Optional, Tuple
+
+FIGURATIVE_TYPES = ('simile', 'metaphor', 'personification', 'idiom', 'hyperbole', 'metonymy', 'other')
+
+# Column order of VERSE_INSERT_SQL / FIGURATIVE_INSERT_SQL / VALIDATION_UPDATE_SQL in db_manager
+VERSE_COLUMNS = (
+    'reference', 'book', 'chapter', 'verse', 'hebrew_text', 'hebrew_text_stripped', 'hebrew_text_non_sacred',
+    'english_text', 'english_text_clean', 'english_text_clean_non_sacred', 'english_text_non_sacred',
+    'word_count', 'llm_restriction_error', 'figurative_detection_deliberation',
+    'figurative_detection_deliberation_non_sacred', 'instances_detected', 'instances_recovered',
+    'instances_lost_to_truncation', 'truncation_occurred', 'both_models_truncated', 'model_used',
+)
+FIGURATIVE_FLAG_COLUMNS = (('figurative_language',) + FIGURATIVE_TYPES +
+                           ('final_figurative_language',) + tuple(f'final_{t}' for t in FIGURATIVE_TYPES))
+FIGURATIVE_COLUMNS = (('verse_id',) + FIGURATIVE_FLAG_COLUMNS + (
+    'target', 'vehicle', 'ground', 'posture',
+    'confidence', 'figurative_text', 'figurative_text_non_sacred', 'figurative_text_in_hebrew',
+    'figurative_text_in_hebrew_stripped', 'figurative_text_in_hebrew_non_sacred',
+    'explanation', 'speaker', 'purpose', 'tagging_analysis_deliberation', 'model_used',
+))
+VALIDATION_DECISION_COLUMNS = tuple(f'validation_decision_{t}' for t in FIGURATIVE_TYPES)
+VALIDATION_FINAL_COLUMNS = ('final_figurative_language',) + tuple(f'final_{t}' for t in FIGURATIVE_TYPES)
+VALIDATION_COLUMNS = (VALIDATION_DECISION_COLUMNS + tuple(f'validation_reason_{t}' for t in FIGURATIVE_TYPES) +
+                      VALIDATION_FINAL_COLUMNS + ('validation_response', 'validation_error', 'id'))
+
+# Prepared verse dict keys used before VerseRecord -> attribute (journal payloads of older runs)
+LEGACY_VERSE_KEYS = {'hebrew': 'hebrew_text', 'hebrew_stripped': 'hebrew_text_stripped', 'english': 'english_text'}
+
+EMPTY_JSON_LIST = '[]'
+
+
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__ for its fields (dataclass(slots=True) before Python 3.10)"""
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _known_fields(cls, data: Dict) -> Dict:
+    names = cls.__dataclass_fields__
+    return {key: value for key, value in data.items() if key in names}
+
+
+@_slotted
+@dataclass
+class VerseRecord:
+    """One verse row (verses table)"""
+    reference: str
+    book: str
+    chapter: int
+    verse: int
+    hebrew_text: str
+    english_text: str
+    word_count: int
+    hebrew_text_stripped: Optional[str] = None
+    hebrew_text_non_sacred: Optional[str] = None
+    english_text_clean: Optional[str] = None
+    english_text_clean_non_sacred: Optional[str] = None
+    english_text_non_sacred: Optional[str] = None
+    llm_restriction_error: Optional[str] = None
+    figurative_detection_deliberation: Optional[str] = None
+    figurative_detection_deliberation_non_sacred: Optional[str] = None
+    instances_detected: Optional[int] = None
+    instances_recovered: Optional[int] = None
+    instances_lost_to_truncation: Optional[int] = None
+    truncation_occurred: str = 'no'
+    both_models_truncated: str = 'no'
+    model_used: str = 'gemini-2.5-flash'
+
+    _row = attrgetter(*VERSE_COLUMNS)
+
+    def row(self) -> Tuple:
+        """VERSE_INSERT_SQL parameters"""
+        return self._row(self)
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'VerseRecord':
+        """From to_dict() output or a prepared verse dict (legacy keys mapped, unknown keys ignored)"""
+        data = {LEGACY_VERSE_KEYS.get(key, key): value for key, value in data.items()}
+        return cls(**_known_fields(cls, data))
+
+
+@_slotted
+@dataclass
+class InstanceRecord:
+    """One figurative_language row; verse_id and id are set by DatabaseManager on insert"""
+    confidence: float
+    figurative_language: str = 'no'
+    simile: str = 'no'
+    metaphor: str = 'no'
+    personification: str = 'no'
+    idiom: str = 'no'
+    hyperbole: str = 'no'
+    metonymy: str = 'no'
+    other: str = 'no'
+    final_figurative_language: str = 'no'
+    final_simile: str = 'no'
+    final_metaphor: str = 'no'
+    final_personification: str = 'no'
+    final_idiom: str = 'no'
+    final_hyperbole: str = 'no'
+    final_metonymy: str = 'no'
+    final_other: str = 'no'
+    target: str = EMPTY_JSON_LIST
+    vehicle: str = EMPTY_JSON_LIST
+    ground: str = EMPTY_JSON_LIST
+    posture: str = EMPTY_JSON_LIST
+    figurative_text: Optional[str] = None
+    figurative_text_non_sacred: Optional[str] = None
+    figurative_text_in_hebrew: Optional[str] = None
+    figurative_text_in_hebrew_stripped: Optional[str] = None
+    figurative_text_in_hebrew_non_sacred: Optional[str] = None
+    explanation: Optional[str] = None
+    speaker: Optional[str] = None
+    purpose: Optional[str] = None
+    tagging_analysis_deliberation: str = ''
+    model_used: str = 'gemini-2.5-flash'
+    verse_id: Optional[int] = None
+    id: Optional[int] = None
+
+    _row = attrgetter(*FIGURATIVE_COLUMNS)
+
+    def row(self) -> Tuple:
+        """FIGURATIVE_INSERT_SQL parameters (verse_id must be set)"""
+        return self._row(self)
+
+    def validation_payload(self, verse: VerseRecord) -> Dict:
+        """The fields MetaphorValidator reads for this instance, with its verse's text as context"""
+        payload = {
+            'db_id': self.id,
+            'verse_reference': verse.reference,
+            'hebrew_text': verse.hebrew_text,
+            'english_text': verse.english_text,
+            'figurative_text': self.figurative_text,
+            'explanation': self.explanation,
+            'confidence': self.confidence,
+        }
+        for fig_type in FIGURATIVE_TYPES:
+            payload[fig_type] = getattr(self, fig_type)
+        return payload
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'InstanceRecord':
+        """From to_dict() output or a figurative_data dict (unknown keys ignored)"""
+        return cls(**_known_fields(cls, data))
+
+
+@_slotted
+@dataclass
+class ValidationRecord:
+    """Validation columns of one figurative_language row (VALIDATION_UPDATE_SQL)"""
+    id: int
+    validation_decision_simile: Optional[str] = None
+    validation_decision_metaphor: Optional[str] = None
+    validation_decision_personification: Optional[str] = None
+    validation_decision_idiom: Optional[str] = None
+    validation_decision_hyperbole: Optional[str] = None
+    validation_decision_metonymy: Optional[str] = None
+    validation_decision_other: Optional[str] = None
+    validation_reason_simile: Optional[str] = None
+    validation_reason_metaphor: Optional[str] = None
+    validation_reason_personification: Optional[str] = None
+    validation_reason_idiom: Optional[str] = None
+    validation_reason_hyperbole: Optional[str] = None
+    validation_reason_metonymy: Optional[str] = None
+    validation_reason_other: Optional[str] = None
+    final_figurative_language: str = 'no'
+    final_simile: str = 'no'
+    final_metaphor: str = 'no'
+    final_personification: str = 'no'
+    final_idiom: str = 'no'
+    final_hyperbole: str = 'no'
+    final_metonymy: str = 'no'
+    final_other: str = 'no'
+    validation_response: Optional[str] = None
+    validation_error: Optional[str] = None
+
+    _row = attrgetter(*VALIDATION_COLUMNS)
+
+    def row(self) -> Tuple:
+        """VALIDATION_UPDATE_SQL parameters (id last, for the WHERE clause)"""
+        return self._row(self)
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, figurative_language_id: int, data: Dict) -> 'ValidationRecord':
+        """From a validation data dict (as for DatabaseManager.update_validation_data)"""
+        return cls(**dict(_known_fields(cls, data), id=figurative_language_id))
@@ -1,4 +1,7 @@
 """Text extraction module for Hebrew texts"""
 from .sefaria_client import SefariaClient
+from .sefaria_text_store import SefariaTextStore
+from .text_normalization import clean_sefaria_text
+from .transform_memo import TransformMemo, configure_transform_memo, get_transform_memo
 
-__all__ = ['SefariaClient']
\ No newline at end of file
+__all__ = ['SefariaClient', 'SefariaTextStore', 'clean_sefaria_text', 'TransformMemo', 'configure_transform_memo', 'get_transform_memo']
\ No newline at end of file
@@ -2,18 +2,53 @@
 # -*- coding: utf-8 -*-
 """
 Sefaria API client for Hebrew text extraction
+
+All requests go through one pooled keep-alive requests.Session with a timeout and
+retry (exponential backoff with full jitter, Retry-After honoured on 429).
+fetch_chapters() fetches many chapters with bounded concurrency, e.g. to prefetch
+whole books before any LLM work starts. SEFARIA_BASE_URL points the client at a
+local stub (mock_llm_server.py serves /api/texts/).
 """
+import os
+import random
+import threading
 import requests
-import re
 import time
-from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+
+from .text_normalization import clean_sefaria_text
+
+SEFARIA_BASE_URL = "https://www.sefaria.org/api"
+REQUEST_TIMEOUT = (5.0, 30.0)              # (connect, read) seconds
+MAX_RETRIES = 4                            # Retries after the first attempt
+RETRY_BACKOFF_BASE = 0.5                   # Seconds; doubled per attempt, full jitter
+RETRY_BACKOFF_MAX = 8.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_CONCURRENT_FETCHES = 6                 # Keeps bulk prefetch polite to the Sefaria API
 
 
 class SefariaClient:
     """Client for extracting Hebrew text from Sefaria API"""
 
-    def __init__(self, base_url: str = "https://www.sefaria.org/api"):
-        self.base_url = base_url
+    def __init__(self, base_url: Optional[str] = None, timeout: Tuple[float, float] = REQUEST_TIMEOUT,
+                 max_retries: int = MAX_RETRIES, max_concurrency: int = MAX_CONCURRENT_FETCHES):
+        self.base_url = (base_url or os.getenv("SEFARIA_BASE_URL") or SEFARIA_BASE_URL).rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_concurrency = max(1, max_concurrency)
+
+        # One keep-alive pool sized for the concurrent fetchers; retries are handled here, not by urllib3
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.stats_lock = threading.Lock()
+        self.request_count = 0
+        self.retry_count = 0
+        self.source_versions = {}  # Range -> "English version / Hebrew version" of the last fetch
 
     def extract_hebrew_text(self, verses_range: str) -> Tuple[List[Dict], float]:
         """
@@ -27,30 +62,100 @@ class SefariaClient:
         """
         print(f"Extracting Hebrew text for {verses_range}...")
 
+        verses, api_time = self._fetch(verses_range)
+
+        print(f"API response time: {api_time:.2f}s")
+        print(f"Retrieved {len(verses)} verses")
+
+        return verses, api_time
+
+    def fetch_chapters(self, references: List[str], max_concurrency: Optional[int] = None
+                       ) -> Tuple[Dict[str, Tuple[List[Dict], float]], Dict[str, str]]:
+        """
+        Fetch many ranges concurrently over the shared session.
+
+        Args:
+            references: Ranges like "Genesis.1"
+            max_concurrency: Parallel requests (default: the client's max_concurrency)
+
+        Returns:
+            Tuple of ({reference: (verses_list, api_response_time)}, {reference: error message})
+        """
+        results, errors = {}, {}
+        if not references:
+            return results, errors
+
+        workers = min(max_concurrency or self.max_concurrency, self.max_concurrency, len(references))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sefaria') as executor:
+            futures = {reference: executor.submit(self._fetch, reference) for reference in references}
+            for reference, future in futures.items():
+                try:
+                    results[reference] = future.result()
+                except Exception as e:
+                    errors[reference] = str(e)
+        return results, errors
+
+    def get_source_version(self, verses_range: str) -> Optional[str]:
+        """Sefaria version titles the last fetch of verses_range came from"""
+        with self.stats_lock:
+            return self.source_versions.get(verses_range)
+
+    def get_stats(self) -> Dict:
+        with self.stats_lock:
+            return {'requests': self.request_count, 'retries': self.retry_count}
+
+    def _fetch(self, verses_range: str) -> Tuple[List[Dict], float]:
+        """GET and parse one range (no console output, safe to call from worker threads)"""
         url = f"{self.base_url}/texts/{verses_range}"
 
         start_time = time.time()
-        response = requests.get(url)
+        response = self._get_with_retry(url)
         api_time = time.time() - start_time
 
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch data: {response.status_code}")
-
         data = response.json()
+        with self.stats_lock:
+            self.source_versions[verses_range] = f"{data.get('versionTitle', '?')} / {data.get('heVersionTitle', '?')}"
+        return self._parse_verses(verses_range, data), api_time
+
+    def _get_with_retry(self, url: str) -> requests.Response:
+        """GET url, retrying connection errors, timeouts and 429/5xx with jittered backoff"""
+        attempt = 0
+        while True:
+            with self.stats_lock:
+                self.request_count += 1
+            retry_after = None
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+                if response.status_code == 200:
+                    return response
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    raise Exception(f"Failed to fetch data: {response.status_code}")
+                retry_after = response.headers.get('Retry-After')
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise Exception(f"Failed to fetch data: {e}")
+
+            delay = random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2 ** attempt)))
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), RETRY_BACKOFF_MAX))
+            with self.stats_lock:
+                self.retry_count += 1
+            time.sleep(delay)
+            attempt += 1
+
+    def _parse_verses(self, verses_range: str, data: Dict) -> List[Dict]:
+        """Turn a /texts response into verse dicts"""
         hebrew_verses = data.get('he', [])
         english_verses = data.get('text', [])
 
-        print(f"API response time: {api_time:.2f}s")
-        print(f"Retrieved {len(hebrew_verses)} Hebrew verses, {len(english_verses)} English verses")
-
         # Parse chapter/verse info from range
         book, chapter_info = verses_range.split('.', 1)
         chapter = int(chapter_info.split('.')[0])
 
         verses = []
         for i, (hebrew, english) in enumerate(zip(hebrew_verses, english_verses), 1):
-            clean_hebrew = self._clean_text(hebrew)
-            clean_english = self._clean_text(english)
+            clean_hebrew = clean_sefaria_text(hebrew)
+            clean_english = clean_sefaria_text(english)
 
             verses.append({
                 'reference': f'{book} {chapter}:{i}',
@@ -62,28 +167,8 @@ class SefariaClient:
                 'word_count': len(clean_hebrew.split())
             })
 
-        return verses, api_time
+        return verses
 
     def _clean_text(self, text: str) -> str:
         """Clean HTML tags and special characters from text"""
-        if not text:
-            return ""
-
-        # Remove footnote markers and content - must be done BEFORE removing general HTML tags
-        # Pattern 1: Footnotes with nested tags (Genesis style): <sup class="footnote-marker">*</sup><i class="footnote"><b>text</b> more text</i>
-        # Use non-greedy matching and allow nested tags inside <i class="footnote">...</i>
-        clean_text = re.sub(r'<sup class="footnote-marker">[^<]*</sup><i class="footnote">.*?</i>', '', text)
-
-        # Pattern 2: End footnote markers (e.g., <sup class="endFootnote">-c</sup>)
-        clean_text = re.sub(r'<sup class="endFootnote">[^<]*</sup>', '', clean_text)
-
-        # Replace line breaks with spaces BEFORE removing other HTML tags
-        clean_text = re.sub(r'<br\s*/?>', ' ', clean_text)
-
-        # Remove all remaining HTML tags (including <small>, <b>, etc.)
-        clean_text = re.sub(r'<[^>]+>', '', clean_text)
-
-        # Remove special Hebrew punctuation
-        clean_text = clean_text.replace('׃', '').strip()
-
-        return clean_text
\ No newline at end of file
+        return clean_sefaria_text(text)
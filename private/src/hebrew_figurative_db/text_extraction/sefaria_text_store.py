@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Single-file store for Sefaria chapter text
+
+Replaces the one-JSON-file-per-chapter .sefaria_cache/ directory with one SQLite
+file. Each chapter is one row keyed by (book, chapter): its verses' Hebrew and
+English packed into one compressed payload (zstd when the zstandard package is
+installed, zlib otherwise; single verses are too short to compress on their own),
+plus verse count, CRC32 of the uncompressed payload, Sefaria source version and
+fetch time. A verse range is a primary-key lookup plus a slice.
+
+get()/set()/has() keep SefariaCache's reference-based interface ("Genesis.1"), so
+the store drops into the processor; import_json_cache() loads an existing
+.sefaria_cache/ directory once.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+SCHEMA_VERSION = 1
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 9
+LEGACY_CACHE_DIR = ".sefaria_cache"
+
+
+class SefariaTextStore:
+    """Compressed, checksummed chapter text keyed by (book, chapter, verse); safe to share across threads"""
+
+    def __init__(self, path: str, compression: Optional[str] = None,
+                 legacy_cache_dir: Optional[str] = LEGACY_CACHE_DIR,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            path: SQLite file (created if missing)
+            compression: 'zstd' or 'zlib' for new rows (default: zstd if available)
+            legacy_cache_dir: .sefaria_cache/ directory imported on first open (None to skip)
+            logger: Logger for import/integrity messages
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.path = path
+        self.codec = compression or ('zstd' if ZSTD_AVAILABLE else 'zlib')
+        if self.codec == 'zstd' and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the zstandard package")
+        if self.codec not in ('zstd', 'zlib'):
+            raise ValueError(f"Unknown compression: {self.codec}")
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if self.codec == 'zstd' else None
+        self._decompressor = zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.corrupt = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._create_schema()
+
+        if legacy_cache_dir and Path(legacy_cache_dir).is_dir() and not self._get_meta('legacy_import'):
+            imported = self.import_json_cache(legacy_cache_dir)
+            self._set_meta('legacy_import', f"{Path(legacy_cache_dir).resolve()} ({imported} chapters)")
+
+    def _create_schema(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise ValueError(f"{self.path} has text store schema {version}, expected {SCHEMA_VERSION}")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS chapters (
+                book TEXT NOT NULL,
+                chapter INTEGER NOT NULL,
+                verse_count INTEGER NOT NULL,
+                codec TEXT NOT NULL,
+                payload BLOB NOT NULL,      -- compressed JSON [[hebrew, english], ...] in verse order
+                crc32 INTEGER NOT NULL,     -- of the uncompressed payload
+                source_version TEXT,
+                fetched_at TEXT NOT NULL,
+                metadata TEXT,
+                PRIMARY KEY (book, chapter)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO store_meta VALUES (?, ?)", (key, value))
+            self.conn.commit()
+
+    @staticmethod
+    def parse_reference(reference: str) -> Tuple[str, int]:
+        """'Genesis.1' -> ('Genesis', 1); only whole-chapter references are stored"""
+        book, _, chapter = reference.rpartition('.')
+        if not book or not chapter.isdigit():
+            raise ValueError(f"Not a chapter reference: {reference}")
+        return book, int(chapter)
+
+    # Encoding
+
+    def _encode(self, verses_data: List[Dict]) -> Tuple[bytes, int]:
+        raw = json.dumps([[v['hebrew'], v['english']] for v in verses_data],
+                         ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        crc = zlib.crc32(raw)
+        if self.codec == 'zstd':
+            return self._compressor.compress(raw), crc
+        return zlib.compress(raw, ZLIB_LEVEL), crc
+
+    def _decode(self, book: str, chapter: int, codec: str, payload: bytes, crc: int) -> Optional[List[Dict]]:
+        """Verse dicts as SefariaClient returns them, or None if the row is unreadable or fails its checksum"""
+        try:
+            if codec == 'zstd':
+                if self._decompressor is None:
+                    self.logger.warning(f"[TEXT_STORE] {book} {chapter} is zstd-compressed; install zstandard to read it")
+                    return None
+                raw = self._decompressor.decompress(payload)
+            else:
+                raw = zlib.decompress(payload)
+        except Exception as e:
+            self.logger.warning(f"[TEXT_STORE] Could not decompress {book} {chapter}: {e}")
+            return None
+        if zlib.crc32(raw) != crc:
+            self.logger.warning(f"[TEXT_STORE] Checksum mismatch for {book} {chapter}; treating as missing")
+            return None
+
+        return [{
+            'reference': f'{book} {chapter}:{verse}',
+            'book': book,
+            'chapter': chapter,
+            'verse': verse,
+            'hebrew': hebrew,
+            'english': english,
+            'word_count': len(hebrew.split())
+        } for verse, (hebrew, english) in enumerate(json.loads(raw), 1)]
+
+    # Chapter / verse access
+
+    def _load(self, book: str, chapter: int) -> Optional[Tuple[List[Dict], Any]]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT codec, payload, crc32, metadata FROM chapters WHERE book = ? AND chapter = ?",
+                (book, chapter)).fetchone()
+        verses = self._decode(book, chapter, *row[:3]) if row else None
+        with self._lock:
+            if verses is None:
+                self.misses += 1
+                self.corrupt += 1 if row else 0
+                return None
+            self.hits += 1
+        return verses, json.loads(row[3]) if row[3] else None
+
+    def get_chapter(self, book: str, chapter: int) -> Optional[List[Dict]]:
+        loaded = self._load(book, chapter)
+        return loaded[0] if loaded else None
+
+    def get_verses(self, book: str, chapter: int, start: int = 1, end: Optional[int] = None) -> Optional[List[Dict]]:
+        """Verses start..end (inclusive, 1-based) of a stored chapter, or None if the chapter is not stored"""
+        verses = self.get_chapter(book, chapter)
+        if verses is None:
+            return None
+        return verses[max(start, 1) - 1:end]
+
+    def put_chapter(self, book: str, chapter: int, verses_data: List[Dict], source_version: Optional[str] = None,
+                    fetched_at: Optional[str] = None, metadata: Any = None):
+        payload, crc = self._encode(verses_data)
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO chapters VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (book, chapter, len(verses_data), self.codec, payload, crc, source_version,
+                 fetched_at or datetime.now().isoformat(),
+                 json.dumps(metadata, ensure_ascii=False) if metadata is not None else None))
+            self.conn.commit()
+
+    # SefariaCache-compatible interface
+
+    def get(self, reference: str) -> Optional[Tuple[List[Dict], Any]]:
+        """(verses_data, metadata) for a chapter reference like 'Genesis.1', or None"""
+        return self._load(*self.parse_reference(reference))
+
+    def set(self, reference: str, verses_data: List[Dict], metadata: Any = None,
+            source_version: Optional[str] = None):
+        book, chapter = self.parse_reference(reference)
+        self.put_chapter(book, chapter, verses_data, source_version=source_version, metadata=metadata)
+
+    def has(self, reference: str) -> bool:
+        book, chapter = self.parse_reference(reference)
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM chapters WHERE book = ? AND chapter = ?",
+                                     (book, chapter)).fetchone() is not None
+
+    # Maintenance
+
+    def import_json_cache(self, cache_dir: str = LEGACY_CACHE_DIR) -> int:
+        """Load every chapter from a .sefaria_cache/ directory (existing rows are kept); returns chapters imported"""
+        imported = skipped = 0
+        for cache_path in sorted(Path(cache_dir).glob('*.json')):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                book, chapter = self.parse_reference(data['reference'])
+            except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, ValueError):
+                skipped += 1
+                continue
+            if not data.get('verses_data') or self.has(data['reference']):
+                skipped += 1
+                continue
+            self.put_chapter(book, chapter, data['verses_data'], source_version='legacy-json-cache',
+                             fetched_at=data.get('cached_at'), metadata=data.get('metadata'))
+            imported += 1
+        self.logger.info(f"[TEXT_STORE] Imported {imported} chapters from {cache_dir} ({skipped} skipped)")
+        return imported
+
+    def verify(self) -> List[str]:
+        """References whose rows fail decompression or their checksum"""
+        with self._lock:
+            rows = self.conn.execute("SELECT book, chapter, codec, payload, crc32 FROM chapters").fetchall()
+        return [f"{book}.{chapter}" for book, chapter, codec, payload, crc in rows
+                if self._decode(book, chapter, codec, payload, crc) is None]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            chapters, verses, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(verse_count), 0), COALESCE(SUM(LENGTH(payload)), 0) FROM chapters"
+            ).fetchone()
+        return {
+            'chapters': chapters,
+            'verses': verses,
+            'payload_bytes': size,
+            'codec': self.codec,
+            'hits': self.hits,
+            'misses': self.misses,
+            'corrupt': self.corrupt,
+            'path': self.path,
+        }
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared normalization for verse text returned by the Sefaria API
+
+clean_sefaria_text() is the one implementation of the cleaning SefariaClient applies
+to every Hebrew and English verse (and so to everything the refresh scripts write).
+The patterns are compiled once, and each pass only runs when the text still contains
+a literal that every match of that pass must include, so plain text (most Hebrew
+verses) skips the regex engine entirely. Pass order and semantics are those of the
+original _clean_text(); benchmarks/check_text_normalization_equivalence.py checks
+that byte-for-byte.
+"""
+
+import re
+
+# Footnotes with nested tags (Genesis style):
+# <sup class="footnote-marker">*</sup><i class="footnote"><b>text</b> more text</i>
+# Non-greedy, so it ends at the first </i>. Must run BEFORE general HTML tag removal.
+FOOTNOTE_PATTERN = re.compile(r'<sup class="footnote-marker">[^<]*</sup><i class="footnote">.*?</i>')
+
+# End footnote markers (e.g., <sup class="endFootnote">-c</sup>)
+END_FOOTNOTE_PATTERN = re.compile(r'<sup class="endFootnote">[^<]*</sup>')
+
+# Line breaks become spaces BEFORE other tags are removed (keeps words apart)
+LINE_BREAK_PATTERN = re.compile(r'<br\s*/?>')
+
+# Any remaining HTML tag (<small>, <b>, ...)
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+SOF_PASUQ = '׃'
+
+
+def clean_sefaria_text(text: str) -> str:
+    """Remove footnotes, HTML markup and sof pasuq from one verse of Sefaria text"""
+    if not text:
+        return ""
+
+    # None of the passes can introduce a '<', so tag-free text skips all of them
+    if '<' in text:
+        if 'footnote-marker' in text:
+            text = FOOTNOTE_PATTERN.sub('', text)
+        if 'endFootnote' in text:
+            text = END_FOOTNOTE_PATTERN.sub('', text)
+        if '<br' in text:
+            text = LINE_BREAK_PATTERN.sub(' ', text)
+        if '<' in text:
+            text = HTML_TAG_PATTERN.sub('', text)
+
+    if SOF_PASUQ in text:
+        text = text.replace(SOF_PASUQ, '')
+    return text.strip()
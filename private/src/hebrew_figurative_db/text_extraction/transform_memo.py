@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-addressed memo for derived-text transforms
+
+strip_diacritics and the divine-names modifier are pure functions of their input,
+and the same strings go through them repeatedly (verse text on every run, repeated
+instance fragments, maintenance scripts). TransformMemo maps
+(transform, transform version, input hash) -> output through an in-process LRU,
+optionally backed by an on-disk SQLite store so a re-run skips them entirely.
+
+Entries are versioned by a fingerprint of the source of the module that implements
+the transform (the same fingerprint scripts/rebuild_derived_columns.py keys its row
+state on), so any edit to e.g. DIVINE_NAME_RULES invalidates them without a manual
+version bump; opening the store drops exactly the stale transforms' entries.
+
+Store reads go through a per-thread connection outside the memo's lock, so threads
+missing the LRU do not serialize on SQLite; writes are buffered and flushed under it.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from . import hebrew_divine_names_modifier, hebrew_utils
+from .hebrew_divine_names_modifier import HebrewDivineNamesModifier
+from .hebrew_utils import HebrewTextProcessor
+
+# Transform name -> module whose source defines its output (fingerprinted into every key)
+TRANSFORM_MODULES = {
+    'divine_names': hebrew_divine_names_modifier,
+    'english_divine_names': hebrew_divine_names_modifier,
+    'strip_diacritics': hebrew_utils,
+}
+
+DEFAULT_MAX_ENTRIES = 65536   # In-process LRU size (distinct (transform, text) pairs)
+STORE_FLUSH_ROWS = 512        # Buffered new outputs written to the store per executemany
+STORE_LOOKUP_CHUNK = 500      # Hashes per IN (...) lookup in get_many()
+
+
+def transform_fingerprints() -> Dict[str, bytes]:
+    """Per-transform digest of the source that implements it"""
+    fingerprints = {}
+    for name, module in TRANSFORM_MODULES.items():
+        with open(module.__file__, 'rb') as f:
+            fingerprints[name] = hashlib.blake2b(name.encode('utf-8') + b'\x00' + f.read(), digest_size=16).digest()
+    return fingerprints
+
+
+def input_hash(text: str) -> bytes:
+    """128-bit content hash used as the store key"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+class TransformMemo:
+    """Memoized strip_diacritics / divine-names transforms, safe to share across threads"""
+
+    def __init__(self, divine_names_modifier: Optional[HebrewDivineNamesModifier] = None,
+                 store_path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger(__name__)
+        modifier = divine_names_modifier or HebrewDivineNamesModifier(logger=self.logger)
+        self._functions = {
+            'strip_diacritics': HebrewTextProcessor.strip_diacritics,
+            'divine_names': modifier.modify_divine_names,
+            'english_divine_names': modifier.modify_english_with_hebrew_terms,
+        }
+        self.max_entries = max_entries
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending = []
+        self._versions = {name: fingerprint.hex() for name, fingerprint in transform_fingerprints().items()}
+        self._local = threading.local()
+        self._readers = []   # per-thread read connections, closed with the store
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+        self.store_path = store_path
+        self._store = None
+        if store_path:
+            self._open_store(store_path)
+
+    def _open_store(self, store_path: str):
+        self._store = sqlite3.connect(store_path, check_same_thread=False)
+        self._store.execute("""
+            CREATE TABLE IF NOT EXISTS transform_memo (
+                transform TEXT NOT NULL,
+                version TEXT NOT NULL,
+                input_hash BLOB NOT NULL,
+                output TEXT,  -- NULL: output identical to input
+                PRIMARY KEY (transform, version, input_hash)
+            ) WITHOUT ROWID
+        """)
+        invalidated = 0
+        for transform, version in self._versions.items():
+            cursor = self._store.execute(
+                "DELETE FROM transform_memo WHERE transform = ? AND version != ?", (transform, version))
+            invalidated += cursor.rowcount
+        self._store.commit()
+        if invalidated:
+            self.logger.info(f"[MEMO] Dropped {invalidated} memo entries from older transform versions")
+
+    def _reader(self) -> Optional[sqlite3.Connection]:
+        """This thread's read connection to the store (None without a store)"""
+        reader = getattr(self._local, 'reader', None)
+        if reader is None:
+            with self._lock:
+                if self._store is None:
+                    return None
+                reader = sqlite3.connect(self.store_path, check_same_thread=False)
+                self._readers.append(reader)
+            self._local.reader = reader
+        return reader
+
+    # Drop-in methods for the call sites
+
+    def strip_diacritics(self, text: str) -> str:
+        return self.apply('strip_diacritics', text)
+
+    def modify_divine_names(self, text: str) -> str:
+        return self.apply('divine_names', text)
+
+    def modify_english_with_hebrew_terms(self, text: str) -> str:
+        return self.apply('english_divine_names', text)
+
+    def apply(self, transform: str, text: str) -> str:
+        """Transform text, consulting the LRU then the store; empty/non-str input passes straight through"""
+        if not text or not isinstance(text, str):
+            return self._functions[transform](text)
+
+        key = (transform, text)
+        with self._lock:
+            output = self._lru.get(key)
+            if output is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return output
+            has_store = self._store is not None
+
+        digest = None
+        if has_store:
+            digest = input_hash(text)
+            reader = self._reader()
+            row = reader.execute(
+                "SELECT output FROM transform_memo WHERE transform = ? AND version = ? AND input_hash = ?",
+                (transform, self._versions[transform], digest)).fetchone() if reader else None
+            if row is not None:
+                output = text if row[0] is None else row[0]
+                with self._lock:
+                    self.store_hits += 1
+                    self._remember(key, output)
+                return output
+
+        output = self._functions[transform](text)
+        with self._lock:
+            self.misses += 1
+            self._remember(key, output)
+            if self._store is not None:
+                self._queue(transform, digest, text, output)
+        return output
+
+    def get_many(self, transform: str, texts: List[str]) -> List[Optional[str]]:
+        """Batch lookup without computing: output per text, or None where not memoized"""
+        results = [None] * len(texts)
+        missing = {}
+        with self._lock:
+            for i, text in enumerate(texts):
+                output = self._lru.get((transform, text))
+                if output is not None:
+                    self.hits += 1
+                    results[i] = output
+                elif self._store is not None:
+                    missing.setdefault(input_hash(text), []).append(i)
+
+        reader = self._reader() if missing else None
+        if reader is None:
+            return results
+        found = []
+        digests = list(missing)
+        for start in range(0, len(digests), STORE_LOOKUP_CHUNK):
+            chunk = digests[start:start + STORE_LOOKUP_CHUNK]
+            found.extend(reader.execute(
+                f"SELECT input_hash, output FROM transform_memo WHERE transform = ? AND version = ? "
+                f"AND input_hash IN ({', '.join('?' for _ in chunk)})", [transform, self._versions[transform]] + chunk))
+        with self._lock:
+            for digest, output in found:
+                for i in missing[digest]:
+                    results[i] = texts[i] if output is None else output
+                    self._remember((transform, texts[i]), results[i])
+                    self.store_hits += 1
+        return results
+
+    def put_many(self, transform: str, pairs: List[tuple]):
+        """Record (text, output) pairs computed elsewhere (e.g. in worker processes)"""
+        with self._lock:
+            for text, output in pairs:
+                self._remember((transform, text), output)
+                if self._store is not None:
+                    self._queue(transform, None, text, output)
+
+    def _remember(self, key, output):
+        self._lru[key] = output
+        if len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _queue(self, transform, digest, text, output):
+        self._pending.append((transform, self._versions[transform], digest or input_hash(text),
+                              None if output == text else output))
+        if len(self._pending) >= STORE_FLUSH_ROWS:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._pending:
+            self._store.executemany("INSERT OR REPLACE INTO transform_memo VALUES (?, ?, ?, ?)", self._pending)
+            self._store.commit()
+            self._pending = []
+
+    def flush(self):
+        """Write buffered outputs to the store"""
+        with self._lock:
+            if self._store is not None:
+                self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            if self._store is not None:
+                self._flush_locked()
+                self._store.close()
+                self._store = None
+            for reader in self._readers:
+                reader.close()
+            self._readers = []
+
+    def get_stats(self) -> Dict:
+        total = self.hits + self.store_hits + self.misses
+        return {
+            'lookups': total,
+            'memory_hits': self.hits,
+            'store_hits': self.store_hits,
+            'computed': self.misses,
+            'hit_rate': (self.hits + self.store_hits) / total if total else 0.0,
+            'entries_in_memory': len(self._lru),
+            'store_path': self.store_path,
+        }
+
+
+_shared_memo = None
+_shared_lock = threading.Lock()
+
+
+def configure_transform_memo(divine_names_modifier: Optional[HebrewDivineNamesModifier] = None,
+                             store_path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES,
+                             logger: Optional[logging.Logger] = None) -> TransformMemo:
+    """Replace the process-wide memo (closing the previous one) and return it"""
+    global _shared_memo
+    with _shared_lock:
+        if _shared_memo is not None:
+            _shared_memo.close()
+        _shared_memo = TransformMemo(divine_names_modifier, store_path, max_entries, logger)
+        return _shared_memo
+
+
+def get_transform_memo() -> TransformMemo:
+    """Process-wide memo (in-memory only unless configure_transform_memo() gave it a store)"""
+    global _shared_memo
+    with _shared_lock:
+        if _shared_memo is None:
+            _shared_memo = TransformMemo()
+        return _shared_memo
@@ -43,8 +43,10 @@ from typing import List, Dict, Optional, Tuple, Set
 
 # Add the src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src', 'hebrew_figurative_db', 'ai_analysis'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from metaphor_validator import MetaphorValidator
+from hebrew_figurative_db.database.db_manager import DatabaseManager
 
 
 class UniversalValidationRecovery:
@@ -652,12 +654,8 @@ class UniversalValidationRecovery:
         if not instances:
             return 0
 
-        updated_count = 0
-
         try:
-            conn = sqlite3.connect(str(self.database_path))
-            cursor = conn.cursor()
-
+            updates = []
             for instance in instances:
                 # CRITICAL FIX: Calculate final fields using same logic as main pipeline
                 validation_data = self._extract_validation_data(instance.get('validation_response', '{}'))
@@ -704,36 +702,18 @@ class UniversalValidationRecovery:
                             validation_data[f'final_{fig_type}'] = 'no'
                         validation_data['final_figurative_language'] = 'no'
 
-                # Update database with validation and final fields data
-                cursor.execute("""
-                    UPDATE figurative_language SET
-                        validation_response = ?,
-                        validation_decision_simile = ?, validation_decision_metaphor = ?, validation_decision_personification = ?,
-                        validation_decision_idiom = ?, validation_decision_hyperbole = ?, validation_decision_metonymy = ?, validation_decision_other = ?,
-                        validation_reason_simile = ?, validation_reason_metaphor = ?, validation_reason_personification = ?,
-                        validation_reason_idiom = ?, validation_reason_hyperbole = ?, validation_reason_metonymy = ?, validation_reason_other = ?,
-                        final_figurative_language = ?, final_simile = ?, final_metaphor = ?, final_personification = ?,
-                        final_idiom = ?, final_hyperbole = ?, final_metonymy = ?, final_other = ?,
-                        validation_error = ?
-                    WHERE id = ?
-                """, (
-                    instance.get('validation_response'),
-                    validation_data.get('validation_decision_simile'), validation_data.get('validation_decision_metaphor'), validation_data.get('validation_decision_personification'),
-                    validation_data.get('validation_decision_idiom'), validation_data.get('validation_decision_hyperbole'), validation_data.get('validation_decision_metonymy'), validation_data.get('validation_decision_other'),
-                    validation_data.get('validation_reason_simile'), validation_data.get('validation_reason_metaphor'), validation_data.get('validation_reason_personification'),
-                    validation_data.get('validation_reason_idiom'), validation_data.get('validation_reason_hyperbole'), validation_data.get('validation_reason_metonymy'), validation_data.get('validation_reason_other'),
-                    validation_data.get('final_figurative_language'),
-                    validation_data.get('final_simile'), validation_data.get('final_metaphor'), validation_data.get('final_personification'),
-                    validation_data.get('final_idiom'), validation_data.get('final_hyperbole'), validation_data.get('final_metonymy'), validation_data.get('final_other'),
-                    instance.get('validation_error'),
-                    instance['id']
-                ))
-
-                if cursor.rowcount > 0:
-                    updated_count += 1
+                validation_data['validation_response'] = instance.get('validation_response')
+                validation_data['validation_error'] = instance.get('validation_error')
+                updates.append((instance['id'], validation_data))
 
-            conn.commit()
-            conn.close()
+            # Sanitize and apply the whole batch with executemany in one transaction
+            db_manager = DatabaseManager(str(self.database_path))
+            db_manager.connect()
+            try:
+                updated_count = db_manager.batch_update_validation_data(updates)
+                db_manager.commit()
+            finally:
+                db_manager.close()
 
             self.logger.info(f"Updated validation data for {updated_count} instances")
             self.recovery_stats['validation_recovery_successes'] = updated_count
@@ -4,14 +4,16 @@
 Populate Missing Columns Script
 
 Populates NULL values for columns that may be missing after merging new books
-into Biblical_fig_language.db:
+into Biblical_fig_language.db. The work is done by rebuild_derived_columns.py with
+only_missing=True, so the columns follow its COPY_COLUMNS / DERIVED_COLUMNS specs
+and only NULL targets are filled (existing values are never overwritten):
 
 Verses table:
-- english_text_clean: copied from english_text
-- english_text_clean_non_sacred: divine names modifier applied to english_text
+- english_text_clean: plain copy of english_text (COPY_COLUMNS, NULL rows only)
+- english_text_clean_non_sacred: english divine names transform applied to english_text_clean
 
 Figurative_language table:
-- figurative_text_non_sacred: divine names modifier applied to figurative_text
+- figurative_text_non_sacred: english divine names transform applied to figurative_text
 
 Usage:
     python populate_missing_columns.py --book Jeremiah
@@ -30,7 +32,7 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 # Add the private module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'private', 'src'))
 
-from hebrew_figurative_db.text_extraction.hebrew_divine_names_modifier import HebrewDivineNamesModifier
+from rebuild_derived_columns import rebuild_derived_columns
 
 DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'database', 'Biblical_fig_language.db')
 
@@ -60,99 +62,20 @@ def get_books_with_missing_columns(cursor):
 
 def populate_verses_columns(cursor, book_filter=None):
     """Populate english_text_clean and english_text_clean_non_sacred for verses"""
-    modifier = HebrewDivineNamesModifier()
-
-    if book_filter:
-        query = """
-            SELECT id, english_text, book
-            FROM verses
-            WHERE book = ?
-            AND (english_text_clean IS NULL OR english_text_clean_non_sacred IS NULL)
-            AND english_text IS NOT NULL
-            ORDER BY id
-        """
-        cursor.execute(query, (book_filter,))
-    else:
-        query = """
-            SELECT id, english_text, book
-            FROM verses
-            WHERE (english_text_clean IS NULL OR english_text_clean_non_sacred IS NULL)
-            AND english_text IS NOT NULL
-            ORDER BY id
-        """
-        cursor.execute(query)
-
-    rows = cursor.fetchall()
-
-    if not rows:
-        return 0, {}
-
-    updated_count = 0
-    book_counts = {}
-
-    for verse_id, english_text, book in rows:
-        english_clean = english_text  # Sefaria already provides clean text
-        english_clean_non_sacred = modifier.modify_english_with_hebrew_terms(english_clean)
-
-        cursor.execute("""
-            UPDATE verses
-            SET english_text_clean = ?, english_text_clean_non_sacred = ?
-            WHERE id = ?
-        """, (english_clean, english_clean_non_sacred, verse_id))
-
-        updated_count += 1
-        book_counts[book] = book_counts.get(book, 0) + 1
-
-    return updated_count, book_counts
+    # english_text_clean is copied from english_text (Sefaria already provides clean text)
+    results = rebuild_derived_columns(cursor.connection,
+                                      columns=['english_text_clean', 'english_text_clean_non_sacred'],
+                                      book=book_filter, only_missing=True)
+    stats = results['verses']
+    return stats['updated_rows'], stats['by_book']
 
 
 def populate_figurative_columns(cursor, book_filter=None):
     """Populate figurative_text_non_sacred for figurative_language"""
-    modifier = HebrewDivineNamesModifier()
-
-    if book_filter:
-        query = """
-            SELECT fl.id, fl.figurative_text, v.book
-            FROM figurative_language fl
-            JOIN verses v ON fl.verse_id = v.id
-            WHERE v.book = ?
-            AND fl.figurative_text_non_sacred IS NULL
-            AND fl.figurative_text IS NOT NULL
-            ORDER BY fl.id
-        """
-        cursor.execute(query, (book_filter,))
-    else:
-        query = """
-            SELECT fl.id, fl.figurative_text, v.book
-            FROM figurative_language fl
-            JOIN verses v ON fl.verse_id = v.id
-            WHERE fl.figurative_text_non_sacred IS NULL
-            AND fl.figurative_text IS NOT NULL
-            ORDER BY fl.id
-        """
-        cursor.execute(query)
-
-    rows = cursor.fetchall()
-
-    if not rows:
-        return 0, {}
-
-    updated_count = 0
-    book_counts = {}
-
-    for fig_id, figurative_text, book in rows:
-        fig_text_non_sacred = modifier.modify_english_with_hebrew_terms(figurative_text)
-
-        cursor.execute("""
-            UPDATE figurative_language
-            SET figurative_text_non_sacred = ?
-            WHERE id = ?
-        """, (fig_text_non_sacred, fig_id))
-
-        updated_count += 1
-        book_counts[book] = book_counts.get(book, 0) + 1
-
-    return updated_count, book_counts
+    results = rebuild_derived_columns(cursor.connection, columns=['figurative_text_non_sacred'],
+                                      book=book_filter, only_missing=True)
+    stats = results['figurative_language']
+    return stats['updated_rows'], stats['by_book']
 
 
 def main():
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rebuild Derived Columns
+
+Single engine for every column that is computed from another column:
+
+Verses table:
+- hebrew_text_stripped: diacritics stripped from hebrew_text
+- hebrew_text_non_sacred: divine names modifier applied to hebrew_text
+- english_text_non_sacred: divine names modifier applied to english_text
+- english_text_clean: copied from english_text (only where NULL)
+- english_text_clean_non_sacred: divine names modifier applied to english_text_clean
+- figurative_detection_deliberation_non_sacred: modifier applied to the deliberation
+
+Figurative_language table:
+- figurative_text_in_hebrew_stripped: diacritics stripped from figurative_text_in_hebrew
+- figurative_text_in_hebrew_non_sacred: modifier applied to figurative_text_in_hebrew
+- figurative_text_non_sacred: modifier applied to figurative_text (English with Hebrew terms)
+
+How it works:
+- Rows are streamed in chunks (fetchmany), never loaded whole
+- Each (row, column) has a source hash stored in derived_column_state. The hash
+  covers the source text and a fingerprint of the transform's module source,
+  so unchanged rows are skipped and any modifier change rebuilds everything
+- Transforms fan out across a process pool (inline for small workloads); with
+  --memo-db, outputs already in a TransformMemo store are reused, not recomputed
+  (the memo is keyed on the same fingerprints, so it never serves stale output)
+- Results go to a temp table via executemany, then one UPDATE ... FROM per table
+- Nothing is committed here; the caller commits (or rolls back for --dry-run)
+
+Empty/NULL sources are left alone, as the per-field scripts did.
+
+Usage:
+    python rebuild_derived_columns.py
+    python rebuild_derived_columns.py --book Jeremiah --only-missing
+    python rebuild_derived_columns.py --columns hebrew_text_non_sacred figurative_text_non_sacred
+    python rebuild_derived_columns.py --db ../database/Pentateuch_Psalms_fig_language.db --force --dry-run
+"""
+
+import sys
+import os
+import io
+import time
+import sqlite3
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the private module to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'private', 'src'))
+
+from hebrew_figurative_db.text_extraction.transform_memo import TransformMemo, transform_fingerprints
+
+DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'database', 'Biblical_fig_language.db')
+
+CHUNK_SIZE = 5000          # Rows fetched per round trip
+MIN_PARALLEL_JOBS = 2000   # Below this many transforms a chunk runs inline (pool IPC costs more)
+
+# table -> (FROM clause, book expression, [(target column, transform, source column)])
+DERIVED_COLUMNS = {
+    'verses': ('verses t', 't.book', [
+        ('hebrew_text_stripped', 'strip_diacritics', 'hebrew_text'),
+        ('hebrew_text_non_sacred', 'divine_names', 'hebrew_text'),
+        ('english_text_non_sacred', 'english_divine_names', 'english_text'),
+        ('english_text_clean_non_sacred', 'english_divine_names', 'english_text_clean'),
+        ('figurative_detection_deliberation_non_sacred', 'english_divine_names', 'figurative_detection_deliberation'),
+    ]),
+    'figurative_language': ('figurative_language t JOIN verses v ON t.verse_id = v.id', 'v.book', [
+        ('figurative_text_in_hebrew_stripped', 'strip_diacritics', 'figurative_text_in_hebrew'),
+        ('figurative_text_in_hebrew_non_sacred', 'divine_names', 'figurative_text_in_hebrew'),
+        ('figurative_text_non_sacred', 'english_divine_names', 'figurative_text'),
+    ]),
+}
+
+# Plain copies that need no transform: (table, target, source), applied to NULL targets only
+COPY_COLUMNS = [
+    ('verses', 'english_text_clean', 'english_text'),
+]
+
+ALL_COLUMNS = [target for _, target, _ in COPY_COLUMNS] + [col for _, _, cols in DERIVED_COLUMNS.values() for col, _, _ in cols]
+
+_worker_transforms = None
+
+
+def _get_transforms():
+    """In-memory TransformMemo, built once per process (repeated fragments transform once)"""
+    global _worker_transforms
+    if _worker_transforms is None:
+        _worker_transforms = TransformMemo()
+    return _worker_transforms
+
+
+def _transform_batch(jobs):
+    """Apply [(transform, text)] -> [output]; runs in pool workers"""
+    transforms = _get_transforms()
+    return [transforms.apply(name, text) for name, text in jobs]
+
+
+def _run_jobs(jobs, executor, workers, memo):
+    """Outputs for [(transform, text)]: memo store hits first, the rest inline or across the pool"""
+    outputs = [None] * len(jobs)
+    if memo is not None:
+        by_transform = {}
+        for n, (name, _) in enumerate(jobs):
+            by_transform.setdefault(name, []).append(n)
+        for name, indexes in by_transform.items():
+            for n, output in zip(indexes, memo.get_many(name, [jobs[n][1] for n in indexes])):
+                outputs[n] = output
+    todo = [n for n, output in enumerate(outputs) if output is None]
+    if not todo:
+        return outputs, 0
+
+    pending = [jobs[n] for n in todo]
+    if executor is not None and len(pending) >= MIN_PARALLEL_JOBS:
+        size = -(-len(pending) // workers)
+        computed = [out for part in executor.map(_transform_batch, [pending[n:n + size] for n in range(0, len(pending), size)])
+                    for out in part]
+    else:
+        computed = _transform_batch(pending)
+
+    new_outputs = {}
+    for n, output in zip(todo, computed):
+        outputs[n] = output
+        new_outputs.setdefault(jobs[n][0], []).append((jobs[n][1], output))
+    if memo is not None:
+        for name, pairs in new_outputs.items():
+            memo.put_many(name, pairs)
+    return outputs, len(todo)
+
+
+def source_hash(fingerprint, text):
+    """64-bit signed hash of (transform fingerprint, source text) - fits an INTEGER column"""
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8, key=fingerprint).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def ensure_state_table(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS derived_column_state (
+            table_name TEXT NOT NULL,
+            column_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            source_hash INTEGER NOT NULL,
+            PRIMARY KEY (table_name, column_name, row_id)
+        ) WITHOUT ROWID
+    """)
+
+
+def copy_columns(cursor, columns, book=None):
+    """Fill NULL plain-copy columns with one UPDATE each"""
+    counts = {}
+    for table, target, source in COPY_COLUMNS:
+        if target not in columns:
+            continue
+        query = f"UPDATE {table} SET {target} = {source} WHERE {target} IS NULL AND {source} IS NOT NULL"
+        params = ()
+        if book:
+            query += " AND book = ?"
+            params = (book,)
+        cursor.execute(query, params)
+        counts[target] = cursor.rowcount
+    return counts
+
+
+def _write_back(cursor, table, targets, updates, states):
+    """Flush collected results: temp tables via executemany, then one UPDATE ... FROM"""
+    temp = f"rebuild_{table}"
+    cursor.execute(f"DROP TABLE IF EXISTS temp.{temp}")
+    cursor.execute(f"CREATE TEMP TABLE {temp} (id INTEGER PRIMARY KEY, {', '.join(targets)})")
+    placeholders = ', '.join('?' for _ in range(len(targets) + 1))
+    cursor.executemany(f"INSERT INTO temp.{temp} VALUES ({placeholders})", updates)
+
+    # NULL in the temp table means "column unchanged for this row"
+    if sqlite3.sqlite_version_info >= (3, 33, 0):
+        assignments = ', '.join(f"{col} = COALESCE(d.{col}, {table}.{col})" for col in targets)
+        cursor.execute(f"UPDATE {table} SET {assignments} FROM temp.{temp} AS d WHERE {table}.id = d.id")
+    else:
+        # SQLite < 3.33 has no UPDATE ... FROM (older Python builds on Windows)
+        assignments = ', '.join(
+            f"{col} = COALESCE((SELECT d.{col} FROM temp.{temp} d WHERE d.id = {table}.id), {col})"
+            for col in targets)
+        cursor.execute(f"UPDATE {table} SET {assignments} WHERE id IN (SELECT id FROM temp.{temp})")
+    cursor.execute(f"DROP TABLE temp.{temp}")
+
+    cursor.execute("DROP TABLE IF EXISTS temp.rebuild_state")
+    cursor.execute("CREATE TEMP TABLE rebuild_state (column_name TEXT, row_id INTEGER, source_hash INTEGER)")
+    cursor.executemany("INSERT INTO temp.rebuild_state VALUES (?, ?, ?)", states)
+    cursor.execute("""
+        INSERT OR REPLACE INTO derived_column_state (table_name, column_name, row_id, source_hash)
+        SELECT ?, column_name, row_id, source_hash FROM temp.rebuild_state
+    """, (table,))
+    cursor.execute("DROP TABLE temp.rebuild_state")
+
+
+def rebuild_table(cursor, table, columns, fingerprints, executor=None, workers=1, book=None,
+                  only_missing=False, force=False, chunk_size=CHUNK_SIZE, memo=None):
+    """
+    Recompute the selected derived columns of one table; returns counts
+
+    stats['changed'] counts values written that differ from the old target value;
+    stats['modified'] counts values that differ from their source text (what the
+    per-field scripts reported as "modified"), whether recomputed or left as they were.
+    """
+    from_clause, book_expr, specs = DERIVED_COLUMNS[table]
+    specs = [spec for spec in specs if spec[0] in columns]
+    stats = {'rows': 0, 'skipped': 0, 'transformed': 0, 'memo_hits': 0, 'updated_rows': 0, 'changed': {},
+             'modified': {}, 'by_book': {}}
+    if not specs:
+        return stats
+
+    sources = list(dict.fromkeys(spec[2] for spec in specs))
+    targets = [spec[0] for spec in specs]
+    select = ["t.id", book_expr] + [f"t.{s}" for s in sources] + [f"t.{c}" for c in targets]
+    joins = []
+    for i, target in enumerate(targets):
+        select.append(f"s{i}.source_hash")
+        joins.append(f"LEFT JOIN derived_column_state s{i} ON s{i}.table_name = '{table}' "
+                     f"AND s{i}.column_name = '{target}' AND s{i}.row_id = t.id")
+    conditions, params = [], []
+    if book:
+        conditions.append(f"{book_expr} = ?")
+        params.append(book)
+    if only_missing:
+        conditions.append('(' + ' OR '.join(f"(t.{c} IS NULL AND t.{s} IS NOT NULL)" for c, _, s in specs) + ')')
+    query = f"SELECT {', '.join(select)} FROM {from_clause} {' '.join(joins)}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY t.id"
+
+    source_index = {s: 2 + i for i, s in enumerate(sources)}
+    target_base = 2 + len(sources)
+    hash_base = target_base + len(targets)
+    # (target position, transform, source position, fingerprint)
+    plan = [(i, transform, source_index[source], fingerprints[transform])
+            for i, (_, transform, source) in enumerate(specs)]
+
+    updates, states = [], []
+    reader = cursor.connection.cursor()
+    reader.execute(query, params)
+    while True:
+        rows = reader.fetchmany(chunk_size)
+        if not rows:
+            break
+        stats['rows'] += len(rows)
+
+        jobs, job_keys = [], []
+        for row in rows:
+            for i, transform, src_pos, fingerprint in plan:
+                text = row[src_pos]
+                if not text:
+                    continue
+                current = row[target_base + i]
+                if only_missing and current is not None:
+                    continue  # only fill NULL targets; leave this row's other values alone
+                digest = source_hash(fingerprint, text)
+                if not force and digest == row[hash_base + i] and current is not None:
+                    stats['skipped'] += 1
+                    if current != text:
+                        stats['modified'][targets[i]] = stats['modified'].get(targets[i], 0) + 1
+                    continue
+                jobs.append((transform, text))
+                job_keys.append((row, i, digest))
+        if not jobs:
+            continue
+
+        outputs, computed = _run_jobs(jobs, executor, workers, memo)
+        stats['transformed'] += computed
+        stats['memo_hits'] += len(jobs) - computed
+
+        pending = {}
+        for (row, i, digest), output in zip(job_keys, outputs):
+            states.append((targets[i], row[0], digest))
+            if output != row[plan[i][2]]:
+                stats['modified'][targets[i]] = stats['modified'].get(targets[i], 0) + 1
+            if output != row[target_base + i]:
+                pending.setdefault(row[0], [row[1]] + [None] * len(targets))[1 + i] = output
+                stats['changed'][targets[i]] = stats['changed'].get(targets[i], 0) + 1
+        for row_id, values in pending.items():
+            updates.append((row_id, *values[1:]))
+            stats['by_book'][values[0]] = stats['by_book'].get(values[0], 0) + 1
+        stats['updated_rows'] += len(pending)
+
+    reader.close()
+    if states:
+        _write_back(cursor, table, targets, updates, states)
+    return stats
+
+
+def rebuild_derived_columns(conn, columns=None, book=None, only_missing=False, force=False,
+                            workers=None, chunk_size=CHUNK_SIZE, memo_path=None):
+    """
+    Rebuild derived columns in conn (no commit).
+
+    Args:
+        columns: target column names (default: all of ALL_COLUMNS)
+        book: restrict to one book
+        only_missing: only fill selected targets that are NULL (and whose source is not);
+            non-NULL values are left as they are
+        force: ignore stored source hashes
+        workers: process pool size (default: CPU count; 0/1 runs inline)
+        memo_path: TransformMemo SQLite store to reuse outputs from (and add new ones to),
+            e.g. the pipeline's output/transform_memo.db
+
+    Returns:
+        {'copied': {column: rows}, table: stats, ...}
+    """
+    columns = set(columns or ALL_COLUMNS)
+    unknown = columns - set(ALL_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown derived columns: {', '.join(sorted(unknown))}")
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    cursor = conn.cursor()
+    ensure_state_table(cursor)
+    results = {'copied': copy_columns(cursor, columns, book)}
+    fingerprints = transform_fingerprints()
+
+    memo = TransformMemo(store_path=memo_path) if memo_path else None
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for table in DERIVED_COLUMNS:
+            results[table] = rebuild_table(cursor, table, columns, fingerprints, executor, workers, book,
+                                           only_missing, force, chunk_size, memo)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if memo is not None:
+            memo.close()
+    return results
+
+
+def print_results(results, elapsed):
+    for column, count in results['copied'].items():
+        print(f"{column}: {count} rows copied")
+    for table in DERIVED_COLUMNS:
+        stats = results.get(table)
+        if not stats:
+            continue
+        print(f"\n{table}: {stats['rows']} rows scanned, {stats['skipped']} values unchanged since last rebuild, "
+              f"{stats['transformed']} transformed, {stats['memo_hits']} from memo, {stats['updated_rows']} rows updated")
+        for column in sorted(set(stats['changed']) | set(stats['modified'])):
+            print(f"  - {column}: {stats['changed'].get(column, 0)} updated, "
+                  f"{stats['modified'].get(column, 0)} differ from their source")
+    print(f"\nCompleted in {elapsed:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild derived (non-sacred / stripped / clean) columns')
+    parser.add_argument('--db', default=DB_PATH, help='Database path')
+    parser.add_argument('--columns', nargs='+', choices=ALL_COLUMNS, help='Columns to rebuild (default: all)')
+    parser.add_argument('--book', type=str, help='Specific book to process (e.g., Jeremiah)')
+    parser.add_argument('--only-missing', action='store_true', help='Only fill NULL target columns')
+    parser.add_argument('--force', action='store_true', help='Recompute even when the source hash is unchanged')
+    parser.add_argument('--workers', type=int, default=None, help='Process pool size (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='Rows streamed per chunk')
+    parser.add_argument('--memo-db', default=None, help='TransformMemo store to reuse transform outputs from')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would be updated without making changes')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Error: Database not found at {args.db}")
+        sys.exit(1)
+
+    print("=" * 70)
+    print("REBUILD DERIVED COLUMNS")
+    print("=" * 70)
+    print(f"Database: {args.db}")
+
+    conn = sqlite3.connect(args.db)
+    start = time.time()
+    results = rebuild_derived_columns(conn, args.columns, args.book, args.only_missing, args.force,
+                                      args.workers, args.chunk_size, args.memo_db)
+    if args.dry_run:
+        conn.rollback()
+        print("\n[DRY RUN - Changes rolled back]")
+    else:
+        conn.commit()
+    conn.close()
+    print_results(results, time.time() - start)
+
+
+if __name__ == '__main__':
+    # Force UTF-8 output
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    main()
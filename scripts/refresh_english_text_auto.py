@@ -5,7 +5,7 @@ Refresh English Text from Sefaria API (Auto-run version)
 
 This script:
 1. Fetches fresh English text from Sefaria API for all verses in the database
-2. Applies footnote removal using the updated _clean_text() method (with <br> → space fix)
+2. Applies footnote removal using the shared clean_sefaria_text() in text_normalization.py (with <br> → space fix)
 3. Updates existing columns:
    - english_text_clean: Clean text with footnotes removed and proper spacing
    - english_text_clean_non_sacred: Clean text with Hebrew divine names modified
@@ -13,7 +13,6 @@ This script:
 import sys
 import os
 import sqlite3
-import time
 from typing import Dict, List, Tuple
 
 # Add the private module to path
@@ -21,6 +20,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'private'))
 
 from src.hebrew_figurative_db.text_extraction.sefaria_client import SefariaClient
 from src.hebrew_figurative_db.text_extraction.hebrew_divine_names_modifier import HebrewDivineNamesModifier
+from src.hebrew_figurative_db.text_extraction.transform_memo import TransformMemo
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'database', 'Pentateuch_Psalms_fig_language.db')
 
@@ -30,7 +30,7 @@ class EnglishTextRefresher:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.sefaria_client = SefariaClient()
-        self.divine_modifier = HebrewDivineNamesModifier()
+        self.divine_modifier = TransformMemo(HebrewDivineNamesModifier())
         self.api_call_count = 0
         self.total_api_time = 0.0
 
@@ -49,30 +49,24 @@ class EnglishTextRefresher:
 
         return verses
 
-    def fetch_english_for_book_chapter(self, book: str, chapter: int) -> Dict[int, str]:
-        """Fetch all English verses for a specific book and chapter"""
-        print(f"  Fetching {book} {chapter}...", end=" ", flush=True)
+    def fetch_english_for_chapters(self, chapter_keys: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Dict[int, str]]:
+        """Fetch English verses for many (book, chapter) pairs concurrently over one pooled session"""
+        references = {f"{book}.{chapter}": (book, chapter) for book, chapter in chapter_keys}
+        print(f"Fetching {len(references)} chapters "
+              f"({self.sefaria_client.max_concurrency} concurrent requests)...")
 
-        # Sefaria API call
-        verses_range = f"{book}.{chapter}"
+        results, errors = self.sefaria_client.fetch_chapters(list(references))
 
-        try:
-            verses, api_time = self.sefaria_client.extract_hebrew_text(verses_range)
+        english_by_chapter = {}
+        for reference, (verses, api_time) in results.items():
             self.api_call_count += 1
             self.total_api_time += api_time
+            # Mapping of verse number to clean English text
+            english_by_chapter[references[reference]] = {verse['verse']: verse['english'] for verse in verses}
+        for reference, error in sorted(errors.items()):
+            print(f"  ERROR fetching {reference}: {error}")
 
-            # Create mapping of verse number to clean English text
-            english_map = {}
-            for verse in verses:
-                verse_num = verse['verse']
-                english_map[verse_num] = verse['english']
-
-            print(f"OK ({len(english_map)} verses, {api_time:.2f}s)")
-            return english_map
-
-        except Exception as e:
-            print(f"ERROR: {e}")
-            return {}
+        return english_by_chapter
 
     def refresh_all_verses(self):
         """Refresh English text for all verses in the database"""
@@ -98,13 +92,16 @@ class EnglishTextRefresher:
         updated_count = 0
         error_count = 0
 
+        # Fetch every chapter up front (bounded concurrency; the client retries with backoff)
+        english_by_chapter = self.fetch_english_for_chapters(
+            [(book, chapter) for book in sorted(chapters_by_book) for chapter in sorted(chapters_by_book[book])])
+
         # Process each book and chapter
         for book in sorted(chapters_by_book.keys()):
             print(f"\n{book}:")
 
             for chapter in sorted(chapters_by_book[book].keys()):
-                # Fetch all English verses for this chapter
-                english_map = self.fetch_english_for_book_chapter(book, chapter)
+                english_map = english_by_chapter.get((book, chapter))
 
                 if not english_map:
                     error_count += len(chapters_by_book[book][chapter])
@@ -128,12 +125,9 @@ class EnglishTextRefresher:
 
                         updated_count += 1
                     else:
-                        print(f"  WARNING: Verse {verse_num} not found in API response")
+                        print(f"  WARNING: {book} {chapter}:{verse_num} not found in API response")
                         error_count += 1
 
-                # Rate limiting - be nice to Sefaria API
-                time.sleep(0.5)
-
         conn.commit()
         conn.close()
 
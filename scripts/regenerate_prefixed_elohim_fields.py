@@ -27,204 +27,18 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 # Add the private module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'private', 'src'))
 
-from hebrew_figurative_db.text_extraction.hebrew_divine_names_modifier import HebrewDivineNamesModifier
+from rebuild_derived_columns import rebuild_derived_columns
 
 DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'database', 'Pentateuch_Psalms_fig_language.db')
 
-def regenerate_verse_hebrew_non_sacred():
-    """Regenerate verses.hebrew_text_non_sacred field"""
-    print("\n" + "=" * 80)
-    print("FIELD 1/4: Regenerating verses.hebrew_text_non_sacred")
-    print("=" * 80)
-
-    modifier = HebrewDivineNamesModifier()
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    # Get all verses
-    cursor.execute("SELECT id, hebrew_text FROM verses ORDER BY id")
-    verses = cursor.fetchall()
-
-    print(f"Total verses to process: {len(verses)}")
-
-    modified_count = 0
-    batch_count = 0
-
-    for verse_id, hebrew_text in verses:
-        if not hebrew_text:
-            continue
-
-        non_sacred = modifier.modify_divine_names(hebrew_text)
-
-        if non_sacred != hebrew_text:
-            modified_count += 1
-
-        cursor.execute("""
-            UPDATE verses
-            SET hebrew_text_non_sacred = ?
-            WHERE id = ?
-        """, (non_sacred, verse_id))
-
-        batch_count += 1
-        if batch_count % 500 == 0:
-            conn.commit()
-            print(f"  Processed {batch_count}/{len(verses)} verses... ({modified_count} modified)")
-
-    conn.commit()
-    conn.close()
-
-    print(f"✓ Completed: {modified_count} verses modified out of {len(verses)}")
-    return modified_count
-
-def regenerate_deliberation_non_sacred():
-    """Regenerate verses.figurative_detection_deliberation_non_sacred field"""
-    print("\n" + "=" * 80)
-    print("FIELD 2/4: Regenerating verses.figurative_detection_deliberation_non_sacred")
-    print("=" * 80)
-
-    modifier = HebrewDivineNamesModifier()
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    # Get all verses with deliberation
-    cursor.execute("""
-        SELECT id, figurative_detection_deliberation
-        FROM verses
-        WHERE figurative_detection_deliberation IS NOT NULL
-        ORDER BY id
-    """)
-    verses = cursor.fetchall()
-
-    print(f"Total verses to process: {len(verses)}")
-
-    modified_count = 0
-    batch_count = 0
-
-    for verse_id, deliberation in verses:
-        if not deliberation:
-            continue
-
-        non_sacred = modifier.modify_english_with_hebrew_terms(deliberation)
-
-        if non_sacred != deliberation:
-            modified_count += 1
-
-        cursor.execute("""
-            UPDATE verses
-            SET figurative_detection_deliberation_non_sacred = ?
-            WHERE id = ?
-        """, (non_sacred, verse_id))
-
-        batch_count += 1
-        if batch_count % 500 == 0:
-            conn.commit()
-            print(f"  Processed {batch_count}/{len(verses)} verses... ({modified_count} modified)")
-
-    conn.commit()
-    conn.close()
-
-    print(f"✓ Completed: {modified_count} verses modified out of {len(verses)}")
-    return modified_count
-
-def regenerate_figurative_hebrew_non_sacred():
-    """Regenerate figurative_language.figurative_text_in_hebrew_non_sacred field"""
-    print("\n" + "=" * 80)
-    print("FIELD 3/4: Regenerating figurative_language.figurative_text_in_hebrew_non_sacred")
-    print("=" * 80)
-
-    modifier = HebrewDivineNamesModifier()
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    # Get all figurative instances
-    cursor.execute("""
-        SELECT id, figurative_text_in_hebrew
-        FROM figurative_language
-        WHERE figurative_text_in_hebrew IS NOT NULL
-        ORDER BY id
-    """)
-    instances = cursor.fetchall()
-
-    print(f"Total instances to process: {len(instances)}")
-
-    modified_count = 0
-    batch_count = 0
-
-    for instance_id, hebrew_text in instances:
-        if not hebrew_text:
-            continue
-
-        non_sacred = modifier.modify_divine_names(hebrew_text)
-
-        if non_sacred != hebrew_text:
-            modified_count += 1
+# (column, label) for the four fields this fix regenerates
+FIELDS = [
+    ('hebrew_text_non_sacred', 'verses.hebrew_text_non_sacred'),
+    ('figurative_detection_deliberation_non_sacred', 'verses.figurative_detection_deliberation_non_sacred'),
+    ('figurative_text_in_hebrew_non_sacred', 'figurative_language.figurative_text_in_hebrew_non_sacred'),
+    ('figurative_text_non_sacred', 'figurative_language.figurative_text_non_sacred'),
+]
 
-        cursor.execute("""
-            UPDATE figurative_language
-            SET figurative_text_in_hebrew_non_sacred = ?
-            WHERE id = ?
-        """, (non_sacred, instance_id))
-
-        batch_count += 1
-        if batch_count % 500 == 0:
-            conn.commit()
-            print(f"  Processed {batch_count}/{len(instances)} instances... ({modified_count} modified)")
-
-    conn.commit()
-    conn.close()
-
-    print(f"✓ Completed: {modified_count} instances modified out of {len(instances)}")
-    return modified_count
-
-def regenerate_figurative_english_non_sacred():
-    """Regenerate figurative_language.figurative_text_non_sacred field (English with Hebrew terms)"""
-    print("\n" + "=" * 80)
-    print("FIELD 4/4: Regenerating figurative_language.figurative_text_non_sacred")
-    print("=" * 80)
-
-    modifier = HebrewDivineNamesModifier()
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    # Get all figurative instances
-    cursor.execute("""
-        SELECT id, figurative_text
-        FROM figurative_language
-        WHERE figurative_text IS NOT NULL
-        ORDER BY id
-    """)
-    instances = cursor.fetchall()
-
-    print(f"Total instances to process: {len(instances)}")
-
-    modified_count = 0
-    batch_count = 0
-
-    for instance_id, english_text in instances:
-        if not english_text:
-            continue
-
-        non_sacred = modifier.modify_english_with_hebrew_terms(english_text)
-
-        if non_sacred != english_text:
-            modified_count += 1
-
-        cursor.execute("""
-            UPDATE figurative_language
-            SET figurative_text_non_sacred = ?
-            WHERE id = ?
-        """, (non_sacred, instance_id))
-
-        batch_count += 1
-        if batch_count % 500 == 0:
-            conn.commit()
-            print(f"  Processed {batch_count}/{len(instances)} instances... ({modified_count} modified)")
-
-    conn.commit()
-    conn.close()
-
-    print(f"✓ Completed: {modified_count} instances modified out of {len(instances)}")
-    return modified_count
 
 def main():
     """Main execution"""
@@ -240,19 +54,22 @@ def main():
     print("\nEstimated affected verses: ~102 (21 vav + 81 other prefixes)")
     print("\nStarting regeneration...\n")
 
-    # Regenerate all 4 fields
-    count1 = regenerate_verse_hebrew_non_sacred()
-    count2 = regenerate_deliberation_non_sacred()
-    count3 = regenerate_figurative_hebrew_non_sacred()
-    count4 = regenerate_figurative_english_non_sacred()
+    # Regenerate all 4 fields in one streamed pass (see rebuild_derived_columns.py)
+    conn = sqlite3.connect(DB_PATH)
+    results = rebuild_derived_columns(conn, columns=[column for column, _ in FIELDS])
+    conn.commit()
+    conn.close()
+
+    # "modified" = regenerated value differs from its source text, as the per-field passes counted it
+    modified = {}
+    for table in ('verses', 'figurative_language'):
+        modified.update(results[table]['modified'])
 
     print("\n" + "=" * 80)
     print("REGENERATION COMPLETE")
     print("=" * 80)
-    print(f"verses.hebrew_text_non_sacred: {count1} modified")
-    print(f"verses.figurative_detection_deliberation_non_sacred: {count2} modified")
-    print(f"figurative_language.figurative_text_in_hebrew_non_sacred: {count3} modified")
-    print(f"figurative_language.figurative_text_non_sacred: {count4} modified")
+    for column, label in FIELDS:
+        print(f"{label}: {modified.get(column, 0)} modified")
     print("\nDatabase successfully updated!")
 
 if __name__ == '__main__':
@@ -5,21 +5,27 @@ Validation Health Check Script
 This script generates comprehensive validation health reports for databases.
 Use it to monitor validation coverage and identify chapters that need recovery.
 
+Coverage for every chapter comes from one aggregated query
+(DatabaseManager.verify_validation_data_for_chapters), so a whole-Tanakh check
+costs a single pass over figurative_language.
+
 Usage:
     python validation_health_check.py --database path/to/database.db
     python validation_health_check.py --database private/isaiah_c10_multi_v_parallel_20251204_1449.db --output validation_report.json
+    python validation_health_check.py --database path/to/database.db --book Isaiah --chapters 1-10
 """
 
 import argparse
 import json
 import logging
 import sys
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
-import sqlite3
+from typing import Dict, List, Optional
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'private'))
 
 from src.hebrew_figurative_db.database.db_manager import DatabaseManager
 
@@ -35,50 +41,33 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def get_all_chapters(db_manager: DatabaseManager) -> List[Dict]:
-    """Get all chapters with figurative language instances"""
-    db_manager.cursor.execute("""
-        SELECT DISTINCT v.book, v.chapter, COUNT(*) as instance_count
-        FROM figurative_language fl
-        JOIN verses v ON fl.verse_id = v.id
-        GROUP BY v.book, v.chapter
-        ORDER BY v.book, v.chapter
-    """)
-    return db_manager.cursor.fetchall()
-
-
-def check_chapter_validation_health(db_manager: DatabaseManager, book: str, chapter: int) -> Dict:
-    """Check validation health for a specific chapter"""
-    try:
-        # Use the existing verification method
-        verification = db_manager.verify_validation_data_for_chapter(book, chapter)
-
-        # Add health status classification
-        if verification.get('error'):
-            health_status = 'ERROR'
-        elif verification.get('validation_coverage_rate', 0) >= 95:
-            health_status = 'HEALTHY'
-        elif verification.get('validation_coverage_rate', 0) >= 80:
-            health_status = 'WARNING'
-        else:
-            health_status = 'CRITICAL'
-
-        verification['health_status'] = health_status
-        return verification
-
-    except Exception as e:
-        logger.error(f"Error checking chapter {book} {chapter}: {e}")
-        return {
-            'book': book,
-            'chapter': chapter,
-            'health_status': 'ERROR',
-            'error': str(e),
-            'needs_recovery': True
-        }
-
-
-def generate_validation_health_report(database_path: str) -> Dict:
-    """Generate comprehensive validation health report"""
+def classify_chapter_health(verification: Dict) -> str:
+    """Health status for one chapter's verification result"""
+    if verification.get('error'):
+        return 'ERROR'
+    elif verification.get('validation_coverage_rate', 0) >= 95:
+        return 'HEALTHY'
+    elif verification.get('validation_coverage_rate', 0) >= 80:
+        return 'WARNING'
+    else:
+        return 'CRITICAL'
+
+
+def parse_chapters(chapters_arg: str) -> List[int]:
+    """'1-5,8' -> [1, 2, 3, 4, 5, 8]"""
+    chapters = []
+    for part in chapters_arg.split(','):
+        if '-' in part:
+            start, end = part.split('-', 1)
+            chapters.extend(range(int(start), int(end) + 1))
+        elif part.strip():
+            chapters.append(int(part))
+    return chapters
+
+
+def generate_validation_health_report(database_path: str, book: Optional[str] = None,
+                                      chapters: Optional[List[int]] = None) -> Dict:
+    """Generate comprehensive validation health report (optionally for one book / some of its chapters)"""
     logger.info(f"Generating validation health report for: {database_path}")
 
     report = {
@@ -99,19 +88,13 @@ def generate_validation_health_report(database_path: str) -> Dict:
 
     try:
         with DatabaseManager(database_path) as db_manager:
-            # Get all chapters
-            chapters = get_all_chapters(db_manager)
-            logger.info(f"Found {len(chapters)} chapters to check")
+            # All chapters in one aggregated pass
+            verifications = db_manager.verify_validation_data_for_chapters(book, chapters)
+            logger.info(f"Checked {len(verifications)} chapters")
 
-            # Check each chapter
-            for chapter_info in chapters:
-                book = chapter_info['book']
-                chapter = chapter_info['chapter']
-                instance_count = chapter_info['instance_count']
-
-                logger.info(f"Checking {book} chapter {chapter} ({instance_count} instances)...")
-
-                metrics = check_chapter_validation_health(db_manager, book, chapter)
+            for metrics in verifications.values():
+                instance_count = metrics['total_instances']
+                metrics['health_status'] = classify_chapter_health(metrics)
                 metrics['instance_count'] = instance_count
                 report['chapters'].append(metrics)
 
@@ -230,6 +213,8 @@ def print_report_summary(report: Dict):
 def main():
     parser = argparse.ArgumentParser(description='Check validation health for figurative language database')
     parser.add_argument('--database', required=True, help='Path to SQLite database')
+    parser.add_argument('--book', help='Only check this book')
+    parser.add_argument('--chapters', help='Only check these chapters of --book (e.g. "1-10,15")')
     parser.add_argument('--output', help='Output JSON file for detailed report')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose logging')
 
@@ -238,8 +223,12 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    if args.chapters and not args.book:
+        parser.error('--chapters requires --book')
+
     # Generate report
-    report = generate_validation_health_report(args.database)
+    report = generate_validation_health_report(
+        args.database, args.book, parse_chapters(args.chapters) if args.chapters else None)
 
     # Print summary
     print_report_summary(report)
@@ -259,5 +248,4 @@ def main():
 
 
 if __name__ == '__main__':
-    from datetime import datetime
     main()
\ No newline at end of file